@@ -10,7 +10,8 @@ from src.services.user_interaction_logger import (
     is_user_interaction_logging_enabled,
     set_user_interaction_logging_enabled,
 )
-from src.utils.auth_utils import invalidate_role_cache, is_admin_user
+from src.utils.auth_cache import get_authorization_cache
+from src.utils.auth_utils import invalidate_role_cache, is_admin_user_async
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ async def handle_logging_toggle_command(
         )
         return
 
-    if not is_admin_user(user.id, settings):
+    if not await is_admin_user_async(user.id, settings):
         await message.reply_text(
             "🚫 У вас нет прав для управления логированием взаимодействий."
         )
@@ -79,11 +80,13 @@ async def handle_auth_refresh_command(
         )
         return
 
-    if not is_admin_user(user.id, settings):
+    if not await is_admin_user_async(user.id, settings):
         await message.reply_text("🚫 У вас нет прав для обновления кэша авторизации.")
         return
 
-    # Clear the authorization cache
+    # Rebuild the role map from the allowlists and clear the authorization cache
+    role_map = settings.telegram.refresh_role_map()
+    get_authorization_cache().refresh_all(role_map)
     invalidate_role_cache()
 
     logger.info(f"User {user.id} ({user.username}) cleared authorization cache")
@@ -7,13 +7,12 @@ department filtering, and integration with export services through service facto
 
 import asyncio
 import logging
-import tempfile
 import warnings
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Optional
+from typing import Coroutine, Optional, Set, Union
 
-from telegram import Update
+from telegram import Message, Update
+from telegram.error import TelegramError
 from telegram.ext import (
     CallbackQueryHandler,
     CommandHandler,
@@ -26,17 +25,23 @@ from src.bot.keyboards.export_keyboards import (
     get_department_selection_keyboard,
     get_export_selection_keyboard,
 )
+from src.data.airtable.airtable_client import RequestPriority, request_priority
 from src.models.participant import Department, Role
 from src.services import service_factory
 from src.services.user_interaction_logger import UserInteractionLogger
-from src.utils.auth_utils import is_admin_user
+from src.utils.auth_utils import is_admin_user_async
 from src.utils.export_utils import (
+    CSVExportFile,
     format_export_success_message,
     generate_readable_export_filename,
+    prepare_telegram_delivery,
 )
 
 logger = logging.getLogger(__name__)
 
+# Exports rendered and uploaded in the background, referenced until finished
+_BACKGROUND_EXPORTS: Set["asyncio.Task[None]"] = set()
+
 
 async def start_export_selection(
     update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -78,7 +83,7 @@ async def start_export_selection(
         return ConversationHandler.END
 
     # Check admin access
-    if not is_admin_user(user_id, settings):
+    if not await is_admin_user_async(user_id, settings):
         logger.warning(
             f"Unauthorized export attempt by user {username} (ID: {user_id})"
         )
@@ -105,7 +110,9 @@ async def start_export_selection(
         "🆕 *Кандидаты* - только участники с ролью CANDIDATE\n"
         "🏢 *По отделу* - участники конкретного отдела\n"
         "📖 *Bible Readers* - экспорт таблицы Bible Readers\n"
-        "🎯 *ROE* - экспорт таблицы ROE",
+        "🎯 *ROE* - экспорт таблицы ROE\n"
+        "📦 *Полный пакет* - участники, ROE и Bible Readers одним архивом\n"
+        "🔁 *Изменения* - новые и изменённые участники с прошлой выгрузки",
         parse_mode="Markdown",
         reply_markup=keyboard,
     )
@@ -156,13 +163,32 @@ async def handle_export_type_selection(
         )
         return ExportStates.SELECTING_DEPARTMENT
 
+    # Handle combined export of all tables
+    if callback_data == ExportCallbackData.EXPORT_RETREAT_PACKET:
+        await query.edit_message_text(
+            "🔄 Готовлю полный пакет...\n"
+            "Участники, ROE и Bible Readers выгружаются одновременно."
+        )
+        _start_background_export(
+            _process_retreat_packet_export(query, context, user_id), user_id
+        )
+        return ConversationHandler.END
+
+    # Handle export of changes since the admin's previous delta export
+    if callback_data == ExportCallbackData.EXPORT_CHANGES:
+        await query.edit_message_text("🔄 Ищу изменения с прошлой выгрузки...")
+        _start_background_export(_process_changes_export(query, user_id), user_id)
+        return ConversationHandler.END
+
     # Handle direct export types
     await query.edit_message_text(
         "🔄 Начинаю экспорт данных...\n" "Это может занять некоторое время."
     )
 
-    # Process the export based on type
-    await _process_export_by_type(callback_data, query, context, user_id)
+    # Render and upload in the background so the handler returns immediately
+    _start_background_export(
+        _process_export_by_type(callback_data, query, context, user_id), user_id
+    )
 
     return ConversationHandler.END
 
@@ -201,12 +227,30 @@ async def handle_department_selection(
             "🆕 *Кандидаты* - только участники с ролью CANDIDATE\n"
             "🏢 *По отделу* - участники конкретного отдела\n"
             "📖 *Bible Readers* - экспорт таблицы Bible Readers\n"
-            "🎯 *ROE* - экспорт таблицы ROE",
+            "🎯 *ROE* - экспорт таблицы ROE\n"
+            "📦 *Полный пакет* - участники, ROE и Bible Readers одним архивом\n"
+            "🔁 *Изменения* - новые и изменённые участники с прошлой выгрузки",
             parse_mode="Markdown",
             reply_markup=keyboard,
         )
         return ExportStates.SELECTING_EXPORT_TYPE
 
+    # Handle all-departments archive
+    if callback_data == ExportCallbackData.EXPORT_DEPARTMENT_PACKETS:
+        logger.info(f"All department packets selected by user {user_id}")
+        interaction_logger.log_journey_step(
+            user_id=user_id,
+            step="department_packets_selected",
+            context={"callback_data": callback_data},
+        )
+        await query.edit_message_text(
+            "🔄 Готовлю архив всех отделов...\n" "Это может занять некоторое время."
+        )
+        _start_background_export(
+            _process_department_packets_export(query, context, user_id), user_id
+        )
+        return ConversationHandler.END
+
     # Parse department name
     department = ExportCallbackData.parse_department(callback_data)
     if not department:
@@ -227,8 +271,10 @@ async def handle_department_selection(
         "Это может занять некоторое время."
     )
 
-    # Process department export
-    await _process_department_export(department, query, context, user_id)
+    # Process department export in the background
+    _start_background_export(
+        _process_department_export(department, query, context, user_id), user_id
+    )
 
     return ConversationHandler.END
 
@@ -271,6 +317,57 @@ async def cancel_export(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     return ConversationHandler.END
 
 
+def _start_background_export(
+    job: Coroutine[None, None, None], user_id: Optional[int]
+) -> "asyncio.Task[None]":
+    """
+    Render and upload an export without blocking the conversation handler.
+
+    The handler returns as soon as the job is scheduled; the job reports
+    progress and the result by editing the "preparing" message.
+
+    Args:
+        job: Export coroutine, e.g. ``_process_export_by_type(...)``
+        user_id: User ID for logging
+
+    Returns:
+        Task running the export
+    """
+    task = asyncio.get_running_loop().create_task(job)
+    _BACKGROUND_EXPORTS.add(task)
+
+    def _done(finished: "asyncio.Task[None]") -> None:
+        _BACKGROUND_EXPORTS.discard(finished)
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.error(
+                f"Background export failed for user {user_id}: "
+                f"{finished.exception()}"
+            )
+
+    task.add_done_callback(_done)
+    logger.debug(f"Started background export for user {user_id}")
+    return task
+
+
+async def wait_for_background_exports(timeout: Optional[float] = None) -> None:
+    """
+    Wait for running background exports, e.g. before the bot stops.
+
+    Args:
+        timeout: Seconds to wait before giving up; waits until all finished
+            when omitted
+    """
+    if not _BACKGROUND_EXPORTS:
+        return
+    pending = list(_BACKGROUND_EXPORTS)
+    logger.info(f"Waiting for {len(pending)} background exports to finish")
+    _, still_running = await asyncio.wait(pending, timeout=timeout)
+    if still_running:
+        logger.warning(
+            f"{len(still_running)} background exports did not finish in time"
+        )
+
+
 async def _process_export_by_type(
     export_type: str, query, context: ContextTypes.DEFAULT_TYPE, user_id: Optional[int]
 ) -> None:
@@ -283,74 +380,83 @@ async def _process_export_by_type(
         context: Telegram context
         user_id: User ID for logging
     """
+    export: Union[str, CSVExportFile]
     try:
         # Create progress callback
         async def progress_callback(current: int, total: int):
             # Simplified progress update for conversation context
-            if total > 0 and current % 50 == 0:  # Update every 50 items
-                percentage = int((current / total) * 100)
-                try:
-                    await query.edit_message_text(
+            if current % 50 == 0:  # Update every 50 items
+                if total > 0:
+                    percentage = int((current / total) * 100)
+                    text = (
                         f"🔄 Экспорт в процессе: {percentage}%\n"
                         f"Обработано: {current} из {total}"
                     )
+                else:
+                    # Total unknown while streaming: no percentage to show
+                    text = f"🔄 Экспорт в процессе...\nОбработано записей: {current}"
+                try:
+                    await query.edit_message_text(text)
                 except Exception as e:
                     logger.warning(f"Failed to update progress: {e}")
 
-        # Get appropriate export service based on type
-        if export_type == ExportCallbackData.EXPORT_ALL:
-            export_service = service_factory.get_export_service(
-                progress_callback=lambda c, t: asyncio.create_task(
-                    progress_callback(c, t)
+        with request_priority(RequestPriority.BACKGROUND):
+            # Get appropriate export service based on type
+            if export_type == ExportCallbackData.EXPORT_ALL:
+                export_service = service_factory.get_export_service(
+                    progress_callback=lambda c, t: asyncio.create_task(
+                        progress_callback(c, t)
+                    )
                 )
-            )
-            csv_data = await export_service.export_to_csv_async()
-            filename_prefix = "participants_all"
+                export = await export_service.get_all_participants_as_file()
+                filename_prefix = "participants_all"
 
-        elif export_type == ExportCallbackData.EXPORT_TEAM:
-            export_service = service_factory.get_export_service(
-                progress_callback=lambda c, t: asyncio.create_task(
-                    progress_callback(c, t)
+            elif export_type == ExportCallbackData.EXPORT_TEAM:
+                export_service = service_factory.get_export_service(
+                    progress_callback=lambda c, t: asyncio.create_task(
+                        progress_callback(c, t)
+                    )
                 )
-            )
-            csv_data = await export_service.get_participants_by_role_as_csv(Role.TEAM)
-            filename_prefix = "participants_team"
+                export = await export_service.get_participants_by_role_as_file(
+                    Role.TEAM
+                )
+                filename_prefix = "participants_team"
 
-        elif export_type == ExportCallbackData.EXPORT_CANDIDATES:
-            export_service = service_factory.get_export_service(
-                progress_callback=lambda c, t: asyncio.create_task(
-                    progress_callback(c, t)
+            elif export_type == ExportCallbackData.EXPORT_CANDIDATES:
+                export_service = service_factory.get_export_service(
+                    progress_callback=lambda c, t: asyncio.create_task(
+                        progress_callback(c, t)
+                    )
                 )
-            )
-            csv_data = await export_service.get_participants_by_role_as_csv(
-                Role.CANDIDATE
-            )
-            filename_prefix = "participants_candidates"
+                export = await export_service.get_participants_by_role_as_file(
+                    Role.CANDIDATE
+                )
+                filename_prefix = "participants_candidates"
 
-        elif export_type == ExportCallbackData.EXPORT_BIBLE_READERS:
-            export_service = service_factory.get_bible_readers_export_service(
-                progress_callback=lambda c, t: asyncio.create_task(
-                    progress_callback(c, t)
+            elif export_type == ExportCallbackData.EXPORT_BIBLE_READERS:
+                export_service = service_factory.get_bible_readers_export_service(
+                    progress_callback=lambda c, t: asyncio.create_task(
+                        progress_callback(c, t)
+                    )
                 )
-            )
-            csv_data = await export_service.export_to_csv_async()
-            filename_prefix = "bible_readers"
+                export = await export_service.export_to_csv_async()
+                filename_prefix = "bible_readers"
 
-        elif export_type == ExportCallbackData.EXPORT_ROE:
-            export_service = service_factory.get_roe_export_service(
-                progress_callback=lambda c, t: asyncio.create_task(
-                    progress_callback(c, t)
+            elif export_type == ExportCallbackData.EXPORT_ROE:
+                export_service = service_factory.get_roe_export_service(
+                    progress_callback=lambda c, t: asyncio.create_task(
+                        progress_callback(c, t)
+                    )
                 )
-            )
-            csv_data = await export_service.export_to_csv_async()
-            filename_prefix = "roe_sessions"
+                export = await export_service.export_to_csv_async()
+                filename_prefix = "roe_sessions"
 
-        else:
-            await query.edit_message_text("❌ Неизвестный тип экспорта.")
-            return
+            else:
+                await query.edit_message_text("❌ Неизвестный тип экспорта.")
+                return
 
         # Send the file
-        await _send_export_file(csv_data, filename_prefix, query, user_id)
+        await _send_export_file(export, filename_prefix, query, user_id)
 
     except Exception as e:
         logger.error(f"Export failed for user {user_id}: {e}")
@@ -375,29 +481,38 @@ async def _process_department_export(
     try:
         # Create progress callback
         async def progress_callback(current: int, total: int):
-            if (
-                total > 0 and current % 25 == 0
-            ):  # Update every 25 items for smaller datasets
-                percentage = int((current / total) * 100)
-                try:
-                    await query.edit_message_text(
+            if current % 25 == 0:  # Update every 25 items for smaller datasets
+                if total > 0:
+                    percentage = int((current / total) * 100)
+                    text = (
                         f"🔄 Экспорт отдела '{department}': {percentage}%\n"
                         f"Обработано: {current} из {total}"
                     )
+                else:
+                    # Total unknown while streaming: no percentage to show
+                    text = (
+                        f"🔄 Экспорт отдела '{department}'...\n"
+                        f"Обработано записей: {current}"
+                    )
+                try:
+                    await query.edit_message_text(text)
                 except Exception as e:
                     logger.warning(f"Failed to update progress: {e}")
 
-        # Get participant export service with department filtering
-        export_service = service_factory.get_export_service(
-            progress_callback=lambda c, t: asyncio.create_task(progress_callback(c, t))
-        )
-        csv_data = await export_service.get_participants_by_department_as_csv(
-            Department(department)
-        )
+        with request_priority(RequestPriority.BACKGROUND):
+            # Get participant export service with department filtering
+            export_service = service_factory.get_export_service(
+                progress_callback=lambda c, t: asyncio.create_task(
+                    progress_callback(c, t)
+                )
+            )
+            export = await export_service.get_participants_by_department_as_file(
+                Department(department)
+            )
 
         # Send the file
         filename_prefix = f"participants_{department.lower()}"
-        await _send_export_file(csv_data, filename_prefix, query, user_id)
+        await _send_export_file(export, filename_prefix, query, user_id)
 
     except Exception as e:
         logger.error(f"Department export failed for user {user_id}: {e}")
@@ -407,6 +522,133 @@ async def _process_department_export(
         )
 
 
+async def _process_department_packets_export(
+    query, context: ContextTypes.DEFAULT_TYPE, user_id: Optional[int]
+) -> None:
+    """
+    Process the export of all departments and roles as one ZIP archive.
+
+    Args:
+        query: Telegram callback query
+        context: Telegram context
+        user_id: User ID for logging
+    """
+    try:
+        # Create progress callback
+        async def progress_callback(current: int, total: int):
+            if total > 0 and current % 50 == 0:  # Update every 50 items
+                percentage = int((current / total) * 100)
+                try:
+                    await query.edit_message_text(
+                        f"🔄 Архив отделов: {percentage}%\n"
+                        f"Обработано: {current} из {total}"
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to update progress: {e}")
+
+        with request_priority(RequestPriority.BACKGROUND):
+            export_service = service_factory.get_export_service(
+                progress_callback=lambda c, t: asyncio.create_task(
+                    progress_callback(c, t)
+                )
+            )
+            export = await export_service.get_department_packets_as_zip()
+
+        await _send_export_file(export, "participants_departments", query, user_id)
+
+    except Exception as e:
+        logger.error(f"Department packets export failed for user {user_id}: {e}")
+        await query.edit_message_text(
+            "❌ Ошибка при экспорте архива отделов.\n"
+            "Пожалуйста, попробуйте позже или обратитесь к администратору."
+        )
+
+
+async def _process_retreat_packet_export(
+    query, context: ContextTypes.DEFAULT_TYPE, user_id: Optional[int]
+) -> None:
+    """
+    Process the full retreat packet export of all tables as one ZIP archive.
+
+    Args:
+        query: Telegram callback query
+        context: Telegram context
+        user_id: User ID for logging
+    """
+    try:
+        # Create progress callback
+        async def progress_callback(current: int, total: int):
+            if current % 50 == 0:  # Update every 50 items
+                if total > 0:
+                    percentage = int((current / total) * 100)
+                    text = (
+                        f"🔄 Полный пакет: {percentage}%\n"
+                        f"Обработано: {current} из {total}"
+                    )
+                else:
+                    # Total unknown while streaming: no percentage to show
+                    text = f"🔄 Полный пакет...\nОбработано записей: {current}"
+                try:
+                    await query.edit_message_text(text)
+                except Exception as e:
+                    logger.warning(f"Failed to update progress: {e}")
+
+        with request_priority(RequestPriority.BACKGROUND):
+            orchestrator = service_factory.get_retreat_packet_orchestrator(
+                progress_callback=lambda c, t: asyncio.create_task(
+                    progress_callback(c, t)
+                )
+            )
+            export = await orchestrator.run_as_zip(count_from="participants.csv")
+
+        await _send_export_file(export, "retreat_packet", query, user_id)
+
+    except Exception as e:
+        logger.error(f"Retreat packet export failed for user {user_id}: {e}")
+        await query.edit_message_text(
+            "❌ Ошибка при экспорте полного пакета.\n"
+            "Пожалуйста, попробуйте позже или обратитесь к администратору."
+        )
+
+
+async def _process_changes_export(query, user_id: Optional[int]) -> None:
+    """
+    Process the export of participants changed since the last delta export.
+
+    The admin's watermark is advanced only after the file was delivered.
+
+    Args:
+        query: Telegram callback query
+        user_id: User ID, the scope of the delta watermark
+    """
+    scope = f"user:{user_id}"
+    try:
+        with request_priority(RequestPriority.BACKGROUND):
+            export_service = service_factory.get_export_service()
+            delta = await export_service.get_changed_participants_as_file(scope)
+
+        if delta.export.row_count == 0:
+            delta.export.close()
+            export_service.mark_changes_exported(scope, delta)
+            await query.edit_message_text(
+                "✅ С прошлой выгрузки изменений нет.\n"
+                "Попробуйте позже или выберите полный экспорт."
+            )
+            return
+
+        if await _send_export_file(
+            delta.export, "participants_changes", query, user_id
+        ):
+            export_service.mark_changes_exported(scope, delta)
+
+    except Exception as e:
+        logger.error(f"Changes export failed for user {user_id}: {e}")
+        await query.edit_message_text(
+            "❌ Ошибка при экспорте изменений.\n"
+            "Пожалуйста, попробуйте позже или обратитесь к администратору."
+        )
+
+
 def _get_export_type_from_filename_prefix(filename_prefix: str) -> Optional[str]:
     """
     Map filename prefix to export type for Russian descriptions.
@@ -423,6 +665,8 @@ def _get_export_type_from_filename_prefix(filename_prefix: str) -> Optional[str]
         "participants_candidates": "candidates",
         "bible_readers": "bible_readers",
         "roe_sessions": "roe",
+        "retreat_packet": "retreat_packet",
+        "participants_changes": "changes",
     }
 
     # Handle department exports (e.g., "participants_admin", "participants_roe")
@@ -435,68 +679,118 @@ def _get_export_type_from_filename_prefix(filename_prefix: str) -> Optional[str]
     return prefix_to_type.get(filename_prefix)
 
 
-async def _send_export_file(
-    csv_data: str, filename_prefix: str, query, user_id: Optional[int]
+async def _reply_with_export_document(
+    query, export: CSVExportFile, filename: str, caption: str
 ) -> None:
     """
-    Send CSV file to user via Telegram.
+    Send an export document, re-using an earlier upload when possible.
+
+    Cached exports that were uploaded before are re-sent by Telegram
+    ``file_id``. Files of cached exports uploaded for the first time have
+    their ``file_id`` remembered for the next admin.
 
     Args:
-        csv_data: CSV content
+        query: Telegram callback query
+        export: Export file to send
+        filename: Filename for uploads
+        caption: Document caption
+    """
+    digest = export.digest
+    cache = service_factory.get_export_artifact_cache() if digest else None
+
+    if export.file_id:
+        try:
+            await query.message.reply_document(
+                document=export.file_id, filename=filename, caption=caption
+            )
+            return
+        except TelegramError as e:
+            logger.warning(f"Re-sending export by file_id failed, uploading: {e}")
+            if cache is not None and digest:
+                cache.forget_file_id(digest)
+
+    message = await query.message.reply_document(
+        document=export.file, filename=filename, caption=caption
+    )
+
+    if cache is not None and digest and isinstance(message, Message):
+        if message.document:
+            cache.remember_file_id(digest, message.document.file_id)
+
+
+async def _send_export_file(
+    export: Union[str, CSVExportFile],
+    filename_prefix: str,
+    query,
+    user_id: Optional[int],
+    file_extension: Optional[str] = None,
+) -> bool:
+    """
+    Send an export file to user via Telegram.
+
+    Export files are uploaded as written, using the row count and size
+    recorded by the exporter; CSV strings are wrapped into a file first.
+    Exports over Telegram's upload limit are sent zipped or in parts.
+
+    Args:
+        export: Export file or CSV content
         filename_prefix: Prefix for filename
         query: Telegram callback query
         user_id: User ID for logging
+        file_extension: Extension of the uploaded file; defaults to the
+            extension of the export's format
+
+    Returns:
+        True if the file was delivered
     """
+    if isinstance(export, str):
+        export = CSVExportFile.from_text(export if export.strip() else "")
+
     # Check if data is empty
-    if not csv_data or csv_data.strip() == "":
+    if export.byte_size == 0:
+        export.close()
         await query.edit_message_text(
             "📭 Нет данных для экспорта.\n" "Попробуйте выбрать другой тип экспорта."
         )
-        return
+        return False
 
-    # Create temporary file
-    temp_file_path = None
+    delivered = False
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".csv",
-            prefix=(
-                f"{filename_prefix}_" f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_"
-            ),
-            delete=False,
-            encoding="utf-8-sig",
-        ) as temp_file:
-            temp_file.write(csv_data)
-            temp_file_path = temp_file.name
-
-        # Send file
-        file_size_mb = Path(temp_file_path).stat().st_size / (1024 * 1024)
-
-        with open(temp_file_path, "rb") as file:
-            ts_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-
-            # Get export type for Russian description
-            export_type = _get_export_type_from_filename_prefix(filename_prefix)
-
-            # Format success message with participant count and Russian description
-            caption = format_export_success_message(
-                base_message="✅ Экспорт завершен успешно!",
-                file_size_mb=file_size_mb,
-                timestamp=f"{ts_utc} UTC",
-                csv_data=csv_data,
-                export_type=export_type,
-            )
+        file_size_mb = export.size_mb
+        ts_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+        # Get export type for Russian description
+        export_type = _get_export_type_from_filename_prefix(filename_prefix)
+
+        # Format success message with participant count and Russian description
+        caption = format_export_success_message(
+            base_message="✅ Экспорт завершен успешно!",
+            file_size_mb=file_size_mb,
+            timestamp=f"{ts_utc} UTC",
+            participant_count=export.row_count,
+            export_type=export_type,
+        )
 
-            # Generate human-readable filename
-            readable_filename = generate_readable_export_filename(
-                export_type or "export"
-            )
+        # Generate human-readable filename
+        readable_filename = generate_readable_export_filename(
+            export_type or "export",
+            extension=file_extension or export.extension,
+        )
 
-            await query.message.reply_document(
-                document=file,
-                filename=readable_filename,
-                caption=caption,
-            )
+        # Exports over Telegram's limit are compressed or split into parts
+        deliveries = prepare_telegram_delivery(export, readable_filename)
+        try:
+            for index, (filename, delivery) in enumerate(deliveries, start=1):
+                part_caption = caption
+                if len(deliveries) > 1:
+                    part_caption += f"\n📦 Часть {index} из {len(deliveries)}"
+                await _reply_with_export_document(
+                    query, delivery, filename, part_caption
+                )
+        finally:
+            for _, delivery in deliveries:
+                delivery.close()
+        delivered = True
 
         # Update final message
         await query.edit_message_text(
@@ -521,19 +815,13 @@ async def _send_export_file(
         )
 
     except Exception as e:
+        export.close()
         logger.error(f"Failed to send export file for user {user_id}: {e}")
-        await query.edit_message_text(
-            "❌ Ошибка при отправке файла.\n" "Попробуйте повторить экспорт."
-        )
-
-    finally:
-        # Clean up temporary file
-        if temp_file_path and Path(temp_file_path).exists():
-            try:
-                Path(temp_file_path).unlink()
-                logger.debug(f"Cleaned up temporary file: {temp_file_path}")
-            except Exception as e:
-                logger.warning(f"Failed to delete temporary file {temp_file_path}: {e}")
+        if not delivered:
+            await query.edit_message_text(
+                "❌ Ошибка при отправке файла.\n" "Попробуйте повторить экспорт."
+            )
+    return delivered
 
 
 def get_export_conversation_handler() -> ConversationHandler:
@@ -568,7 +856,9 @@ def get_export_conversation_handler() -> ConversationHandler:
                         f"{ExportCallbackData.EXPORT_CANDIDATES}|"
                         f"{ExportCallbackData.EXPORT_BY_DEPARTMENT}|"
                         f"{ExportCallbackData.EXPORT_BIBLE_READERS}|"
-                        f"{ExportCallbackData.EXPORT_ROE})$",
+                        f"{ExportCallbackData.EXPORT_ROE}|"
+                        f"{ExportCallbackData.EXPORT_RETREAT_PACKET}|"
+                        f"{ExportCallbackData.EXPORT_CHANGES})$",
                     ),
                 ],
                 ExportStates.SELECTING_DEPARTMENT: [
@@ -576,6 +866,7 @@ def get_export_conversation_handler() -> ConversationHandler:
                         handle_department_selection,
                         pattern=(
                             f"^(export:department:.+|"
+                            f"{ExportCallbackData.EXPORT_DEPARTMENT_PACKETS}|"
                             f"{ExportCallbackData.BACK_TO_EXPORT_SELECTION})$"
                         ),
                     ),
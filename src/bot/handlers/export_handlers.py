@@ -7,9 +7,7 @@ with admin-only access control and progress notifications.
 
 import asyncio
 import logging
-import tempfile
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Optional
 
 from telegram import Message, Update
@@ -20,27 +18,17 @@ from telegram.ext import ContextTypes
 from src.bot.handlers.export_conversation_handlers import start_export_selection
 from src.services import service_factory
 from src.services.user_interaction_logger import UserInteractionLogger
-from src.utils.auth_utils import is_admin_user
-from src.utils.export_utils import format_export_success_message
+from src.utils.auth_utils import is_admin_user_async
+from src.utils.columnar_export import ExportFormat
+from src.utils.export_utils import (
+    CSVExportFile,
+    format_export_success_message,
+    prepare_telegram_delivery,
+)
 
 logger = logging.getLogger(__name__)
 
 
-async def _cleanup_temp_file(file_path: str) -> None:
-    """
-    Clean up temporary file with proper error handling.
-
-    Args:
-        file_path: Path to the temporary file to delete
-    """
-    try:
-        if file_path and Path(file_path).exists():
-            Path(file_path).unlink()
-            logger.debug(f"Successfully cleaned up temporary file: {file_path}")
-    except Exception as e:
-        logger.warning(f"Failed to delete temporary file {file_path}: {e}")
-
-
 class ExportProgressTracker:
     """Track and throttle export progress notifications."""
 
@@ -91,12 +79,16 @@ class ExportProgressTracker:
                 self.last_update = now
                 self.last_percentage = percentage
 
-                progress_bar = self._create_progress_bar(percentage)
-                text = (
-                    f"📊 Экспорт данных...\n\n"
-                    f"{progress_bar}\n"
-                    f"Прогресс: {percentage}% ({current}/{total})"
-                )
+                if total == 0:
+                    # Total unknown while streaming: no percentage to show
+                    text = f"📊 Экспорт данных...\n\nОбработано записей: {current}"
+                else:
+                    progress_bar = self._create_progress_bar(percentage)
+                    text = (
+                        f"📊 Экспорт данных...\n\n"
+                        f"{progress_bar}\n"
+                        f"Прогресс: {percentage}% ({current}/{total})"
+                    )
 
                 try:
                     # Send once, then edit the same message to avoid spamming the chat
@@ -156,7 +148,7 @@ async def handle_export_command(
         return
 
     # Check admin access
-    if not is_admin_user(user_id, settings):
+    if not await is_admin_user_async(user_id, settings):
         logger.warning(
             f"Unauthorized export attempt by user {username} (ID: {user_id})"
         )
@@ -192,45 +184,36 @@ async def handle_export_command(
             progress_callback=lambda c, t: asyncio.create_task(progress_callback(c, t))
         )
 
-        # Check estimated file size
+        # Exports over Telegram's limit are sent zipped or in parts
         if not await export_service.is_within_telegram_limit():
             estimated_size_mb = await export_service.estimate_file_size() / (
                 1024 * 1024
             )
             await update.message.reply_text(
-                f"⚠️ Предупреждение: Файл может превышать лимит Telegram (50MB).\n"
+                f"⚠️ Файл превышает лимит Telegram (50MB).\n"
                 f"Приблизительный размер: {estimated_size_mb:.1f}MB\n"
-                f"Попробую отправить, но возможна ошибка."
+                f"Файл будет отправлен архивом или несколькими частями."
             )
 
-        # Export data to CSV
-        csv_data = await export_service.export_to_csv_async()
+        # Export data straight into a file
+        export = await export_service.get_all_participants_as_file(ExportFormat.CSV)
 
         # Check if data is empty
-        if not csv_data or csv_data.strip() == "":
+        if export.byte_size == 0:
+            export.close()
             await update.message.reply_text(
                 "📭 Нет данных для экспорта.\n" "База данных участников пуста."
             )
             return
 
-        # Create temporary file
-        temp_file_path = None
+        file_size_mb = export.size_mb
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".csv",
-                prefix=(
-                    f"participants_export_"
-                    f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_"
-                ),
-                delete=False,
-                # Write with UTF-8 BOM to ensure Excel correctly detects encoding
-                encoding="utf-8-sig",
-            ) as temp_file:
-                temp_file.write(csv_data)
-                temp_file_path = temp_file.name
+            deliveries = prepare_telegram_delivery(
+                export,
+                f"participants_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            )
         except Exception as e:
-            logger.error(f"Failed to create temporary file for user {user_id}: {e}")
+            logger.error(f"Failed to create export file for user {user_id}: {e}")
             await update.message.reply_text(
                 "❌ Ошибка при создании файла для экспорта\n\n"
                 "Попробуйте повторить команду позже или обратитесь к администратору."
@@ -238,165 +221,50 @@ async def handle_export_command(
             return
 
         try:
-            # Send file to user with comprehensive error handling
-            file_size_mb = Path(temp_file_path).stat().st_size / (1024 * 1024)
-
-            # Check file size limit before attempting upload
-            if file_size_mb > 50:
-                await update.message.reply_text(
-                    f"❌ Файл слишком большой для отправки через Telegram\n\n"
-                    f"📁 Размер файла: {file_size_mb:.2f}MB\n"
-                    f"📏 Лимит Telegram: 50MB\n\n"
-                    f"💡 Рекомендации:\n"
-                    f"• Попробуйте экспортировать меньше данных\n"
-                    f"• Обратитесь к администратору для получения файла"
-                )
-                return
-
-            max_retries = 3
-            retry_delay = 2
-
-            for attempt in range(max_retries):
-                try:
-                    with open(temp_file_path, "rb") as file:
-                        # Prepare UTC timestamp for caption
-                        ts_utc = datetime.now(timezone.utc).strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        )
-
-                        # Format success message with participant count
-                        base_msg = (
-                            "✅ Экспорт завершен успешно!\n\n"
-                            "📊 Файл содержит данные всех участников"
-                        )
-                        caption = format_export_success_message(
-                            base_message=base_msg,
-                            file_size_mb=file_size_mb,
-                            timestamp=f"{ts_utc} UTC",
-                            csv_data=csv_data,
-                            # Legacy all-participants export - no specific type
-                            export_type=None,
-                        )
-
-                        await update.message.reply_document(
-                            document=file,
-                            filename=(
-                                f"participants_"
-                                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                            ),
-                            caption=caption,
-                        )
-
-                    logger.info(
-                        f"Export completed successfully for user {username} "
-                        f"(ID: {user_id}). File size: {file_size_mb:.2f}MB"
-                    )
-
-                    # Log successful export
-                    interaction_logger.log_journey_step(
-                        user_id=user_id,
-                        step="export_completed_successfully",
-                        context={
-                            "file_size_mb": round(file_size_mb, 2),
-                            "delivery_method": "telegram_document",
-                            "attempt": attempt + 1,
-                        },
-                    )
-                    break  # Success, exit retry loop
-
-                except RetryAfter as e:
-                    if attempt < max_retries - 1:
-                        wait_time = e.retry_after + retry_delay
-                        logger.warning(
-                            f"Telegram rate limit hit, waiting {wait_time}s before "
-                            f"retry {attempt + 1}/{max_retries}"
-                        )
-                        await update.message.reply_text(
-                            f"⏳ Telegram временно ограничивает загрузки\n"
-                            f"Повторная попытка через {wait_time} секунд..."
-                        )
-                        await asyncio.sleep(wait_time)
-                    else:
-                        raise
+            # Prepare UTC timestamp for caption
+            ts_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
-                except BadRequest as e:
-                    error_message = str(e).lower()
-                    error_type = "unknown_bad_request"
-
-                    if (
-                        "file too large" in error_message
-                        or "entity too large" in error_message
-                    ):
-                        error_type = "file_too_large"
-                        await update.message.reply_text(
-                            f"❌ Файл слишком большой для Telegram\n\n"
-                            f"📁 Размер: {file_size_mb:.2f}MB\n"
-                            f"🚫 Ошибка: {str(e)}\n\n"
-                            f"Попробуйте уменьшить объем экспортируемых данных."
-                        )
-                    elif "invalid file" in error_message:
-                        error_type = "invalid_file_format"
-                        await update.message.reply_text(
-                            f"❌ Ошибка формата файла\n\n"
-                            f"🚫 Детали: {str(e)}\n\n"
-                            f"Попробуйте повторить экспорт."
-                        )
-                    else:
-                        await update.message.reply_text(
-                            f"❌ Ошибка при отправке файла\n\n"
-                            f"🚫 Причина: {str(e)}\n\n"
-                            f"Попробуйте повторить экспорт позже."
-                        )
-
-                    # Log error details
-                    interaction_logger.log_missing_response(
-                        user_id=user_id,
-                        button_data="export_command",
-                        error_type=error_type,
-                        error_message=f"BadRequest: {str(e)}",
-                    )
+            # Format success message with participant count
+            base_msg = (
+                "✅ Экспорт завершен успешно!\n\n"
+                "📊 Файл содержит данные всех участников"
+            )
+            caption = format_export_success_message(
+                base_message=base_msg,
+                file_size_mb=file_size_mb,
+                timestamp=f"{ts_utc} UTC",
+                participant_count=export.row_count,
+                # Legacy all-participants export - no specific type
+                export_type=None,
+            )
 
-                    logger.error(
-                        f"BadRequest during file upload for user {user_id}: {e}"
-                    )
+            for index, (filename, delivery) in enumerate(deliveries, start=1):
+                part_caption = caption
+                if len(deliveries) > 1:
+                    part_caption += f"\n📦 Часть {index} из {len(deliveries)}"
+                if not await _send_export_document(
+                    update, delivery, filename, part_caption, interaction_logger
+                ):
                     return
+        finally:
+            for _, delivery in deliveries:
+                delivery.close()
 
-                except NetworkError as e:
-                    if attempt < max_retries - 1:
-                        logger.warning(
-                            f"Network error during file upload, retrying "
-                            f"{attempt + 1}/{max_retries}: {e}"
-                        )
-                        await update.message.reply_text(
-                            f"🌐 Проблемы с сетью, повторная попытка "
-                            f"{attempt + 1}/{max_retries}..."
-                        )
-                        await asyncio.sleep(retry_delay * (attempt + 1))
-                    else:
-                        await update.message.reply_text(
-                            "❌ Ошибка сети при отправке файла\n\n"
-                            "🌐 Попробуйте повторить команду через несколько минут\n\n"
-                            "Если проблема продолжается, обратитесь к администратору."
-                        )
-                        logger.error(
-                            f"Persistent network error for user {user_id}: {e}"
-                        )
-                        return
-
-                except TelegramError as e:
-                    await update.message.reply_text(
-                        f"❌ Ошибка Telegram API\n\n"
-                        f"🚫 Детали: {str(e)}\n\n"
-                        f"Попробуйте повторить экспорт через несколько минут."
-                    )
-                    logger.error(
-                        f"Telegram API error during file upload for user {user_id}: {e}"
-                    )
-                    return
+        logger.info(
+            f"Export completed successfully for user {username} "
+            f"(ID: {user_id}). File size: {file_size_mb:.2f}MB"
+        )
 
-        finally:
-            # Clean up temporary file - always execute
-            await _cleanup_temp_file(temp_file_path)
+        # Log successful export
+        interaction_logger.log_journey_step(
+            user_id=user_id,
+            step="export_completed_successfully",
+            context={
+                "file_size_mb": round(file_size_mb, 2),
+                "delivery_method": "telegram_document",
+                "parts": len(deliveries),
+            },
+        )
 
     except Exception as e:
         logger.error(f"Export failed for user {username} (ID: {user_id}): {e}")
@@ -407,6 +275,126 @@ async def handle_export_command(
         )
 
 
+async def _send_export_document(
+    update: Update,
+    export: CSVExportFile,
+    filename: str,
+    caption: str,
+    interaction_logger: UserInteractionLogger,
+) -> bool:
+    """
+    Upload one export file, retrying rate limits and network errors.
+
+    Errors are reported to the user and logged.
+
+    Args:
+        update: Telegram update object
+        export: Export file to upload
+        filename: Filename of the upload
+        caption: Document caption
+        interaction_logger: Logger for the user's journey
+
+    Returns:
+        True if the file was uploaded
+    """
+    user_id = update.effective_user.id if update.effective_user else None
+    max_retries = 3
+    retry_delay = 2
+
+    for attempt in range(max_retries):
+        try:
+            export.file.seek(0)
+            await update.message.reply_document(
+                document=export.file, filename=filename, caption=caption
+            )
+            return True
+
+        except RetryAfter as e:
+            if attempt < max_retries - 1:
+                wait_time = e.retry_after + retry_delay
+                logger.warning(
+                    f"Telegram rate limit hit, waiting {wait_time}s before "
+                    f"retry {attempt + 1}/{max_retries}"
+                )
+                await update.message.reply_text(
+                    f"⏳ Telegram временно ограничивает загрузки\n"
+                    f"Повторная попытка через {wait_time} секунд..."
+                )
+                await asyncio.sleep(wait_time)
+            else:
+                raise
+
+        except BadRequest as e:
+            error_message = str(e).lower()
+            error_type = "unknown_bad_request"
+
+            if "file too large" in error_message or "entity too large" in error_message:
+                error_type = "file_too_large"
+                await update.message.reply_text(
+                    f"❌ Файл слишком большой для Telegram\n\n"
+                    f"📁 Размер: {export.size_mb:.2f}MB\n"
+                    f"🚫 Ошибка: {str(e)}\n\n"
+                    f"Попробуйте уменьшить объем экспортируемых данных."
+                )
+            elif "invalid file" in error_message:
+                error_type = "invalid_file_format"
+                await update.message.reply_text(
+                    f"❌ Ошибка формата файла\n\n"
+                    f"🚫 Детали: {str(e)}\n\n"
+                    f"Попробуйте повторить экспорт."
+                )
+            else:
+                await update.message.reply_text(
+                    f"❌ Ошибка при отправке файла\n\n"
+                    f"🚫 Причина: {str(e)}\n\n"
+                    f"Попробуйте повторить экспорт позже."
+                )
+
+            # Log error details
+            interaction_logger.log_missing_response(
+                user_id=user_id,
+                button_data="export_command",
+                error_type=error_type,
+                error_message=f"BadRequest: {str(e)}",
+            )
+
+            logger.error(f"BadRequest during file upload for user {user_id}: {e}")
+            return False
+
+        except NetworkError as e:
+            if attempt < max_retries - 1:
+                logger.warning(
+                    f"Network error during file upload, retrying "
+                    f"{attempt + 1}/{max_retries}: {e}"
+                )
+                await update.message.reply_text(
+                    f"🌐 Проблемы с сетью, повторная попытка "
+                    f"{attempt + 1}/{max_retries}..."
+                )
+                await asyncio.sleep(retry_delay * (attempt + 1))
+            else:
+                await update.message.reply_text(
+                    "❌ Ошибка сети при отправке файла\n\n"
+                    "🌐 Попробуйте повторить команду через несколько минут\n\n"
+                    "Если проблема продолжается, обратитесь к администратору."
+                )
+                logger.error(f"Persistent network error for user {user_id}: {e}")
+                return False
+
+        except TelegramError as e:
+            await update.message.reply_text(
+                f"❌ Ошибка Telegram API\n\n"
+                f"🚫 Детали: {str(e)}\n\n"
+                f"Попробуйте повторить экспорт через несколько минут."
+            )
+            logger.error(
+                f"Telegram API error during file upload for user {user_id}: {e}"
+            )
+            return False
+
+    return False
+
+
 async def handle_export_progress(message: Message, current: int, total: int) -> None:
     """
     Handle export progress notification.
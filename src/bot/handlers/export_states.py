@@ -26,6 +26,11 @@ class ExportCallbackData:
     EXPORT_BY_DEPARTMENT = "export:by_department"
     EXPORT_BIBLE_READERS = "export:bible_readers"
     EXPORT_ROE = "export:roe"
+    EXPORT_RETREAT_PACKET = "export:retreat_packet"
+    EXPORT_CHANGES = "export:changes"
+
+    # All departments and roles as one archive (department selection menu)
+    EXPORT_DEPARTMENT_PACKETS = "export:department_packets"
 
     # Navigation
     CANCEL = "export:cancel"
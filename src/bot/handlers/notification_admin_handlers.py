@@ -21,7 +21,7 @@ from src.services.daily_notification_service import (
 )
 from src.services.service_factory import get_participant_repository
 from src.services.statistics_service import StatisticsService
-from src.utils.auth_utils import is_admin_user
+from src.utils.auth_utils import is_admin_user_async
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +55,7 @@ async def handle_notifications_command(
         return
 
     # Check admin permission
-    if not is_admin_user(user.id, settings):
+    if not await is_admin_user_async(user.id, settings):
         await message.reply_text(
             "🚫 У вас нет прав для управления уведомлениями о статистике."
         )
@@ -173,7 +173,7 @@ async def handle_set_notification_time_command(
         return
 
     # Check admin permission
-    if not is_admin_user(user.id, settings):
+    if not await is_admin_user_async(user.id, settings):
         await message.reply_text("🚫 У вас нет прав для настройки времени уведомлений.")
         return
 
@@ -293,7 +293,7 @@ async def handle_test_stats_command(
         return
 
     # Check admin permission
-    if not is_admin_user(user.id, settings):
+    if not await is_admin_user_async(user.id, settings):
         await message.reply_text(
             "🚫 У вас нет прав для тестирования уведомлений о статистике."
         )
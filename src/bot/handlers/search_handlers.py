@@ -36,7 +36,7 @@ from src.services.service_factory import get_participant_repository
 from src.services.user_interaction_logger import get_user_interaction_logger
 from src.utils.access_control import require_viewer_or_above
 from src.utils.auth_cache import get_authorization_cache
-from src.utils.auth_utils import get_user_role
+from src.utils.auth_utils import get_user_role_async
 from src.utils.participant_filter import filter_participants_by_role
 
 logger = logging.getLogger(__name__)
@@ -291,7 +291,7 @@ async def process_name_search(
     auth_cache = get_authorization_cache()
     cached_role, cache_state = auth_cache.get(user.id)
 
-    user_role = get_user_role(user.id, settings)
+    user_role = await get_user_role_async(user.id, settings)
     logger.info(f"User {user.id} (role: {user_role}) searching for: '{query}'")
 
     # Dynamic role update detection: invalidate cache to ensure fresh role resolution
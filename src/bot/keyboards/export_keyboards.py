@@ -12,7 +12,7 @@ from src.bot.handlers.export_states import ExportCallbackData
 
 def get_export_selection_keyboard() -> InlineKeyboardMarkup:
     """
-    Get export selection inline keyboard with 6 export options.
+    Get export selection inline keyboard with 8 export options.
 
     Provides buttons for users to choose between different export types:
     - Export All Participants (current functionality)
@@ -21,6 +21,8 @@ def get_export_selection_keyboard() -> InlineKeyboardMarkup:
     - Export by Department (department selection submenu)
     - Export Bible Readers (BibleReaders table)
     - Export ROE Sessions (ROE table)
+    - Export Full Retreat Packet (all three tables as one archive)
+    - Export Changes (participants changed since the admin's last delta)
 
     Returns:
         InlineKeyboardMarkup with export option buttons and cancel
@@ -57,7 +59,18 @@ def get_export_selection_keyboard() -> InlineKeyboardMarkup:
                 "🎯 Экспорт ROE", callback_data=ExportCallbackData.EXPORT_ROE
             ),
         ],
-        # Row 4: Navigation
+        # Row 4: Combined and incremental exports
+        [
+            InlineKeyboardButton(
+                "📦 Полный пакет (ZIP)",
+                callback_data=ExportCallbackData.EXPORT_RETREAT_PACKET,
+            ),
+            InlineKeyboardButton(
+                "🔁 Изменения",
+                callback_data=ExportCallbackData.EXPORT_CHANGES,
+            ),
+        ],
+        # Row 5: Navigation
         [
             InlineKeyboardButton("❌ Отмена", callback_data=ExportCallbackData.CANCEL),
         ],
@@ -71,7 +84,8 @@ def get_department_selection_keyboard() -> InlineKeyboardMarkup:
     Get department selection inline keyboard with all 13 departments.
 
     Provides buttons for users to select specific department for
-    participant export filtering. Layout optimized for mobile.
+    participant export filtering, plus one button exporting all departments
+    as a single archive. Layout optimized for mobile.
 
     Returns:
         InlineKeyboardMarkup with department buttons and navigation
@@ -117,6 +131,16 @@ def get_department_selection_keyboard() -> InlineKeyboardMarkup:
 
         keyboard.append(row)
 
+    # Add all-departments archive row
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                "📦 Все отделы (ZIP)",
+                callback_data=ExportCallbackData.EXPORT_DEPARTMENT_PACKETS,
+            )
+        ]
+    )
+
     # Add navigation row
     navigation_row = [
         InlineKeyboardButton(
@@ -11,7 +11,17 @@ import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Union,
+)
 
 import pytz
 
@@ -21,6 +31,83 @@ if TYPE_CHECKING:  # For type hints without import-time dependency
     from src.services.file_logging_service import FileLoggingConfig
 
 
+# Role hierarchy levels, higher values grant more access
+ROLE_LEVELS: Mapping[str, int] = MappingProxyType(
+    {"viewer": 1, "coordinator": 2, "admin": 3}
+)
+
+# TelegramSettings fields whose changes rebuild the role map
+_ROLE_ID_FIELDS = ("admin_user_ids", "coordinator_user_ids", "viewer_user_ids")
+
+
+@dataclass(frozen=True)
+class RoleMap:
+    """
+    Frozen lookup of the highest role of every allowlisted user.
+
+    Built once from the role allowlists so authorization checks are one hash
+    lookup instead of scans of the ID lists.
+    """
+
+    roles: Mapping[int, str]
+    admin_ids: FrozenSet[int]
+    coordinator_ids: FrozenSet[int]
+    viewer_ids: FrozenSet[int]
+
+    @classmethod
+    def from_ids(
+        cls,
+        admin_ids: Iterable[int],
+        coordinator_ids: Iterable[int],
+        viewer_ids: Iterable[int],
+    ) -> "RoleMap":
+        """
+        Build the map from role allowlists.
+
+        Users listed under several roles get the highest one.
+
+        Args:
+            admin_ids: Admin user IDs
+            coordinator_ids: Coordinator user IDs
+            viewer_ids: Viewer user IDs
+
+        Returns:
+            Role map
+        """
+        admins = frozenset(admin_ids)
+        coordinators = frozenset(coordinator_ids)
+        viewers = frozenset(viewer_ids)
+        roles: Dict[int, str] = {}
+        # Lowest role first so higher roles overwrite it
+        for role, user_ids in (
+            ("viewer", viewers),
+            ("coordinator", coordinators),
+            ("admin", admins),
+        ):
+            roles.update(dict.fromkeys(user_ids, role))
+        return cls(MappingProxyType(roles), admins, coordinators, viewers)
+
+    def role_of(self, user_id: int) -> Optional[str]:
+        """Return the highest role of a user, or None if not allowlisted."""
+        return self.roles.get(user_id)
+
+    def has_access(self, user_id: int, required_role: str) -> bool:
+        """
+        Check if a user has the required role or a higher one.
+
+        Args:
+            user_id: Telegram user ID
+            required_role: Required role ("admin", "coordinator", "viewer")
+
+        Returns:
+            True if the user's role is at least the required one
+        """
+        role = self.roles.get(user_id)
+        if role is None:
+            return False
+        return ROLE_LEVELS[role] >= ROLE_LEVELS.get(required_role, len(ROLE_LEVELS) + 1)
+
+
 def _parse_user_ids(env_var_name: str) -> list[int]:
     """
     Parse user IDs from environment variable.
@@ -126,6 +213,9 @@ class DatabaseSettings:
     rate_limit_per_second: int = field(
         default_factory=lambda: int(os.getenv("AIRTABLE_RATE_LIMIT", "5"))
     )
+    rate_limit_burst: int = field(
+        default_factory=lambda: int(os.getenv("AIRTABLE_RATE_LIMIT_BURST", "1"))
+    )
     timeout_seconds: int = field(
         default_factory=lambda: int(os.getenv("AIRTABLE_TIMEOUT", "30"))
     )
@@ -143,6 +233,39 @@ class DatabaseSettings:
     connection_timeout: int = field(
         default_factory=lambda: int(os.getenv("DB_CONNECTION_TIMEOUT", "60"))
     )
+    max_keepalive_connections: int = field(
+        default_factory=lambda: int(os.getenv("DB_MAX_KEEPALIVE_CONNECTIONS", "5"))
+    )
+    keepalive_expiry_seconds: float = field(
+        default_factory=lambda: float(os.getenv("DB_KEEPALIVE_EXPIRY", "30.0"))
+    )
+
+    # Native async transport (httpx connection pool shared by all table clients)
+    airtable_async_transport: bool = field(
+        default_factory=lambda: os.getenv("AIRTABLE_ASYNC_TRANSPORT", "false").lower()
+        == "true"
+    )
+    airtable_http2: bool = field(
+        default_factory=lambda: os.getenv("AIRTABLE_HTTP2", "true").lower() == "true"
+    )
+
+    # Local Participants replica (background delta sync, reads served locally)
+    participant_replica_enabled: bool = field(
+        default_factory=lambda: os.getenv(
+            "PARTICIPANT_REPLICA_ENABLED", "false"
+        ).lower()
+        == "true"
+    )
+    participant_replica_sync_interval_seconds: float = field(
+        default_factory=lambda: float(
+            os.getenv("PARTICIPANT_REPLICA_SYNC_INTERVAL", "30")
+        )
+    )
+    participant_replica_full_sync_interval_seconds: float = field(
+        default_factory=lambda: float(
+            os.getenv("PARTICIPANT_REPLICA_FULL_SYNC_INTERVAL", "900")
+        )
+    )
 
     # Export view configuration
     participant_export_view: str = field(
@@ -202,12 +325,36 @@ class DatabaseSettings:
         if self.rate_limit_per_second <= 0 or self.rate_limit_per_second > 100:
             raise ValueError("Rate limit must be between 1 and 100 requests per second")
 
+        if self.rate_limit_burst <= 0:
+            raise ValueError("Rate limit burst must be positive")
+
         if self.timeout_seconds <= 0:
             raise ValueError("Timeout must be positive")
 
         if self.max_retries < 0:
             raise ValueError("Max retries cannot be negative")
 
+        if self.max_connections <= 0:
+            raise ValueError("Max connections must be positive")
+
+        if self.max_keepalive_connections < 0:
+            raise ValueError("Max keep-alive connections cannot be negative")
+
+        if self.keepalive_expiry_seconds < 0:
+            raise ValueError("Keep-alive expiry cannot be negative")
+
+        if self.participant_replica_sync_interval_seconds <= 0:
+            raise ValueError("Participant replica sync interval must be positive")
+
+        if (
+            self.participant_replica_full_sync_interval_seconds
+            < self.participant_replica_sync_interval_seconds
+        ):
+            raise ValueError(
+                "Participant replica full sync interval cannot be shorter "
+                "than the sync interval"
+            )
+
         # Validate export view configuration
         if not self.participant_export_view:
             raise ValueError("Participant export view name cannot be empty")
@@ -286,9 +433,15 @@ class DatabaseSettings:
             table_name=table_config["table_name"],
             table_id=table_config["table_id"],
             rate_limit_per_second=self.rate_limit_per_second,
+            rate_limit_burst=self.rate_limit_burst,
             timeout_seconds=self.timeout_seconds,
             max_retries=self.max_retries,
             retry_delay_seconds=self.retry_delay_seconds,
+            use_async_transport=self.airtable_async_transport,
+            http2=self.airtable_http2,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry_seconds=self.keepalive_expiry_seconds,
         )
 
 
@@ -357,6 +510,31 @@ class TelegramSettings:
         default_factory=lambda: _parse_coordinator_ids()
     )
 
+    # Precomputed user ID -> role lookup of the allowlists above
+    role_map: RoleMap = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the role map from the loaded allowlists."""
+        self.refresh_role_map()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Keep the role map in sync when an allowlist is replaced
+        if name in _ROLE_ID_FIELDS and "role_map" in self.__dict__:
+            self.refresh_role_map()
+
+    def refresh_role_map(self) -> RoleMap:
+        """
+        Rebuild the role map from the current allowlists.
+
+        Returns:
+            The new role map
+        """
+        self.role_map = RoleMap.from_ids(
+            self.admin_user_ids, self.coordinator_user_ids, self.viewer_user_ids
+        )
+        return self.role_map
+
     def validate(self) -> None:
         """
         Validate Telegram settings.
@@ -469,6 +647,29 @@ class LoggingSettings:
     file_backup_count: int = field(
         default_factory=lambda: int(os.getenv("FILE_LOG_BACKUP_COUNT", "5"))
     )
+    file_queue_size: int = field(
+        default_factory=lambda: int(os.getenv("FILE_LOG_QUEUE_SIZE", "10000"))
+    )  # Records queued per log category; 0 writes on the calling thread
+
+    # Security audit pipeline settings
+    security_audit_buffer_size: int = field(
+        default_factory=lambda: int(os.getenv("SECURITY_AUDIT_BUFFER_SIZE", "10000"))
+    )  # 0 writes audit events synchronously
+    security_audit_flush_interval_seconds: float = field(
+        default_factory=lambda: float(
+            os.getenv("SECURITY_AUDIT_FLUSH_INTERVAL_SECONDS", "1.0")
+        )
+    )
+    security_audit_granted_sample_rate: float = field(
+        default_factory=lambda: float(
+            os.getenv("SECURITY_AUDIT_GRANTED_SAMPLE_RATE", "1.0")
+        )
+    )
+    security_audit_fast_sample_rate: float = field(
+        default_factory=lambda: float(
+            os.getenv("SECURITY_AUDIT_FAST_SAMPLE_RATE", "1.0")
+        )
+    )
 
     def validate(self) -> None:
         """
@@ -500,6 +701,23 @@ class LoggingSettings:
         if self.file_backup_count < 0:
             raise ValueError("file_backup_count cannot be negative")
 
+        if self.file_queue_size < 0:
+            raise ValueError("file_queue_size cannot be negative")
+
+        # Security audit pipeline validation
+        if self.security_audit_buffer_size < 0:
+            raise ValueError("security_audit_buffer_size cannot be negative")
+
+        if self.security_audit_flush_interval_seconds <= 0:
+            raise ValueError("security_audit_flush_interval_seconds must be positive")
+
+        for name in (
+            "security_audit_granted_sample_rate",
+            "security_audit_fast_sample_rate",
+        ):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
 
 @dataclass
 class ApplicationSettings:
@@ -533,6 +751,28 @@ class ApplicationSettings:
         default_factory=lambda: int(os.getenv("OPERATION_TIMEOUT", "60"))
     )
 
+    # Rendered export reuse across admins
+    export_cache_enabled: bool = field(
+        default_factory=lambda: os.getenv("EXPORT_CACHE_ENABLED", "true").lower()
+        == "true"
+    )
+    export_cache_max_age_seconds: float = field(
+        default_factory=lambda: float(os.getenv("EXPORT_CACHE_MAX_AGE", "900"))
+    )
+    export_cache_max_mb: int = field(
+        default_factory=lambda: int(os.getenv("EXPORT_CACHE_MAX_MB", "200"))
+    )
+
+    # JSON file keeping delta export watermarks across restarts
+    export_watermark_file: str = field(
+        default_factory=lambda: os.getenv("EXPORT_WATERMARK_FILE", "")
+    )
+
+    # Default format of participant exports: csv, xlsx or parquet
+    export_format: str = field(
+        default_factory=lambda: os.getenv("EXPORT_FORMAT", "csv").lower()
+    )
+
     def validate(self) -> None:
         """
         Validate application settings.
@@ -550,6 +790,16 @@ class ApplicationSettings:
         if self.operation_timeout <= 0:
             raise ValueError("Operation timeout must be positive")
 
+        if self.export_cache_max_age_seconds < 0:
+            raise ValueError("Export cache max age cannot be negative")
+
+        if self.export_cache_max_mb <= 0:
+            raise ValueError("Export cache size must be positive")
+
+        valid_export_formats = ["csv", "xlsx", "parquet"]
+        if self.export_format not in valid_export_formats:
+            raise ValueError(f"EXPORT_FORMAT must be one of {valid_export_formats}")
+
 
 def _parse_admin_user_id() -> Optional[int]:
     """
@@ -696,6 +946,7 @@ class Settings:
             max_file_size=self.logging.file_max_size,
             backup_count=self.logging.file_backup_count,
             create_subdirs=True,
+            queue_size=self.logging.file_queue_size,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -6,10 +6,25 @@ error handling, rate limiting, and connection management.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import httpx
 from pyairtable import Api, Table
@@ -18,6 +33,10 @@ from pyairtable.api.types import RecordDict
 from src.config.field_mappings import (  # Original participant mapping
     AirtableFieldMapping,
 )
+from src.data.airtable.airtable_transport import (
+    AirtableAsyncTransport,
+    get_shared_transport,
+)
 from src.data.repositories.participant_repository import RepositoryError
 
 logger = logging.getLogger(__name__)
@@ -32,31 +51,254 @@ class AirtableConfig:
     table_name: str = "Participants"
     table_id: Optional[str] = None
     rate_limit_per_second: int = 5
+    rate_limit_burst: int = 1
     timeout_seconds: int = 30
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
 
+    # Native async transport (shared httpx connection pool)
+    use_async_transport: bool = False
+    http2: bool = True
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry_seconds: float = 30.0
+
+
+class RequestPriority(IntEnum):
+    """Scheduling priority for rate-limited requests (lower values go first)."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+# Priority applied to requests that don't pass one explicitly. Exports and
+# scheduled jobs switch to BACKGROUND via ``request_priority`` so interactive
+# searches are served ahead of them.
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "airtable_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Run the enclosed Airtable requests with the given rate-limit priority.
+
+    Args:
+        priority: Priority for requests issued inside the block
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
 
 class RateLimiter:
-    """Rate limiter for Airtable API requests."""
+    """
+    Token-bucket rate limiter for Airtable API requests.
+
+    Tokens refill continuously at ``requests_per_second`` up to ``burst`` and
+    each request consumes one. When the bucket is empty, waiting requests are
+    released in priority order (interactive before background), first come
+    first served within the same priority.
+    """
 
-    def __init__(self, requests_per_second: int = 5):
+    def __init__(self, requests_per_second: int = 5, burst: int = 1):
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
+        self.burst = max(1, burst)
         self.last_request_time = 0.0
-        self._lock = asyncio.Lock()
 
-    async def acquire(self) -> None:
-        """Wait until next request is allowed per rate limit."""
-        async with self._lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._stats: Dict[str, Any] = {
+            "acquired": 0,
+            "queued": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+        self._priority_stats: Dict[RequestPriority, Dict[str, Any]] = {
+            priority: {"acquired": 0, "total_wait_seconds": 0.0}
+            for priority in RequestPriority
+        }
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(
+            float(self.burst), self._tokens + elapsed * self.requests_per_second
+        )
+
+    def _has_token(self) -> bool:
+        # Tolerate float rounding after sleeping exactly until the next token
+        return self._tokens >= 1.0 - 1e-9
+
+    def _schedule_dispatch(self) -> None:
+        """Schedule waking up waiters when the next token becomes available."""
+        loop = asyncio.get_running_loop()
+        if self._timer is not None and self._timer_loop is loop:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = max(0.0, (1.0 - self._tokens) / self.requests_per_second)
+        self._timer = loop.call_later(delay, self._dispatch)
+        self._timer_loop = loop
+
+    def _dispatch(self) -> None:
+        """Hand available tokens to the highest-priority waiters."""
+        self._timer = None
+        self._refill()
+        while self._waiters:
+            _, _, future = self._waiters[0]
+            if future.done() or future.get_loop().is_closed():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._has_token():
+                break
+            heapq.heappop(self._waiters)
+            self._tokens -= 1.0
+            future.set_result(None)
+        if self._waiters:
+            self._schedule_dispatch()
+
+    def _record(self, priority: RequestPriority, wait_seconds: float) -> None:
+        self.last_request_time = time.time()
+        self._stats["acquired"] += 1
+        self._stats["total_wait_seconds"] += wait_seconds
+        self._stats["max_wait_seconds"] = max(
+            self._stats["max_wait_seconds"], wait_seconds
+        )
+        priority_stats = self._priority_stats[priority]
+        priority_stats["acquired"] += 1
+        priority_stats["total_wait_seconds"] += wait_seconds
+
+    async def acquire(self, priority: Optional[RequestPriority] = None) -> None:
+        """
+        Wait until next request is allowed per rate limit.
+
+        Args:
+            priority: Request priority; defaults to the priority of the
+                current ``request_priority`` block (interactive otherwise)
+        """
+        if priority is None:
+            priority = _current_priority.get()
+
+        start = time.monotonic()
+        self._refill()
+        if not self._waiters and self._has_token():
+            self._tokens -= 1.0
+            self._record(priority, 0.0)
+            return
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        self._stats["queued"] += 1
+        self._schedule_dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Token was granted right before cancellation; return it
+                self._tokens = min(float(self.burst), self._tokens + 1.0)
+            raise
+
+        self._record(priority, time.monotonic() - start)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get rate limiter statistics.
+
+        Returns:
+            Dictionary with queue depth, wait times and per-priority counters
+        """
+        acquired = self._stats["acquired"]
+        return {
+            "requests_per_second": self.requests_per_second,
+            "burst": self.burst,
+            "queue_depth": sum(1 for _, _, f in self._waiters if not f.done()),
+            "acquired": acquired,
+            "queued": self._stats["queued"],
+            "average_wait_seconds": (
+                self._stats["total_wait_seconds"] / acquired if acquired else 0.0
+            ),
+            "max_wait_seconds": self._stats["max_wait_seconds"],
+            "by_priority": {
+                priority.name.lower(): {
+                    "acquired": stats["acquired"],
+                    "average_wait_seconds": (
+                        stats["total_wait_seconds"] / stats["acquired"]
+                        if stats["acquired"]
+                        else 0.0
+                    ),
+                }
+                for priority, stats in self._priority_stats.items()
+            },
+        }
+
+
+# Airtable enforces its request quota per base, so every table client of a
+# base shares one limiter
+_SHARED_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+
+
+def get_shared_rate_limiter(
+    base_id: str, requests_per_second: int, burst: int = 1
+) -> RateLimiter:
+    """
+    Return the rate limiter shared by all clients of an Airtable base.
+
+    A new limiter replaces the shared one if the configured rate or burst
+    changed (e.g. after a settings reload).
+
+    Args:
+        base_id: Airtable base ID
+        requests_per_second: Sustained request rate for the base
+        burst: Maximum number of requests allowed back to back
+
+    Returns:
+        Shared RateLimiter instance
+    """
+    limiter = _SHARED_RATE_LIMITERS.get(base_id)
+    if (
+        limiter is None
+        or limiter.requests_per_second != requests_per_second
+        or limiter.burst != max(1, burst)
+    ):
+        limiter = RateLimiter(requests_per_second, burst)
+        _SHARED_RATE_LIMITERS[base_id] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics for every shared rate limiter, keyed by base ID."""
+    return {
+        base_id: limiter.get_stats()
+        for base_id, limiter in _SHARED_RATE_LIMITERS.items()
+    }
+
 
-            if time_since_last < self.min_interval:
-                sleep_time = self.min_interval - time_since_last
-                await asyncio.sleep(sleep_time)
+def reset_shared_rate_limiters() -> None:
+    """Forget shared rate limiters (useful for testing or config reloads)."""
+    _SHARED_RATE_LIMITERS.clear()
 
-            self.last_request_time = time.time()
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Extract an HTTP status code from a transport or pyairtable error."""
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
 
 
 class AirtableAPIError(RepositoryError):
@@ -78,14 +320,29 @@ class AirtableClient:
 
     Provides low-level access to Airtable API operations with proper error
     handling and rate limiting according to Airtable's API constraints.
+
+    By default requests go through pyairtable in a worker thread. When an
+    ``AirtableAsyncTransport`` is supplied (or ``config.use_async_transport`` is
+    enabled) requests are sent natively on the event loop over a shared
+    connection pool instead.
     """
 
-    def __init__(self, config: AirtableConfig):
+    def __init__(
+        self,
+        config: AirtableConfig,
+        transport: Optional[AirtableAsyncTransport] = None,
+    ):
         self.config = config
-        self.rate_limiter = RateLimiter(config.rate_limit_per_second)
+        self.rate_limiter = get_shared_rate_limiter(
+            config.base_id, config.rate_limit_per_second, config.rate_limit_burst
+        )
         self._api: Optional[Api] = None
         self._table: Optional[Table] = None
 
+        if transport is None and config.use_async_transport:
+            transport = get_shared_transport(config)
+        self.transport = transport
+
         # Connection validation will be done on first request
         logger.info(
             f"Initialized Airtable client for base {config.base_id}, table {config.table_name}"
@@ -98,15 +355,16 @@ class AirtableClient:
             self._api = Api(self.config.api_key)
         return self._api
 
+    @property
+    def table_identifier(self) -> str:
+        """Table ID if configured, otherwise the table name."""
+        return self.config.table_id if self.config.table_id else self.config.table_name
+
     @property
     def table(self) -> Table:
         """Get or create Airtable table instance."""
         if self._table is None:
-            # Use table_id if available, otherwise fall back to table_name
-            table_identifier = (
-                self.config.table_id if self.config.table_id else self.config.table_name
-            )
-            self._table = self.api.table(self.config.base_id, table_identifier)
+            self._table = self.api.table(self.config.base_id, self.table_identifier)
         return self._table
 
     def _translate_fields_for_api(self, fields: Dict[str, Any]) -> Dict[str, Any]:
@@ -150,7 +408,12 @@ class AirtableClient:
             await self.rate_limiter.acquire()
 
             # Try to get schema information (lightweight operation)
-            await asyncio.to_thread(self.table.schema)
+            if self.transport is not None:
+                await self.transport.get_table_schema(
+                    self.config.base_id, self.table_identifier
+                )
+            else:
+                await asyncio.to_thread(self.table.schema)
 
             logger.info("Airtable connection test successful")
             return True
@@ -158,7 +421,9 @@ class AirtableClient:
         except Exception as e:
             error_msg = f"Airtable connection test failed: {str(e)}"
             logger.error(error_msg)
-            raise AirtableAPIError(error_msg, original_error=e)
+            raise AirtableAPIError(
+                error_msg, status_code=_status_code(e), original_error=e
+            )
 
     async def create_record(self, fields: Dict[str, Any]) -> RecordDict:
         """
@@ -181,7 +446,12 @@ class AirtableClient:
             # Translate field names to Field IDs and option values to Option IDs
             translated_fields = self._translate_fields_for_api(fields)
 
-            record = await asyncio.to_thread(self.table.create, translated_fields)
+            if self.transport is not None:
+                record = await self.transport.create_record(
+                    self.config.base_id, self.table_identifier, translated_fields
+                )
+            else:
+                record = await asyncio.to_thread(self.table.create, translated_fields)
 
             logger.debug(f"Created record with ID: {record['id']}")
             return record
@@ -189,7 +459,9 @@ class AirtableClient:
         except Exception as e:
             error_msg = f"Failed to create record: {str(e)}"
             logger.error(error_msg)
-            raise AirtableAPIError(error_msg, original_error=e)
+            raise AirtableAPIError(
+                error_msg, status_code=_status_code(e), original_error=e
+            )
 
     async def get_record(self, record_id: str) -> Optional[RecordDict]:
         """
@@ -209,6 +481,11 @@ class AirtableClient:
         try:
             logger.debug(f"Getting record with ID: {record_id}")
 
+            if self.transport is not None:
+                return await self.transport.get_record(
+                    self.config.base_id, self.table_identifier, record_id
+                )
+
             record = await asyncio.to_thread(self.table.get, record_id)
 
             return record
@@ -222,7 +499,9 @@ class AirtableClient:
 
             error_msg = f"Failed to get record {record_id}: {str(e)}"
             logger.error(error_msg)
-            raise AirtableAPIError(error_msg, original_error=e)
+            raise AirtableAPIError(
+                error_msg, status_code=_status_code(e), original_error=e
+            )
 
     async def update_record(self, record_id: str, fields: Dict[str, Any]) -> RecordDict:
         """
@@ -248,9 +527,17 @@ class AirtableClient:
             # Translate field names to Field IDs and option values to Option IDs
             translated_fields = self._translate_fields_for_api(fields)
 
-            record = await asyncio.to_thread(
-                self.table.update, record_id, translated_fields
-            )
+            if self.transport is not None:
+                record = await self.transport.update_record(
+                    self.config.base_id,
+                    self.table_identifier,
+                    record_id,
+                    translated_fields,
+                )
+            else:
+                record = await asyncio.to_thread(
+                    self.table.update, record_id, translated_fields
+                )
 
             logger.debug(f"Updated record with ID: {record['id']}")
             return record
@@ -258,7 +545,9 @@ class AirtableClient:
         except Exception as e:
             error_msg = f"Failed to update record {record_id}: {str(e)}"
             logger.error(error_msg)
-            raise AirtableAPIError(error_msg, original_error=e)
+            raise AirtableAPIError(
+                error_msg, status_code=_status_code(e), original_error=e
+            )
 
     async def delete_record(self, record_id: str) -> bool:
         """
@@ -278,7 +567,12 @@ class AirtableClient:
         try:
             logger.debug(f"Deleting record with ID: {record_id}")
 
-            await asyncio.to_thread(self.table.delete, record_id)
+            if self.transport is not None:
+                await self.transport.delete_record(
+                    self.config.base_id, self.table_identifier, record_id
+                )
+            else:
+                await asyncio.to_thread(self.table.delete, record_id)
 
             logger.debug(f"Deleted record with ID: {record_id}")
             return True
@@ -286,7 +580,9 @@ class AirtableClient:
         except Exception as e:
             error_msg = f"Failed to delete record {record_id}: {str(e)}"
             logger.error(error_msg)
-            raise AirtableAPIError(error_msg, original_error=e)
+            raise AirtableAPIError(
+                error_msg, status_code=_status_code(e), original_error=e
+            )
 
     async def list_records(
         self,
@@ -317,20 +613,16 @@ class AirtableClient:
         try:
             logger.debug(f"Listing records with formula: {formula}, max: {max_records}")
 
-            # Build parameters for Airtable API
-            params: Dict[str, Any] = {}
-            if formula:
-                params["formula"] = formula
-            if sort:
-                params["sort"] = sort
-            if fields:
-                params["fields"] = fields
-            if max_records:
-                params["max_records"] = max_records
-            if view:
-                params["view"] = view
-            # Ensure a list is returned to keep behavior identical
-            records = await asyncio.to_thread(lambda: list(self.table.all(**params)))
+            params = self._build_list_params(formula, sort, fields, max_records, view)
+            if self.transport is not None:
+                records = await self.transport.list_records(
+                    self.config.base_id, self.table_identifier, **params
+                )
+            else:
+                # Ensure a list is returned to keep behavior identical
+                records = await asyncio.to_thread(
+                    lambda: list(self.table.all(**params))
+                )
 
             logger.debug(f"Retrieved {len(records)} records")
             return records
@@ -338,7 +630,148 @@ class AirtableClient:
         except Exception as e:
             error_msg = f"Failed to list records: {str(e)}"
             logger.error(error_msg)
-            raise AirtableAPIError(error_msg, original_error=e)
+            raise AirtableAPIError(
+                error_msg, status_code=_status_code(e), original_error=e
+            )
+
+    @staticmethod
+    def _build_list_params(
+        formula: Optional[str] = None,
+        sort: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        max_records: Optional[int] = None,
+        view: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Build list parameters for Airtable API, omitting unset options."""
+        params: Dict[str, Any] = {}
+        if formula:
+            params["formula"] = formula
+        if sort:
+            params["sort"] = sort
+        if fields:
+            params["fields"] = fields
+        if max_records:
+            params["max_records"] = max_records
+        if view:
+            params["view"] = view
+        if page_size:
+            params["page_size"] = page_size
+        return params
+
+    def _page_fetcher(
+        self, params: Dict[str, Any]
+    ) -> Callable[[], Awaitable[Tuple[List[RecordDict], bool]]]:
+        """
+        Build a callable that fetches the next page of a listing.
+
+        Each call waits for a rate-limit token and returns a tuple of
+        (records on the page, whether more pages may follow).
+        """
+        if self.transport is not None:
+            transport = self.transport
+            offset: Optional[str] = None
+
+            async def fetch_transport_page() -> Tuple[List[RecordDict], bool]:
+                nonlocal offset
+                await self.rate_limiter.acquire()
+                page, offset = await transport.list_page(
+                    self.config.base_id, self.table_identifier, offset=offset, **params
+                )
+                return page, offset is not None
+
+            return fetch_transport_page
+
+        pages: Optional[Iterator[List[RecordDict]]] = None
+
+        async def fetch_table_page() -> Tuple[List[RecordDict], bool]:
+            nonlocal pages
+            await self.rate_limiter.acquire()
+            if pages is None:
+                pages = self.table.iterate(**params)
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                return [], False
+            return list(page), True
+
+        return fetch_table_page
+
+    async def stream_records(
+        self,
+        formula: Optional[str] = None,
+        sort: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        max_records: Optional[int] = None,
+        view: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[RecordDict, None]:
+        """
+        Stream records page by page as they arrive from Airtable.
+
+        Records are yielded as soon as their page is received, so callers get
+        the first rows after one round trip and can stop early (``break``)
+        without fetching the rest of the table. With ``prefetch`` enabled the
+        next page is requested while the caller processes the current one.
+
+        Args:
+            formula: Airtable formula for filtering
+            sort: List of field names to sort by (prefix with '-' for descending)
+            fields: List of field names to include in response
+            max_records: Maximum number of records to return
+            view: Name of view to use
+            page_size: Number of records per page (Airtable maximum is 100)
+            prefetch: Request the next page while the current one is consumed;
+                disable when the caller usually stops after the first page
+
+        Yields:
+            Records matching criteria
+
+        Raises:
+            AirtableAPIError: If fetching a page fails
+        """
+        logger.debug(f"Streaming records with formula: {formula}, max: {max_records}")
+
+        params = self._build_list_params(
+            formula, sort, fields, max_records, view, page_size
+        )
+        fetch_page = self._page_fetcher(params)
+
+        async def next_page() -> Tuple[List[RecordDict], bool]:
+            try:
+                return await fetch_page()
+            except Exception as e:
+                error_msg = f"Failed to stream records: {str(e)}"
+                logger.error(error_msg)
+                raise AirtableAPIError(
+                    error_msg, status_code=_status_code(e), original_error=e
+                )
+
+        pending: Optional["asyncio.Future[Tuple[List[RecordDict], bool]]"] = (
+            asyncio.ensure_future(next_page())
+        )
+        streamed = 0
+        try:
+            while pending is not None:
+                page, has_more = await pending
+                pending = None
+                if has_more and prefetch:
+                    pending = asyncio.ensure_future(next_page())
+
+                for record in page:
+                    streamed += 1
+                    yield record
+
+                if has_more and pending is None:
+                    pending = asyncio.ensure_future(next_page())
+        finally:
+            # Caller stopped early: drop the in-flight prefetch
+            if pending is not None:
+                if not pending.done():
+                    pending.cancel()
+                elif not pending.cancelled():
+                    pending.exception()  # Mark a failed prefetch as retrieved
+            logger.debug(f"Streamed {streamed} records")
 
     async def bulk_create(self, records: List[Dict[str, Any]]) -> List[RecordDict]:
         """
@@ -371,9 +804,14 @@ class AirtableClient:
                     self._translate_fields_for_api(record) for record in batch
                 ]
 
-                batch_results = await asyncio.to_thread(
-                    self.table.batch_create, translated_batch
-                )
+                if self.transport is not None:
+                    batch_results = await self.transport.batch_create(
+                        self.config.base_id, self.table_identifier, translated_batch
+                    )
+                else:
+                    batch_results = await asyncio.to_thread(
+                        self.table.batch_create, translated_batch
+                    )
 
                 results.extend(batch_results)
                 logger.debug(f"Created batch with {len(batch_results)} records")
@@ -381,7 +819,9 @@ class AirtableClient:
             except Exception as e:
                 error_msg = f"Failed to create batch: {str(e)}"
                 logger.error(error_msg)
-                raise AirtableAPIError(error_msg, original_error=e)
+                raise AirtableAPIError(
+                    error_msg, status_code=_status_code(e), original_error=e
+                )
 
         return results
 
@@ -420,9 +860,15 @@ class AirtableClient:
                     for update in batch
                 ]
 
-                batch_results = await asyncio.to_thread(
-                    self.table.batch_update, translated_batch  # type: ignore[arg-type]
-                )
+                if self.transport is not None:
+                    batch_results = await self.transport.batch_update(
+                        self.config.base_id, self.table_identifier, translated_batch
+                    )
+                else:
+                    batch_results = await asyncio.to_thread(
+                        self.table.batch_update,
+                        translated_batch,  # type: ignore[arg-type]
+                    )
 
                 results.extend(batch_results)
                 logger.debug(f"Updated batch with {len(batch_results)} records")
@@ -430,7 +876,9 @@ class AirtableClient:
             except Exception as e:
                 error_msg = f"Failed to update batch: {str(e)}"
                 logger.error(error_msg)
-                raise AirtableAPIError(error_msg, original_error=e)
+                raise AirtableAPIError(
+                    error_msg, status_code=_status_code(e), original_error=e
+                )
 
         return results
 
@@ -448,16 +896,46 @@ class AirtableClient:
         Raises:
             AirtableAPIError: If search fails
         """
-        # Build Airtable formula for exact match
+        return await self.list_records(
+            formula=self._field_match_formula(field_name, value)
+        )
+
+    async def find_first_by_field(
+        self, field_name: str, value: Any
+    ) -> Optional[RecordDict]:
+        """
+        Find the first record whose field matches a value exactly.
+
+        Unlike :meth:`search_by_field`, a single record is requested and no
+        further page is prefetched, so the lookup stops at the first match.
+
+        Args:
+            field_name: Name of field to search
+            value: Value to match exactly
+
+        Returns:
+            First matching record, or None if nothing matches
+
+        Raises:
+            AirtableAPIError: If search fails
+        """
+        async for record in self.stream_records(
+            formula=self._field_match_formula(field_name, value),
+            max_records=1,
+            prefetch=False,
+        ):
+            return record
+        return None
+
+    @staticmethod
+    def _field_match_formula(field_name: str, value: Any) -> str:
+        """Build the Airtable formula for an exact field match."""
         if isinstance(value, str):
             # String values need to be quoted and single quotes escaped
             escaped_value = value.replace("'", "''")
-            formula = f"{{{field_name}}} = '{escaped_value}'"
-        else:
-            # Numbers and other values don't need quotes
-            formula = f"{{{field_name}}} = {value}"
-
-        return await self.list_records(formula=formula)
+            return f"{{{field_name}}} = '{escaped_value}'"
+        # Numbers and other values don't need quotes
+        return f"{{{field_name}}} = {value}"
 
     async def search_by_formula(self, formula: str) -> List[RecordDict]:
         """
@@ -489,6 +967,11 @@ class AirtableClient:
         try:
             logger.debug("Getting table schema")
 
+            if self.transport is not None:
+                return await self.transport.get_table_schema(
+                    self.config.base_id, self.table_identifier
+                )
+
             schema = await asyncio.to_thread(self.table.schema)
 
             return schema
@@ -496,4 +979,6 @@ class AirtableClient:
         except Exception as e:
             error_msg = f"Failed to get schema: {str(e)}"
             logger.error(error_msg)
-            raise AirtableAPIError(error_msg, original_error=e)
+            raise AirtableAPIError(
+                error_msg, status_code=_status_code(e), original_error=e
+            )
@@ -10,6 +10,10 @@ from typing import Optional
 
 from src.config.settings import DatabaseSettings
 from src.data.airtable.airtable_client import AirtableClient
+from src.data.airtable.airtable_transport import (
+    AirtableAsyncTransport,
+    get_shared_transport,
+)
 
 
 class AirtableClientFactory:
@@ -17,7 +21,9 @@ class AirtableClientFactory:
     Factory for creating table-specific Airtable clients.
 
     This factory uses the DatabaseSettings to get table-specific configurations
-    and creates appropriately configured AirtableClient instances.
+    and creates appropriately configured AirtableClient instances. When the
+    async transport is enabled, every client created by the factory shares a
+    single connection pool.
     """
 
     def __init__(self, database_settings: Optional[DatabaseSettings] = None):
@@ -28,6 +34,7 @@ class AirtableClientFactory:
             database_settings: DatabaseSettings instance. If None, creates a new one.
         """
         self.database_settings = database_settings or DatabaseSettings()
+        self._transport: Optional[AirtableAsyncTransport] = None
 
     def create_client(self, table_type: str) -> AirtableClient:
         """
@@ -52,5 +59,12 @@ class AirtableClientFactory:
         # Get table-specific configuration
         airtable_config = self.database_settings.to_airtable_config(table_type)
 
+        # Share one connection pool across all tables of the base
+        if airtable_config.use_async_transport and self._transport is None:
+            self._transport = get_shared_transport(airtable_config)
+
         # Create and return the client
-        return AirtableClient(airtable_config)
+        return AirtableClient(
+            airtable_config,
+            transport=self._transport if airtable_config.use_async_transport else None,
+        )
@@ -0,0 +1,347 @@
+"""
+In-process replica of the Participants table.
+
+The replica keeps every raw Participants record in memory and is refreshed by
+a background job. Between periodic full syncs it only pulls records changed
+since the last sync, using a ``LAST_MODIFIED_TIME()`` formula watermark, so
+repository reads can be answered locally instead of costing an Airtable round
+trip each. Repository writes are applied to the replica as soon as Airtable
+confirms them (write-through).
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from pyairtable.api.types import RecordDict
+
+from src.data.airtable.airtable_client import AirtableClient
+from src.data.airtable.formula_utils import build_modified_since_formula
+from src.models.participant import Participant
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_value(value: Any) -> Any:
+    """
+    Normalize a field value for equality checks.
+
+    Airtable formulas compare ``{Floor} = 2`` and ``{Floor} = '2'`` alike, so
+    numeric strings and numbers are compared as floats and everything else
+    as stripped strings.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def _matches(field_value: Any, expected: Any) -> bool:
+    """Check whether a record field value equals the expected value."""
+    if field_value is None or field_value == "":
+        return False
+    if isinstance(field_value, list):
+        return any(_matches(item, expected) for item in field_value)
+    return _normalize_value(field_value) == expected
+
+
+class ParticipantReplica:
+    """
+    Local replica of the Participants table kept fresh by delta syncs.
+
+    Records are stored by record ID together with their parsed Participant.
+    Reads check :meth:`is_fresh` so callers can fall back to Airtable while
+    the replica is still loading or when syncs keep failing.
+    """
+
+    def __init__(
+        self,
+        client: AirtableClient,
+        sync_interval_seconds: float = 30.0,
+        full_sync_interval_seconds: float = 900.0,
+        max_staleness_seconds: Optional[float] = None,
+        watermark_overlap_seconds: float = 5.0,
+    ):
+        """
+        Initialize an empty replica.
+
+        Args:
+            client: AirtableClient for the Participants table
+            sync_interval_seconds: Interval of the background delta sync
+            full_sync_interval_seconds: Interval of full resyncs, which also
+                pick up deleted records that a delta sync cannot see
+            max_staleness_seconds: Age after which replica reads are refused;
+                defaults to three sync intervals
+            watermark_overlap_seconds: Overlap subtracted from the watermark
+                to tolerate clock skew between the bot and Airtable
+        """
+        self.client = client
+        self.sync_interval_seconds = sync_interval_seconds
+        self.full_sync_interval_seconds = full_sync_interval_seconds
+        self.max_staleness_seconds = (
+            max_staleness_seconds
+            if max_staleness_seconds is not None
+            else sync_interval_seconds * 3
+        )
+        self.watermark_overlap_seconds = watermark_overlap_seconds
+
+        self._records: Dict[str, RecordDict] = {}
+        self._participants: Dict[str, Participant] = {}
+        self._watermark: Optional[datetime] = None
+        self._last_sync: Optional[float] = None
+        self._last_full_sync: Optional[float] = None
+        self._sync_lock = asyncio.Lock()
+        # Writes made while a full sync is running, re-applied after the swap
+        self._pending_writes: Optional[Dict[str, Optional[RecordDict]]] = None
+
+        self.version = 0
+        self.stats = {
+            "full_syncs": 0,
+            "delta_syncs": 0,
+            "records_changed": 0,
+            "sync_errors": 0,
+            "write_through": 0,
+        }
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return True once the first full sync has completed."""
+        return self._last_full_sync is not None
+
+    def is_fresh(self) -> bool:
+        """Return True if the replica may serve reads."""
+        if self._last_sync is None:
+            return False
+        return time.monotonic() - self._last_sync <= self.max_staleness_seconds
+
+    def _needs_full_sync(self) -> bool:
+        if self._last_full_sync is None or self._watermark is None:
+            return True
+        elapsed = time.monotonic() - self._last_full_sync
+        return elapsed >= self.full_sync_interval_seconds
+
+    async def sync(self, full: bool = False) -> int:
+        """
+        Refresh the replica from Airtable.
+
+        Runs a full sync on first use, when ``full`` is set or when the full
+        sync interval has elapsed; otherwise pulls only records modified
+        since the watermark. Concurrent calls are serialized.
+
+        Args:
+            full: Force a full resync
+
+        Returns:
+            Number of records loaded or changed by this sync
+
+        Raises:
+            AirtableAPIError: If fetching records fails
+        """
+        async with self._sync_lock:
+            started_at = datetime.now(timezone.utc)
+            try:
+                if full or self._needs_full_sync():
+                    changed = await self._full_sync()
+                else:
+                    changed = await self._delta_sync()
+            except Exception:
+                self.stats["sync_errors"] += 1
+                raise
+
+            self._watermark = started_at - timedelta(
+                seconds=self.watermark_overlap_seconds
+            )
+            self._last_sync = time.monotonic()
+            return changed
+
+    async def _full_sync(self) -> int:
+        self._pending_writes = {}
+        try:
+            records: Dict[str, RecordDict] = {}
+            async for record in self.client.stream_records():
+                records[record["id"]] = record
+
+            participants = {}
+            for record_id, record in records.items():
+                participant = self._parse(record)
+                if participant is not None:
+                    participants[record_id] = participant
+
+            self._records = records
+            self._participants = participants
+
+            for record_id, pending in self._pending_writes.items():
+                if pending is None:
+                    self._discard(record_id)
+                else:
+                    self._store(pending)
+        finally:
+            self._pending_writes = None
+
+        self._last_full_sync = time.monotonic()
+        self.version += 1
+        self.stats["full_syncs"] += 1
+        logger.info(f"Participant replica loaded {len(self._records)} records")
+        return len(self._records)
+
+    async def _delta_sync(self) -> int:
+        assert self._watermark is not None
+        formula = build_modified_since_formula(self._watermark)
+
+        changed = 0
+        async for record in self.client.stream_records(formula=formula):
+            self._store(record)
+            changed += 1
+
+        if changed:
+            self.version += 1
+            self.stats["records_changed"] += changed
+            logger.debug(f"Participant replica applied {changed} changed records")
+        self.stats["delta_syncs"] += 1
+        return changed
+
+    @staticmethod
+    def _parse(record: RecordDict) -> Optional[Participant]:
+        try:
+            return Participant.from_airtable_record(record)
+        except Exception as e:
+            logger.debug(
+                f"Replica skipping invalid participant record {record.get('id')}: {e}"
+            )
+            return None
+
+    def _store(self, record: RecordDict) -> None:
+        record_id = record["id"]
+        self._records[record_id] = record
+        participant = self._parse(record)
+        if participant is not None:
+            self._participants[record_id] = participant
+        else:
+            self._participants.pop(record_id, None)
+
+    def _discard(self, record_id: str) -> None:
+        self._records.pop(record_id, None)
+        self._participants.pop(record_id, None)
+
+    def apply_upsert(self, record: RecordDict) -> None:
+        """
+        Write a record returned by Airtable through to the replica.
+
+        Args:
+            record: Full Airtable record with ``id`` and ``fields``
+        """
+        if not record or "id" not in record:
+            return
+        if self._pending_writes is not None:
+            self._pending_writes[record["id"]] = record
+        self._store(record)
+        self.version += 1
+        self.stats["write_through"] += 1
+
+    def apply_delete(self, record_id: str) -> None:
+        """
+        Remove a deleted record from the replica.
+
+        Args:
+            record_id: Airtable record ID
+        """
+        if self._pending_writes is not None:
+            self._pending_writes[record_id] = None
+        self._discard(record_id)
+        self.version += 1
+        self.stats["write_through"] += 1
+
+    def get(self, record_id: str) -> Optional[Participant]:
+        """Return a copy of the participant with the given record ID."""
+        participant = self._participants.get(record_id)
+        return participant.model_copy() if participant is not None else None
+
+    def get_record(self, record_id: str) -> Optional[RecordDict]:
+        """Return the raw record with the given record ID."""
+        return self._records.get(record_id)
+
+    def filter(self, predicate: Callable[[RecordDict], bool]) -> List[Participant]:
+        """
+        Return copies of valid participants whose raw record matches.
+
+        Args:
+            predicate: Function receiving the raw Airtable record
+
+        Returns:
+            Matching participants in table order
+        """
+        return [
+            self._participants[record_id].model_copy()
+            for record_id, record in self._records.items()
+            if record_id in self._participants and predicate(record)
+        ]
+
+    def find_by_field(self, field_name: str, value: Any) -> List[Participant]:
+        """
+        Return participants whose Airtable field equals a value.
+
+        Mirrors ``AirtableClient.search_by_field`` without the round trip.
+
+        Args:
+            field_name: Airtable field name
+            value: Value to match exactly
+
+        Returns:
+            Matching participants in table order
+        """
+        expected = _normalize_value(getattr(value, "value", value))
+        return self.filter(
+            lambda record: _matches(record.get("fields", {}).get(field_name), expected)
+        )
+
+    def participants(self, copy: bool = True) -> List[Participant]:
+        """
+        Return all valid participants.
+
+        Args:
+            copy: Return copies; pass False for read-only consumers such as
+                search, which then see the same objects until they change
+
+        Returns:
+            Participants in table order
+        """
+        if not copy:
+            return list(self._participants.values())
+        return [participant.model_copy() for participant in self._participants.values()]
+
+    def field_values(self, field_name: str) -> List[Any]:
+        """Return the raw values of a field across all records."""
+        return [
+            record.get("fields", {}).get(field_name)
+            for record in self._records.values()
+        ]
+
+    def count(self) -> int:
+        """Return the number of records in the replica."""
+        return len(self._records)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get replica statistics.
+
+        Returns:
+            Dictionary with sync counters, size, version and staleness
+        """
+        age = (
+            time.monotonic() - self._last_sync if self._last_sync is not None else None
+        )
+        return {
+            **self.stats,
+            "records": len(self._records),
+            "participants": len(self._participants),
+            "version": self.version,
+            "fresh": self.is_fresh(),
+            "seconds_since_sync": age,
+        }
@@ -8,11 +8,31 @@ record format.
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from pyairtable.api.types import RecordDict
 
 from src.config.field_mappings import AirtableFieldMapping
 from src.data.airtable.airtable_client import AirtableAPIError, AirtableClient
-from src.data.airtable.formula_utils import escape_formula_value, prepare_formula_value
+from src.data.airtable.airtable_participant_replica import ParticipantReplica
+from src.data.airtable.formula_utils import (
+    build_modified_since_formula,
+    build_record_id_formulas,
+    escape_formula_value,
+    prepare_formula_value,
+)
 from src.data.repositories.participant_repository import (
     DuplicateError,
     NotFoundError,
@@ -22,11 +42,15 @@ from src.data.repositories.participant_repository import (
 )
 from src.models.participant import Participant
 from src.services.search_service import (
+    ParticipantSearchIndex,
     SearchService,
     detect_language,
     format_participant_result,
+    normalize_russian,
 )
+from src.utils.participant_cache import ParticipantSnapshotCache
 from src.utils.participant_filter import filter_participants_by_role
+from src.utils.search_result_cache import SearchResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +59,18 @@ logger = logging.getLogger(__name__)
 _FLOOR_CACHE: Dict[str, Tuple[float, List[int]]] = {}
 _FLOOR_CACHE_TTL_SECONDS = 300  # 5 minutes
 
-_PARTICIPANT_CACHE: Dict[str, Tuple[float, List[Participant]]] = {}
-_PARTICIPANT_CACHE_TTL_SECONDS = 60  # 1 minute cache for enhanced search
+# Participant snapshots used by fuzzy/enhanced search, keyed by
+# "{base_id}:{table_identifier}:participants"; refreshed single-flight with
+# stale-while-revalidate and patched in place on writes
+_PARTICIPANT_CACHE: Dict[str, ParticipantSnapshotCache] = {}
+_PARTICIPANT_CACHE_TTL_SECONDS = 60  # refresh in background after 1 minute
+
+# Fuzzy search indexes kept in sync with the participant snapshots above
+_SEARCH_INDEXES: Dict[str, ParticipantSearchIndex] = {}
+
+# Formatted search results per table, valid for one participant snapshot
+# version; repeated lookups skip scoring and formatting
+_SEARCH_RESULT_CACHES: Dict[str, SearchResultCache] = {}
 
 
 class AirtableParticipantRepository(ParticipantRepository):
@@ -45,18 +79,54 @@ class AirtableParticipantRepository(ParticipantRepository):
 
     Maps between Participant domain objects and Airtable records, handling
     all CRUD operations and search functionality through the AirtableClient.
+    When a ParticipantReplica is attached, lookups are answered from the
+    replica while it is fresh and writes are applied to it write-through.
     """
 
-    def __init__(self, client: AirtableClient):
+    def __init__(
+        self, client: AirtableClient, replica: Optional[ParticipantReplica] = None
+    ):
         """
         Initialize the repository with an AirtableClient.
 
         Args:
             client: Configured AirtableClient instance
+            replica: Optional local replica of the Participants table
         """
         self.client = client
+        self.replica = replica
         logger.info("Initialized AirtableParticipantRepository")
 
+    def _fresh_replica(self) -> Optional[ParticipantReplica]:
+        """Return the attached replica if it is fresh enough to serve reads."""
+        if self.replica is not None and self.replica.is_fresh():
+            return self.replica
+        return None
+
+    def _write_through(self, records: List[RecordDict]) -> None:
+        """Apply records returned by Airtable writes to the replica and cache."""
+        if self.replica is not None:
+            for record in records:
+                self.replica.apply_upsert(record)
+
+        cache = _PARTICIPANT_CACHE.get(self._get_participant_cache_key())
+        if cache is None:
+            return
+        try:
+            cache.upsert(Participant.from_airtable_record(r) for r in records)
+        except Exception as e:
+            logger.debug(f"Invalidating participant cache after write: {e}")
+            cache.invalidate()
+
+    def _write_through_delete(self, record_id: str) -> None:
+        """Remove a deleted record from the replica and cache."""
+        if self.replica is not None:
+            self.replica.apply_delete(record_id)
+
+        cache = _PARTICIPANT_CACHE.get(self._get_participant_cache_key())
+        if cache is not None:
+            cache.remove(record_id)
+
     async def create(self, participant: Participant) -> Participant:
         """
         Create a new participant record in Airtable.
@@ -95,7 +165,7 @@ class AirtableParticipantRepository(ParticipantRepository):
             created_participant = Participant.from_airtable_record(record)
 
             logger.info(f"Created participant with ID: {record['id']}")
-            self._invalidate_participant_cache()
+            self._write_through([record])
             return created_participant
 
         except AirtableAPIError as e:
@@ -129,6 +199,12 @@ class AirtableParticipantRepository(ParticipantRepository):
         try:
             logger.debug(f"Getting participant by ID: {participant_id}")
 
+            replica = self._fresh_replica()
+            if replica is not None:
+                participant = replica.get(participant_id)
+                if participant is not None:
+                    return participant
+
             record = await self.client.get_record(participant_id)
             if not record:
                 return None
@@ -142,6 +218,68 @@ class AirtableParticipantRepository(ParticipantRepository):
         except Exception as e:
             raise RepositoryError(f"Unexpected error getting participant: {e}", e)
 
+    async def get_by_ids(self, record_ids: Iterable[str]) -> Dict[str, Participant]:
+        """
+        Get several participants by Airtable record ID in batched requests.
+
+        IDs are answered from the fresh replica or the participant snapshot
+        when available; the rest are fetched with chunked
+        ``OR(RECORD_ID()=...)`` formula queries instead of one request each.
+
+        Args:
+            record_ids: Airtable record IDs; duplicates are looked up once
+
+        Returns:
+            Mapping of record ID to participant for the IDs that exist
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        wanted = list(dict.fromkeys(r for r in record_ids if r))
+        found: Dict[str, Participant] = {}
+        if not wanted:
+            return found
+
+        try:
+            replica = self._fresh_replica()
+            if replica is not None:
+                for record_id in wanted:
+                    participant = replica.get(record_id)
+                    if participant is not None:
+                        found[record_id] = participant
+            else:
+                cache = _PARTICIPANT_CACHE.get(self._get_participant_cache_key())
+                snapshot = cache.peek() if cache is not None else None
+                if snapshot is not None:
+                    wanted_set = set(wanted)
+                    for participant in snapshot.participants:
+                        if participant.record_id in wanted_set:
+                            found[participant.record_id] = participant.model_copy()
+
+            missing = [record_id for record_id in wanted if record_id not in found]
+            formulas = build_record_id_formulas(missing)
+            for formula in formulas:
+                for record in await self.client.list_records(formula=formula):
+                    try:
+                        found[record["id"]] = Participant.from_airtable_record(record)
+                    except Exception as e:
+                        logger.warning(
+                            f"Skipping invalid participant record {record.get('id')}: {e}"
+                        )
+
+            logger.debug(
+                f"Resolved {len(found)} of {len(wanted)} participants "
+                f"with {len(formulas)} requests"
+            )
+            return found
+
+        except AirtableAPIError as e:
+            raise RepositoryError(
+                f"Failed to get participants by ID: {e}", e.original_error
+            )
+        except Exception as e:
+            raise RepositoryError(f"Unexpected error getting participants: {e}", e)
+
     async def update(self, participant: Participant) -> Participant:
         """
         Update an existing participant record.
@@ -175,7 +313,7 @@ class AirtableParticipantRepository(ParticipantRepository):
             updated_participant = Participant.from_airtable_record(updated_record)
 
             logger.info(f"Updated participant: {participant.record_id}")
-            self._invalidate_participant_cache()
+            self._write_through([updated_record])
             return updated_participant
 
         except AirtableAPIError as e:
@@ -234,7 +372,7 @@ class AirtableParticipantRepository(ParticipantRepository):
 
             if updated_record:
                 logger.info(f"Successfully updated participant {record_id}")
-                self._invalidate_participant_cache()
+                self._write_through([updated_record])
                 return True
             else:
                 logger.warning(f"No record returned from update for {record_id}")
@@ -321,7 +459,7 @@ class AirtableParticipantRepository(ParticipantRepository):
 
             if success:
                 logger.info(f"Deleted participant: {participant_id}")
-                self._invalidate_participant_cache()
+                self._write_through_delete(participant_id)
 
             return success
 
@@ -357,13 +495,12 @@ class AirtableParticipantRepository(ParticipantRepository):
             field_name = AirtableFieldMapping.get_airtable_field_name("full_name_ru")
             if not field_name:
                 raise RepositoryError("Field mapping not found for full_name_ru")
-            records = await self.client.search_by_field(field_name, full_name_ru)
-
-            if not records:
+            # Only the first match is returned, so only one record is fetched
+            record = await self.client.find_first_by_field(field_name, full_name_ru)
+            if record is None:
                 return None
 
-            # Return the first matching participant
-            return Participant.from_airtable_record(records[0])
+            return Participant.from_airtable_record(record)
 
         except AirtableAPIError as e:
             raise RepositoryError(
@@ -398,12 +535,9 @@ class AirtableParticipantRepository(ParticipantRepository):
                     "Offset pagination not directly supported by Airtable API, offset will be ignored"
                 )
 
-            # Get records from Airtable
-            records = await self.client.list_records(max_records=limit)
-
-            # Convert to Participant objects
+            # Convert records page by page as they arrive from Airtable
             participants = []
-            for record in records:
+            async for record in self.client.stream_records(max_records=limit):
                 try:
                     participant = Participant.from_airtable_record(record)
                     participants.append(participant)
@@ -421,6 +555,51 @@ class AirtableParticipantRepository(ParticipantRepository):
         except Exception as e:
             raise RepositoryError(f"Unexpected error listing participants: {e}", e)
 
+    async def stream_all(
+        self, page_size: Optional[int] = None, prefetch: bool = True
+    ) -> AsyncGenerator[Participant, None]:
+        """
+        Stream all participants page by page as they arrive from Airtable.
+
+        Args:
+            page_size: Optional number of records fetched per page
+            prefetch: Fetch the next page while the current one is consumed;
+                disable when the caller stops after the first page
+
+        Yields:
+            Participants in table order; invalid records are skipped
+
+        Raises:
+            RepositoryError: If listing fails
+        """
+        records = self.client.stream_records(page_size=page_size, prefetch=prefetch)
+        try:
+            async for record in records:
+                try:
+                    yield Participant.from_airtable_record(record)
+                except Exception as e:
+                    logger.warning(
+                        f"Skipping invalid participant record {record.get('id', 'unknown')}: {e}"
+                    )
+        except AirtableAPIError as e:
+            raise RepositoryError(
+                f"Failed to stream participants: {e}", e.original_error
+            )
+        finally:
+            # Closing this stream early also stops the page fetches
+            await records.aclose()
+
+    async def stream_view_records(self, view: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream raw Airtable records for a given view page by page."""
+        try:
+            async for record in self.client.stream_records(view=view):
+                yield record  # type: ignore[misc]
+        except AirtableAPIError as e:
+            raise RepositoryError(
+                f"Failed to stream participants for view '{view}': {e}",
+                e.original_error,
+            )
+
     async def list_view_records(self, view: str) -> List[Dict[str, Any]]:
         """Retrieve raw Airtable records for a given view."""
         try:
@@ -437,6 +616,89 @@ class AirtableParticipantRepository(ParticipantRepository):
                 f"Unexpected error listing participants for view '{view}': {e}", e
             )
 
+    def peek_count(self) -> Optional[int]:
+        """
+        Return the record count of the fresh replica, if one is attached.
+
+        Returns:
+            Replica record count, or None when counting needs a table scan
+        """
+        replica = self._fresh_replica()
+        return replica.count() if replica is not None else None
+
+    def get_data_version(self) -> Optional[int]:
+        """
+        Return the version of the fresh replica, if one is attached.
+
+        Returns:
+            Replica version, or None when reads go to Airtable
+        """
+        replica = self._fresh_replica()
+        return replica.version if replica is not None else None
+
+    async def has_changes_since(self, since: datetime) -> bool:
+        """
+        Check for records modified after a moment with a single-record query.
+
+        Deleted records leave no modification time and are not detected.
+
+        Args:
+            since: Timezone-aware moment to compare modification times with
+
+        Returns:
+            True if at least one record was created or modified since then
+
+        Raises:
+            RepositoryError: If the check fails
+        """
+        try:
+            records = await self.client.list_records(
+                formula=build_modified_since_formula(since), max_records=1
+            )
+            return bool(records)
+        except AirtableAPIError as e:
+            raise RepositoryError(
+                f"Failed to check participants for changes: {e}", e.original_error
+            )
+        except Exception as e:
+            raise RepositoryError(
+                f"Unexpected error checking participants for changes: {e}", e
+            )
+
+    async def list_modified_since(self, since: datetime) -> List[Dict[str, Any]]:
+        """
+        Retrieve records modified after a moment with a formula query.
+
+        Only changed records are fetched, so frequent delta exports cost a
+        page or two instead of a full table scan. Deleted records leave no
+        modification time and are not returned.
+
+        Args:
+            since: Timezone-aware moment to compare modification times with
+
+        Returns:
+            Airtable record dictionaries of created or modified records
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        try:
+            records = await self.client.list_records(
+                formula=build_modified_since_formula(since)
+            )
+            logger.debug(
+                f"Retrieved {len(records)} participants modified since {since}"
+            )
+            return records  # type: ignore
+        except AirtableAPIError as e:
+            raise RepositoryError(
+                f"Failed to list modified participants: {e}", e.original_error
+            )
+        except Exception as e:
+            raise RepositoryError(
+                f"Unexpected error listing modified participants: {e}", e
+            )
+
     async def search_by_criteria(self, criteria: Dict[str, Any]) -> List[Participant]:
         """
         Search participants by multiple criteria.
@@ -535,28 +797,74 @@ class AirtableParticipantRepository(ParticipantRepository):
         table_identifier = config.table_id if config.table_id else config.table_name
         return f"{config.base_id}:{table_identifier}:participants"
 
-    def _invalidate_participant_cache(self) -> None:
-        """Invalidate cached participant list to reflect data mutations."""
+    def _get_participant_cache(self) -> ParticipantSnapshotCache:
+        """Return the shared participant snapshot cache for this table."""
         cache_key = self._get_participant_cache_key()
-        if cache_key in _PARTICIPANT_CACHE:
-            logger.debug("Invalidating participant cache for %s", cache_key)
-            _PARTICIPANT_CACHE.pop(cache_key, None)
+        cache = _PARTICIPANT_CACHE.get(cache_key)
+        if cache is None:
+            cache = _PARTICIPANT_CACHE[cache_key] = ParticipantSnapshotCache()
+        return cache
 
     async def _get_all_participants_cached(self) -> List[Participant]:
-        """Fetch all participants with short-lived caching to reduce Airtable load."""
-        cache_key = self._get_participant_cache_key()
-        cached = _PARTICIPANT_CACHE.get(cache_key)
-        now = time.time()
+        """
+        Fetch all participants from the replica or the shared snapshot cache.
 
-        if cached:
-            cached_at, participants = cached
-            if now - cached_at < _PARTICIPANT_CACHE_TTL_SECONDS:
-                logger.debug("Using cached participants for enhanced search")
-                return participants
+        Concurrent callers share one streamed ``list_all`` scan; once the
+        snapshot is older than the TTL it is still served while a refresh
+        runs.
+        """
+        replica = self._fresh_replica()
+        if replica is not None:
+            return replica.participants(copy=False)
+
+        return await self._get_participant_cache().get(
+            self.list_all, ttl_seconds=_PARTICIPANT_CACHE_TTL_SECONDS
+        )
 
-        participants = await self.list_all()
-        _PARTICIPANT_CACHE[cache_key] = (now, participants)
-        return participants
+    def _participant_snapshot_version(self) -> Optional[Tuple[object, int]]:
+        """
+        Identify the participant data the last snapshot read returned.
+
+        Returns:
+            (source, version) of the fresh replica or the snapshot cache, or
+            None when no versioned snapshot exists
+        """
+        replica = self._fresh_replica()
+        if replica is not None:
+            return (replica, replica.version)
+
+        cache = _PARTICIPANT_CACHE.get(self._get_participant_cache_key())
+        if cache is None or cache.peek() is None:
+            return None
+        return (cache, cache.version)
+
+    def _get_search_result_cache(self) -> SearchResultCache:
+        """Return the shared search result cache for this table."""
+        cache_key = self._get_participant_cache_key()
+        cache = _SEARCH_RESULT_CACHES.get(cache_key)
+        if cache is None:
+            cache = _SEARCH_RESULT_CACHES[cache_key] = SearchResultCache()
+        return cache
+
+    @staticmethod
+    def _search_result_key(
+        mode: str,
+        query: str,
+        threshold: float,
+        limit: int,
+        user_role: Optional[str],
+    ) -> Tuple[str, str, float, int, Optional[str]]:
+        """Build the result cache key for a name search."""
+        normalized = " ".join(normalize_russian(query).split())
+        return (mode, normalized, threshold, limit, user_role)
+
+    def _get_search_index(self) -> ParticipantSearchIndex:
+        """Return the shared fuzzy search index for this table."""
+        cache_key = self._get_participant_cache_key()
+        index = _SEARCH_INDEXES.get(cache_key)
+        if index is None:
+            index = _SEARCH_INDEXES[cache_key] = ParticipantSearchIndex()
+        return index
 
     async def get_by_role(self, role: str) -> List[Participant]:
         """
@@ -608,6 +916,11 @@ class AirtableParticipantRepository(ParticipantRepository):
             field_name = AirtableFieldMapping.get_airtable_field_name("payment_status")
             if not field_name:
                 raise RepositoryError("Field mapping not found for payment_status")
+
+            replica = self._fresh_replica()
+            if replica is not None:
+                return replica.find_by_field(field_name, payment_status)
+
             records = await self.client.search_by_field(field_name, payment_status)
 
             # Convert to Participant objects
@@ -672,6 +985,12 @@ class AirtableParticipantRepository(ParticipantRepository):
             )
             if not contact_field:
                 raise RepositoryError("Field mapping not found for contact_information")
+
+            replica = self._fresh_replica()
+            if replica is not None:
+                matches = replica.find_by_field(contact_field, contact_info)
+                return matches[0] if matches else None
+
             records = await self.client.search_by_field(contact_field, contact_info)
 
             if not records:
@@ -709,6 +1028,12 @@ class AirtableParticipantRepository(ParticipantRepository):
             telegram_field = AirtableFieldMapping.get_airtable_field_name("telegram_id")
             if not telegram_field:
                 raise RepositoryError("Field mapping not found for telegram_id")
+
+            replica = self._fresh_replica()
+            if replica is not None:
+                matches = replica.find_by_field(telegram_field, telegram_id)
+                return matches[0] if matches else None
+
             records = await self.client.search_by_field(telegram_field, telegram_id)
 
             if not records:
@@ -814,6 +1139,11 @@ class AirtableParticipantRepository(ParticipantRepository):
             field_name = AirtableFieldMapping.get_airtable_field_name("role")
             if not field_name:
                 raise RepositoryError("Field mapping not found for role")
+
+            replica = self._fresh_replica()
+            if replica is not None:
+                return replica.find_by_field(field_name, role)
+
             records = await self.client.search_by_field(field_name, role)
 
             # Convert to Participant objects
@@ -860,6 +1190,11 @@ class AirtableParticipantRepository(ParticipantRepository):
             field_name = AirtableFieldMapping.get_airtable_field_name("department")
             if not field_name:
                 raise RepositoryError("Field mapping not found for department")
+
+            replica = self._fresh_replica()
+            if replica is not None:
+                return replica.find_by_field(field_name, department)
+
             records = await self.client.search_by_field(field_name, department)
 
             # Convert to Participant objects
@@ -924,7 +1259,7 @@ class AirtableParticipantRepository(ParticipantRepository):
                 created_participants.append(participant)
 
             logger.info(f"Bulk created {len(created_participants)} participants")
-            self._invalidate_participant_cache()
+            self._write_through(created_records)
             return created_participants
 
         except AirtableAPIError as e:
@@ -987,7 +1322,7 @@ class AirtableParticipantRepository(ParticipantRepository):
                 updated_participants.append(participant)
 
             logger.info(f"Bulk updated {len(updated_participants)} participants")
-            self._invalidate_participant_cache()
+            self._write_through(updated_records)
             return updated_participants
 
         except AirtableAPIError as e:
@@ -1017,10 +1352,18 @@ class AirtableParticipantRepository(ParticipantRepository):
         try:
             logger.debug("Counting all participants")
 
-            # Get all records and count them
-            # Note: For very large datasets, this could be optimized with a dedicated count API
-            records = await self.client.list_records()
-            count = len(records)
+            replica = self._fresh_replica()
+            if replica is not None:
+                return replica.count()
+
+            # Airtable has no count API: stream the table requesting a single
+            # field so pages stay small and nothing is kept in memory
+            count_field = AirtableFieldMapping.get_airtable_field_name("full_name_ru")
+            count = 0
+            async for _ in self.client.stream_records(
+                fields=[count_field] if count_field else None
+            ):
+                count += 1
 
             logger.debug(f"Total participant count: {count}")
             return count
@@ -1105,11 +1448,23 @@ class AirtableParticipantRepository(ParticipantRepository):
                 logger.debug("No participants in database")
                 return []
 
+            version = self._participant_snapshot_version()
+            result_key = self._search_result_key(
+                "fuzzy", query, threshold, limit, user_role
+            )
+            if version is not None:
+                cached = self._get_search_result_cache().get(version, result_key)
+                if cached is not None:
+                    logger.debug(f"Fuzzy search for '{query}' served from cache")
+                    return list(cached)
+
             # Use SearchService for fuzzy matching (maintaining backward compatibility)
             search_service = SearchService(
                 similarity_threshold=threshold, max_results=limit
             )
-            search_results = search_service.search_participants(query, all_participants)
+            search_results = search_service.search_participants(
+                query, all_participants, index=self._get_search_index()
+            )
 
             # Apply role-based filtering to participants
             filtered_participants = filter_participants_by_role(
@@ -1122,6 +1477,11 @@ class AirtableParticipantRepository(ParticipantRepository):
                 for i, result in enumerate(search_results)
             ]
 
+            if version is not None:
+                self._get_search_result_cache().put(
+                    version, result_key, tuple(fuzzy_results)
+                )
+
             logger.debug(
                 f"Fuzzy search found {len(fuzzy_results)} matches (role: {user_role})"
             )
@@ -1175,6 +1535,16 @@ class AirtableParticipantRepository(ParticipantRepository):
                 logger.debug("No participants in database")
                 return []
 
+            version = self._participant_snapshot_version()
+            result_key = self._search_result_key(
+                "enhanced", query, threshold, limit, user_role
+            )
+            if version is not None:
+                cached = self._get_search_result_cache().get(version, result_key)
+                if cached is not None:
+                    logger.debug(f"Enhanced search for '{query}' served from cache")
+                    return list(cached)
+
             # Detect query language for optimized formatting
             detected_lang = detect_language(query.strip())
 
@@ -1183,7 +1553,7 @@ class AirtableParticipantRepository(ParticipantRepository):
                 similarity_threshold=threshold, max_results=limit
             )
             search_results = search_service.search_participants_enhanced(
-                query, all_participants
+                query, all_participants, index=self._get_search_index()
             )
 
             # Apply role-based filtering to participants before formatting
@@ -1203,6 +1573,11 @@ class AirtableParticipantRepository(ParticipantRepository):
                     (filtered_participant, result.similarity_score, formatted_result)
                 )
 
+            if version is not None:
+                self._get_search_result_cache().put(
+                    version, result_key, tuple(enhanced_results)
+                )
+
             logger.debug(
                 f"Enhanced search found {len(enhanced_results)} matches (role: {user_role})"
             )
@@ -1233,6 +1608,11 @@ class AirtableParticipantRepository(ParticipantRepository):
             field_name = AirtableFieldMapping.get_airtable_field_name("room_number")
             if not field_name:
                 raise RepositoryError("Field mapping not found for room_number")
+
+            replica = self._fresh_replica()
+            if replica is not None:
+                return replica.find_by_field(field_name, room_number)
+
             records = await self.client.search_by_field(field_name, room_number)
 
             # Convert to Participant objects
@@ -1281,6 +1661,11 @@ class AirtableParticipantRepository(ParticipantRepository):
             field_name = AirtableFieldMapping.get_airtable_field_name("floor")
             if not field_name:
                 raise RepositoryError("Field mapping not found for floor")
+
+            replica = self._fresh_replica()
+            if replica is not None:
+                return replica.find_by_field(field_name, floor)
+
             records = await self.client.search_by_field(field_name, floor)
 
             # Convert to Participant objects
@@ -1324,6 +1709,11 @@ class AirtableParticipantRepository(ParticipantRepository):
             RepositoryError: If floor discovery fails
         """
         try:
+            floor_field_name = AirtableFieldMapping.get_airtable_field_name("floor")
+            replica = self._fresh_replica()
+            if replica is not None and floor_field_name:
+                return self._unique_floors(replica.field_values(floor_field_name))
+
             # Create cache key using config (AirtableClient exposes config, not base_id/table_id directly)
             table_identifier = (
                 self.client.config.table_id
@@ -1351,7 +1741,6 @@ class AirtableParticipantRepository(ParticipantRepository):
 
             # Fetch floor data from Airtable with timeout
             logger.debug("Fetching floor data from Airtable")
-            floor_field_name = AirtableFieldMapping.get_airtable_field_name("floor")
             if not floor_field_name:
                 logger.warning("Floor field mapping not found; returning empty list")
                 return []
@@ -1368,25 +1757,9 @@ class AirtableParticipantRepository(ParticipantRepository):
                 return []
 
             # Extract and process floor values
-            from typing import Set
-
-            floor_set: Set[int] = set()
-            for record in records:
-                floor_value = record.get("fields", {}).get(floor_field_name)
-
-                # Filter out None, empty strings, and invalid values
-                if floor_value is not None and floor_value != "":
-                    try:
-                        # Convert to int, filtering out non-numeric floors
-                        floor_int = int(floor_value)
-                        floor_set.add(floor_int)
-                    except (ValueError, TypeError):
-                        # Skip non-numeric floor values (like "Ground")
-                        logger.debug(f"Skipping non-numeric floor value: {floor_value}")
-                        continue
-
-            # Convert to sorted list
-            result = sorted(list(floor_set))
+            result = self._unique_floors(
+                record.get("fields", {}).get(floor_field_name) for record in records
+            )
 
             # Cache the result
             _FLOOR_CACHE[cache_key] = (current_time, result)
@@ -1401,6 +1774,23 @@ class AirtableParticipantRepository(ParticipantRepository):
             logger.warning(f"Unexpected error during floor discovery: {e}")
             return []
 
+    @staticmethod
+    def _unique_floors(floor_values: Iterable[Any]) -> List[int]:
+        """Return sorted unique numeric floors, skipping empty and named floors."""
+        floor_set: Set[int] = set()
+        for floor_value in floor_values:
+            # Filter out None, empty strings, and invalid values
+            if floor_value is not None and floor_value != "":
+                try:
+                    # Convert to int, filtering out non-numeric floors
+                    floor_set.add(int(floor_value))
+                except (ValueError, TypeError):
+                    # Skip non-numeric floor values (like "Ground")
+                    logger.debug(f"Skipping non-numeric floor value: {floor_value}")
+                    continue
+
+        return sorted(floor_set)
+
     async def get_team_members_by_department(
         self, department: Optional[str] = None
     ) -> List[Participant]:
@@ -1452,6 +1842,26 @@ class AirtableParticipantRepository(ParticipantRepository):
                 escaped_dept = escape_formula_value(department)
                 base_conditions.append(f"{{Department}} = '{escaped_dept}'")
 
+            replica = self._fresh_replica()
+            if replica is not None:
+                participants = replica.filter(
+                    lambda record: self._is_team_member_in(
+                        record.get("fields", {}), department
+                    )
+                )
+                # Same order as the Airtable sort below: chiefs first, then church
+                participants.sort(
+                    key=lambda p: (
+                        not p.is_department_chief,
+                        (p.church or "").casefold(),
+                    )
+                )
+                logger.debug(
+                    f"Found {len(participants)} team members for department: "
+                    f"{department} (replica)"
+                )
+                return participants
+
             # Combine conditions
             if len(base_conditions) == 1:
                 formula = base_conditions[0]
@@ -1493,3 +1903,14 @@ class AirtableParticipantRepository(ParticipantRepository):
             raise RepositoryError(
                 f"Unexpected error getting team members by department: {e}", e
             )
+
+    @staticmethod
+    def _is_team_member_in(fields: Dict[str, Any], department: Optional[str]) -> bool:
+        """Check raw record fields against the team member department filter."""
+        if fields.get("Role") != "TEAM":
+            return False
+        if department is None:
+            return True
+        if department == "unassigned":
+            return not fields.get("Department")
+        return fields.get("Department") == department
@@ -0,0 +1,429 @@
+"""
+Native async transport for the Airtable REST API.
+
+Speaks the Airtable REST API directly over a shared ``httpx.AsyncClient`` so
+requests run on the event loop instead of occupying default-executor threads,
+and reuse pooled keep-alive connections (HTTP/2 when the optional ``h2``
+package is installed) instead of paying a TLS handshake per table session.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+from urllib.parse import quote
+
+import httpx
+from pyairtable.api.types import RecordDict
+
+if TYPE_CHECKING:  # For type hints without import-time dependency
+    from src.data.airtable.airtable_client import AirtableConfig
+
+logger = logging.getLogger(__name__)
+
+AIRTABLE_API_URL = "https://api.airtable.com/v0"
+
+# Airtable returns at most 100 records per page
+MAX_PAGE_SIZE = 100
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AirtableTransportError(Exception):
+    """Exception raised when an Airtable REST request fails."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        original_error: Optional[Exception] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.original_error = original_error
+
+
+def is_http2_available() -> bool:
+    """Check whether the optional ``h2`` package required for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_sort(sort: List[str]) -> List[Dict[str, str]]:
+    """Convert pyairtable-style sort fields (``-Field`` for desc) to REST format."""
+    result = []
+    for field_name in sort:
+        if field_name.startswith("-"):
+            result.append({"field": field_name[1:], "direction": "desc"})
+        else:
+            result.append({"field": field_name, "direction": "asc"})
+    return result
+
+
+class AirtableAsyncTransport:
+    """
+    Async Airtable REST transport backed by a pooled ``httpx.AsyncClient``.
+
+    A single transport is meant to be shared by every table client of the bot
+    so that all of them reuse one connection pool. The underlying HTTP client
+    is created lazily and re-created if the event loop changes (e.g. between
+    test runs), since pooled connections are bound to the loop that opened them.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout_seconds: float = 30,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry_seconds: float = 30.0,
+        http2: bool = True,
+        max_retries: int = 3,
+        retry_delay_seconds: float = 1.0,
+        base_url: str = AIRTABLE_API_URL,
+        http_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            api_key: Airtable personal access token
+            timeout_seconds: Per-request timeout
+            max_connections: Maximum number of concurrent pooled connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            keepalive_expiry_seconds: Idle time before a keep-alive connection closes
+            http2: Use HTTP/2 when the ``h2`` package is available
+            max_retries: Retries for rate-limited or transient failures
+            retry_delay_seconds: Base delay for exponential retry backoff
+            base_url: Airtable REST API root URL
+            http_transport: Optional custom httpx transport (used in tests)
+        """
+        self.api_key = api_key
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self.base_url = base_url.rstrip("/")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+
+        self.http2 = http2 and is_http2_available()
+        if http2 and not self.http2:
+            logger.info(
+                "HTTP/2 requested for Airtable transport but 'h2' is not installed; "
+                "using HTTP/1.1 keep-alive connections"
+            )
+
+        self._http_transport = http_transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.timeout_seconds,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._http_transport,
+            )
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    def _table_path(base_id: str, table: str) -> str:
+        """Build the REST path for a table (names may contain non-ASCII)."""
+        return f"/{base_id}/{quote(table, safe='')}"
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """Compute backoff delay, honouring Retry-After when the server sends it."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+        return self.retry_delay_seconds * (2**attempt)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a request to the Airtable REST API with retries.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the API root
+            params: Query string parameters
+            json: JSON request body
+
+        Returns:
+            Decoded JSON response, or None if the resource was not found
+
+        Raises:
+            AirtableTransportError: If the request fails after all retries
+        """
+        client = self._get_client()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await client.request(method, path, params=params, json=json)
+            except httpx.TransportError as e:
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt, None))
+                    continue
+                raise AirtableTransportError(
+                    f"{method} {path} failed: {e}", original_error=e
+                )
+
+            if response.status_code in RETRYABLE_STATUS_CODES and (
+                attempt < self.max_retries
+            ):
+                delay = self._retry_delay(attempt, response)
+                logger.warning(
+                    f"Airtable returned {response.status_code} for {method} {path}, "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code == 404:
+                return None
+
+            if response.is_error:
+                raise AirtableTransportError(
+                    f"{method} {path} returned {response.status_code}: "
+                    f"{response.text}",
+                    status_code=response.status_code,
+                )
+
+            return response.json() if response.content else {}
+
+        # Unreachable: the loop either returns or raises
+        raise AirtableTransportError(f"{method} {path} failed")  # pragma: no cover
+
+    async def list_page(
+        self,
+        base_id: str,
+        table: str,
+        offset: Optional[str] = None,
+        formula: Optional[str] = None,
+        sort: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        max_records: Optional[int] = None,
+        view: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Tuple[List[RecordDict], Optional[str]]:
+        """
+        Fetch a single page of records.
+
+        Uses the POST ``listRecords`` endpoint so long formulas never hit URL
+        length limits.
+
+        Returns:
+            Tuple of (records on this page, offset for the next page or None)
+        """
+        body: Dict[str, Any] = {}
+        if formula:
+            body["filterByFormula"] = formula
+        if sort:
+            body["sort"] = _build_sort(sort)
+        if fields:
+            body["fields"] = fields
+        if max_records:
+            body["maxRecords"] = max_records
+        if view:
+            body["view"] = view
+        if page_size:
+            body["pageSize"] = min(page_size, MAX_PAGE_SIZE)
+        if offset:
+            body["offset"] = offset
+
+        data = await self.request(
+            "POST", f"{self._table_path(base_id, table)}/listRecords", json=body
+        )
+        if data is None:
+            raise AirtableTransportError(
+                f"Table {table} not found in base {base_id}", status_code=404
+            )
+        return data.get("records", []), data.get("offset")
+
+    async def list_records(
+        self,
+        base_id: str,
+        table: str,
+        **options: Any,
+    ) -> List[RecordDict]:
+        """
+        Fetch all records matching the options, following pagination.
+
+        Accepts the same keyword options as :meth:`list_page`.
+        """
+        records: List[RecordDict] = []
+        offset: Optional[str] = None
+        while True:
+            page, offset = await self.list_page(
+                base_id, table, offset=offset, **options
+            )
+            records.extend(page)
+            if not offset:
+                return records
+
+    async def get_record(
+        self, base_id: str, table: str, record_id: str
+    ) -> Optional[RecordDict]:
+        """Fetch a single record by ID, returning None if it does not exist."""
+        data = await self.request(
+            "GET", f"{self._table_path(base_id, table)}/{record_id}"
+        )
+        return cast(RecordDict, data) if data is not None else None
+
+    async def create_record(
+        self, base_id: str, table: str, fields: Dict[str, Any]
+    ) -> RecordDict:
+        """Create a single record."""
+        data = await self.request(
+            "POST", self._table_path(base_id, table), json={"fields": fields}
+        )
+        if data is None:
+            raise AirtableTransportError(
+                f"Table {table} not found in base {base_id}", status_code=404
+            )
+        return cast(RecordDict, data)
+
+    async def update_record(
+        self, base_id: str, table: str, record_id: str, fields: Dict[str, Any]
+    ) -> RecordDict:
+        """Patch a single record."""
+        data = await self.request(
+            "PATCH",
+            f"{self._table_path(base_id, table)}/{record_id}",
+            json={"fields": fields},
+        )
+        if data is None:
+            raise AirtableTransportError(
+                f"Record {record_id} not found", status_code=404
+            )
+        return cast(RecordDict, data)
+
+    async def delete_record(self, base_id: str, table: str, record_id: str) -> bool:
+        """Delete a single record."""
+        data = await self.request(
+            "DELETE", f"{self._table_path(base_id, table)}/{record_id}"
+        )
+        if data is None:
+            raise AirtableTransportError(
+                f"Record {record_id} not found", status_code=404
+            )
+        return bool(data.get("deleted", True))
+
+    async def batch_create(
+        self, base_id: str, table: str, records: List[Dict[str, Any]]
+    ) -> List[RecordDict]:
+        """Create up to 10 records in a single request."""
+        data = await self.request(
+            "POST",
+            self._table_path(base_id, table),
+            json={"records": [{"fields": fields} for fields in records]},
+        )
+        if data is None:
+            raise AirtableTransportError(
+                f"Table {table} not found in base {base_id}", status_code=404
+            )
+        return data.get("records", [])
+
+    async def batch_update(
+        self, base_id: str, table: str, updates: List[Dict[str, Any]]
+    ) -> List[RecordDict]:
+        """Patch up to 10 records (``{'id', 'fields'}`` dicts) in a single request."""
+        data = await self.request(
+            "PATCH", self._table_path(base_id, table), json={"records": updates}
+        )
+        if data is None:
+            raise AirtableTransportError(
+                f"Table {table} or one of its records not found", status_code=404
+            )
+        return data.get("records", [])
+
+    async def get_table_schema(self, base_id: str, table: str) -> Dict[str, Any]:
+        """Fetch schema metadata for a table by ID or name."""
+        data = await self.request("GET", f"/meta/bases/{base_id}/tables")
+        for table_schema in (data or {}).get("tables", []):
+            if table in (table_schema.get("id"), table_schema.get("name")):
+                return table_schema
+        raise AirtableTransportError(
+            f"Table {table} not found in base {base_id}", status_code=404
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+
+# Shared transports keyed by credentials and pool settings so every table
+# client created with the same configuration reuses one connection pool
+_SHARED_TRANSPORTS: Dict[Tuple, AirtableAsyncTransport] = {}
+
+
+def get_shared_transport(config: "AirtableConfig") -> AirtableAsyncTransport:
+    """
+    Return the process-wide transport for the given configuration.
+
+    Table-specific settings (base, table) are not part of the key, so clients
+    for participants, ROE, Bible readers and schedule share one pool.
+
+    Args:
+        config: Airtable configuration of the requesting client
+
+    Returns:
+        Shared AirtableAsyncTransport instance
+    """
+    key = (
+        config.api_key,
+        config.timeout_seconds,
+        config.max_connections,
+        config.max_keepalive_connections,
+        config.keepalive_expiry_seconds,
+        config.http2,
+        config.max_retries,
+        config.retry_delay_seconds,
+    )
+    transport = _SHARED_TRANSPORTS.get(key)
+    if transport is None:
+        transport = AirtableAsyncTransport(
+            api_key=config.api_key,
+            timeout_seconds=config.timeout_seconds,
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry_seconds=config.keepalive_expiry_seconds,
+            http2=config.http2,
+            max_retries=config.max_retries,
+            retry_delay_seconds=config.retry_delay_seconds,
+        )
+        _SHARED_TRANSPORTS[key] = transport
+    return transport
+
+
+async def close_shared_transports() -> None:
+    """Close and forget all shared transports (called on bot shutdown)."""
+    transports = list(_SHARED_TRANSPORTS.values())
+    _SHARED_TRANSPORTS.clear()
+    for transport in transports:
+        await transport.aclose()
@@ -1,7 +1,12 @@
 """Utility helpers for building Airtable formulas safely."""
 
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Tuple
+from typing import Any, List, Sequence, Tuple
+
+# Record IDs per OR(RECORD_ID()=...) formula; ~35 characters per ID keeps
+# the encoded formula well below Airtable's 16k URL limit
+RECORD_ID_FORMULA_BATCH_SIZE = 100
 
 
 def escape_formula_value(value: str) -> str:
@@ -16,3 +21,25 @@ def prepare_formula_value(value: Any) -> Tuple[bool, Any]:
     if isinstance(value, str):
         return True, escape_formula_value(value)
     return False, value
+
+
+def build_record_id_formulas(
+    record_ids: Sequence[str], batch_size: int = RECORD_ID_FORMULA_BATCH_SIZE
+) -> List[str]:
+    """Build ``OR(RECORD_ID()='...')`` formulas matching the IDs in batches."""
+    formulas = []
+    for start in range(0, len(record_ids), batch_size):
+        clauses = ",".join(
+            f"RECORD_ID()='{escape_formula_value(record_id)}'"
+            for record_id in record_ids[start : start + batch_size]
+        )
+        formulas.append(f"OR({clauses})")
+    return formulas
+
+
+def build_modified_since_formula(since: datetime) -> str:
+    """Build a formula matching records modified after ``since`` (UTC)."""
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc)
+    watermark = since.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{watermark}'))"
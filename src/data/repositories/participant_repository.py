@@ -7,7 +7,18 @@ without changing business logic.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from src.models.participant import Participant
 
@@ -53,6 +64,29 @@ class ParticipantRepository(ABC):
         """
         pass
 
+    async def get_by_ids(self, record_ids: Iterable[str]) -> Dict[str, Participant]:
+        """
+        Retrieve several participants by record ID.
+
+        The default implementation calls :meth:`get_by_id` for each ID;
+        implementations should override it with a batched lookup.
+
+        Args:
+            record_ids: Record identifiers; duplicates are looked up once
+
+        Returns:
+            Mapping of record ID to participant for the IDs that exist
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        found: Dict[str, Participant] = {}
+        for record_id in dict.fromkeys(record_ids):
+            participant = await self.get_by_id(record_id)
+            if participant is not None:
+                found[record_id] = participant
+        return found
+
     @abstractmethod
     async def get_by_full_name_ru(self, full_name_ru: str) -> Optional[Participant]:
         """
@@ -138,6 +172,97 @@ class ParticipantRepository(ABC):
         """
         pass
 
+    # Optional streaming read; default falls back to list_all
+    async def stream_all(
+        self, page_size: Optional[int] = None, prefetch: bool = True
+    ) -> AsyncGenerator[Participant, None]:
+        """
+        Stream all participants as they are retrieved.
+
+        Implementations backed by paginated storage should yield participants
+        page by page so callers get the first rows early, use constant memory
+        and can stop iterating before the whole table is fetched.
+
+        Args:
+            page_size: Optional number of records fetched per page
+            prefetch: Fetch the next page while the current one is consumed;
+                disable when the caller stops after the first page
+
+        Yields:
+            Participants in storage order
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        for participant in await self.list_all():
+            yield participant
+
+    # Optional count that costs no storage read; default reports none
+    def peek_count(self) -> Optional[int]:
+        """
+        Return the number of participants if it is known without a read.
+
+        Callers use it as a hint (e.g. for progress totals) and fall back to
+        :meth:`count_total` or to counting streamed rows when it is None.
+
+        Returns:
+            Participant count, or None if it would have to be read
+        """
+        return None
+
+    # Optional change detection used to reuse cached exports
+    def get_data_version(self) -> Optional[Hashable]:
+        """
+        Return a version identifying the current participant data.
+
+        The version must change whenever participant data changes. The
+        default reports no version, which makes callers fall back to
+        :meth:`has_changes_since`.
+
+        Returns:
+            Hashable data version, or None if the storage cannot provide one
+        """
+        return None
+
+    async def has_changes_since(self, since: datetime) -> bool:
+        """
+        Check whether participants were created or modified after a moment.
+
+        The default conservatively reports a change.
+
+        Args:
+            since: Timezone-aware moment to compare modification times with
+
+        Returns:
+            True if data may have changed since the given moment
+
+        Raises:
+            RepositoryError: If the check fails
+        """
+        return True
+
+    async def list_modified_since(self, since: datetime) -> List[Dict[str, Any]]:
+        """
+        Retrieve raw records created or modified after a moment.
+
+        The default conservatively returns every participant, rebuilt from
+        its Airtable fields without a ``createdTime``.
+
+        Args:
+            since: Timezone-aware moment to compare modification times with
+
+        Returns:
+            Airtable record dictionaries with ``id``, ``fields`` and, where
+            available, ``createdTime``
+
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        return [
+            {"id": participant.record_id, "fields": participant.to_airtable_fields()}
+            for participant in await self.list_all()
+        ]
+
     @abstractmethod
     async def search_by_criteria(self, criteria: Dict[str, Any]) -> List[Participant]:
         """
@@ -20,6 +20,7 @@ from telegram.request import HTTPXRequest
 from src.bot.handlers.admin_handlers import handle_logging_toggle_command
 from src.bot.handlers.export_conversation_handlers import (
     get_export_conversation_handler,
+    wait_for_background_exports,
 )
 from src.bot.handlers.export_handlers import handle_export_command
 from src.bot.handlers.help_handlers import handle_help_command
@@ -31,15 +32,23 @@ from src.bot.handlers.notification_admin_handlers import (
 from src.bot.handlers.schedule_handlers import get_schedule_handlers
 from src.bot.handlers.search_conversation import get_search_conversation_handler
 from src.config.settings import Settings, get_settings
+from src.data.airtable.airtable_transport import close_shared_transports
 from src.services.daily_notification_service import DailyNotificationService
 from src.services.file_logging_service import FileLoggingService
 from src.services.notification_scheduler import NotificationScheduler
-from src.services.service_factory import get_participant_repository
+from src.services.security_audit_service import get_security_audit_service
+from src.services.service_factory import (
+    get_participant_replica,
+    get_participant_repository,
+)
 from src.services.statistics_service import StatisticsService
 from src.utils.single_instance import InstanceLock
 
 logger = logging.getLogger(__name__)
 
+# Seconds background exports may take to finish uploading when the bot stops
+BACKGROUND_EXPORT_STOP_TIMEOUT_SECONDS = 60
+
 # Global file logging service instance
 _file_logging_service: Optional[FileLoggingService] = None
 
@@ -84,9 +93,61 @@ def configure_logging(settings: Settings) -> None:
         logger.error(f"Failed to initialize file logging: {e}")
         logger.warning("Continuing with console logging only")
 
+    # Configure sampling and buffering of security audit events
+    try:
+        get_security_audit_service().configure(
+            buffer_size=settings.logging.security_audit_buffer_size,
+            flush_interval_seconds=settings.logging.security_audit_flush_interval_seconds,
+            granted_sample_rate=settings.logging.security_audit_granted_sample_rate,
+            fast_sample_rate=settings.logging.security_audit_fast_sample_rate,
+        )
+    except Exception as e:
+        logger.error(f"Failed to configure security audit pipeline: {e}")
+
     logger.info(f"Logging configured with level: {settings.logging.log_level}")
 
 
+async def initialize_participant_replica(application: Application) -> None:
+    """
+    Schedule the background sync job of the local Participants replica.
+
+    The first run performs a full load; later runs pull only changed records.
+    Failures are logged and leave repositories reading from Airtable.
+
+    Args:
+        application: The initialized Application instance
+    """
+    try:
+        replica = get_participant_replica()
+        if replica is None:
+            logger.debug("Participant replica disabled")
+            return
+
+        async def sync_participant_replica(context: ContextTypes.DEFAULT_TYPE) -> None:
+            try:
+                await replica.sync()
+            except Exception as e:
+                logger.warning(f"Participant replica sync failed: {e}")
+
+        if application.job_queue is None:
+            logger.warning("JobQueue not available, participant replica not synced")
+            return
+
+        application.job_queue.run_repeating(
+            sync_participant_replica,
+            interval=replica.sync_interval_seconds,
+            first=0,
+            name="participant_replica_sync",
+        )
+        logger.info(
+            "Participant replica sync scheduled every %ss",
+            replica.sync_interval_seconds,
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize participant replica: {e}")
+        logger.warning("Participant reads will go directly to Airtable")
+
+
 def get_file_logging_service() -> Optional[FileLoggingService]:
     """
     Get the global file logging service instance.
@@ -191,7 +252,10 @@ def create_application() -> Application:
     # Register post_init callback for notification scheduler initialization
     async def initialize_notification_scheduler(application: Application) -> None:
         """
-        Post-initialization callback to set up notification scheduler.
+        Post-initialization callback to set up background jobs.
+
+        Starts the security audit drain task and schedules the participant
+        replica sync (when enabled) and the daily notification scheduler.
 
         Called after application is fully initialized but before polling starts.
         This ensures proper lifecycle management and clean separation of concerns.
@@ -204,6 +268,9 @@ def create_application() -> Application:
         """
         settings = application.bot_data.get("settings")
 
+        await get_security_audit_service().start()
+        await initialize_participant_replica(application)
+
         try:
             logger.info("Initializing daily notification scheduler via post_init")
 
@@ -249,6 +316,16 @@ def create_application() -> Application:
 
     app.post_init = initialize_notification_scheduler
 
+    # Let exports running in the background finish their uploads on stop,
+    # then write the buffered security audit events
+    async def finish_background_work(application: Application) -> None:
+        await wait_for_background_exports(
+            timeout=BACKGROUND_EXPORT_STOP_TIMEOUT_SECONDS
+        )
+        await get_security_audit_service().stop()
+
+    app.post_stop = finish_background_work
+
     # Register global error handler for better diagnostics
     async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
         err = getattr(context, "error", None)
@@ -442,6 +519,8 @@ async def run_bot() -> None:
         raise
     finally:
         await _shutdown_application(app)
+        with suppress(Exception):
+            await close_shared_transports()
         logger.info("Bot shutdown complete")
 
 
@@ -481,6 +560,11 @@ def main() -> None:
         if loop is not None and not loop.is_closed() and not loop.is_running():
             loop.close()
 
+        # Write queued file log records and stop the log writer threads
+        if _file_logging_service is not None:
+            with suppress(Exception):
+                _file_logging_service.close()
+
         print("Application terminated")
 
 
@@ -9,7 +9,6 @@ import csv
 import io
 import logging
 import tempfile
-from datetime import date, datetime
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
@@ -21,12 +20,14 @@ from src.data.repositories.participant_repository import (
     RepositoryError,
 )
 from src.models.bible_readers import BibleReader
+from src.services.participant_name_hydrator import ParticipantNameHydrator
+from src.utils.columnar_export import ExportTable
 from src.utils.export_utils import (
     extract_headers_from_view_records,
     format_line_number,
     generate_readable_export_filename,
-    order_rows_by_view_headers,
 )
+from src.utils.row_formatter import RowFormatter
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,7 @@ class BibleReadersExportService:
         self.participant_repository = participant_repository
         self.progress_callback = progress_callback
         self._settings = settings
+        self._name_hydrator: Optional[ParticipantNameHydrator] = None
 
     @property
     def settings(self) -> Settings:
@@ -94,6 +96,8 @@ class BibleReadersExportService:
             Exception: If repository access fails
         """
         logger.info("Starting BibleReaders CSV export")
+        # Resolve linked participant names afresh for every export
+        self._name_hydrator = None
 
         # Try to use view-based export first
         try:
@@ -117,6 +121,11 @@ class BibleReadersExportService:
         total_count = len(bible_readers)
         logger.info(f"Retrieved {total_count} Bible readers for export")
 
+        # Resolve all linked participants of the export in one batch
+        await self._get_name_hydrator().prefetch(
+            bible_reader.participants for bible_reader in bible_readers
+        )
+
         # Report initial progress
         if self.progress_callback:
             self.progress_callback(0, total_count)
@@ -126,12 +135,13 @@ class BibleReadersExportService:
 
         # Define CSV headers using Airtable field names
         headers = self._get_csv_headers()
+        formatter = self._compile_row_formatter(headers)
 
         # Create CSV writer
-        writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
+        writer = csv.writer(output)
 
         # Write headers
-        writer.writeheader()
+        writer.writerow(headers)
 
         # Calculate width for line numbers based on total count
         width = len(str(total_count)) if total_count > 0 else 1
@@ -139,9 +149,9 @@ class BibleReadersExportService:
         # Process Bible readers
         for index, bible_reader in enumerate(bible_readers):
             # Convert Bible reader to CSV row with participant hydration
-            row = await self._bible_reader_to_csv_row(bible_reader)
+            row = await self._bible_reader_to_csv_row(bible_reader, formatter)
             # Add line number as first column with consistent width
-            row["#"] = format_line_number(index + 1, width)
+            row[0] = format_line_number(index + 1, width)
             writer.writerow(row)
 
             # Report progress at intervals (every 10 records or at end)
@@ -178,11 +188,8 @@ class BibleReadersExportService:
         if self.progress_callback:
             self.progress_callback(0, total_count)
 
-        # Calculate width for line numbers
-        width = len(str(total_count)) if total_count > 0 else 1
-
-        # Prepare rows with view data and hydrated names
-        prepared_rows = []
+        # Parse records first so all linked participants resolve in one batch
+        parsed = []
         for index, record in enumerate(raw_records):
             try:
                 bible_reader = BibleReader.from_airtable_record(record)
@@ -192,72 +199,55 @@ class BibleReadersExportService:
                     f"{record.get('id', 'unknown')} from view '{view_name}': {exc}"
                 )
                 continue
+            parsed.append((index, record, bible_reader))
 
-            # Get view field data
-            view_data = record.get("fields", {})
+        await self._get_name_hydrator().prefetch(
+            bible_reader.participants for _, _, bible_reader in parsed
+        )
 
-            # Create row with view data and hydrated participant names
-            row = {}
-            for field_name, field_value in view_data.items():
-                row[field_name] = self._format_raw_value(field_value)
+        # Build columns from view data in view order
+        table = ExportTable.from_view_records(
+            [record for _, record, _ in parsed], headers, list_separator="; "
+        )
+        # Number rows by their position in the view, skipped records included
+        table.add_line_numbers(
+            [index + 1 for index, _, _ in parsed],
+            width=len(str(total_count)) if total_count > 0 else 1,
+        )
 
-            # Hydrate participant names for Participants field
-            participant_names = await self._hydrate_participant_names(
-                bible_reader.participants
+        # Hydrate participant names for relationship fields
+        hydrated: Dict[str, List[List[str]]] = {}
+        hydrated["Participants"] = []
+        for index, _, bible_reader in parsed:
+            hydrated["Participants"].append(
+                await self._hydrate_participant_names(bible_reader.participants)
             )
 
-            # Override with hydrated names
-            if participant_names:
-                row["Participants"] = "; ".join(participant_names)
-
-            # Add line number
-            row["#"] = format_line_number(index + 1, width)
-            prepared_rows.append(row)
-
             # Report progress
             if self.progress_callback:
-                if (index + 1) % 10 == 0 or (index + 1) == len(raw_records):
-                    self.progress_callback(index + 1, len(raw_records))
-
-        # Reorder rows based on view headers
-        if view_headers:
-            reordered_rows = order_rows_by_view_headers(
-                view_headers,
-                list(prepared_rows[0].keys()) if prepared_rows else [],
-                prepared_rows,
-            )
-        else:
-            reordered_rows = prepared_rows
-
-        # Write to CSV
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
-        writer.writeheader()
+                if (index + 1) % 10 == 0 or (index + 1) == total_count:
+                    self.progress_callback(index + 1, total_count)
 
-        for row in reordered_rows:
-            writer.writerow(row)
+        # Override with hydrated names where linked participants resolved
+        for field_name, names_per_row in hydrated.items():
+            column = table.column(field_name)
+            if column is None:
+                continue
+            table.add_column(
+                field_name,
+                [
+                    "; ".join(names) if names else value
+                    for names, value in zip(names_per_row, column.values)
+                ],
+                text=column.text,
+            )
 
-        csv_string = output.getvalue()
-        output.close()
+        with table.write() as export:
+            csv_string = export.read_text()
 
-        logger.info(
-            f"BibleReaders view export completed with {len(reordered_rows)} records"
-        )
+        logger.info(f"BibleReaders view export completed with {len(parsed)} records")
         return csv_string
 
-    @staticmethod
-    def _format_raw_value(value) -> str:
-        """Format raw Airtable values for CSV output."""
-        if value is None:
-            return ""
-        if isinstance(value, (date, datetime)):
-            return value.isoformat()[:10]
-        if isinstance(value, list):
-            return "; ".join(str(item) for item in value)
-        if isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
-        return str(value)
-
     async def export_to_csv_async(self) -> str:
         """Async wrapper matching the export interface pattern."""
         return await self.get_all_bible_readers_as_csv()
@@ -385,26 +375,31 @@ class BibleReadersExportService:
 
         return within_limit
 
+    def _get_name_hydrator(self) -> ParticipantNameHydrator:
+        """Return the name hydrator of the current export."""
+        hydrator = self._name_hydrator
+        if (
+            hydrator is None
+            or hydrator.participant_repository is not self.participant_repository
+        ):
+            hydrator = ParticipantNameHydrator(self.participant_repository)
+            self._name_hydrator = hydrator
+        return hydrator
+
     async def _hydrate_participant_names(self, participant_ids: List[str]) -> List[str]:
         """
         Hydrate participant IDs to full names.
 
+        Uses names prefetched for the whole export; IDs not prefetched are
+        resolved in one batch.
+
         Args:
             participant_ids: List of participant record IDs
 
         Returns:
             List of participant full names (Russian)
         """
-        if not participant_ids:
-            return []
-
-        names = []
-        for participant_id in participant_ids:
-            participant = await self.participant_repository.get_by_id(participant_id)
-            if participant and participant.full_name_ru:
-                names.append(participant.full_name_ru)
-
-        return names
+        return await self._get_name_hydrator().names(participant_ids)
 
     def _get_csv_headers(self) -> List[str]:
         """
@@ -415,53 +410,48 @@ class BibleReadersExportService:
         """
         return ["#", "Where", "Participants", "When", "Bible"]
 
+    def _compile_row_formatter(self, headers: List[str]) -> RowFormatter:
+        """
+        Compile the row formatter of one export.
+
+        The Participants column is left to participant name hydration.
+
+        Args:
+            headers: CSV headers in output order
+
+        Returns:
+            Row formatter for Bible readers
+        """
+        return RowFormatter.compile(
+            BibleReader,
+            BibleReadersFieldMapping.PYTHON_TO_AIRTABLE,
+            headers,
+            skip={"Participants"},
+        )
+
     async def _bible_reader_to_csv_row(
-        self, bible_reader: BibleReader
-    ) -> Dict[str, str]:
+        self, bible_reader: BibleReader, formatter: Optional[RowFormatter] = None
+    ) -> List[str]:
         """
-        Convert a BibleReader object to a CSV row dictionary with participant hydration.
+        Convert a BibleReader object to a CSV row with participant hydration.
 
         Args:
             bible_reader: BibleReader instance to convert
+            formatter: Row formatter compiled for the export; compiled for the
+                default headers when omitted
 
         Returns:
-            Dictionary with Airtable field names as keys and formatted values
+            Formatted values in the formatter's header order
         """
-        row = {}
-
-        # Map each field from BibleReader model
-        for (
-            python_field,
-            airtable_field,
-        ) in BibleReadersFieldMapping.PYTHON_TO_AIRTABLE.items():
-            if python_field == "record_id":
-                continue  # Skip internal record_id
-
-            # Get value from Bible reader
-            value = getattr(bible_reader, python_field, None)
-
-            # Format value for CSV
-            if value is None:
-                row[airtable_field] = ""
-            elif isinstance(value, date):
-                row[airtable_field] = value.isoformat()  # YYYY-MM-DD format
-            elif isinstance(value, list):
-                # Handle list fields (participants, churches, room_numbers)
-                if python_field == "participants":
-                    # Skip participants IDs, we'll hydrate names separately
-                    row[airtable_field] = "; ".join(value) if value else ""
-                else:
-                    # Format other list fields (churches, room_numbers)
-                    row[airtable_field] = (
-                        "; ".join(str(item) for item in value) if value else ""
-                    )
-            else:
-                row[airtable_field] = str(value)
+        formatter = formatter or self._compile_row_formatter(self._get_csv_headers())
+        row = formatter.format(bible_reader)
 
         # Hydrate participant names for Participants column
-        participant_names = await self._hydrate_participant_names(
-            bible_reader.participants
-        )
-        row["Participants"] = "; ".join(participant_names) if participant_names else ""
+        index = formatter.index("Participants")
+        if index is not None:
+            participant_names = await self._hydrate_participant_names(
+                bible_reader.participants
+            )
+            row[index] = "; ".join(participant_names) if participant_names else ""
 
         return row
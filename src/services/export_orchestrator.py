@@ -0,0 +1,171 @@
+"""
+Concurrent orchestration of exports from several tables.
+
+A combined export (the full retreat packet) needs the Participants, ROE and
+BibleReaders tables. Each table export spends most of its time waiting for
+Airtable pages, so the orchestrator runs them at the same time instead of one
+after another. All table clients of a base share one rate limiter, which keeps
+the concurrent fetches within the base's request budget; the orchestrator
+additionally caps how many exports run at once.
+"""
+
+import asyncio
+import logging
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from src.utils.export_utils import CSVExportFile, write_zip_export
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+
+# Starts one table export, reporting its progress through the given callback
+ExportJob = Callable[[ProgressCallback], Awaitable[Union[str, CSVExportFile]]]
+
+# Default number of table exports running at the same time
+DEFAULT_MAX_CONCURRENT_EXPORTS = 3
+
+
+class ExportOrchestrator:
+    """
+    Runs independent table exports concurrently and combines their results.
+
+    Features:
+    - Concurrent table exports with a concurrency cap
+    - Combined progress reported through one ``progress_callback``, with a
+      total of 0 while any table streams without a known total
+    - Exports kept as they finish while slower tables are still running
+    - Remaining exports cancelled and files released when one fails
+    """
+
+    def __init__(
+        self,
+        jobs: Mapping[str, ExportJob],
+        progress_callback: Optional[ProgressCallback] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_EXPORTS,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            jobs: Table exports keyed by their file name in the combined export
+            progress_callback: Optional callback for combined progress updates
+                (current, total) across all tables
+            max_concurrency: Maximum number of exports running at once
+        """
+        self.jobs = dict(jobs)
+        self.progress_callback = progress_callback
+        self.max_concurrency = max(1, max_concurrency)
+        self.durations: Dict[str, float] = {}
+        self._progress: Dict[str, Tuple[int, int]] = {}
+        self._finished: Set[str] = set()
+
+    def _on_progress(self, name: str, current: int, total: int) -> None:
+        self._progress[name] = (current, total)
+        if self.progress_callback:
+            combined_current = sum(c for c, _ in self._progress.values())
+            # A table streaming without a known total (0) leaves the combined
+            # total unknown too; summing the others would exceed 100%
+            if any(
+                t == 0 and table not in self._finished
+                for table, (_, t) in self._progress.items()
+            ):
+                combined_total = 0
+            else:
+                combined_total = sum(max(c, t) for c, t in self._progress.values())
+            self.progress_callback(combined_current, combined_total)
+
+    async def _run_job(
+        self, name: str, job: ExportJob, semaphore: asyncio.Semaphore
+    ) -> Tuple[str, CSVExportFile]:
+        async with semaphore:
+            started = time.monotonic()
+            result = await job(
+                lambda current, total: self._on_progress(name, current, total)
+            )
+            self.durations[name] = time.monotonic() - started
+            self._finished.add(name)
+
+        export = (
+            CSVExportFile.from_text(result if result.strip() else "")
+            if isinstance(result, str)
+            else result
+        )
+        logger.info(
+            f"Export {name} finished with {export.row_count} records "
+            f"in {self.durations[name]:.2f}s"
+        )
+        return name, export
+
+    async def run(self) -> Dict[str, CSVExportFile]:
+        """
+        Run all table exports concurrently.
+
+        Returns:
+            Export files keyed by their file name, in job order
+
+        Raises:
+            Exception: The first export error; the other exports are
+                cancelled and already rendered files are closed
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.ensure_future(self._run_job(name, job, semaphore))
+            for name, job in self.jobs.items()
+        ]
+        exports: Dict[str, CSVExportFile] = {}
+        started = time.monotonic()
+
+        try:
+            for finished in asyncio.as_completed(tasks):
+                name, export = await finished
+                exports[name] = export
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, tuple):
+                    exports.setdefault(result[0], result[1])
+            for export in exports.values():
+                export.close()
+            raise
+
+        logger.info(
+            f"Combined export of {len(exports)} tables finished in "
+            f"{time.monotonic() - started:.2f}s "
+            f"(sum of table exports {sum(self.durations.values()):.2f}s)"
+        )
+        return {name: exports[name] for name in self.jobs}
+
+    async def run_as_zip(self, count_from: Optional[str] = None) -> CSVExportFile:
+        """
+        Run all table exports and pack them into one ZIP archive.
+
+        Args:
+            count_from: File name whose row count is reported for the archive;
+                defaults to the total of all files
+
+        Returns:
+            Archive with one CSV per table, positioned at its start
+        """
+        exports = await self.run()
+        try:
+            if count_from is not None and count_from in exports:
+                row_count = exports[count_from].row_count
+            else:
+                row_count = sum(export.row_count for export in exports.values())
+            return write_zip_export(exports, row_count)
+        finally:
+            for export in exports.values():
+                export.close()
@@ -3,10 +3,15 @@ File logging service for persistent log storage with organized directory structu
 
 Provides file-based logging with automatic directory management, log rotation,
 and dual output capabilities to complement console logging.
+
+Loggers only put records on a bounded in-memory queue; a writer thread per log
+category formats them and does the disk writes and rotation checks, so slow
+disks do not add latency to the event loop.
 """
 
 import logging
 import logging.handlers
+import queue
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -21,6 +26,7 @@ class FileLoggingConfig:
     max_file_size: int = 10 * 1024 * 1024  # 10MB default
     backup_count: int = 5  # Keep 5 backup files
     create_subdirs: bool = True
+    queue_size: int = 10000  # Records waiting per category; 0 writes directly
 
     def validate(self) -> None:
         """
@@ -35,6 +41,63 @@ class FileLoggingConfig:
         if self.backup_count < 0:
             raise ValueError("backup_count cannot be negative")
 
+        if self.queue_size < 0:
+            raise ValueError("queue_size cannot be negative")
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler with an overflow policy for a bounded queue.
+
+    Debug records are dropped once the queue is half full and info records
+    once it is seven eighths full, so debug noise goes first and info lines
+    such as user interactions make room for warnings and errors only under
+    heavier backlog. Warnings and errors are dropped only when the queue is
+    full. Logging never blocks on the writer.
+    """
+
+    def __init__(
+        self, log_queue: "queue.Queue[logging.LogRecord]", category: str
+    ) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue drained by the category's writer thread
+            category: Log category, used in diagnostics
+        """
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.category = category
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.dropped = 0
+        self._debug_high_water = max(log_queue.maxsize // 2, 1)
+        self._info_high_water = max(log_queue.maxsize * 7 // 8, 1)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue unless the overflow policy drops it."""
+        if record.levelno < logging.INFO:
+            high_water: Optional[int] = self._debug_high_water
+        elif record.levelno < logging.WARNING:
+            high_water = self._info_high_water
+        else:
+            high_water = None
+        if high_water is not None and self.log_queue.qsize() >= high_water:
+            self.dropped += 1
+            return
+        try:
+            self.log_queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Wait until the writer thread has written all queued records."""
+        listener = self.listener
+        if listener is not None:
+            self.log_queue.join()
+            for handler in listener.handlers:
+                handler.flush()
+
 
 class FileLoggingService:
     """
@@ -54,6 +117,7 @@ class FileLoggingService:
         self.config = config
         self.config.validate()
         self._loggers: Dict[str, logging.Logger] = {}
+        self._category_handlers: Dict[str, logging.Handler] = {}
 
         if self.config.enabled:
             self.initialize_directories()
@@ -85,6 +149,83 @@ class FileLoggingService:
             )
             return None
 
+    def _get_category_handler(
+        self, category: str, log_file_path: Path, formatter: logging.Formatter
+    ) -> Optional[logging.Handler]:
+        """
+        Get the shared handler of a log category, creating it on first use.
+
+        With a positive queue size the handler is a :class:`BoundedQueueHandler`
+        whose records are written by one writer thread per category.
+
+        Args:
+            category: Log category, e.g. "application"
+            log_file_path: Path to the category's log file
+            formatter: Log formatter applied by the writer
+
+        Returns:
+            Category handler or None if the file handler cannot be created
+        """
+        handler = self._category_handlers.get(category)
+        if handler is not None:
+            return handler
+
+        file_handler = self._create_rotating_handler(log_file_path, formatter)
+        if file_handler is None or self.config.queue_size <= 0:
+            handler = file_handler
+        else:
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(
+                self.config.queue_size
+            )
+            queue_handler = BoundedQueueHandler(log_queue, category)
+            listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            listener.start()
+            queue_handler.listener = listener
+            handler = queue_handler
+
+        if handler is not None:
+            self._category_handlers[category] = handler
+        return handler
+
+    def close(self) -> None:
+        """Write all queued records, stop the writer threads and close files."""
+        for handler in self._category_handlers.values():
+            for logger in self._loggers.values():
+                logger.removeHandler(handler)
+
+            if isinstance(handler, BoundedQueueHandler) and handler.listener:
+                listener, handler.listener = handler.listener, None
+                try:
+                    # Drain first so the stop sentinel fits into the queue
+                    handler.log_queue.join()
+                    listener.stop()
+                except Exception as e:
+                    logging.getLogger(__name__).warning(
+                        f"Failed to stop {handler.category} log writer: {e}"
+                    )
+                for file_handler in listener.handlers:
+                    file_handler.close()
+            handler.close()
+
+        self._category_handlers.clear()
+        self._loggers.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of the queued log categories.
+
+        Returns:
+            Dictionary with queued and dropped record counts per category
+        """
+        stats: Dict[str, int] = {}
+        for category, handler in self._category_handlers.items():
+            if isinstance(handler, BoundedQueueHandler):
+                stats[f"{category}_queued"] = handler.log_queue.qsize()
+                stats[f"{category}_dropped"] = handler.dropped
+        return stats
+
     def initialize_directories(self) -> None:
         """Create log directory structure if it doesn't exist."""
         if not self.config.enabled:
@@ -133,7 +274,7 @@ class FileLoggingService:
                     datefmt="%Y-%m-%d %H:%M:%S",
                 )
 
-                handler = self._create_rotating_handler(log_file, formatter)
+                handler = self._get_category_handler("application", log_file, formatter)
                 if handler:
                     logger.addHandler(handler)
 
@@ -172,7 +313,9 @@ class FileLoggingService:
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
 
-            handler = self._create_rotating_handler(log_file, formatter)
+            handler = self._get_category_handler(
+                "user_interactions", log_file, formatter
+            )
             if handler:
                 logger.addHandler(handler)
 
@@ -205,7 +348,7 @@ class FileLoggingService:
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
 
-            handler = self._create_rotating_handler(log_file, formatter)
+            handler = self._get_category_handler("errors", log_file, formatter)
             if handler:
                 logger.addHandler(handler)
 
@@ -8,10 +8,23 @@ field mapping, UTF-8 encoding, and file management.
 import csv
 import io
 import logging
+import shutil
 import tempfile
-from datetime import date, datetime
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from src.config.field_mappings import AirtableFieldMapping
 from src.config.settings import Settings
@@ -21,15 +34,47 @@ from src.data.repositories.participant_repository import (
     RepositoryError,
 )
 from src.models.participant import Department, Participant, Role
+from src.utils.columnar_export import (
+    LINE_NUMBER_HEADER,
+    ExportFormat,
+    ExportTable,
+    format_raw_value,
+)
+from src.utils.export_artifact_cache import ExportArtifactCache, ExportKey
+from src.utils.export_size_estimator import (
+    DEFAULT_SIZE_SAMPLE_ROWS,
+    ExportSizeEstimate,
+    ExportSizeEstimator,
+)
 from src.utils.export_utils import (
+    CSVExportFile,
+    CSVExportWriter,
     extract_headers_from_view_records,
     format_line_number,
     generate_readable_export_filename,
-    order_rows_by_view_headers,
+    write_zip_export,
 )
+from src.utils.export_watermarks import ExportWatermarkStore
+from src.utils.row_formatter import RowFormatter
 
 logger = logging.getLogger(__name__)
 
+# Column of delta exports telling whether a participant is new or changed
+CHANGE_TYPE_HEADER = "ChangeType"
+CHANGE_CREATED = "created"
+CHANGE_UPDATED = "updated"
+
+
+@dataclass
+class DeltaExport:
+    """Export of participants changed since the previous delta export."""
+
+    export: CSVExportFile
+    since: Optional[datetime]
+    watermark: datetime
+    created: int = 0
+    updated: int = 0
+
 
 class ParticipantExportService:
     """
@@ -46,9 +91,15 @@ class ParticipantExportService:
     # Telegram file upload limit (50MB)
     TELEGRAM_FILE_LIMIT = 50 * 1024 * 1024  # 50MB in bytes
 
-    # Average bytes per participant record (estimated)
+    # Average bytes per participant record when no record can be sampled
     BYTES_PER_RECORD_ESTIMATE = 500  # Conservative estimate
 
+    # Records rendered to measure the average row width
+    SIZE_SAMPLE_ROWS = DEFAULT_SIZE_SAMPLE_ROWS
+
+    # Overlap when asking Airtable for changes since a cached export
+    CHANGE_CHECK_OVERLAP = timedelta(seconds=5)
+
     # View names are now configured via settings
     # These constants are kept for backward compatibility but deprecated
     TEAM_VIEW_NAME = "Тимы"
@@ -88,6 +139,10 @@ class ParticipantExportService:
         repository: ParticipantRepository,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         settings: Optional[Settings] = None,
+        artifact_cache: Optional[ExportArtifactCache] = None,
+        export_format: ExportFormat = ExportFormat.CSV,
+        size_estimator: Optional[ExportSizeEstimator] = None,
+        watermark_store: Optional[ExportWatermarkStore] = None,
     ):
         """
         Initialize the export service.
@@ -96,10 +151,21 @@ class ParticipantExportService:
             repository: Participant repository for data access
             progress_callback: Optional callback for progress updates (current, total)
             settings: Optional settings object for view configuration
+            artifact_cache: Optional cache of rendered exports shared by all
+                service instances; exports are always rendered when omitted
+            export_format: Default output format of the ``*_as_file`` exports
+            size_estimator: Optional estimator shared by all service instances
+                so rendered exports improve later size estimates
+            watermark_store: Optional store of delta export watermarks shared
+                by all service instances
         """
         self.repository = repository
         self.progress_callback = progress_callback
         self._settings = settings
+        self.artifact_cache = artifact_cache
+        self.export_format = export_format
+        self.size_estimator = size_estimator or ExportSizeEstimator()
+        self.watermark_store = watermark_store or ExportWatermarkStore()
 
     @property
     def settings(self) -> Settings:
@@ -121,51 +187,49 @@ class ParticipantExportService:
         Raises:
             Exception: If repository access fails
         """
-        logger.info("Starting participant CSV export")
+        with await self.get_all_participants_as_file(ExportFormat.CSV) as export:
+            return export.read_text()
 
-        # Retrieve all participants
-        participants = await self.repository.list_all()
-        total_count = len(participants)
-        logger.info(f"Retrieved {total_count} participants for export")
-
-        # Report initial progress
-        if self.progress_callback:
-            self.progress_callback(0, total_count)
-
-        # Create CSV in memory
-        output = io.StringIO()
+    async def get_all_participants_as_file(
+        self, export_format: Optional[ExportFormat] = None
+    ) -> CSVExportFile:
+        """
+        Export all participants straight into a spooled file.
 
-        # Define CSV headers using Airtable field names
-        headers = self._get_csv_headers()
+        CSV rows are written as participants are streamed from the
+        repository, without a CSV string in between.
 
-        # Create CSV writer
-        writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
+        Args:
+            export_format: Output format; defaults to the service's format
 
-        # Write headers
-        writer.writeheader()
+        Returns:
+            Export file with row count, byte size and extension
 
-        # Calculate width for line numbers based on total participant count
-        width = len(str(total_count)) if total_count > 0 else 1
+        Raises:
+            Exception: If repository access fails
+        """
+        export_format = export_format or self.export_format
+        key: ExportKey = ("participants", "all", export_format.value)
+        return await self._cached_export(
+            key, lambda: self._render_all_participants(key, export_format)
+        )
 
-        # Process participants
-        for index, participant in enumerate(participants):
-            # Convert participant to CSV row
-            row = self._participant_to_csv_row(participant)
-            # Add line number as first column with consistent width
-            row["#"] = format_line_number(index + 1, width)
-            writer.writerow(row)
+    async def _render_all_participants(
+        self, key: ExportKey, export_format: ExportFormat
+    ) -> CSVExportFile:
+        logger.info("Starting participant CSV export")
 
-            # Report progress at intervals (every 10 records or at end)
-            if self.progress_callback:
-                if (index + 1) % 10 == 0 or (index + 1) == total_count:
-                    self.progress_callback(index + 1, total_count)
+        # Counting would scan the table a second time, so the total is only
+        # a hint and the streamed rows decide the final count
+        expected_count = self._known_row_count(key)
+        logger.info(f"Streaming participants for export (expected {expected_count})")
 
-        # Get CSV string
-        csv_string = output.getvalue()
-        output.close()
+        export = await self._stream_participants(
+            self.repository.stream_all(), expected_count, export_format=export_format
+        )
 
-        logger.info(f"CSV export completed with {total_count} records")
-        return csv_string
+        logger.info(f"CSV export completed with {export.row_count} records")
+        return export
 
     def export_to_csv(self) -> str:
         """
@@ -217,8 +281,8 @@ class ParticipantExportService:
         Raises:
             Exception: If file creation or export fails
         """
-        # Generate CSV content
-        csv_content = await self.get_all_participants_as_csv()
+        # The file is named .csv whatever the configured export format
+        export = await self.get_all_participants_as_file(ExportFormat.CSV)
 
         # Determine directory
         if directory:
@@ -238,10 +302,10 @@ class ParticipantExportService:
         file_path = dir_path / filename
 
         try:
-            # Write to file with UTF-8 BOM so apps like Excel detect Cyrillic
-            # correctly when opening CSV files.
-            with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
-                f.write(csv_content)
+            # The export is already UTF-8 with BOM so apps like Excel detect
+            # Cyrillic correctly when opening CSV files.
+            with export, open(file_path, "wb") as f:
+                shutil.copyfileobj(export.file, f)
 
             logger.info(f"CSV file saved to: {file_path}")
             return str(file_path)
@@ -256,40 +320,121 @@ class ParticipantExportService:
                     pass
             raise e
 
-    async def estimate_file_size(self) -> int:
+    async def estimate_file_size(
+        self, export_format: Optional[ExportFormat] = None
+    ) -> int:
         """
-        Estimate the size of the CSV file before generation.
+        Estimate the size of the full export before generation.
+
+        Uses the size of the last rendered full export when recent; otherwise
+        renders the first records of the table and projects their average
+        row width onto the record count. Estimates are cached.
 
-        Uses record count and average record size to estimate.
+        Args:
+            export_format: Output format; defaults to the service's format
 
         Returns:
             Estimated file size in bytes
         """
-        # Get total record count
-        total_count = await self.repository.count_total()
-
-        # Calculate header size (approximate)
-        headers = self._get_csv_headers()
-        header_size = len(",".join(headers)) + 2  # +2 for newline
+        export_format = export_format or self.export_format
+        key: ExportKey = ("participants", "all", export_format.value)
 
-        # Estimate total size
-        estimated_size = header_size + (total_count * self.BYTES_PER_RECORD_ESTIMATE)
+        estimate = self.size_estimator.get(key)
+        if estimate is None:
+            estimate = await self._sample_size_estimate(key, export_format)
 
         logger.info(
-            "Estimated CSV size: %s bytes for %s records",
-            estimated_size,
-            total_count,
+            "Estimated %s export size: %s bytes for %s records (%s)",
+            export_format.value,
+            estimate.estimated_bytes,
+            estimate.row_count,
+            "measured" if estimate.measured else "sampled",
+        )
+        return estimate.estimated_bytes
+
+    def _known_row_count(self, key: ExportKey) -> Optional[int]:
+        """
+        Return the row count of an export if known without a table scan.
+
+        The count comes from the fresh replica, else from the size estimator:
+        the last rendered export or sampled estimate of this export, in any
+        format.
+
+        Args:
+            key: Export type and filter
+
+        Returns:
+            Known row count, or None
+        """
+        row_count = self.repository.peek_count()
+        if row_count is None:
+            row_count = self.size_estimator.last_row_count(key)
+        if row_count is None:
+            # The same export in another format has the same rows
+            for export_format in ExportFormat:
+                row_count = self.size_estimator.last_row_count(
+                    key[:-1] + (export_format.value,)
+                )
+                if row_count is not None:
+                    break
+        return row_count
+
+    async def _sample_size_estimate(
+        self, key: ExportKey, export_format: ExportFormat
+    ) -> ExportSizeEstimate:
+        """Estimate the export size by rendering the first records of the table."""
+        # Only the first page is read, so no second page is prefetched
+        sample: List[Participant] = []
+        participants = self.repository.stream_all(
+            page_size=self.SIZE_SAMPLE_ROWS, prefetch=False
         )
-        return estimated_size
+        try:
+            async for participant in participants:
+                sample.append(participant)
+                if len(sample) >= self.SIZE_SAMPLE_ROWS:
+                    break
+        finally:
+            await participants.aclose()
+
+        # A short first page is the whole table; otherwise the table is only
+        # counted when neither the replica nor an earlier export knows its size
+        row_count: Optional[int] = None
+        if 0 < len(sample) < self.SIZE_SAMPLE_ROWS:
+            row_count = len(sample)
+        else:
+            row_count = self._known_row_count(key)
+        if row_count is None:
+            row_count = await self.repository.count_total()
+
+        with (
+            self._write_participants(
+                sample, report=False, export_format=export_format
+            ) as rendered,
+            self._write_participants(
+                [], report=False, export_format=export_format
+            ) as empty,
+        ):
+            return self.size_estimator.record_sample(
+                key,
+                rendered,
+                empty,
+                row_count,
+                fallback_bytes_per_row=self.BYTES_PER_RECORD_ESTIMATE,
+            )
 
-    async def is_within_telegram_limit(self) -> bool:
+    async def is_within_telegram_limit(
+        self, export_format: Optional[ExportFormat] = None
+    ) -> bool:
         """
         Check if the estimated file size is within Telegram's upload limit.
 
+        Args:
+            export_format: Output format; defaults to the service's format
+
         Returns:
             True if file is within limit, False otherwise
         """
-        estimated_size = await self.estimate_file_size()
+        estimated_size = await self.estimate_file_size(export_format)
         within_limit = estimated_size < self.TELEGRAM_FILE_LIMIT
 
         if not within_limit:
@@ -300,6 +445,99 @@ class ParticipantExportService:
 
         return within_limit
 
+    async def get_changed_participants_as_file(
+        self, scope: str, export_format: Optional[ExportFormat] = None
+    ) -> DeltaExport:
+        """
+        Export participants created or modified since the scope's last delta.
+
+        Only changed records are read from Airtable. Each row carries a
+        ``ChangeType`` column of ``created`` or ``updated``. The first delta
+        export of a scope contains every participant as ``created``. The
+        watermark is not advanced until :meth:`mark_changes_exported` is
+        called, so a failed delivery is repeated by the next delta export.
+
+        Args:
+            scope: Export scope, e.g. one per admin
+            export_format: Output format; defaults to the service's format
+
+        Returns:
+            Delta export with the file and the watermark to commit
+
+        Raises:
+            Exception: If repository access fails
+        """
+        export_format = export_format or self.export_format
+        since = self.watermark_store.get(scope)
+        # Back-date so records changed while reading appear again next time
+        watermark = datetime.now(timezone.utc) - self.CHANGE_CHECK_OVERLAP
+
+        changes: List[Tuple[Participant, str]] = []
+        if since is None:
+            logger.info(f"First delta export for {scope}, exporting all participants")
+            changes = [
+                (participant, CHANGE_CREATED)
+                for participant in await self.repository.list_all()
+            ]
+        else:
+            records = await self.repository.list_modified_since(since)
+            for record in records:
+                try:
+                    participant = Participant.from_airtable_record(record)
+                except Exception as exc:
+                    logger.warning(
+                        f"Skipping invalid changed participant record "
+                        f"{record.get('id', 'unknown')}: {exc}"
+                    )
+                    continue
+                changes.append((participant, self._change_type(record, since)))
+
+        table = ExportTable(
+            ["#", CHANGE_TYPE_HEADER] + self._get_csv_headers()[1:], len(changes)
+        )
+        table.add_line_numbers()
+        table.add_column(
+            CHANGE_TYPE_HEADER, [change for _, change in changes], format_raw_value
+        )
+        self._add_mapped_columns(table, [participant for participant, _ in changes])
+
+        created = sum(1 for _, change in changes if change == CHANGE_CREATED)
+        logger.info(
+            f"Delta export for {scope} since {since}: {created} created, "
+            f"{len(changes) - created} updated"
+        )
+        return DeltaExport(
+            export=table.write(export_format),
+            since=since,
+            watermark=watermark,
+            created=created,
+            updated=len(changes) - created,
+        )
+
+    def mark_changes_exported(self, scope: str, delta: DeltaExport) -> None:
+        """
+        Advance the scope's watermark once a delta export was delivered.
+
+        Args:
+            scope: Export scope the delta was exported for
+            delta: Delivered delta export
+        """
+        self.watermark_store.set(scope, delta.watermark)
+
+    @staticmethod
+    def _change_type(record: Dict[str, Any], since: datetime) -> str:
+        """Classify a changed record as created or updated after ``since``."""
+        created_time = record.get("createdTime")
+        if not created_time:
+            return CHANGE_UPDATED
+        try:
+            created_at = datetime.fromisoformat(
+                str(created_time).replace("Z", "+00:00")
+            )
+        except ValueError:
+            return CHANGE_UPDATED
+        return CHANGE_CREATED if created_at > since else CHANGE_UPDATED
+
     async def get_participants_by_role_as_csv(self, role: Role) -> str:
         """
         Export participants filtered by role to CSV format.
@@ -316,17 +554,48 @@ class ParticipantExportService:
         Raises:
             Exception: If repository access fails
         """
+        with await self.get_participants_by_role_as_file(
+            role, ExportFormat.CSV
+        ) as export:
+            return export.read_text()
+
+    async def get_participants_by_role_as_file(
+        self, role: Role, export_format: Optional[ExportFormat] = None
+    ) -> CSVExportFile:
+        """
+        Export participants filtered by role straight into a spooled file.
+
+        Args:
+            role: The role to filter by (TEAM or CANDIDATE)
+            export_format: Output format; defaults to the service's format
+
+        Returns:
+            Export file with row count, byte size and extension
+
+        Raises:
+            Exception: If repository access fails
+        """
+        export_format = export_format or self.export_format
+        return await self._cached_export(
+            ("participants", "role", str(role.value), export_format.value),
+            lambda: self._render_participants_by_role(role, export_format),
+        )
+
+    async def _render_participants_by_role(
+        self, role: Role, export_format: ExportFormat
+    ) -> CSVExportFile:
         logger.info(f"Starting participant CSV export filtered by role: {role.value}")
 
         if role == Role.TEAM:
             # Use configured view name from settings for team exports
             view_name = "Тимы"  # Hardcoded for now as team view not yet configurable
-            csv_string = await self._export_view_to_csv(
+            export = await self._export_view_to_file(
                 view_name,
                 filter_func=lambda record, participant: participant.role == Role.TEAM,
+                export_format=export_format,
             )
             logger.info("Team export completed using Airtable view '%s'", view_name)
-            return csv_string
+            return export
 
         if role == Role.CANDIDATE:
             # Use configured view name from settings for candidate exports
@@ -336,52 +605,36 @@ class ParticipantExportService:
             except (ValueError, AttributeError):
                 # If settings can't be initialized (e.g., in tests), use the constant
                 view_name = self.CANDIDATE_VIEW_NAME
-            csv_string = await self._export_view_to_csv(
+            export = await self._export_view_to_file(
                 view_name,
                 filter_func=lambda record, participant: participant.role
                 == Role.CANDIDATE,
+                export_format=export_format,
             )
             logger.info(
                 "Candidate export completed using Airtable view '%s'",
                 view_name,
             )
-            return csv_string
+            return export
 
         # Fallback to legacy filtering for any other roles
-        all_participants = await self.repository.list_all()
         filtered_participants = [
-            p for p in all_participants if p.role is not None and p.role == role
+            p
+            async for p in self.repository.stream_all()
+            if p.role is not None and p.role == role
         ]
+        logger.info(
+            f"Filtered {len(filtered_participants)} participants with role {role.value}"
+        )
 
-        total_count = len(filtered_participants)
-        logger.info(f"Filtered {total_count} participants with role {role.value}")
-
-        if self.progress_callback:
-            self.progress_callback(0, total_count)
-
-        output = io.StringIO()
-        headers = self._get_csv_headers()
-        writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
-        writer.writeheader()
-
-        # Calculate width for line numbers based on total filtered count
-        width = len(str(total_count)) if total_count > 0 else 1
-
-        for index, participant in enumerate(filtered_participants):
-            row = self._participant_to_csv_row(participant)
-            # Add line number as first column with consistent width
-            row["#"] = format_line_number(index + 1, width)
-            writer.writerow(row)
-
-            if self.progress_callback:
-                if (index + 1) % 10 == 0 or (index + 1) == total_count:
-                    self.progress_callback(index + 1, total_count)
-
-        csv_string = output.getvalue()
-        output.close()
+        export = self._write_participants(
+            filtered_participants, export_format=export_format
+        )
 
-        logger.info(f"Role-filtered CSV export completed with {total_count} records")
-        return csv_string
+        logger.info(
+            f"Role-filtered CSV export completed with {export.row_count} records"
+        )
+        return export
 
     async def get_participants_by_department_as_csv(
         self, department: Department
@@ -401,6 +654,36 @@ class ParticipantExportService:
         Raises:
             Exception: If repository access fails
         """
+        with await self.get_participants_by_department_as_file(
+            department, ExportFormat.CSV
+        ) as export:
+            return export.read_text()
+
+    async def get_participants_by_department_as_file(
+        self, department: Department, export_format: Optional[ExportFormat] = None
+    ) -> CSVExportFile:
+        """
+        Export participants filtered by department straight into a spooled file.
+
+        Args:
+            department: The department to filter by
+            export_format: Output format; defaults to the service's format
+
+        Returns:
+            Export file with row count, byte size and extension
+
+        Raises:
+            Exception: If repository access fails
+        """
+        export_format = export_format or self.export_format
+        return await self._cached_export(
+            ("participants", "department", str(department.value), export_format.value),
+            lambda: self._render_participants_by_department(department, export_format),
+        )
+
+    async def _render_participants_by_department(
+        self, department: Department, export_format: ExportFormat
+    ) -> CSVExportFile:
         logger.info(
             "Starting participant CSV export filtered by department: %s",
             department.value,
@@ -414,8 +697,8 @@ class ParticipantExportService:
 
         # Use team view for department filtering (hardcoded for now)
         view_name = "Тимы"  # Hardcoded as team view not yet configurable
-        csv_string = await self._export_view_to_csv(
-            view_name, filter_func=department_filter
+        export = await self._export_view_to_file(
+            view_name, filter_func=department_filter, export_format=export_format
         )
 
         logger.info(
@@ -423,14 +706,169 @@ class ParticipantExportService:
             department.value,
             view_name,
         )
-        return csv_string
+        return export
 
-    async def _export_view_to_csv(
+    async def get_department_packets_as_zip(self) -> CSVExportFile:
+        """
+        Export every department and role as one ZIP archive of CSV files.
+
+        The team view is pulled from Airtable once and split in a single
+        pass, instead of pulling it again for every department.
+
+        Returns:
+            Archive with ``departments/<Department>.csv`` and
+            ``roles/<ROLE>.csv`` members; its row count is the number of
+            participants in the view
+
+        Raises:
+            Exception: If repository access fails
+        """
+        return await self._cached_export(
+            ("participants", "department_packets"),
+            self._render_department_packets,
+        )
+
+    async def _render_department_packets(self) -> CSVExportFile:
+        exports, row_count = await self.get_department_exports_as_files()
+        try:
+            return write_zip_export(exports, row_count)
+        finally:
+            for export in exports.values():
+                export.close()
+
+    async def get_department_exports_as_files(
+        self,
+    ) -> Tuple[Dict[str, CSVExportFile], int]:
+        """
+        Export every department and role found in the team view.
+
+        Rows are pulled once and grouped by department and by role in the same
+        pass; each group is then written as its own CSV file, numbered from 1
+        like a single department export. Groups without rows are omitted.
+
+        Returns:
+            Tuple of export files keyed by ``departments/<Department>.csv`` or
+            ``roles/<ROLE>.csv``, and the number of participants split
+
+        Raises:
+            Exception: If repository access fails
+        """
+        view_name = self.TEAM_VIEW_NAME
+        logger.info("Starting department packet export from view '%s'", view_name)
+
+        raw_records: Optional[List[Dict[str, Any]]] = None
+        try:
+            raw_records = await self.repository.list_view_records(view_name)
+        except RepositoryError as error:
+            if not self._is_view_not_found_error(error):
+                raise
+            logger.info(
+                "View '%s' not found, splitting list_all() participants instead",
+                view_name,
+            )
+
+        # Without the view, groups are written with the mapped field headers
+        headers: Optional[List[str]] = None
+        if raw_records is None:
+            participants = await self.repository.list_all()
+            rows: List[Tuple[Dict[str, Any], Participant]] = [
+                ({}, participant) for participant in participants
+            ]
+        else:
+            rows = self._parse_view_records(view_name, raw_records)
+            headers = self._determine_view_headers(view_name, raw_records)
+
+        groups: Dict[str, List[Tuple[Dict[str, Any], Participant]]] = {}
+        total_count = len(rows)
+        if self.progress_callback:
+            self.progress_callback(0, total_count)
+        for index, (record, participant) in enumerate(rows):
+            if participant.department is not None:
+                name = f"departments/{Department(participant.department).value}.csv"
+                groups.setdefault(name, []).append((record, participant))
+            if participant.role is not None:
+                name = f"roles/{Role(participant.role).value}.csv"
+                groups.setdefault(name, []).append((record, participant))
+            self._report_progress(index + 1, total_count)
+
+        exports: Dict[str, CSVExportFile] = {}
+        try:
+            for name in sorted(groups):
+                group = groups[name]
+                if headers is None:
+                    exports[name] = self._write_participants(
+                        [participant for _, participant in group], report=False
+                    )
+                else:
+                    exports[name] = self._write_view_rows(group, headers, report=False)
+        except BaseException:
+            for export in exports.values():
+                export.close()
+            raise
+
+        logger.info(
+            "Department packet export split %s participants into %s files",
+            total_count,
+            len(exports),
+        )
+        return exports, total_count
+
+    async def _cached_export(
+        self, key: ExportKey, render: Callable[[], Awaitable[CSVExportFile]]
+    ) -> CSVExportFile:
+        """
+        Serve an export from the artifact cache or render and cache it.
+
+        A cached export is reused while the repository reports the same data
+        version. Without a version it is reused while Airtable reports no
+        records modified since it was rendered.
+
+        Args:
+            key: Export type and filter
+            render: Coroutine function rendering the export
+
+        Returns:
+            Export file, served from the cache when possible
+        """
+        cache = self.artifact_cache
+        if cache is None:
+            export = await render()
+            self.size_estimator.record_export(key, export)
+            return export
+
+        version = self.repository.get_data_version()
+        entry = cache.get(key, version)
+        if entry is not None and version is None:
+            try:
+                changed = await self.repository.has_changes_since(entry.rendered_at)
+            except RepositoryError as e:
+                logger.warning(f"Export change check failed, rendering again: {e}")
+                changed = True
+            if changed:
+                cache.discard(key)
+                entry = None
+
+        if entry is not None:
+            cached = cache.open(entry)
+            if cached is not None:
+                logger.info(
+                    f"Serving cached export {key} with {cached.row_count} records"
+                )
+                return cached
+
+        # Back-date the render so clock skew with Airtable cannot hide changes
+        rendered_at = datetime.now(timezone.utc) - self.CHANGE_CHECK_OVERLAP
+        export = await render()
+        self.size_estimator.record_export(key, export)
+        return cache.store(key, version, export, rendered_at)
+
+    async def _export_view_to_file(
         self,
         view_name: str,
         filter_func: Optional[Callable[[Dict[str, Any], Participant], bool]] = None,
-    ) -> str:
-        """Export Airtable view records to CSV, optionally filtering results."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> CSVExportFile:
+        """Export Airtable view records to a file, optionally filtering."""
         try:
             raw_records = await self.repository.list_view_records(view_name)
             logger.info(
@@ -442,11 +880,11 @@ class ParticipantExportService:
             # Check if this is a 422 VIEW_NAME_NOT_FOUND error
             if self._is_view_not_found_error(error):
                 logger.info(
-                    "View '%s' not found, falling back to list_all() with filtering",
+                    "View '%s' not found, falling back to stream_all() with filtering",
                     view_name,
                 )
                 return await self._fallback_candidates_from_all_participants(
-                    filter_func
+                    filter_func, export_format
                 )
             else:
                 # Re-raise other repository errors
@@ -454,6 +892,27 @@ class ParticipantExportService:
 
         headers = self._determine_view_headers(view_name, raw_records)
 
+        rows = self._parse_view_records(view_name, raw_records)
+        if filter_func:
+            rows = [
+                (record, participant)
+                for record, participant in rows
+                if filter_func(record, participant)
+            ]
+
+        if filter_func:
+            logger.info(
+                "Filtered view '%s' records down to %s rows for export",
+                view_name,
+                len(rows),
+            )
+
+        return self._write_view_rows(rows, headers, export_format=export_format)
+
+    def _parse_view_records(
+        self, view_name: str, raw_records: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], Participant]]:
+        """Pair view records with their parsed participants, skipping invalid ones."""
         rows: List[Tuple[Dict[str, Any], Participant]] = []
         for record in raw_records:
             try:
@@ -466,20 +925,8 @@ class ParticipantExportService:
                     exc,
                 )
                 continue
-
-            if filter_func and not filter_func(record, participant):
-                continue
-
             rows.append((record, participant))
-
-        if filter_func:
-            logger.info(
-                "Filtered view '%s' records down to %s rows for export",
-                view_name,
-                len(rows),
-            )
-
-        return self._records_to_csv(rows, headers)
+        return rows
 
     def _determine_view_headers(
         self, view_name: str, records: List[Dict[str, Any]]
@@ -504,83 +951,298 @@ class ParticipantExportService:
         # Add line number column as first header
         return ["#"] + headers
 
-    def _records_to_csv(
+    def _report_progress(self, current: int, total: int) -> None:
+        """Report progress every 10 records and at the end."""
+        if self.progress_callback and (current % 10 == 0 or current == total):
+            self.progress_callback(current, total)
+
+    async def _stream_participants(
+        self,
+        participants: AsyncIterator[Participant],
+        expected_count: Optional[int] = None,
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> CSVExportFile:
+        """
+        Write participants to a file while the repository streams them.
+
+        CSV rows are written one by one, so only the current page is held in
+        memory. XLSX and Parquet are written column by column and collect
+        the participants first. Progress is reported every 10 rows against
+        the expected count, with a total of 0 when no count is known, and
+        completes with the streamed row count.
+
+        CSV line numbers are padded to the width of the expected count. When
+        the streamed count has a different width, the file is read back and
+        rewritten once. Without a known count the guess is a width of 1, so
+        an export of 10 or more rows is then always written twice: this is
+        the case for the first export of a process when the replica is off
+        and no size estimate was made yet.
+
+        Args:
+            participants: Participants in export order
+            expected_count: Number of participants if known; sets the
+                progress total and the first guess of the line number width
+            export_format: Output format
+
+        Returns:
+            Export file with the streamed participants
+        """
+        expected = expected_count or 0
+        if self.progress_callback:
+            self.progress_callback(0, expected)
+
+        def report(current: int) -> None:
+            if self.progress_callback and current % 10 == 0:
+                self.progress_callback(
+                    current, max(current, expected) if expected else 0
+                )
+
+        if export_format != ExportFormat.CSV:
+            collected: List[Participant] = []
+            async for participant in participants:
+                collected.append(participant)
+                report(len(collected))
+            export = self._write_participants(
+                collected, report=False, export_format=export_format
+            )
+        else:
+            headers = self._get_csv_headers()
+            build_row = self._compile_csv_row(headers, expected)
+            writer = CSVExportWriter(headers)
+            try:
+                async for participant in participants:
+                    writer.writerow(build_row(writer.row_count + 1, {}, participant))
+                    report(writer.row_count)
+            except BaseException:
+                writer.abort()
+                raise
+            export = writer.finish()
+
+            # A wrong guess only changes the padding, which is fixed locally
+            # instead of reading the table again
+            width = len(str(max(export.row_count, 1)))
+            if width != len(str(max(expected, 1))):
+                logger.debug(
+                    "Rewriting %s export rows to pad line numbers to width %s "
+                    "(expected %s rows)",
+                    export.row_count,
+                    width,
+                    expected_count,
+                )
+                export = self._pad_line_numbers(export, headers, width)
+
+        row_count = export.row_count
+        if (
+            self.progress_callback
+            and row_count
+            and (row_count % 10 or row_count < expected or not expected)
+        ):
+            self.progress_callback(row_count, row_count)
+        return export
+
+    @staticmethod
+    def _pad_line_numbers(
+        export: CSVExportFile, headers: List[str], width: int
+    ) -> CSVExportFile:
+        """
+        Rewrite a CSV export with its line numbers padded to a new width.
+
+        Args:
+            export: CSV export to rewrite; it is closed afterwards
+            headers: Headers of the export
+            width: Width of the line number column
+
+        Returns:
+            Rewritten export
+        """
+        if LINE_NUMBER_HEADER not in headers:
+            return export
+
+        line_index = headers.index(LINE_NUMBER_HEADER)
+        writer = CSVExportWriter(headers)
+        try:
+            with export:
+                text = io.TextIOWrapper(export.file, encoding="utf-8-sig", newline="")
+                reader = csv.reader(text)
+                next(reader, None)
+                for row in reader:
+                    row[line_index] = format_line_number(writer.row_count + 1, width)
+                    writer.writerow(row)
+                text.detach()
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.finish()
+
+    def _write_participants(
+        self,
+        participants: Sequence[Participant],
+        report: bool = True,
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> CSVExportFile:
+        """Write participants with mapped headers and line numbers to a file."""
+        total_count = len(participants)
+
+        # Report initial progress
+        if report and self.progress_callback:
+            self.progress_callback(0, total_count)
+
+        if export_format == ExportFormat.CSV:
+            return self._write_csv_rows(
+                (({}, participant) for participant in participants),
+                self._get_csv_headers(),
+                total_count,
+                report,
+            )
+
+        table = ExportTable(self._get_csv_headers(), total_count)
+        table.add_line_numbers()
+        self._add_mapped_columns(table, participants)
+        export = table.write(export_format)
+
+        if report and total_count:
+            self._report_progress(total_count, total_count)
+        return export
+
+    def _write_view_rows(
         self,
         rows: List[Tuple[Dict[str, Any], Participant]],
         headers: List[str],
-    ) -> str:
-        """Convert prepared participant rows to CSV string using ordered headers."""
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
-        writer.writeheader()
+        report: bool = True,
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> CSVExportFile:
+        """
+        Write prepared view rows to a file in the view's column order.
 
+        Raw Airtable fields fill the columns the participant mapping does not
+        cover; missing view fields are left empty.
+        """
         total_count = len(rows)
-        if self.progress_callback and total_count >= 0:
-            # Notify initial progress; guard division in callback implementation
+        if report and self.progress_callback:
             self.progress_callback(0, total_count)
 
-        # Calculate width for line numbers based on total row count
-        width = len(str(total_count)) if total_count > 0 else 1
+        if export_format == ExportFormat.CSV:
+            return self._write_csv_rows(rows, headers, total_count, report)
 
-        # Prepare all rows with data
-        prepared_rows = []
-        for index, (record, participant) in enumerate(rows):
-            row_data = self._participant_to_csv_row(participant)
-            airtable_fields = record.get("fields", {})
-
-            # Merge mapped data with raw Airtable fields for completeness
-            merged_row = {}
-            for field_name, field_value in airtable_fields.items():
-                merged_row[field_name] = self._format_raw_value(field_value)
-
-            # Override with mapped values where available
-            merged_row.update(row_data)
-
-            # Add line number with consistent width
-            merged_row["#"] = format_line_number(index + 1, width)
-            prepared_rows.append(merged_row)
-
-        # Extract view headers (without #) for reordering
-        view_headers = [h for h in headers if h != "#"]
-
-        # Use utility to reorder rows based on view headers
-        if view_headers:
-            reordered_rows = order_rows_by_view_headers(
-                view_headers,
-                list(prepared_rows[0].keys()) if prepared_rows else [],
-                prepared_rows,
+        mapped_headers = {
+            airtable_field
+            for python_field, airtable_field in (
+                AirtableFieldMapping.PYTHON_TO_AIRTABLE.items()
             )
-        else:
-            reordered_rows = prepared_rows
+            if python_field != "record_id"
+        }
+        table = ExportTable.from_view_records(
+            [record for record, _ in rows], headers, skip=mapped_headers
+        )
+        self._add_mapped_columns(table, [participant for _, participant in rows])
+        export = table.write(export_format)
 
-        # Write reordered rows to CSV
-        for index, row in enumerate(reordered_rows):
-            writer.writerow(row)
+        if report and total_count:
+            self._report_progress(total_count, total_count)
+        return export
 
-            if (
-                self.progress_callback
-                and total_count > 0
-                and ((index + 1) % 10 == 0 or (index + 1) == total_count)
-            ):
-                self.progress_callback(index + 1, total_count)
+    def _write_csv_rows(
+        self,
+        rows: Iterable[Tuple[Dict[str, Any], Participant]],
+        headers: List[str],
+        total_count: int,
+        report: bool = True,
+    ) -> CSVExportFile:
+        """Write view rows to a CSV file one by one, reporting progress."""
+        build_row = self._compile_csv_row(headers, total_count)
+        writer = CSVExportWriter(headers)
+        try:
+            for record, participant in rows:
+                writer.writerow(build_row(writer.row_count + 1, record, participant))
+                if report:
+                    self._report_progress(writer.row_count, total_count)
+        except BaseException:
+            writer.abort()
+            raise
+        return writer.finish()
+
+    def _compile_csv_row(
+        self, headers: Sequence[str], total_count: int
+    ) -> Callable[[int, Dict[str, Any], Participant], List[str]]:
+        """
+        Compile the CSV row builder of one export.
+
+        Mapped headers are formatted from the participant, ``#`` holds the
+        right-aligned line number and other headers are raw view fields.
+
+        Args:
+            headers: Export headers in output order
+            total_count: Number of rows; sets the line number width
+
+        Returns:
+            Function building the row of a line number, view record and
+            participant
+        """
+        formatter = self._compile_row_formatter(headers)
+        mapped = {index for _, _, index in formatter.columns}
+        raw_fields = [
+            (index, header)
+            for index, header in enumerate(headers)
+            if index not in mapped and header != LINE_NUMBER_HEADER
+        ]
+        line_index = formatter.index(LINE_NUMBER_HEADER)
+        width = len(str(max(total_count, 1)))
+
+        def build_row(
+            number: int, record: Dict[str, Any], participant: Participant
+        ) -> List[str]:
+            row = formatter.format(participant)
+            fields = record.get("fields", {})
+            for index, header in raw_fields:
+                row[index] = format_raw_value(fields.get(header))
+            if line_index is not None:
+                row[line_index] = format_line_number(number, width)
+            return row
+
+        return build_row
+
+    def _add_mapped_columns(
+        self, table: ExportTable, participants: Sequence[Participant]
+    ) -> None:
+        """Add the table's columns that map to Participant fields."""
+        formatter = self._compile_row_formatter(table.headers)
+        for getter, text, index in formatter.columns:
+            table.add_column(
+                formatter.headers[index], list(map(getter, participants)), text=text
+            )
 
-        csv_string = output.getvalue()
-        output.close()
-        return csv_string
+    def _compile_row_formatter(self, headers: Sequence[str]) -> RowFormatter:
+        """
+        Compile the participant row formatter of one export.
+
+        Args:
+            headers: Export headers in output order
+
+        Returns:
+            Row formatter for participants
+        """
+        return RowFormatter.compile(
+            Participant,
+            AirtableFieldMapping.PYTHON_TO_AIRTABLE,
+            headers,
+            formatters={"DateOfBirth": self._format_date_of_birth_value},
+        )
 
     @staticmethod
-    def _format_raw_value(value: Any) -> str:
-        """Format raw Airtable values for CSV output when mapping is unavailable."""
+    def _format_mapped_value(value: Any) -> str:
+        """Format a mapped value that has no annotation-based formatter."""
         if value is None:
             return ""
         if isinstance(value, (date, datetime)):
-            return value.isoformat()[:10]
-        if isinstance(value, list):
-            return ", ".join(str(item) for item in value)
-        if isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
+            return value.isoformat()[:10]  # YYYY-MM-DD format
         return str(value)
 
+    @staticmethod
+    def _format_date_of_birth_value(value: Any) -> str:
+        if isinstance(value, (date, datetime)):
+            return Participant._format_date_of_birth(value)
+        return ParticipantExportService._format_mapped_value(value)
+
     def _get_csv_headers(self) -> List[str]:
         """
         Get CSV headers based on Airtable field names with line numbers as first column.
@@ -600,44 +1262,6 @@ class ParticipantExportService:
         # Add line number column as first header
         return ["#"] + headers
 
-    def _participant_to_csv_row(self, participant: Participant) -> Dict[str, str]:
-        """
-        Convert a Participant object to a CSV row dictionary.
-
-        Args:
-            participant: Participant instance to convert
-
-        Returns:
-            Dictionary with Airtable field names as keys and formatted values
-        """
-        row = {}
-
-        # Map each field
-        for (
-            python_field,
-            airtable_field,
-        ) in AirtableFieldMapping.PYTHON_TO_AIRTABLE.items():
-            if python_field == "record_id":
-                continue  # Skip internal record_id
-
-            # Get value from participant
-            value = getattr(participant, python_field, None)
-
-            # Format value for CSV
-            if value is None:
-                row[airtable_field] = ""
-            elif isinstance(value, (date, datetime)):
-                if airtable_field == "DateOfBirth":
-                    row[airtable_field] = Participant._format_date_of_birth(value)
-                else:
-                    row[airtable_field] = value.isoformat()[:10]  # YYYY-MM-DD format
-            elif hasattr(value, "value"):  # Enum
-                row[airtable_field] = str(value.value)
-            else:
-                row[airtable_field] = str(value)
-
-        return row
-
     def _is_view_not_found_error(self, error: RepositoryError) -> bool:
         """
         Check if the RepositoryError represents a 422 VIEW_NAME_NOT_FOUND error.
@@ -667,70 +1291,42 @@ class ParticipantExportService:
     async def _fallback_candidates_from_all_participants(
         self,
         filter_func: Optional[Callable[[Dict[str, Any], Participant], bool]] = None,
-    ) -> str:
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> CSVExportFile:
         """
-        Fallback method to export participants using list_all() with filtering.
+        Fallback method to export participants using stream_all() with filtering.
 
         Args:
             filter_func: Optional filter function to apply to participants
+            export_format: Output format
 
         Returns:
-            CSV formatted string with filtered participant data
+            Export file with the filtered participant data
         """
-        logger.info("Using fallback export via list_all() with provided filtering")
-
-        # Get all participants
-        all_participants = await self.repository.list_all()
+        logger.info("Using fallback export via stream_all() with provided filtering")
 
         # Apply provided filter function if available, otherwise use all participants
-        if filter_func:
-            filtered_participants = []
-            for participant in all_participants:
+        filtered_participants = []
+        async for participant in self.repository.stream_all():
+            if filter_func:
                 # Pass empty dict as record since filter functions only use participant
                 record: Dict[str, Any] = {}
                 if filter_func(record, participant):
                     filtered_participants.append(participant)
-        else:
             # If no filter provided, fall back to candidate filtering for compatibility
-            filtered_participants = [
-                p
-                for p in all_participants
-                if p.role is not None and p.role == Role.CANDIDATE
-            ]
-
-        total_count = len(filtered_participants)
-        logger.info(f"Found {total_count} participants via fallback method")
-
-        # Report initial progress
-        if self.progress_callback:
-            self.progress_callback(0, total_count)
-
-        # Create CSV in memory
-        output = io.StringIO()
-        headers = self._get_csv_headers()
-        writer = csv.DictWriter(output, fieldnames=headers, extrasaction="ignore")
-        writer.writeheader()
-
-        # Calculate width for line numbers based on total count
-        width = len(str(total_count)) if total_count > 0 else 1
+            elif participant.role is not None and participant.role == Role.CANDIDATE:
+                filtered_participants.append(participant)
 
-        # Process filtered participants
-        for index, participant in enumerate(filtered_participants):
-            row = self._participant_to_csv_row(participant)
-            # Add line number as first column with consistent width
-            row["#"] = format_line_number(index + 1, width)
-            writer.writerow(row)
-
-            # Report progress at intervals
-            if self.progress_callback:
-                if (index + 1) % 10 == 0 or (index + 1) == total_count:
-                    self.progress_callback(index + 1, total_count)
+        logger.info(
+            f"Found {len(filtered_participants)} participants via fallback method"
+        )
 
-        csv_string = output.getvalue()
-        output.close()
+        export = self._write_participants(
+            filtered_participants, export_format=export_format
+        )
 
-        logger.info(f"Fallback export completed with {total_count} records")
-        return csv_string
+        logger.info(f"Fallback export completed with {export.row_count} records")
+        return export
 
     def _get_export_type_from_prefix(
         self, filename_prefix: Optional[str]
@@ -0,0 +1,83 @@
+"""
+Batched participant name hydration for exports.
+
+Export rows reference participants by linked record ID. Instead of looking up
+every ID with its own request, exports collect all linked IDs up front and
+resolve them with a single batched repository call.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from src.data.repositories.participant_repository import ParticipantRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ParticipantNameHydrator:
+    """
+    Resolves linked participant IDs to Russian full names.
+
+    Names are remembered for the lifetime of the hydrator (one export), IDs
+    that do not resolve are remembered as missing so they are not requested
+    again.
+    """
+
+    def __init__(self, participant_repository: ParticipantRepository):
+        """
+        Initialize the hydrator.
+
+        Args:
+            participant_repository: Repository used to resolve record IDs
+        """
+        self.participant_repository = participant_repository
+        self._names: Dict[str, Optional[str]] = {}
+
+    async def prefetch(self, id_lists: Iterable[Optional[List[str]]]) -> None:
+        """
+        Resolve every ID of the given linked-record lists in one batch.
+
+        Args:
+            id_lists: Linked participant ID lists of all exported rows
+        """
+        missing = list(
+            dict.fromkeys(
+                record_id
+                for ids in id_lists
+                if ids
+                for record_id in ids
+                if record_id not in self._names
+            )
+        )
+        if not missing:
+            return
+
+        participants = await self.participant_repository.get_by_ids(missing)
+        for record_id in missing:
+            participant = participants.get(record_id)
+            self._names[record_id] = participant.full_name_ru if participant else None
+        logger.debug(
+            f"Hydrated {len(participants)} of {len(missing)} linked participants"
+        )
+
+    async def names(self, participant_ids: Optional[List[str]]) -> List[str]:
+        """
+        Return full names for participant IDs, keeping their order.
+
+        IDs not covered by an earlier :meth:`prefetch` are resolved together.
+
+        Args:
+            participant_ids: List of participant record IDs
+
+        Returns:
+            Russian full names of the participants that exist
+        """
+        if not participant_ids:
+            return []
+
+        await self.prefetch([participant_ids])
+        return [
+            name
+            for name in (self._names.get(record_id) for record_id in participant_ids)
+            if name
+        ]
@@ -6,9 +6,12 @@ name normalization and configurable similarity thresholds.
 """
 
 import logging
+import operator
+import re
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from rapidfuzz import fuzz, process
 
@@ -404,6 +407,100 @@ def normalize_russian(text: str) -> str:
     return normalized
 
 
+# Russian/Ukrainian Cyrillic to Latin, close to the passport-style scheme
+# coordinators use when typing names on a Latin keyboard
+_CYRILLIC_TO_LATIN = str.maketrans(
+    {
+        "а": "a",
+        "б": "b",
+        "в": "v",
+        "г": "g",
+        "д": "d",
+        "е": "e",
+        "ё": "e",
+        "ж": "zh",
+        "з": "z",
+        "и": "i",
+        "й": "i",
+        "к": "k",
+        "л": "l",
+        "м": "m",
+        "н": "n",
+        "о": "o",
+        "п": "p",
+        "р": "r",
+        "с": "s",
+        "т": "t",
+        "у": "u",
+        "ф": "f",
+        "х": "kh",
+        "ц": "ts",
+        "ч": "ch",
+        "ш": "sh",
+        "щ": "shch",
+        "ъ": "",
+        "ы": "y",
+        "ь": "",
+        "э": "e",
+        "ю": "yu",
+        "я": "ya",
+        "і": "i",
+        "ї": "yi",
+        "є": "ye",
+        "ґ": "g",
+    }
+)
+
+# Spelling variants folded together after transliteration, e.g.
+# Alexander/Aleksandr, Mikhail/Mihail, Dmitriy/Dmitrii
+_LATIN_SPELLING_VARIANTS = tuple(
+    (re.compile(pattern), canonical)
+    for pattern, canonical in (
+        (r"ph", "f"),
+        (r"kh", "h"),
+        (r"ck", "k"),
+        (r"x", "ks"),
+        (r"w", "v"),
+        (r"iy\b", "ii"),
+    )
+)
+
+
+def transliterate_to_latin(text: str) -> str:
+    """
+    Transliterate Cyrillic characters of normalized text to Latin.
+
+    Latin characters, digits and punctuation are left unchanged.
+
+    Args:
+        text: Text already passed through :func:`normalize_russian`
+
+    Returns:
+        Text in Latin script
+    """
+    return text.translate(_CYRILLIC_TO_LATIN)
+
+
+def canonical_name_key(text: str) -> str:
+    """
+    Build the script-independent key a name is indexed and searched by.
+
+    "Александр Иванов" and "Aleksandr Ivanov" both map to "aleksandr ivanov"
+    and "Alexander" to the close "aleksander", so one comparison covers
+    either script.
+
+    Args:
+        text: Name or query in Cyrillic, Latin or mixed script
+
+    Returns:
+        Lowercase Latin key
+    """
+    key = transliterate_to_latin(normalize_russian(text))
+    for variant, canonical in _LATIN_SPELLING_VARIANTS:
+        key = variant.sub(canonical, key)
+    return key
+
+
 @dataclass
 class SearchResult:
     """
@@ -420,6 +517,352 @@ class SearchResult:
         return self.similarity_score > other.similarity_score
 
 
+# Secondary-language matches are discounted unless the primary match is excellent
+SECONDARY_FIELD_WEIGHT = 0.9
+
+# Language bits recording which name field an index key came from
+LANG_RU = 1
+LANG_EN = 2
+
+# Slack for score cutoffs so float rounding never drops a borderline match;
+# the exact threshold is re-checked in Python
+_CUTOFF_EPSILON = 1e-6
+
+
+# Candidate pre-filter: character bigrams of every name token. Small indexes,
+# and queries whose matches need not share a bigram, are scanned in full; the
+# bound holds from a cutoff of about 75 for typical names. The gain is modest:
+# on 3,000 synthetic participants at a cutoff of 80 the candidates are still
+# 20-75% of the entries and a query takes about 4-6 ms instead of 7-8 ms.
+# Trigrams would keep fewer candidates, but the bound only holds for them from
+# a cutoff of about 88, so common thresholds would fall back to a full scan.
+NGRAM_SIZE = 2
+PREFILTER_MIN_ENTRIES = 256
+
+
+def _token_ngrams(token: str) -> Set[str]:
+    """Return the character n-grams of a name token, or the token if shorter."""
+    if len(token) < NGRAM_SIZE:
+        return {token}
+    return {token[i : i + NGRAM_SIZE] for i in range(len(token) - NGRAM_SIZE + 1)}
+
+
+def _prefilter_is_exact(query: str, score_cutoff: float) -> bool:
+    """
+    Check that every entry reaching the cutoff shares an n-gram with the query.
+
+    Entries sharing a token with the query share its n-grams. Otherwise
+    token_set_ratio is the Indel ratio 2M/T of the joined tokens, for T
+    characters in both strings and a longest common subsequence of M. The M
+    matched characters form at most 1 + (T - 2M) + s runs that are
+    contiguous in both strings, s being the query's spaces; once the
+    non-space matches exceed NGRAM_SIZE - 1 per run, one run is a shared
+    n-gram. The bound is linear in T, which the cutoff confines to
+    [2L / (2 - c), 2L / c] for a query of L characters, so both ends are
+    checked.
+
+    Args:
+        query: Canonical query key
+        score_cutoff: Raw score cutoff on the 0-100 scale
+
+    Returns:
+        True if the n-gram candidates contain every match
+    """
+    tokens = set(query.split())
+    ratio = score_cutoff / 100
+    if not tokens or ratio <= 0:
+        return False
+    length = len(" ".join(tokens))
+    spaces = len(tokens) - 1
+
+    def shares_ngram(total: float) -> bool:
+        matched = ratio * total / 2 - spaces
+        runs = 1 + (1 - ratio) * total + spaces
+        # Margin so float rounding never passes a bound that only just fails
+        return matched > (NGRAM_SIZE - 1) * runs + _CUTOFF_EPSILON
+
+    return shares_ngram(2 * length / (2 - ratio)) and shares_ngram(2 * length / ratio)
+
+
+class _NameEntries:
+    """
+    Flat arrays of canonical name keys, the index slot owning each key and
+    the name languages (``LANG_RU``/``LANG_EN`` bits) the key came from.
+    """
+
+    def __init__(self) -> None:
+        self.choices: List[str] = []
+        self.owners: List[int] = []
+        self.langs: List[int] = []
+        self._ngrams: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, slot: int, keys: Dict[str, int]) -> None:
+        for value, langs in keys.items():
+            position = len(self.choices)
+            self.choices.append(value)
+            self.owners.append(slot)
+            self.langs.append(langs)
+
+            grams: Set[str] = set()
+            for token in value.split():
+                grams |= _token_ngrams(token)
+            for gram in grams:
+                self._ngrams[gram].append(position)
+
+    def candidates(self, query: str, score_cutoff: float) -> Optional[List[int]]:
+        """
+        Return entry positions worth scoring, or None to scan every entry.
+
+        Candidates share at least one n-gram with a query token. The
+        pre-filter is only used where it provably keeps every entry reaching
+        the cutoff (see :func:`_prefilter_is_exact`); other queries scan every
+        entry.
+        """
+        if len(self.choices) < PREFILTER_MIN_ENTRIES or not _prefilter_is_exact(
+            query, score_cutoff
+        ):
+            return None
+
+        positions: Set[int] = set()
+        for token in query.split():
+            for gram in _token_ngrams(token):
+                positions.update(self._ngrams.get(gram, ()))
+        return sorted(positions)
+
+    def best_scores(
+        self,
+        query: str,
+        score_cutoff: float,
+        weights: Optional[Dict[int, float]] = None,
+    ) -> Dict[int, float]:
+        """
+        Score the query against candidate entries in one batch call.
+
+        Args:
+            query: Canonical query key
+            score_cutoff: Minimum (weighted) score on the 0-100 scale
+            weights: Optional score multiplier per entry language mask
+
+        Returns:
+            Best (weighted) score per index slot
+        """
+        best: Dict[int, float] = {}
+        # Entries with the largest weight need the lowest raw score; the
+        # weighted score of every entry is checked against the cutoff below
+        raw_cutoff = score_cutoff
+        if weights:
+            raw_cutoff = score_cutoff / max(weights.values())
+        if not self.choices or raw_cutoff > 100:
+            return best
+
+        extract_cutoff = max(raw_cutoff - _CUTOFF_EPSILON, 0)
+        candidates = self.candidates(query, extract_cutoff)
+        positions: Sequence[int]
+        if candidates is None:
+            positions = range(len(self.choices))
+            choices = self.choices
+        else:
+            positions = candidates
+            choices = [self.choices[p] for p in positions]
+
+        matches = process.extract(
+            query,
+            choices,
+            scorer=fuzz.token_set_ratio,
+            limit=None,
+            score_cutoff=extract_cutoff,
+        )
+        for _, score, index in matches:
+            position = positions[index]
+            if weights:
+                score *= weights[self.langs[position]]
+                if score < score_cutoff - _CUTOFF_EPSILON:
+                    continue
+            slot = self.owners[position]
+            if score > best.get(slot, -1.0):
+                best[slot] = score
+        return best
+
+
+class ParticipantSearchIndex:
+    """
+    Pre-normalized name index for fuzzy participant search.
+
+    Full names and name parts of every participant are stored as canonical
+    Latin keys (see :func:`canonical_name_key`), so Russian and English names
+    share one flat array and a query in either script is scored once with a
+    single rapidfuzz batch call. Keys remember which name field they came
+    from, and identical keys from both fields are stored once. On large
+    indexes a bigram pre-filter first narrows the entries to candidates
+    sharing text with the query. :meth:`sync` updates the index in
+    place from a new participant snapshot, re-indexing only participants
+    whose names changed.
+    """
+
+    def __init__(self, participants: Iterable[Participant] = ()):
+        """
+        Build an index for the given participants.
+
+        Args:
+            participants: Participants to index
+        """
+        self._reset()
+        self.sync(list(participants))
+
+    def _reset(self) -> None:
+        self._participants: List[Optional[Participant]] = []
+        self._names: List[Tuple[Optional[str], Optional[str]]] = []
+        self._positions: List[int] = []
+        self._slots: Dict[object, int] = {}
+        self._full = _NameEntries()
+        self._all = _NameEntries()
+        self._dead_slots = 0
+        self._last_synced: List[Participant] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def _key(participant: Participant) -> object:
+        return participant.record_id or ("object", id(participant))
+
+    def _add(self, participant: Participant, position: int) -> None:
+        slot = len(self._participants)
+        self._participants.append(participant)
+        self._names.append((participant.full_name_ru, participant.full_name_en))
+        self._positions.append(position)
+        self._slots[self._key(participant)] = slot
+
+        full_keys: Dict[str, int] = {}
+        all_keys: Dict[str, int] = {}
+        for lang, name in (
+            (LANG_RU, participant.full_name_ru),
+            (LANG_EN, participant.full_name_en),
+        ):
+            if not name:
+                continue
+            full = canonical_name_key(name)
+            full_keys[full] = full_keys.get(full, 0) | lang
+            for key in [full] + [canonical_name_key(p) for p in parse_name_parts(name)]:
+                all_keys[key] = all_keys.get(key, 0) | lang
+        self._full.add(slot, full_keys)
+        self._all.add(slot, all_keys)
+
+    def _drop(self, slot: int) -> None:
+        self._participants[slot] = None
+        self._dead_slots += 1
+
+    def sync(self, participants: Sequence[Participant]) -> None:
+        """
+        Bring the index in line with a participant snapshot.
+
+        Unchanged participants only have their position refreshed; changed
+        or new ones are (re-)indexed and missing ones are dropped. When more
+        than half of the entries are stale the index is rebuilt.
+
+        Args:
+            participants: Current full participant list
+        """
+        last = self._last_synced
+        if len(last) == len(participants) and all(
+            map(operator.is_, participants, last)
+        ):
+            return
+
+        seen = set()
+        for position, participant in enumerate(participants):
+            key = self._key(participant)
+            seen.add(key)
+            slot = self._slots.get(key)
+            if slot is not None:
+                if self._names[slot] == (
+                    participant.full_name_ru,
+                    participant.full_name_en,
+                ):
+                    self._participants[slot] = participant
+                    self._positions[slot] = position
+                    continue
+                self._drop(slot)
+            self._add(participant, position)
+
+        for key in [key for key in self._slots if key not in seen]:
+            self._drop(self._slots.pop(key))
+
+        self._last_synced = list(participants)
+        if self._dead_slots > max(len(self._slots), 32):
+            logger.debug("Rebuilding participant search index")
+            self._reset()
+            self.sync(participants)
+
+    def _ranked(
+        self, scores: Dict[int, float], threshold: float, limit: int
+    ) -> List[SearchResult]:
+        results = []
+        for slot, score in scores.items():
+            participant = self._participants[slot]
+            if participant is not None and score >= threshold:
+                results.append((self._positions[slot], participant, score))
+        # Highest score first; ties keep snapshot order
+        results.sort(key=lambda item: (-item[2], item[0]))
+        return [
+            SearchResult(participant=participant, similarity_score=score)
+            for _, participant, score in results[:limit]
+        ]
+
+    def search(self, query: str, threshold: float, limit: int) -> List[SearchResult]:
+        """
+        Match a query in either script against full Russian and English names.
+
+        Args:
+            query: Search query
+            threshold: Minimum similarity score (0.0-1.0)
+            limit: Maximum number of results
+
+        Returns:
+            SearchResult list sorted by similarity score (descending)
+        """
+        scores = self._full.best_scores(
+            canonical_name_key(query.strip()), threshold * 100
+        )
+        return self._ranked(
+            {slot: score / 100.0 for slot, score in scores.items()}, threshold, limit
+        )
+
+    def search_enhanced(
+        self, query: str, threshold: float, limit: int
+    ) -> List[SearchResult]:
+        """
+        Match a query against full names and name parts, preferring the
+        name in the query's language.
+
+        Every key is scored once; keys that only come from the other
+        language's name are weighted by ``SECONDARY_FIELD_WEIGHT``.
+
+        Args:
+            query: Search query
+            threshold: Minimum similarity score (0.0-1.0)
+            limit: Maximum number of results
+
+        Returns:
+            SearchResult list sorted by similarity score (descending)
+        """
+        query = query.strip()
+        primary = LANG_RU if detect_language(query) == "ru" else LANG_EN
+        # A discounted secondary score never exceeds SECONDARY_FIELD_WEIGHT,
+        # so it can only win when the primary match is not excellent
+        weights = {
+            langs: 1.0 if langs & primary else SECONDARY_FIELD_WEIGHT
+            for langs in (LANG_RU, LANG_EN, LANG_RU | LANG_EN)
+        }
+
+        scores = self._all.best_scores(
+            canonical_name_key(query), threshold * 100, weights
+        )
+        return self._ranked(
+            {slot: score / 100.0 for slot, score in scores.items()}, threshold, limit
+        )
+
+
 class SearchService:
     """
     Service for fuzzy participant name searching and room/floor searches.
@@ -451,7 +894,10 @@ class SearchService:
         )
 
     def search_participants(
-        self, query: str, participants: List[Participant]
+        self,
+        query: str,
+        participants: List[Participant],
+        index: Optional[ParticipantSearchIndex] = None,
     ) -> List[SearchResult]:
         """
         Search participants by name using fuzzy matching.
@@ -459,6 +905,8 @@ class SearchService:
         Args:
             query: Search query (name or partial name)
             participants: List of participants to search through
+            index: Optional reusable index, synced to ``participants`` before
+                searching; a temporary index is built when omitted
 
         Returns:
             List of SearchResult objects sorted by similarity score (descending)
@@ -469,56 +917,37 @@ class SearchService:
         if not participants:
             return []
 
-        query_normalized = normalize_russian(query.strip())
-        results = []
+        logger.debug(f"Searching for '{query}' among {len(participants)} participants")
 
-        logger.debug(
-            f"Searching for '{query}' (normalized: '{query_normalized}') among {len(participants)} participants"
+        index = self._synced_index(participants, index)
+        limited_results = index.search(
+            query, self.similarity_threshold, self.max_results
         )
 
-        for participant in participants:
-            # Get the best similarity score from Russian and English names
-            max_score = 0.0
-
-            # Check Russian name
-            if participant.full_name_ru:
-                ru_normalized = normalize_russian(participant.full_name_ru)
-                ru_score = fuzz.token_set_ratio(query_normalized, ru_normalized) / 100.0
-                max_score = max(max_score, ru_score)
-
-            # Check English name
-            if participant.full_name_en:
-                en_normalized = normalize_russian(participant.full_name_en)
-                en_score = fuzz.token_set_ratio(query_normalized, en_normalized) / 100.0
-                max_score = max(max_score, en_score)
-
-            # Add to results if meets threshold
-            if max_score >= self.similarity_threshold:
-                results.append(
-                    SearchResult(participant=participant, similarity_score=max_score)
-                )
-
-        # Sort by similarity score descending and limit results
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
-        limited_results = results[: self.max_results]
-
         logger.debug(
             f"Found {len(limited_results)} matches above threshold {self.similarity_threshold}"
         )
         return limited_results
 
     def search_participants_enhanced(
-        self, query: str, participants: List[Participant]
+        self,
+        query: str,
+        participants: List[Participant],
+        index: Optional[ParticipantSearchIndex] = None,
     ) -> List[SearchResult]:
         """
         Enhanced search with language detection and multi-field matching.
 
         Uses language detection to optimize search strategy and searches individual
-        name parts (first/last names) in addition to full names.
+        name parts (first/last names) in addition to full names. Matches in the
+        other language's name are weighted by 0.9 and only considered when the
+        primary name has no excellent (>= 0.9) match.
 
         Args:
             query: Search query (name or partial name)
             participants: List of participants to search through
+            index: Optional reusable index, synced to ``participants`` before
+                searching; a temporary index is built when omitted
 
         Returns:
             List of SearchResult objects sorted by similarity score (descending)
@@ -529,82 +958,29 @@ class SearchService:
         if not participants:
             return []
 
-        query_normalized = normalize_russian(query.strip())
-        detected_lang = detect_language(query.strip())
-        results = []
-
         logger.debug(
-            f"Enhanced search for '{query}' (lang: {detected_lang}, normalized: '{query_normalized}') among {len(participants)} participants"
+            f"Enhanced search for '{query}' (lang: {detect_language(query.strip())}) among {len(participants)} participants"
         )
 
-        for participant in participants:
-            max_score = 0.0
-
-            # Get fields to search based on detected language
-            if detected_lang == "ru":
-                primary_field: Optional[str] = participant.full_name_ru
-                secondary_field: Optional[str] = participant.full_name_en
-            else:
-                primary_field = participant.full_name_en
-                secondary_field = participant.full_name_ru
-
-            # Search in primary field (full name and individual parts)
-            if primary_field:
-                # Full name search
-                primary_normalized = normalize_russian(primary_field)
-                full_score = (
-                    fuzz.token_set_ratio(query_normalized, primary_normalized) / 100.0
-                )
-                max_score = max(max_score, full_score)
-
-                # Individual name parts search
-                name_parts = parse_name_parts(primary_field)
-                for part in name_parts:
-                    part_normalized = normalize_russian(part)
-                    part_score = (
-                        fuzz.token_set_ratio(query_normalized, part_normalized) / 100.0
-                    )
-                    max_score = max(max_score, part_score)
-
-            # Search in secondary field (lower priority)
-            if (
-                secondary_field and max_score < 0.9
-            ):  # Only if no excellent match in primary
-                # Full name search
-                secondary_normalized = normalize_russian(secondary_field)
-                secondary_full_score = (
-                    fuzz.token_set_ratio(query_normalized, secondary_normalized) / 100.0
-                )
-                max_score = max(
-                    max_score, secondary_full_score * 0.9
-                )  # Slight penalty for secondary field
-
-                # Individual name parts search
-                secondary_parts = parse_name_parts(secondary_field)
-                for part in secondary_parts:
-                    part_normalized = normalize_russian(part)
-                    part_score = (
-                        fuzz.token_set_ratio(query_normalized, part_normalized) / 100.0
-                    )
-                    max_score = max(
-                        max_score, part_score * 0.9
-                    )  # Slight penalty for secondary field
-
-            # Add to results if meets threshold
-            if max_score >= self.similarity_threshold:
-                results.append(
-                    SearchResult(participant=participant, similarity_score=max_score)
-                )
-
-        # Sort by similarity score descending and limit results
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
-        limited_results = results[: self.max_results]
+        index = self._synced_index(participants, index)
+        limited_results = index.search_enhanced(
+            query, self.similarity_threshold, self.max_results
+        )
 
         logger.debug(
             f"Enhanced search found {len(limited_results)} matches above threshold {self.similarity_threshold}"
         )
         return limited_results
 
+    @staticmethod
+    def _synced_index(
+        participants: List[Participant], index: Optional[ParticipantSearchIndex]
+    ) -> ParticipantSearchIndex:
+        if index is None:
+            return ParticipantSearchIndex(participants)
+        index.sync(participants)
+        return index
+
     def get_similarity_score(self, query: str, target: str) -> float:
         """
         Get similarity score between two strings.
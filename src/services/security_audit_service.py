@@ -4,13 +4,24 @@ Security audit service for comprehensive authorization and sync logging.
 Provides structured audit logging for all security events, authorization attempts,
 Airtable sync operations, and performance metrics to ensure complete observability
 and compliance with security monitoring requirements.
+
+Granted authorizations and fast performance metrics can be sampled; denied,
+slow and failed events are always kept. Once started in an event loop, the
+service buffers events in a bounded ring buffer that a background task drains
+in batches, keeping serialization and log I/O off the request path. When the
+buffer is full only sampled events are evicted; events that must be kept are
+written synchronously instead.
 """
 
+import asyncio
+import itertools
 import json
 import logging
+import random
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 # Configuration imported where needed
 
@@ -20,6 +31,49 @@ logger = logging.getLogger(__name__)
 AUTHORIZATION_FAST_THRESHOLD_MS = 100  # < 100ms is considered fast
 AUTHORIZATION_SLOW_THRESHOLD_MS = 300  # > 300ms is considered slow
 
+# Default pipeline configuration
+DEFAULT_AUDIT_BUFFER_SIZE = 10000  # Events held while waiting to be written
+DEFAULT_AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_AUDIT_GRANTED_SAMPLE_RATE = 1.0  # Share of granted events logged
+DEFAULT_AUDIT_FAST_SAMPLE_RATE = 1.0  # Share of fast performance metrics logged
+
+# Message templates with the static parts of the JSON payloads pre-serialized
+_AUTHORIZATION_TEMPLATE = (
+    'SECURITY_AUDIT: {"event_type": "authorization_event", "user_id": %s, '
+    '"action": %s, "result": %s, "user_role": %s, "cache_state": %s, '
+    '"timestamp": %s%s}'
+)
+_SYNC_TEMPLATE = (
+    '{"event_type": "sync_event", "sync_type": %s, "duration_ms": %s, '
+    '"records_processed": %s, "success": %s, "timestamp": %s%s}'
+)
+_PERFORMANCE_TEMPLATE = (
+    '{"event_type": "performance_metrics", "operation": %s, "duration_ms": %s, '
+    '"cache_hit": %s, "user_role": %s, "timestamp": %s%s}'
+)
+
+_encode = json.JSONEncoder(default=str).encode
+
+
+def _encode_value(value: Any) -> str:
+    """Encode one JSON value, falling back to its string form."""
+    try:
+        return _encode(value)
+    except (TypeError, ValueError):
+        # Fallback for values json cannot encode, e.g. circular structures
+        return _encode(str(value))
+
+
+def _encode_timestamp(timestamp: Optional[datetime]) -> str:
+    return _encode(timestamp.isoformat()) if timestamp else "null"
+
+
+# Log method name and message of a formatted event
+FormattedEvent = Tuple[str, str]
+EventFormatter = Callable[[Any], FormattedEvent]
+# Buffered event: sequence number, formatter and event
+BufferedEvent = Tuple[int, EventFormatter, Any]
+
 
 @dataclass
 class AuthorizationEvent:
@@ -110,65 +164,213 @@ class SecurityAuditService:
 
     Provides structured logging for authorization events, sync operations,
     and performance metrics to ensure complete security observability.
+
+    Features:
+    - Sampling of granted authorizations and fast performance metrics
+    - Denied, slow and failed events always logged
+    - Bounded ring buffer drained in batches by a background task
+    - Synchronous writes while the drain task is not running
     """
 
-    def __init__(self):
-        """Initialize security audit service."""
+    def __init__(
+        self,
+        buffer_size: int = DEFAULT_AUDIT_BUFFER_SIZE,
+        flush_interval_seconds: float = DEFAULT_AUDIT_FLUSH_INTERVAL_SECONDS,
+        granted_sample_rate: float = DEFAULT_AUDIT_GRANTED_SAMPLE_RATE,
+        fast_sample_rate: float = DEFAULT_AUDIT_FAST_SAMPLE_RATE,
+    ):
+        """
+        Initialize security audit service.
+
+        Args:
+            buffer_size: Maximum number of buffered events; when full the
+                oldest sampled events are dropped, and 0 always writes
+                synchronously
+            flush_interval_seconds: Interval between batch writes
+            granted_sample_rate: Share of granted authorization events logged
+            fast_sample_rate: Share of fast performance metrics logged
+        """
         self.logger = logging.getLogger(__name__)
+        # Sampled events are kept apart so the oldest one is evicted in O(1);
+        # sequence numbers restore the order of both queues when flushing
+        self._must_keep: Deque[BufferedEvent] = deque()
+        self._sampled: Deque[BufferedEvent] = deque()
+        self._sequence = itertools.count()
+        self._drain_task: Optional[asyncio.Task] = None
+        self._stats = {"logged": 0, "sampled_out": 0, "dropped": 0}
+        self.configure(
+            buffer_size=buffer_size,
+            flush_interval_seconds=flush_interval_seconds,
+            granted_sample_rate=granted_sample_rate,
+            fast_sample_rate=fast_sample_rate,
+        )
 
-    def _safe_json_dumps(self, data: dict) -> str:
+    def configure(
+        self,
+        buffer_size: int = DEFAULT_AUDIT_BUFFER_SIZE,
+        flush_interval_seconds: float = DEFAULT_AUDIT_FLUSH_INTERVAL_SECONDS,
+        granted_sample_rate: float = DEFAULT_AUDIT_GRANTED_SAMPLE_RATE,
+        fast_sample_rate: float = DEFAULT_AUDIT_FAST_SAMPLE_RATE,
+    ) -> None:
         """
-        Safely serialize data to JSON, handling non-serializable objects.
+        Reconfigure buffering and sampling; buffered events are kept.
 
         Args:
-            data: Dictionary to serialize
+            buffer_size: Maximum number of buffered events, 0 to disable
+            flush_interval_seconds: Interval between batch writes
+            granted_sample_rate: Share of granted authorization events logged
+            fast_sample_rate: Share of fast performance metrics logged
+        """
+        capacity = max(buffer_size, 1)
+        self.buffer_size = buffer_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.granted_sample_rate = granted_sample_rate
+        self.fast_sample_rate = fast_sample_rate
+        self._capacity = capacity
+
+    async def start(self) -> None:
+        """Start buffering events and draining them in the running loop."""
+        if self.buffer_size <= 0 or self.is_running:
+            return
+        self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+        self.logger.debug("Security audit drain task started")
+
+    async def stop(self) -> None:
+        """Stop the drain task and write all buffered events."""
+        task, self._drain_task = self._drain_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.flush()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether events are buffered for the drain task."""
+        task = self._drain_task
+        return task is not None and not task.done() and not task.get_loop().is_closed()
+
+    def flush(self) -> int:
+        """
+        Write all buffered events.
+
+        Returns:
+            Number of events written
+        """
+        written = 0
+        while True:
+            try:
+                _, format_event, event = self._oldest_queue().popleft()
+            except IndexError:
+                break
+            self._write(format_event, event)
+            written += 1
+        return written
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get pipeline statistics.
 
         Returns:
-            JSON string representation
+            Dictionary with logged, sampled out, dropped and buffered counts
+        """
+        return {**self._stats, "buffered": self._buffered()}
+
+    def _buffered(self) -> int:
+        return len(self._must_keep) + len(self._sampled)
+
+    def _oldest_queue(self) -> Deque[BufferedEvent]:
+        """Return the queue holding the oldest buffered event."""
+        must_keep, sampled = self._must_keep, self._sampled
+        if not sampled or (must_keep and must_keep[0][0] < sampled[0][0]):
+            return must_keep
+        return sampled
+
+    async def _drain(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to write security audit events: {e}")
+
+    def _sampled_out(self, rate: float) -> bool:
+        if rate >= 1.0 or random.random() < rate:
+            return False
+        self._stats["sampled_out"] += 1
+        return True
+
+    def _emit(
+        self, format_event: EventFormatter, event: Any, sampled: bool = False
+    ) -> None:
+        """
+        Buffer an event for the drain task, or write it right away.
+
+        Args:
+            format_event: Formatter of the event
+            event: Event to log
+            sampled: Whether the event belongs to a sampled class (granted
+                authorizations, fast metrics) and may be dropped under load
         """
-        try:
-            return json.dumps(data, default=str)
-        except (TypeError, ValueError):
-            # Fallback for non-serializable objects (like Mock objects in tests)
-            safe_data = {}
-            for key, value in data.items():
-                try:
-                    json.dumps(value)  # Test if value is serializable
-                    safe_data[key] = value
-                except (TypeError, ValueError):
-                    safe_data[key] = str(value)  # Convert to string as fallback
-            return json.dumps(safe_data)
+        if not self.is_running:
+            self._write(format_event, event)
+            return
+        if self._buffered() >= self._capacity:
+            if self._sampled:
+                # Make room by dropping the oldest sampled event
+                self._sampled.popleft()
+                self._stats["dropped"] += 1
+            elif sampled:
+                self._stats["dropped"] += 1
+                return
+            else:
+                # Only events that must be kept are buffered, so never drop one
+                self._write(format_event, event)
+                return
+        queue = self._sampled if sampled else self._must_keep
+        queue.append((next(self._sequence), format_event, event))
+
+    def _write(self, format_event: EventFormatter, event: Any) -> None:
+        method, message = format_event(event)
+        getattr(self.logger, method)(message)
+        self._stats["logged"] += 1
 
     def log_authorization_event(self, event: AuthorizationEvent) -> None:
         """
         Log authorization event with appropriate severity level.
 
         Denied access attempts are logged as warnings for security monitoring.
-        Granted access is logged as info for audit trail.
+        Granted access is logged as info for audit trail, sampled at the
+        granted sample rate.
 
         Args:
             event: Authorization event to log
         """
-        # Create structured log message
-        log_data: Dict[str, Any] = {
-            "event_type": "authorization_event",
-            "user_id": event.user_id,
-            "action": event.action,
-            "result": event.result,
-            "user_role": event.user_role,
-            "cache_state": event.cache_state,
-            "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-        }
+        granted = event.result != "denied"
+        if granted and self._sampled_out(self.granted_sample_rate):
+            return
+        self._emit(self._format_authorization_event, event, sampled=granted)
 
+    @staticmethod
+    def _format_authorization_event(event: AuthorizationEvent) -> FormattedEvent:
         # Add optional fields if present
+        extra = ""
         if event.airtable_metadata:
-            log_data["airtable_metadata"] = event.airtable_metadata
-
+            extra += f', "airtable_metadata": {_encode_value(event.airtable_metadata)}'
         if event.error_details:
-            log_data["error_details"] = event.error_details
-
-        # Format log message with safe JSON serialization
-        log_message = f"SECURITY_AUDIT: {self._safe_json_dumps(log_data)}"
+            extra += f', "error_details": {_encode_value(event.error_details)}'
+
+        log_message = _AUTHORIZATION_TEMPLATE % (
+            _encode_value(event.user_id),
+            _encode_value(event.action),
+            _encode_value(event.result),
+            _encode_value(event.user_role),
+            _encode_value(event.cache_state),
+            _encode_timestamp(event.timestamp),
+            extra,
+        )
 
         # Log at appropriate level based on result
         if event.result == "denied":
@@ -177,9 +379,8 @@ class SecurityAuditService:
                 f"User {event.user_id} (role: {event.user_role}) attempted "
                 f"'{event.action}'"
             )
-            self.logger.warning(f"{denied_message} - {log_message}")
-        else:
-            self.logger.info(log_message)
+            return "warning", f"{denied_message} - {log_message}"
+        return "info", log_message
 
     def log_sync_event(self, event: SyncEvent) -> None:
         """
@@ -190,23 +391,27 @@ class SecurityAuditService:
         Args:
             event: Sync event to log
         """
-        # Create structured log message
-        log_data = {
-            "event_type": "sync_event",
-            "sync_type": event.sync_type,
-            "duration_ms": event.duration_ms,
-            "records_processed": event.records_processed,
-            "success": event.success,
-            "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-        }
+        self._emit(self._format_sync_event, event)
 
+    @staticmethod
+    def _format_sync_event(event: SyncEvent) -> FormattedEvent:
         # Add failure details if present
+        extra = ""
         if not event.success:
             if event.error_details:
-                log_data["error_details"] = event.error_details
+                extra += f', "error_details": {_encode_value(event.error_details)}'
             if event.failed_record_ids:
-                log_data["failed_record_count"] = len(event.failed_record_ids)
                 # Don't log full record IDs for privacy, just count
+                extra += f', "failed_record_count": {len(event.failed_record_ids)}'
+
+        log_data = _SYNC_TEMPLATE % (
+            _encode_value(event.sync_type),
+            _encode_value(event.duration_ms),
+            _encode_value(event.records_processed),
+            _encode_value(event.success),
+            _encode_timestamp(event.timestamp),
+            extra,
+        )
 
         # Format log message
         base_message = (
@@ -215,41 +420,54 @@ class SecurityAuditService:
         )
 
         if event.success:
-            self.logger.info(
-                f"{base_message} - SUCCESS: {self._safe_json_dumps(log_data)}"
-            )
-        else:
-            failed_count = (
-                len(event.failed_record_ids) if event.failed_record_ids else 0
-            )
-            self.logger.error(
-                f"{base_message} - FAILED: {failed_count} failed records - "
-                f"{self._safe_json_dumps(log_data)}"
-            )
+            return "info", f"{base_message} - SUCCESS: {log_data}"
+        failed_count = len(event.failed_record_ids) if event.failed_record_ids else 0
+        return "error", (
+            f"{base_message} - FAILED: {failed_count} failed records - {log_data}"
+        )
 
     def log_performance_metrics(self, metrics: PerformanceMetrics) -> None:
         """
         Log performance metrics with appropriate severity based on thresholds.
 
         Slow operations (>300ms) are logged as warnings for monitoring.
-        Fast operations (<100ms) are logged as debug for detailed tracking.
+        Fast operations (<100ms) are logged as debug for detailed tracking,
+        sampled at the fast sample rate.
         Medium operations are logged as info.
+        Metrics below the logger's level are skipped before any other work.
 
         Args:
             metrics: Performance metrics to log
         """
-        # Create structured log message
-        log_data = {
-            "event_type": "performance_metrics",
-            "operation": metrics.operation,
-            "duration_ms": metrics.duration_ms,
-            "cache_hit": metrics.cache_hit,
-            "user_role": metrics.user_role,
-            "timestamp": metrics.timestamp.isoformat() if metrics.timestamp else None,
-        }
-
+        fast = metrics.duration_ms < AUTHORIZATION_FAST_THRESHOLD_MS
+        if metrics.duration_ms > AUTHORIZATION_SLOW_THRESHOLD_MS:
+            level = logging.WARNING
+        elif fast:
+            level = logging.DEBUG
+        else:
+            level = logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
+        if fast and self._sampled_out(self.fast_sample_rate):
+            return
+        self._emit(self._format_performance_metrics, metrics, sampled=fast)
+
+    @staticmethod
+    def _format_performance_metrics(metrics: PerformanceMetrics) -> FormattedEvent:
+        extra = ""
         if metrics.additional_context:
-            log_data["additional_context"] = metrics.additional_context
+            extra = (
+                f', "additional_context": {_encode_value(metrics.additional_context)}'
+            )
+
+        log_data = _PERFORMANCE_TEMPLATE % (
+            _encode_value(metrics.operation),
+            _encode_value(metrics.duration_ms),
+            _encode_value(metrics.cache_hit),
+            _encode_value(metrics.user_role),
+            _encode_timestamp(metrics.timestamp),
+            extra,
+        )
 
         # Format log message
         base_message = (
@@ -259,13 +477,10 @@ class SecurityAuditService:
 
         # Log at appropriate level based on performance thresholds
         if metrics.duration_ms > AUTHORIZATION_SLOW_THRESHOLD_MS:
-            self.logger.warning(
-                f"{base_message} - SLOW operation: {self._safe_json_dumps(log_data)}"
-            )
-        elif metrics.duration_ms < AUTHORIZATION_FAST_THRESHOLD_MS:
-            self.logger.debug(f"{base_message} - {self._safe_json_dumps(log_data)}")
-        else:
-            self.logger.info(f"{base_message} - {self._safe_json_dumps(log_data)}")
+            return "warning", f"{base_message} - SLOW operation: {log_data}"
+        if metrics.duration_ms < AUTHORIZATION_FAST_THRESHOLD_MS:
+            return "debug", f"{base_message} - {log_data}"
+        return "info", f"{base_message} - {log_data}"
 
     def create_authorization_event(
         self,
@@ -6,15 +6,21 @@ from typing import Callable, Dict, Optional, Tuple
 from src.config.settings import get_settings
 from src.data.airtable.airtable_bible_readers_repo import AirtableBibleReadersRepository
 from src.data.airtable.airtable_client import AirtableClient
+from src.data.airtable.airtable_participant_replica import ParticipantReplica
 from src.data.airtable.airtable_participant_repo import AirtableParticipantRepository
 from src.data.airtable.airtable_roe_repo import AirtableROERepository
 from src.services.bible_readers_export_service import BibleReadersExportService
+from src.services.export_orchestrator import ExportOrchestrator
 from src.services.participant_export_service import ParticipantExportService
 from src.services.participant_list_service import ParticipantListService
 from src.services.roe_export_service import ROEExportService
 from src.services.schedule_service import ScheduleService
 from src.services.search_service import SearchService
 from src.services.statistics_service import StatisticsService
+from src.utils.columnar_export import ExportFormat
+from src.utils.export_artifact_cache import ExportArtifactCache
+from src.utils.export_size_estimator import ExportSizeEstimator
+from src.utils.export_watermarks import ExportWatermarkStore
 
 # Cache for table-specific clients
 _AIRTABLE_CLIENTS: Dict[str, AirtableClient] = {}
@@ -27,6 +33,18 @@ _AIRTABLE_CLIENT_SIGNATURE: Optional[tuple] = None
 # Cached services
 _SCHEDULE_SERVICE: Optional[ScheduleService] = None
 
+# Shared local replica of the Participants table (None when disabled)
+_PARTICIPANT_REPLICA: Optional[ParticipantReplica] = None
+
+# Rendered exports shared by all admins (None until first use)
+_EXPORT_ARTIFACT_CACHE: Optional[ExportArtifactCache] = None
+
+# Export size estimates shared by all admins
+_EXPORT_SIZE_ESTIMATOR = ExportSizeEstimator()
+
+# Delta export watermarks shared by all admins (None until first use)
+_EXPORT_WATERMARK_STORE: Optional[ExportWatermarkStore] = None
+
 
 def get_airtable_client() -> AirtableClient:
     """Return a shared AirtableClient instance based on current settings."""
@@ -71,17 +89,96 @@ def get_airtable_client_for_table(table_type: str) -> AirtableClient:
 
 def reset_airtable_client_cache() -> None:
     """Reset cached Airtable clients (useful for testing or config reloads)."""
-    global _AIRTABLE_CLIENT, _AIRTABLE_CLIENT_SIGNATURE
+    global _AIRTABLE_CLIENT, _AIRTABLE_CLIENT_SIGNATURE, _PARTICIPANT_REPLICA
+    global _EXPORT_ARTIFACT_CACHE, _EXPORT_WATERMARK_STORE
 
     # Reset legacy cache
     _AIRTABLE_CLIENT = None
     _AIRTABLE_CLIENT_SIGNATURE = None
+    _PARTICIPANT_REPLICA = None
+
+    # Exports rendered from the previous configuration must not be reused
+    if _EXPORT_ARTIFACT_CACHE is not None:
+        _EXPORT_ARTIFACT_CACHE.clear()
+    _EXPORT_ARTIFACT_CACHE = None
+    _EXPORT_SIZE_ESTIMATOR.clear()
+    _EXPORT_WATERMARK_STORE = None
 
     # Reset table-specific caches
     _AIRTABLE_CLIENTS.clear()
     _AIRTABLE_CLIENT_SIGNATURES.clear()
 
 
+def get_participant_replica() -> Optional[ParticipantReplica]:
+    """
+    Return the shared local replica of the Participants table.
+
+    The replica is created once per Airtable client and kept fresh by the
+    background sync job registered in ``main``.
+
+    Returns:
+        ParticipantReplica if enabled in settings, None otherwise
+    """
+    global _PARTICIPANT_REPLICA
+
+    database = get_settings().database
+    if not database.participant_replica_enabled:
+        return None
+
+    client = get_airtable_client()
+    if _PARTICIPANT_REPLICA is None or _PARTICIPANT_REPLICA.client is not client:
+        _PARTICIPANT_REPLICA = ParticipantReplica(
+            client,
+            sync_interval_seconds=database.participant_replica_sync_interval_seconds,
+            full_sync_interval_seconds=(
+                database.participant_replica_full_sync_interval_seconds
+            ),
+        )
+    return _PARTICIPANT_REPLICA
+
+
+def get_export_artifact_cache() -> Optional[ExportArtifactCache]:
+    """
+    Return the shared cache of rendered exports.
+
+    Returns:
+        ExportArtifactCache if enabled in settings, None otherwise
+    """
+    global _EXPORT_ARTIFACT_CACHE
+
+    application = get_settings().application
+    if not application.export_cache_enabled:
+        return None
+
+    if _EXPORT_ARTIFACT_CACHE is None:
+        _EXPORT_ARTIFACT_CACHE = ExportArtifactCache(
+            max_age_seconds=application.export_cache_max_age_seconds,
+            max_total_bytes=application.export_cache_max_mb * 1024 * 1024,
+        )
+    return _EXPORT_ARTIFACT_CACHE
+
+
+def get_export_size_estimator() -> ExportSizeEstimator:
+    """Return the shared cache of export size estimates."""
+    return _EXPORT_SIZE_ESTIMATOR
+
+
+def get_export_watermark_store() -> ExportWatermarkStore:
+    """
+    Return the shared store of delta export watermarks.
+
+    Returns:
+        ExportWatermarkStore persisted to the configured file, if any
+    """
+    global _EXPORT_WATERMARK_STORE
+
+    if _EXPORT_WATERMARK_STORE is None:
+        _EXPORT_WATERMARK_STORE = ExportWatermarkStore(
+            get_settings().application.export_watermark_file or None
+        )
+    return _EXPORT_WATERMARK_STORE
+
+
 def get_participant_repository() -> AirtableParticipantRepository:
     """
     Get participant repository instance.
@@ -92,7 +189,7 @@ def get_participant_repository() -> AirtableParticipantRepository:
         AirtableParticipantRepository: Configured repository instance
     """
     client = get_airtable_client()
-    return AirtableParticipantRepository(client)
+    return AirtableParticipantRepository(client, replica=get_participant_replica())
 
 
 def get_search_service() -> SearchService:
@@ -137,7 +234,14 @@ def get_export_service(
         ParticipantExportService: Configured export service instance
     """
     repository = get_participant_repository()
-    return ParticipantExportService(repository, progress_callback)
+    return ParticipantExportService(
+        repository,
+        progress_callback,
+        artifact_cache=get_export_artifact_cache(),
+        export_format=ExportFormat(get_settings().application.export_format),
+        size_estimator=get_export_size_estimator(),
+        watermark_store=get_export_watermark_store(),
+    )
 
 
 def get_bible_readers_repository() -> AirtableBibleReadersRepository:
@@ -213,6 +317,37 @@ def get_roe_export_service(
     )
 
 
+def get_retreat_packet_orchestrator(
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> ExportOrchestrator:
+    """
+    Get an orchestrator for the full retreat packet export.
+
+    The packet combines all participants, ROE sessions and Bible readers;
+    the three table exports run concurrently within the shared rate limit.
+
+    Args:
+        progress_callback: Optional callback for combined progress updates
+
+    Returns:
+        ExportOrchestrator: Orchestrator with one job per table
+    """
+    return ExportOrchestrator(
+        {
+            "participants.csv": lambda progress: get_export_service(
+                progress
+            ).get_all_participants_as_file(ExportFormat.CSV),
+            "roe.csv": lambda progress: get_roe_export_service(
+                progress
+            ).export_to_csv_async(),
+            "bible_readers.csv": lambda progress: get_bible_readers_export_service(
+                progress
+            ).export_to_csv_async(),
+        },
+        progress_callback=progress_callback,
+    )
+
+
 def get_schedule_service() -> ScheduleService:
     """Get a shared ScheduleService instance.
 
@@ -10,6 +10,7 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Dict
 
+from src.data.airtable.airtable_client import RequestPriority, request_priority
 from src.data.repositories.participant_repository import (
     ParticipantRepository,
     RepositoryError,
@@ -67,7 +68,9 @@ class StatisticsService:
             # Airtable doesn't support offset pagination
             # Repository will use max_records internally to prevent unlimited fetches
             logger.debug("Fetching all participants from repository")
-            all_participants = await self.repository.list_all()
+            # Scheduled job: let interactive searches go ahead of this scan
+            with request_priority(RequestPriority.BACKGROUND):
+                all_participants = await self.repository.list_all()
             participants_processed = len(all_participants)
 
             logger.debug(
@@ -13,9 +13,13 @@ from typing import Callable, List, Optional, Union
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src.config.settings import get_settings
+from src.config.settings import ROLE_LEVELS, get_settings
 from src.services.security_audit_service import get_security_audit_service
-from src.utils.auth_utils import get_user_role
+from src.utils.auth_utils import (
+    deferred_min_duration,
+    ensure_min_duration_async,
+    get_user_role,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +81,11 @@ def require_role(
 
             # Resolve user role (this will internally log role resolution audit events)
             settings = get_settings()
-            user_role = get_user_role(user.id, settings)
+            start_perf = time.perf_counter()
+            with deferred_min_duration():
+                user_role = get_user_role(user.id, settings)
+            # Constant-time padding without stalling other updates
+            await ensure_min_duration_async(start_perf)
 
             # Determine handler action name
             handler_action = f"handler_access:{handler_func.__name__}"
@@ -223,17 +231,14 @@ def _has_required_role(user_role: Optional[str], required_roles: List[str]) -> b
     if user_role is None:
         return False
 
-    # Define role hierarchy (higher values = higher privileges)
-    role_hierarchy = {"viewer": 1, "coordinator": 2, "admin": 3}
-
-    user_level = role_hierarchy.get(user_role, 0)
+    user_level = ROLE_LEVELS.get(user_role, 0)
     if user_level == 0:
         # Unknown role
         return False
 
     # Check if user role meets or exceeds any of the required roles
     for required_role in required_roles:
-        required_level = role_hierarchy.get(required_role, float("inf"))
+        required_level = ROLE_LEVELS.get(required_role, float("inf"))
         if user_level >= required_level:
             return True
 
@@ -4,11 +4,14 @@ Authentication utilities for the Telegram bot.
 Provides functions for user authorization and access control.
 """
 
+import asyncio
+import contextlib
+import contextvars
 import logging
 import time
-from typing import Dict, Tuple, Union
+from typing import Any, Collection, Dict, Iterator, Tuple, Union
 
-from src.config.settings import Settings
+from src.config.settings import ROLE_LEVELS, RoleMap, Settings
 from src.services.security_audit_service import get_security_audit_service
 
 logger = logging.getLogger(__name__)
@@ -23,24 +26,91 @@ _ADMIN_CHECK_MIN_MS = 2.0
 _ROLE_RESOLUTION_MIN_MS = 2.0
 
 
+# Set while an async caller pads auth checks itself instead of blocking
+_MIN_DURATION_DEFERRED: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "auth_min_duration_deferred", default=False
+)
+
+
+def _remaining_seconds(start_perf: float, min_ms: float) -> float:
+    """Return the seconds left until a check started at start_perf took min_ms."""
+    return start_perf + (min_ms / 1000.0) - time.perf_counter()
+
+
 def _ensure_min_duration(start_perf: float, min_ms: float) -> None:
-    """Busy-wait/sleep to ensure a minimum wall-clock duration in milliseconds.
+    """Sleep to ensure a minimum wall-clock duration in milliseconds.
 
-    Uses time.perf_counter() for precision and time.sleep for efficiency.
+    Skipped inside :func:`deferred_min_duration`, whose caller pads the check
+    with :func:`ensure_min_duration_async` instead.
     """
-    target = start_perf + (min_ms / 1000.0)
-    # Sleep in coarse grain if there's noticeable time left
-    while True:
-        now = time.perf_counter()
-        remaining = target - now
-        if remaining <= 0:
-            break
-        # For larger remaining, sleep; for very fine remaining, spin briefly
-        if remaining > 0.001:
-            time.sleep(min(remaining, 0.001))
-        else:
-            # Busy-wait for sub-millisecond precision
-            pass
+    if _MIN_DURATION_DEFERRED.get():
+        return
+    remaining = _remaining_seconds(start_perf, min_ms)
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+async def ensure_min_duration_async(
+    start_perf: float, min_ms: float = _ROLE_RESOLUTION_MIN_MS
+) -> None:
+    """
+    Pad an auth check to a minimum duration without blocking the event loop.
+
+    Args:
+        start_perf: ``time.perf_counter()`` value taken when the check started
+        min_ms: Minimum duration of the check in milliseconds
+    """
+    remaining = _remaining_seconds(start_perf, min_ms)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+
+@contextlib.contextmanager
+def deferred_min_duration() -> Iterator[None]:
+    """
+    Skip the blocking padding of sync auth checks made inside the block.
+
+    Async callers use this around ``is_admin_user``/``get_user_role`` and
+    then await :func:`ensure_min_duration_async`, so the constant-time
+    padding no longer stalls other updates handled by the event loop.
+    """
+    token = _MIN_DURATION_DEFERRED.set(True)
+    try:
+        yield
+    finally:
+        _MIN_DURATION_DEFERRED.reset(token)
+
+
+def _get_role_map(settings: Settings) -> RoleMap:
+    """
+    Return the precomputed role map of the settings.
+
+    Settings objects without one, e.g. test doubles, get a map built from
+    their allowlists for this check.
+
+    Args:
+        settings: Application settings containing role user IDs
+
+    Returns:
+        Role map of the allowlists
+    """
+    telegram = settings.telegram
+    role_map = getattr(telegram, "role_map", None)
+    if isinstance(role_map, RoleMap):
+        return role_map
+    return RoleMap.from_ids(
+        _allowlist(telegram, "admin_user_ids"),
+        _allowlist(telegram, "coordinator_user_ids"),
+        _allowlist(telegram, "viewer_user_ids"),
+    )
+
+
+def _allowlist(telegram: Any, name: str) -> Collection[int]:
+    """Return an allowlist of the settings, empty if unset."""
+    user_ids = getattr(telegram, name, None)
+    if isinstance(user_ids, (list, tuple, set, frozenset)):
+        return user_ids
+    return ()
 
 
 def _convert_user_id(user_id: Union[int, str, None]) -> Union[int, None]:
@@ -107,8 +177,8 @@ def is_admin_user(user_id: Union[int, str, None], settings: Settings) -> bool:
 
         return False
 
-    # Check if user is in admin list
-    is_admin = converted_user_id in settings.telegram.admin_user_ids
+    # One hash lookup in the precomputed admin set
+    is_admin = converted_user_id in _get_role_map(settings).admin_ids
 
     # Calculate performance metrics
     duration_ms = int((time.time() - start_time) * 1000)
@@ -144,6 +214,29 @@ def is_admin_user(user_id: Union[int, str, None], settings: Settings) -> bool:
     return is_admin
 
 
+async def is_admin_user_async(
+    user_id: Union[int, str, None], settings: Settings
+) -> bool:
+    """
+    Check if a user is an admin without blocking the event loop.
+
+    Same as :func:`is_admin_user`, with the constant-time padding awaited
+    instead of slept.
+
+    Args:
+        user_id: Telegram user ID (int, str, or None)
+        settings: Application settings containing admin user IDs
+
+    Returns:
+        True if the user is an admin, False otherwise
+    """
+    start_perf = time.perf_counter()
+    with deferred_min_duration():
+        is_admin = is_admin_user(user_id, settings)
+    await ensure_min_duration_async(start_perf, _ADMIN_CHECK_MIN_MS)
+    return is_admin
+
+
 def _has_role_access(user_id: int, required_role: str, settings: Settings) -> bool:
     """
     Check if user has access to the required role based on role hierarchy.
@@ -161,41 +254,28 @@ def _has_role_access(user_id: int, required_role: str, settings: Settings) -> bo
     Raises:
         ValueError: If required_role is not supported
     """
-    # Define role hierarchy order (highest to lowest)
-    role_hierarchy = ["admin", "coordinator", "viewer"]
-    role_lists = {
-        "admin": settings.telegram.admin_user_ids,
-        "coordinator": settings.telegram.coordinator_user_ids,
-        "viewer": settings.telegram.viewer_user_ids,
-    }
-
     # Guard against unknown roles
-    if required_role not in role_hierarchy:
+    if required_role not in ROLE_LEVELS:
         logger.warning(f"Unknown role '{required_role}' requested, denying access")
         return False
 
-    # Check roles in hierarchy order until we reach the required role
-    required_role_index = role_hierarchy.index(required_role)
-
-    for i in range(required_role_index + 1):
-        role_name = role_hierarchy[i]
-        if user_id in role_lists[role_name]:
-            # Use hashed user ID for privacy in logs
-            user_hash = hash(str(user_id)) & 0x7FFFFFFF  # Positive 31-bit hash
-            if i < required_role_index:
-                logger.debug(
-                    f"{required_role.title()} access granted for "
-                    f"{role_name} user (hash: {user_hash})"
-                )
-            else:
-                logger.debug(
-                    f"{required_role.title()} access granted for "
-                    f"user (hash: {user_hash})"
-                )
-            return True
-
+    role_map = _get_role_map(settings)
     # Use hashed user ID for privacy in logs
     user_hash = hash(str(user_id)) & 0x7FFFFFFF  # Positive 31-bit hash
+    if role_map.has_access(user_id, required_role):
+        role = role_map.role_of(user_id)
+        if role != required_role:
+            logger.debug(
+                f"{required_role.title()} access granted for "
+                f"{role} user (hash: {user_hash})"
+            )
+        else:
+            logger.debug(
+                f"{required_role.title()} access granted for "
+                f"user (hash: {user_hash})"
+            )
+        return True
+
     logger.debug(f"{required_role.title()} access denied for user (hash: {user_hash})")
     return False
 
@@ -332,28 +412,42 @@ def get_user_role(
     return role
 
 
-def _resolve_user_role_uncached(user_id: int, settings: Settings) -> Union[str, None]:
+async def get_user_role_async(
+    user_id: Union[int, str, None], settings: Settings
+) -> Union[str, None]:
     """
-    Resolve user role without caching (internal function).
+    Get the highest role for a user without blocking the event loop.
+
+    Same as :func:`get_user_role`, with the constant-time padding awaited
+    instead of slept.
 
     Args:
-        user_id: Validated user ID (guaranteed to be int)
+        user_id: Telegram user ID (int, str, or None)
         settings: Application settings containing role user IDs
 
     Returns:
         The highest role name ("admin", "coordinator", "viewer") or None if no role
     """
-    # Check roles in hierarchy order (highest to lowest)
-    if user_id in settings.telegram.admin_user_ids:
-        return "admin"
+    start_perf = time.perf_counter()
+    with deferred_min_duration():
+        role = get_user_role(user_id, settings)
+    await ensure_min_duration_async(start_perf, _ROLE_RESOLUTION_MIN_MS)
+    return role
 
-    if user_id in settings.telegram.coordinator_user_ids:
-        return "coordinator"
 
-    if user_id in settings.telegram.viewer_user_ids:
-        return "viewer"
+def _resolve_user_role_uncached(user_id: int, settings: Settings) -> Union[str, None]:
+    """
+    Resolve user role without caching (internal function).
+
+    Args:
+        user_id: Validated user ID (guaranteed to be int)
+        settings: Application settings containing role user IDs
 
-    return None
+    Returns:
+        The highest role name ("admin", "coordinator", "viewer") or None if no role
+    """
+    # The role map already holds the highest role of every user
+    return _get_role_map(settings).role_of(user_id)
 
 
 def invalidate_role_cache(user_id: Union[int, str, None] = None) -> None:
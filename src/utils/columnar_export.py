@@ -0,0 +1,527 @@
+"""
+Columnar export tables with CSV, XLSX and Parquet output.
+
+Export data is collected as one value list per column instead of one
+dictionary per row. Every column infers its type and picks its formatter
+once, so writers format whole columns without per-value type dispatch and
+spreadsheet formats receive real numbers, booleans and dates instead of
+strings. CSV and XLSX are written without extra dependencies; Parquet needs
+the optional ``pyarrow`` package.
+"""
+
+import csv
+import importlib.util
+import io
+import re
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
+from xml.sax.saxutils import escape
+
+from src.utils.export_utils import (
+    CSV_EXPORT_SPOOL_MAX_BYTES,
+    CSVExportFile,
+    format_line_number,
+)
+
+LINE_NUMBER_HEADER = "#"
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_XML_ILLEGAL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_EXCEL_EPOCH = date(1899, 12, 30)
+
+
+class ExportFormat(str, Enum):
+    """Output formats of columnar exports."""
+
+    CSV = "csv"
+    XLSX = "xlsx"
+    PARQUET = "parquet"
+
+    @property
+    def extension(self) -> str:
+        """File extension without the dot."""
+        return self.value
+
+
+class ColumnType(str, Enum):
+    """Value type of an export column."""
+
+    STRING = "string"
+    NUMBER = "number"
+    BOOLEAN = "boolean"
+    DATE = "date"
+
+
+class ExportFormatUnavailableError(RuntimeError):
+    """Raised when an export format needs an optional package that is missing."""
+
+
+def parquet_available() -> bool:
+    """Check whether the optional ``pyarrow`` package for Parquet is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def format_raw_value(value: Any, list_separator: str = ", ") -> str:
+    """
+    Format a raw Airtable value as CSV text.
+
+    Args:
+        value: Field value as returned by Airtable
+        list_separator: Separator for multi-value fields
+
+    Returns:
+        Text with empty values as "", dates as YYYY-MM-DD and booleans as
+        TRUE/FALSE
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()[:10]
+    if isinstance(value, list):
+        return list_separator.join(str(item) for item in value)
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    return str(value)
+
+
+def infer_column_type(values: Iterable[Any]) -> ColumnType:
+    """
+    Infer the type shared by all non-empty values of a column.
+
+    ISO date strings (YYYY-MM-DD) count as dates. Columns mixing types are
+    strings.
+
+    Args:
+        values: Column values
+
+    Returns:
+        Column type
+    """
+    found: Optional[ColumnType] = None
+    for value in values:
+        if value is None or value == "":
+            continue
+        if isinstance(value, bool):
+            kind = ColumnType.BOOLEAN
+        elif isinstance(value, (int, float)):
+            kind = ColumnType.NUMBER
+        elif isinstance(value, date):
+            kind = ColumnType.DATE
+        elif isinstance(value, str) and _is_iso_date(value):
+            kind = ColumnType.DATE
+        else:
+            return ColumnType.STRING
+        if found is not None and kind != found:
+            return ColumnType.STRING
+        found = kind
+    return found or ColumnType.STRING
+
+
+def _is_iso_date(value: str) -> bool:
+    if not _ISO_DATE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass
+class ExportColumn:
+    """One export column: its values, type and CSV text formatter."""
+
+    name: str
+    values: List[Any]
+    type: ColumnType
+    text: Callable[[Any], str]
+
+    def texts(self) -> List[str]:
+        """Return the CSV text of every value."""
+        return list(map(self.text, self.values))
+
+    def typed_values(self) -> List[Any]:
+        """Return values converted to the column type, None when empty."""
+        if self.type == ColumnType.NUMBER:
+            return [None if value == "" else value for value in self.values]
+        if self.type == ColumnType.BOOLEAN:
+            return [
+                None if value in (None, "") else bool(value) for value in self.values
+            ]
+        if self.type == ColumnType.DATE:
+            return list(map(_to_date, self.values))
+        return [
+            None if value is None or value == "" else self.text(value)
+            for value in self.values
+        ]
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+class ExportTable:
+    """
+    Export data held as columns in header order.
+
+    Columns missing from the table are written empty, so the header order
+    alone decides the layout and rows never need reordering.
+    """
+
+    def __init__(self, headers: Sequence[str], row_count: int):
+        """
+        Initialize an empty table.
+
+        Args:
+            headers: Column order of the export
+            row_count: Number of data rows
+        """
+        self.headers = list(headers)
+        self.row_count = row_count
+        self._columns: Dict[str, ExportColumn] = {}
+
+    @classmethod
+    def from_view_records(
+        cls,
+        records: Sequence[Dict[str, Any]],
+        headers: Sequence[str],
+        list_separator: str = ", ",
+        skip: Collection[str] = (),
+    ) -> "ExportTable":
+        """
+        Build columns from raw Airtable view records in one pass per column.
+
+        Args:
+            records: Raw records with ``fields`` dictionaries
+            headers: Column order, optionally starting with the line number
+                column ``#`` (numbered 1..n)
+            list_separator: Separator for multi-value fields
+            skip: Headers whose columns the caller adds itself
+
+        Returns:
+            Table with one column per header
+        """
+        table = cls(headers, len(records))
+        fields = [record.get("fields", {}) for record in records]
+
+        def text(value: Any) -> str:
+            return format_raw_value(value, list_separator)
+
+        for header in table.headers:
+            if header in skip:
+                continue
+            if header == LINE_NUMBER_HEADER:
+                table.add_line_numbers()
+                continue
+            values = [
+                text(value) if isinstance(value, list) else value
+                for value in (record_fields.get(header) for record_fields in fields)
+            ]
+            table.add_column(header, values, text=text)
+        return table
+
+    def add_line_numbers(
+        self,
+        line_numbers: Optional[Sequence[int]] = None,
+        width: Optional[int] = None,
+    ) -> None:
+        """
+        Add the ``#`` column, right-aligned in CSV.
+
+        Args:
+            line_numbers: Line numbers of the rows; 1..n when omitted
+            width: Alignment width; defaults to the widest number
+        """
+        numbers = (
+            list(line_numbers)
+            if line_numbers is not None
+            else list(range(1, self.row_count + 1))
+        )
+        if width is None:
+            width = len(str(max(numbers))) if numbers else 1
+        self._columns[LINE_NUMBER_HEADER] = ExportColumn(
+            name=LINE_NUMBER_HEADER,
+            values=numbers,
+            type=ColumnType.NUMBER,
+            text=lambda number: format_line_number(number, width),
+        )
+
+    def add_column(
+        self,
+        name: str,
+        values: List[Any],
+        text: Callable[[Any], str] = format_raw_value,
+        column_type: Optional[ColumnType] = None,
+    ) -> None:
+        """
+        Add or replace a column.
+
+        Args:
+            name: Header of the column
+            values: One value per row
+            text: Formatter for CSV text
+            column_type: Column type; inferred from the values when omitted
+        """
+        if len(values) != self.row_count:
+            raise ValueError(
+                f"Column {name} has {len(values)} values for {self.row_count} rows"
+            )
+        self._columns[name] = ExportColumn(
+            name=name,
+            values=values,
+            type=column_type or infer_column_type(values),
+            text=text,
+        )
+
+    def column(self, name: str) -> Optional[ExportColumn]:
+        """Return the column with the given header, if present."""
+        return self._columns.get(name)
+
+    def columns(self) -> List[ExportColumn]:
+        """Return columns in header order, empty ones for missing headers."""
+        return [
+            self._columns.get(header)
+            or ExportColumn(
+                name=header,
+                values=[None] * self.row_count,
+                type=ColumnType.STRING,
+                text=format_raw_value,
+            )
+            for header in self.headers
+        ]
+
+    def write(
+        self,
+        export_format: "ExportFormat" = ExportFormat.CSV,
+        max_memory_bytes: int = CSV_EXPORT_SPOOL_MAX_BYTES,
+    ) -> CSVExportFile:
+        """
+        Write the table to a spooled temporary file.
+
+        Args:
+            export_format: Output format
+            max_memory_bytes: Size after which the file is moved to disk
+
+        Returns:
+            Export file positioned at its start, with row count, byte size
+            and the format's extension
+
+        Raises:
+            ExportFormatUnavailableError: If Parquet is requested without
+                ``pyarrow`` installed
+        """
+        writers = {
+            ExportFormat.CSV: self._write_csv,
+            ExportFormat.XLSX: self._write_xlsx,
+            ExportFormat.PARQUET: self._write_parquet,
+        }
+        if export_format == ExportFormat.PARQUET and not parquet_available():
+            raise ExportFormatUnavailableError(
+                "Parquet export requires the optional 'pyarrow' package"
+            )
+
+        spool = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)
+        try:
+            writers[export_format](spool)
+        except BaseException:
+            spool.close()
+            raise
+
+        byte_size = spool.seek(0, io.SEEK_END)
+        spool.seek(0)
+        return CSVExportFile(
+            file=spool,
+            row_count=self.row_count,
+            byte_size=byte_size,
+            extension=export_format.extension,
+        )
+
+    def _write_csv(self, spool: IO[bytes]) -> None:
+        text = io.TextIOWrapper(
+            spool, encoding="utf-8-sig", newline="", write_through=True
+        )
+        writer = csv.writer(text)
+        writer.writerow(self.headers)
+        writer.writerows(zip(*(column.texts() for column in self.columns())))
+        text.flush()
+        # Detach so closing the wrapper later does not close the spool
+        text.detach()
+
+    def _write_xlsx(self, spool: IO[bytes]) -> None:
+        with zipfile.ZipFile(spool, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, content in _XLSX_PARTS.items():
+                archive.writestr(name, content)
+            with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+                self._write_xlsx_sheet(sheet)
+
+    def _write_xlsx_sheet(self, sheet: IO[bytes]) -> None:
+        letters = [_column_letter(index) for index in range(len(self.headers))]
+        sheet.write(_XLSX_SHEET_START)
+
+        header_cells = "".join(
+            f'<c r="{letter}1" t="inlineStr" s="2"><is><t>{_xml_text(header)}</t>'
+            "</is></c>"
+            for letter, header in zip(letters, self.headers)
+        )
+        sheet.write(f'<row r="1">{header_cells}</row>'.encode("utf-8"))
+
+        # Cell XML without its reference, formatted column by column
+        cells = [_xlsx_cells(column) for column in self.columns()]
+        for row_index, row in enumerate(zip(*cells), start=2):
+            parts = [f'<row r="{row_index}">']
+            for letter, cell in zip(letters, row):
+                if cell:
+                    parts.append(f'<c r="{letter}{row_index}"{cell}')
+            parts.append("</row>")
+            sheet.write("".join(parts).encode("utf-8"))
+
+        sheet.write(b"</sheetData></worksheet>")
+
+    def _write_parquet(self, spool: IO[bytes]) -> None:
+        import pyarrow as pa  # Optional dependency, checked in write()
+        import pyarrow.parquet as pq
+
+        arrays = []
+        for column in self.columns():
+            values = column.typed_values()
+            if column.type == ColumnType.NUMBER:
+                integral = all(
+                    isinstance(value, int) for value in values if value is not None
+                )
+                arrow_type = pa.int64() if integral else pa.float64()
+            elif column.type == ColumnType.BOOLEAN:
+                arrow_type = pa.bool_()
+            elif column.type == ColumnType.DATE:
+                arrow_type = pa.date32()
+            else:
+                arrow_type = pa.string()
+            arrays.append(pa.array(values, type=arrow_type))
+
+        pq.write_table(pa.Table.from_arrays(arrays, names=self.headers), spool)
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _xml_text(value: str) -> str:
+    return escape(_XML_ILLEGAL_CHARS.sub("", value))
+
+
+def _xlsx_cells(column: ExportColumn) -> List[str]:
+    """Render the cells of a column, empty strings for empty values."""
+    values = column.typed_values()
+    if column.type == ColumnType.NUMBER:
+        return ["" if value is None else f"><v>{value}</v></c>" for value in values]
+    if column.type == ColumnType.BOOLEAN:
+        return [
+            "" if value is None else f' t="b"><v>{int(value)}</v></c>'
+            for value in values
+        ]
+    if column.type == ColumnType.DATE:
+        return [
+            "" if value is None else f' s="1"><v>{(value - _EXCEL_EPOCH).days}</v></c>'
+            for value in values
+        ]
+    return [
+        (
+            ""
+            if value is None
+            else (
+                ' t="inlineStr"><is><t xml:space="preserve">'
+                f"{_xml_text(value)}</t></is></c>"
+            )
+        )
+        for value in values
+    ]
+
+
+_XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XLSX_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XLSX_DOC_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_XLSX_SHEET_START = (
+    f'{_XML_DECLARATION}<worksheet xmlns="{_XLSX_MAIN_NS}">'
+    '<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" '
+    'activePane="bottomLeft" state="frozen"/></sheetView></sheetViews>'
+    "<sheetData>"
+).encode("utf-8")
+
+# Static workbook parts: one sheet, and styles for dates (1) and headers (2)
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        f"{_XML_DECLARATION}"
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        f'ContentType="{_XLSX_DOC_TYPE}.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        f'ContentType="{_XLSX_DOC_TYPE}.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        f'ContentType="{_XLSX_DOC_TYPE}.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        f'{_XML_DECLARATION}<Relationships xmlns="{_XLSX_PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>'
+    ),
+    "xl/workbook.xml": (
+        f'{_XML_DECLARATION}<workbook xmlns="{_XLSX_MAIN_NS}" xmlns:r="{_XLSX_REL_NS}">'
+        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        f'{_XML_DECLARATION}<Relationships xmlns="{_XLSX_PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_XLSX_REL_NS}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/styles.xml": (
+        f'{_XML_DECLARATION}<styleSheet xmlns="{_XLSX_MAIN_NS}">'
+        '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/></numFmts>'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+        "</border></borders>"
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+        "</cellStyleXfs>"
+        '<cellXfs count="3">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" '
+        'applyNumberFormat="1"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+        "</cellXfs></styleSheet>"
+    ),
+}
@@ -0,0 +1,310 @@
+"""
+Cache of rendered export files shared by all admins.
+
+Rendered exports are stored on disk under the SHA-256 digest of their
+content and indexed by export key (type and filter) together with the version
+of the source data they were rendered from. Identical requests reuse the file
+instead of pulling and rendering the data again, and exports with identical
+content share one file and the Telegram ``file_id`` it was uploaded as, so it
+can be re-sent without uploading it again.
+"""
+
+import hashlib
+import logging
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Hashable, Optional, Tuple, Union
+
+from src.utils.export_utils import CSVExportFile
+
+logger = logging.getLogger(__name__)
+
+# Default cache configuration
+DEFAULT_EXPORT_CACHE_MAX_AGE_SECONDS = 900  # 15 minutes
+DEFAULT_EXPORT_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200MB on disk
+
+ExportKey = Tuple[str, ...]
+
+_COPY_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class CachedExport:
+    """Cache entry of one export key."""
+
+    version: Optional[Hashable]
+    digest: str
+    row_count: int
+    rendered_at: datetime
+    created_at: float
+
+
+@dataclass
+class _Blob:
+    path: Path
+    byte_size: int
+    extension: str
+    file_id: Optional[str] = None
+
+
+class ExportArtifactCache:
+    """
+    Content-addressed cache of rendered export files.
+
+    Features:
+    - Entries keyed by export key and source data version
+    - Files shared by all entries with identical content
+    - Telegram ``file_id`` remembered per file for re-sending
+    - Eviction by age and by total size on disk
+    - Hit/miss statistics
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        max_age_seconds: float = DEFAULT_EXPORT_CACHE_MAX_AGE_SECONDS,
+        max_total_bytes: int = DEFAULT_EXPORT_CACHE_MAX_BYTES,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            directory: Directory for cached files; a private temporary
+                directory is created on first use if not given
+            max_age_seconds: Age after which entries are no longer served
+            max_total_bytes: Total size of cached files kept on disk
+        """
+        self._directory = Path(directory) if directory is not None else None
+        self.max_age_seconds = max_age_seconds
+        self.max_total_bytes = max_total_bytes
+        # Least recently used first
+        self._entries: "OrderedDict[ExportKey, CachedExport]" = OrderedDict()
+        self._blobs: Dict[str, _Blob] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "shared_files": 0,
+        }
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the cached files."""
+        if self._directory is None:
+            self._directory = Path(tempfile.mkdtemp(prefix="export_cache_"))
+        self._directory.mkdir(parents=True, exist_ok=True)
+        return self._directory
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached files."""
+        return sum(blob.byte_size for blob in self._blobs.values())
+
+    def get(
+        self, key: ExportKey, version: Optional[Hashable]
+    ) -> Optional[CachedExport]:
+        """
+        Look up a still valid entry.
+
+        Args:
+            key: Export type and filter
+            version: Current version of the source data
+
+        Returns:
+            Cached entry, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version or self._expired(entry):
+            if entry is not None:
+                self._drop_entry(key)
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry
+
+    def discard(self, key: ExportKey) -> None:
+        """Drop the entry of an export key, e.g. when its source changed."""
+        if key in self._entries:
+            self._drop_entry(key)
+
+    def open(self, entry: CachedExport) -> Optional[CSVExportFile]:
+        """
+        Open the file of a cached entry for sending.
+
+        Args:
+            entry: Entry returned by :meth:`get`
+
+        Returns:
+            Export file positioned at its start, or None if the file is gone
+        """
+        blob = self._blobs.get(entry.digest)
+        if blob is None:
+            return None
+        try:
+            handle = open(blob.path, "rb")
+        except OSError as e:
+            logger.warning(f"Cached export file {blob.path} unavailable: {e}")
+            self._remove_blob(entry.digest)
+            return None
+        return CSVExportFile(
+            file=handle,
+            row_count=entry.row_count,
+            byte_size=blob.byte_size,
+            digest=entry.digest,
+            file_id=blob.file_id,
+            extension=blob.extension,
+        )
+
+    def store(
+        self,
+        key: ExportKey,
+        version: Optional[Hashable],
+        export: CSVExportFile,
+        rendered_at: datetime,
+    ) -> CSVExportFile:
+        """
+        Store a freshly rendered export and return it backed by the cache.
+
+        Args:
+            key: Export type and filter
+            version: Version of the source data the export was rendered from
+            export: Rendered export file; closed once it has been cached
+            rendered_at: Moment the source data was read
+
+        Returns:
+            Export file opened from the cache, with digest and any known
+            Telegram ``file_id``; the given export if it cannot be cached
+        """
+        if export.byte_size > self.max_total_bytes:
+            logger.debug(f"Export {key} larger than the export cache, not cached")
+            return export
+
+        entry = CachedExport(
+            version=version,
+            digest=self._write_blob(export),
+            row_count=export.row_count,
+            rendered_at=rendered_at,
+            created_at=time.monotonic(),
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._stats["stores"] += 1
+        self._drop_unreferenced()
+        self._evict(keep=key)
+
+        cached = self.open(entry)
+        if cached is None:
+            export.file.seek(0)
+            return export
+        export.close()
+        return cached
+
+    def remember_file_id(self, digest: str, file_id: str) -> None:
+        """
+        Remember the Telegram ``file_id`` an export file was uploaded as.
+
+        Args:
+            digest: Content digest of the uploaded export
+            file_id: Telegram file ID returned for the upload
+        """
+        blob = self._blobs.get(digest)
+        if blob is not None:
+            blob.file_id = file_id
+
+    def forget_file_id(self, digest: str) -> None:
+        """Forget a ``file_id`` that Telegram no longer accepts."""
+        blob = self._blobs.get(digest)
+        if blob is not None:
+            blob.file_id = None
+
+    def clear(self) -> None:
+        """Drop all entries and delete the cached files."""
+        self._entries.clear()
+        for digest in list(self._blobs):
+            self._remove_blob(digest)
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with counters, hit rate, entry/file counts and size
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "files": len(self._blobs),
+            "total_bytes": self.total_bytes,
+            "max_total_bytes": self.max_total_bytes,
+        }
+
+    def _expired(self, entry: CachedExport) -> bool:
+        return time.monotonic() - entry.created_at >= self.max_age_seconds
+
+    def _write_blob(self, export: CSVExportFile) -> str:
+        digest_builder = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".part", delete=False
+        ) as part:
+            export.file.seek(0)
+            for chunk in iter(lambda: export.file.read(_COPY_CHUNK_SIZE), b""):
+                digest_builder.update(chunk)
+                part.write(chunk)
+        digest = digest_builder.hexdigest()
+
+        if digest in self._blobs:
+            Path(part.name).unlink()
+            self._stats["shared_files"] += 1
+        else:
+            path = self.directory / f"{digest}.{export.extension}"
+            shutil.move(part.name, path)
+            self._blobs[digest] = _Blob(
+                path=path, byte_size=export.byte_size, extension=export.extension
+            )
+        return digest
+
+    def _drop_entry(self, key: ExportKey) -> None:
+        del self._entries[key]
+        self._drop_unreferenced()
+
+    def _drop_unreferenced(self) -> None:
+        referenced = {entry.digest for entry in self._entries.values()}
+        for digest in [d for d in self._blobs if d not in referenced]:
+            self._remove_blob(digest)
+
+    def _remove_blob(self, digest: str) -> None:
+        blob = self._blobs.pop(digest, None)
+        if blob is None:
+            return
+        try:
+            blob.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to delete cached export {blob.path}: {e}")
+
+    def _evict(self, keep: ExportKey) -> None:
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if key != keep and self._expired(entry)
+        ]
+        for key in expired:
+            self._drop_entry(key)
+            self._stats["evictions"] += 1
+
+        while self._entries and self.total_bytes > self.max_total_bytes:
+            key = next(iter(self._entries))
+            self._drop_entry(key)
+            self._stats["evictions"] += 1
+            logger.debug(f"Evicted cached export {key} to stay within size limit")
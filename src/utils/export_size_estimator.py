@@ -0,0 +1,179 @@
+"""
+Size estimates of exports before they are rendered.
+
+Estimates come from real data instead of a fixed number of bytes per record:
+from the measured size of the last rendered export of the same type, or from
+rendering a small sample of records when no export was rendered recently.
+Estimates are kept for a while so repeated pre-flight checks cost nothing.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+from src.utils.export_artifact_cache import ExportKey
+from src.utils.export_utils import CSVExportFile
+
+logger = logging.getLogger(__name__)
+
+# Default estimator configuration
+DEFAULT_SIZE_ESTIMATE_MAX_AGE_SECONDS = 3600  # 1 hour
+DEFAULT_SIZE_SAMPLE_ROWS = 100
+
+
+@dataclass(frozen=True)
+class ExportSizeEstimate:
+    """Projected size of one export type."""
+
+    row_count: int
+    bytes_per_row: float
+    fixed_bytes: int
+    measured: bool
+    created_at: float
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Projected file size in bytes."""
+        return self.fixed_bytes + round(self.row_count * self.bytes_per_row)
+
+
+class ExportSizeEstimator:
+    """
+    Cache of export size estimates keyed by export type and filter.
+
+    Features:
+    - Exact sizes recorded from rendered exports
+    - Average row width measured from rendered samples
+    - Estimates expire after a maximum age
+    - Hit/miss statistics
+    """
+
+    def __init__(self, max_age_seconds: float = DEFAULT_SIZE_ESTIMATE_MAX_AGE_SECONDS):
+        """
+        Initialize an empty estimator.
+
+        Args:
+            max_age_seconds: Age after which estimates are no longer served
+        """
+        self.max_age_seconds = max_age_seconds
+        self._estimates: Dict[ExportKey, ExportSizeEstimate] = {}
+        # Row counts outlive their estimates: they only serve as hints
+        self._row_counts: Dict[ExportKey, int] = {}
+        self._stats = {"hits": 0, "misses": 0, "measured": 0, "sampled": 0}
+
+    def get(self, key: ExportKey) -> Optional[ExportSizeEstimate]:
+        """
+        Look up a still valid estimate.
+
+        Args:
+            key: Export type and filter
+
+        Returns:
+            Estimate, or None on a miss
+        """
+        estimate = self._estimates.get(key)
+        if estimate is None or (
+            time.monotonic() - estimate.created_at >= self.max_age_seconds
+        ):
+            self._estimates.pop(key, None)
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["hits"] += 1
+        return estimate
+
+    def last_row_count(self, key: ExportKey) -> Optional[int]:
+        """
+        Look up the row count of the last estimate, even an expired one.
+
+        Args:
+            key: Export type and filter
+
+        Returns:
+            Last recorded row count, or None if nothing was recorded
+        """
+        return self._row_counts.get(key)
+
+    def record_export(self, key: ExportKey, export: CSVExportFile) -> None:
+        """
+        Record the exact size of a rendered export.
+
+        Args:
+            key: Export type and filter
+            export: Rendered export
+        """
+        self._estimates[key] = ExportSizeEstimate(
+            row_count=export.row_count,
+            bytes_per_row=(
+                export.byte_size / export.row_count if export.row_count else 0.0
+            ),
+            fixed_bytes=0 if export.row_count else export.byte_size,
+            measured=True,
+            created_at=time.monotonic(),
+        )
+        self._row_counts[key] = export.row_count
+        self._stats["measured"] += 1
+
+    def record_sample(
+        self,
+        key: ExportKey,
+        sample: CSVExportFile,
+        empty: CSVExportFile,
+        row_count: int,
+        fallback_bytes_per_row: float,
+    ) -> ExportSizeEstimate:
+        """
+        Project the size of a full export from a rendered sample.
+
+        Args:
+            key: Export type and filter
+            sample: Export rendered from the first records of the table
+            empty: Export rendered without records, i.e. headers only
+            row_count: Number of records of the full export
+            fallback_bytes_per_row: Row width used when the sample is empty
+
+        Returns:
+            The recorded estimate
+        """
+        if sample.row_count:
+            bytes_per_row = max(sample.byte_size - empty.byte_size, 0) / (
+                sample.row_count
+            )
+        else:
+            bytes_per_row = fallback_bytes_per_row
+
+        estimate = ExportSizeEstimate(
+            row_count=row_count,
+            bytes_per_row=bytes_per_row,
+            fixed_bytes=empty.byte_size,
+            measured=False,
+            created_at=time.monotonic(),
+        )
+        self._estimates[key] = estimate
+        self._row_counts[key] = row_count
+        self._stats["sampled"] += 1
+        logger.debug(
+            f"Sampled export {key}: {bytes_per_row:.0f} bytes per row "
+            f"from {sample.row_count} records"
+        )
+        return estimate
+
+    def clear(self) -> None:
+        """Drop all estimates and row counts."""
+        self._estimates.clear()
+        self._row_counts.clear()
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get estimator statistics.
+
+        Returns:
+            Dictionary with counters, hit rate and number of estimates
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "estimates": len(self._estimates),
+        }
@@ -15,6 +15,8 @@ EXPORT_TYPE_RUSSIAN = {
     "departments": "Департаменты",
     "roe": "РОЭ",
     "bible_readers": "Чтецы",
+    "retreat_packet": "Полный пакет",
+    "changes": "Изменения",
 }
 
 
@@ -6,15 +6,36 @@ usability for event organizers who need quick participant counting
 and reference capabilities.
 """
 
+import codecs
 import csv
 import io
 import re
+import shutil
+import tempfile
 import uuid
+import zipfile
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from src.utils.export_type_mapping import get_russian_export_description
 
+# Exports up to this size stay in memory; larger ones roll over to disk
+CSV_EXPORT_SPOOL_MAX_BYTES = 1024 * 1024
+
+# Largest document a bot may upload to Telegram
+TELEGRAM_UPLOAD_LIMIT_BYTES = 50 * 1024 * 1024
+
 
 def format_line_number(line_num: int, width: Optional[int] = None) -> str:
     """
@@ -183,6 +204,7 @@ def format_export_success_message(
     timestamp: str,
     csv_data: Optional[str] = None,
     export_type: Optional[str] = None,
+    participant_count: Optional[int] = None,
 ) -> str:
     """
     Format export success message with optional participant count and Russian type.
@@ -197,6 +219,7 @@ def format_export_success_message(
         timestamp: Export timestamp string
         csv_data: Optional CSV data to extract participant count from
         export_type: Optional export type for Russian description (e.g., "candidates")
+        participant_count: Optional known row count; skips parsing ``csv_data``
 
     Returns:
         Formatted success message string with optional Russian export type description
@@ -211,7 +234,9 @@ def format_export_success_message(
     message_parts.append("")
 
     # Add participant count if available
-    if csv_data:
+    if participant_count:
+        message_parts.append(f"👥 Участников: {participant_count}")
+    elif csv_data:
         try:
             count = extract_participant_count_from_csv(csv_data)
             if count is not None:
@@ -228,6 +253,330 @@ def format_export_success_message(
     return "\n".join(message_parts)
 
 
+@dataclass
+class CSVExportFile:
+    """
+    CSV export written to a spooled temporary file.
+
+    The content is UTF-8 with BOM (so Excel detects Cyrillic) and the file is
+    positioned at its start, ready to be uploaded. Row count and byte size
+    are recorded while writing, so callers never need to re-read the file.
+    Exports served from the export cache also carry their content digest and
+    the Telegram ``file_id`` of an earlier upload, if any. Archives and
+    spreadsheet formats use the same container with their own extension.
+    """
+
+    file: IO[bytes]
+    row_count: int
+    byte_size: int
+    digest: Optional[str] = None
+    file_id: Optional[str] = None
+    extension: str = "csv"
+
+    @property
+    def size_mb(self) -> float:
+        """File size in megabytes."""
+        return self.byte_size / (1024 * 1024)
+
+    @classmethod
+    def from_text(cls, csv_string: str) -> "CSVExportFile":
+        """
+        Wrap an already rendered CSV string.
+
+        Args:
+            csv_string: CSV formatted string with headers and data rows
+
+        Returns:
+            Export file with the encoded string and its data row count
+        """
+        try:
+            row_count = extract_participant_count_from_csv(csv_string) or 0
+        except ValueError:
+            row_count = 0
+
+        data = csv_string.encode("utf-8-sig") if csv_string else b""
+        spool = tempfile.SpooledTemporaryFile(max_size=CSV_EXPORT_SPOOL_MAX_BYTES)
+        spool.write(data)
+        spool.seek(0)
+        return cls(file=spool, row_count=row_count, byte_size=len(data))
+
+    def read_text(self) -> str:
+        """
+        Decode the whole export, leaving the file positioned at its start.
+
+        Returns:
+            CSV content without the BOM
+        """
+        self.file.seek(0)
+        try:
+            return self.file.read().decode("utf-8-sig")
+        finally:
+            self.file.seek(0)
+
+    def close(self) -> None:
+        """Release the memory or disk space held by the export."""
+        self.file.close()
+
+    def __enter__(self) -> "CSVExportFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_csv_export(
+    headers: Sequence[str],
+    rows: Iterable[Dict[str, Any]],
+    max_memory_bytes: int = CSV_EXPORT_SPOOL_MAX_BYTES,
+) -> CSVExportFile:
+    """
+    Stream rows through a CSV writer into a spooled temporary file.
+
+    Rows are encoded as they are written, so the rendered CSV never exists as
+    a separate string. Missing fields are written empty and fields not in
+    ``headers`` are ignored.
+
+    Args:
+        headers: Column order of the export
+        rows: Row dictionaries keyed by header; may be a generator
+        max_memory_bytes: Size after which the export is moved to disk
+
+    Returns:
+        Export file positioned at its start, with row count and byte size
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)
+    try:
+        text = io.TextIOWrapper(
+            spool, encoding="utf-8-sig", newline="", write_through=True
+        )
+        writer = csv.DictWriter(text, fieldnames=headers, extrasaction="ignore")
+        writer.writeheader()
+
+        row_count = 0
+        for row in rows:
+            writer.writerow(row)
+            row_count += 1
+
+        text.flush()
+        # Detach so closing the wrapper later does not close the spool
+        text.detach()
+    except BaseException:
+        spool.close()
+        raise
+
+    byte_size = spool.tell()
+    spool.seek(0)
+    return CSVExportFile(file=spool, row_count=row_count, byte_size=byte_size)
+
+
+class CSVExportWriter:
+    """
+    CSV export written row by row into a spooled temporary file.
+
+    Unlike :func:`write_csv_export`, rows are pushed by the caller, so rows
+    that arrive asynchronously (e.g. page by page from Airtable) are encoded
+    as they come in and never collected first.
+    """
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        max_memory_bytes: int = CSV_EXPORT_SPOOL_MAX_BYTES,
+    ):
+        """
+        Open the spool and write the header row.
+
+        Args:
+            headers: Column order of the export
+            max_memory_bytes: Size after which the export is moved to disk
+        """
+        self.row_count = 0
+        self._spool = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)
+        self._text = io.TextIOWrapper(
+            self._spool, encoding="utf-8-sig", newline="", write_through=True
+        )
+        self._writer = csv.writer(self._text)
+        self._writer.writerow(headers)
+
+    def writerow(self, row: Sequence[str]) -> None:
+        """Encode one data row in header order."""
+        self._writer.writerow(row)
+        self.row_count += 1
+
+    def finish(self) -> CSVExportFile:
+        """
+        Complete the export.
+
+        Returns:
+            Export file positioned at its start, with row count and byte size
+        """
+        self._text.flush()
+        # Detach so closing the wrapper later does not close the spool
+        self._text.detach()
+        byte_size = self._spool.tell()
+        self._spool.seek(0)
+        return CSVExportFile(
+            file=self._spool, row_count=self.row_count, byte_size=byte_size
+        )
+
+    def abort(self) -> None:
+        """Discard an unfinished export."""
+        self._spool.close()
+
+
+def write_zip_export(
+    members: Mapping[str, CSVExportFile],
+    row_count: int,
+    max_memory_bytes: int = CSV_EXPORT_SPOOL_MAX_BYTES,
+) -> CSVExportFile:
+    """
+    Pack several CSV exports into one ZIP archive in a spooled temporary file.
+
+    Member files are copied in chunks and left open, positioned at their start.
+
+    Args:
+        members: CSV exports keyed by their path inside the archive
+        row_count: Number of distinct participants contained in the archive
+        max_memory_bytes: Size after which the archive is moved to disk
+
+    Returns:
+        Archive positioned at its start, with the given row count and its size
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)
+    try:
+        with zipfile.ZipFile(spool, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, export in members.items():
+                export.file.seek(0)
+                with archive.open(name, "w") as target:
+                    shutil.copyfileobj(export.file, target)
+                export.file.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+
+    byte_size = spool.seek(0, io.SEEK_END)
+    spool.seek(0)
+    return CSVExportFile(
+        file=spool, row_count=row_count, byte_size=byte_size, extension="zip"
+    )
+
+
+def split_csv_export(
+    export: CSVExportFile,
+    max_bytes: int,
+    max_memory_bytes: int = CSV_EXPORT_SPOOL_MAX_BYTES,
+) -> List[CSVExportFile]:
+    """
+    Split a CSV export into parts of at most ``max_bytes`` each.
+
+    Every part starts with the header row and records are never cut, so a
+    single record larger than the limit still gets a part of its own. The
+    export is left open, positioned at its start.
+
+    Args:
+        export: CSV export to split
+        max_bytes: Size limit of each part
+        max_memory_bytes: Size after which a part is moved to disk
+
+    Returns:
+        Parts in record order, each positioned at its start
+    """
+    parts: List[CSVExportFile] = []
+    spool: Optional[IO[bytes]] = None
+    part_bytes = part_rows = 0
+
+    line = io.StringIO()
+    writer = csv.writer(line)
+
+    def encode(row: List[str]) -> bytes:
+        line.seek(0)
+        line.truncate()
+        writer.writerow(row)
+        return line.getvalue().encode("utf-8")
+
+    def finish_part() -> None:
+        assert spool is not None
+        spool.seek(0)
+        parts.append(
+            CSVExportFile(file=spool, row_count=part_rows, byte_size=part_bytes)
+        )
+
+    export.file.seek(0)
+    text = io.TextIOWrapper(export.file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return parts
+        header_line = codecs.BOM_UTF8 + encode(header)
+
+        for row in reader:
+            data = encode(row)
+            if spool is not None and part_rows and part_bytes + len(data) > max_bytes:
+                finish_part()
+                spool = None
+            if spool is None:
+                spool = tempfile.SpooledTemporaryFile(max_size=max_memory_bytes)
+                spool.write(header_line)
+                part_bytes, part_rows = len(header_line), 0
+            spool.write(data)
+            part_bytes += len(data)
+            part_rows += 1
+
+        if spool is not None:
+            finish_part()
+    except BaseException:
+        if spool is not None and (not parts or parts[-1].file is not spool):
+            spool.close()
+        for part in parts:
+            part.close()
+        raise
+    finally:
+        # Detach so the export stays open for the caller
+        text.detach()
+        export.file.seek(0)
+    return parts
+
+
+def prepare_telegram_delivery(
+    export: CSVExportFile,
+    filename: str,
+    max_bytes: int = TELEGRAM_UPLOAD_LIMIT_BYTES,
+) -> List[Tuple[str, CSVExportFile]]:
+    """
+    Fit an export into Telegram's upload limit.
+
+    Exports within the limit are delivered as they are. Larger CSV exports
+    are compressed into a ZIP archive, and split into several CSV files when
+    even the archive is too large. Other formats are already compressed and
+    are delivered unchanged.
+
+    Args:
+        export: Rendered export; closed when it is replaced
+        filename: File name of the export
+        max_bytes: Upload limit
+
+    Returns:
+        (file name, export file) pairs to send in order
+    """
+    if export.byte_size <= max_bytes or export.extension != "csv":
+        return [(filename, export)]
+
+    stem = filename.rsplit(".", 1)[0]
+    try:
+        archive = write_zip_export({filename: export}, export.row_count)
+        if archive.byte_size <= max_bytes:
+            return [(f"{stem}.zip", archive)]
+        archive.close()
+
+        parts = split_csv_export(export, max_bytes)
+    finally:
+        export.close()
+    return [
+        (f"{stem}_part{index}.csv", part) for index, part in enumerate(parts, start=1)
+    ]
+
+
 def extract_headers_from_view_records(
     records: Optional[List[Dict[str, Any]]],
 ) -> List[str]:
@@ -301,7 +650,9 @@ def order_rows_by_view_headers(
 
 
 def generate_readable_export_filename(
-    export_type: str, export_datetime: Optional[datetime] = None
+    export_type: str,
+    export_datetime: Optional[datetime] = None,
+    extension: str = "csv",
 ) -> str:
     """
     Generate human-readable filename for CSV exports with DD_MM_YYYY format.
@@ -312,6 +663,7 @@ def generate_readable_export_filename(
     Args:
         export_type: Type of export (e.g., "candidates", "team", "roe")
         export_datetime: Optional datetime for filename. Uses current time if None.
+        extension: File extension without the dot, e.g. "zip" for archives
 
     Returns:
         Human-readable filename string with normalized type and date format
@@ -334,7 +686,7 @@ def generate_readable_export_filename(
     # Generate unique suffix to prevent filename conflicts
     unique_suffix = str(uuid.uuid4()).replace("-", "")[:8]
 
-    return f"{normalized_type}_{date_str}_{unique_suffix}.csv"
+    return f"{normalized_type}_{date_str}_{unique_suffix}.{extension}"
 
 
 def _normalize_export_type_for_filename(export_type: str) -> str:
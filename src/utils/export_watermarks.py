@@ -0,0 +1,109 @@
+"""
+Watermarks of delta exports.
+
+A delta export contains only participants created or modified since the
+previous delta export of the same scope, usually one admin. The store keeps
+the moment each scope was last exported, optionally persisted to a JSON file
+so watermarks survive restarts.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class ExportWatermarkStore:
+    """
+    Moments up to which each export scope has been exported.
+
+    Features:
+    - One watermark per scope, e.g. per admin
+    - Optional persistence to a JSON file
+    - Watermarks only move forward
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: Optional JSON file the watermarks are loaded from and saved
+                to; watermarks are kept in memory only when omitted
+        """
+        self.path = Path(path) if path else None
+        self._watermarks: Optional[Dict[str, datetime]] = None
+
+    def get(self, scope: str) -> Optional[datetime]:
+        """
+        Return the watermark of a scope.
+
+        Args:
+            scope: Export scope
+
+        Returns:
+            Timezone-aware watermark, or None if the scope was never exported
+        """
+        return self._load().get(scope)
+
+    def set(self, scope: str, watermark: datetime) -> None:
+        """
+        Advance the watermark of a scope.
+
+        Older watermarks than the stored one are ignored, so a slow export
+        cannot move the scope back.
+
+        Args:
+            scope: Export scope
+            watermark: Timezone-aware moment up to which changes were exported
+        """
+        watermarks = self._load()
+        current = watermarks.get(scope)
+        if current is not None and current >= watermark:
+            return
+        watermarks[scope] = watermark
+        self._save()
+
+    def clear(self) -> None:
+        """Forget all watermarks, leaving the file untouched."""
+        self._watermarks = {}
+
+    def get_stats(self) -> Dict[str, Union[int, bool]]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with the number of scopes and whether they are persisted
+        """
+        return {"scopes": len(self._load()), "persistent": self.path is not None}
+
+    def _load(self) -> Dict[str, datetime]:
+        if self._watermarks is not None:
+            return self._watermarks
+
+        self._watermarks = {}
+        if self.path is None or not self.path.exists():
+            return self._watermarks
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._watermarks = {
+                scope: datetime.fromisoformat(value) for scope, value in data.items()
+            }
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable export watermarks {self.path}: {e}")
+        return self._watermarks
+
+    def _save(self) -> None:
+        if self.path is None or self._watermarks is None:
+            return
+        data = {scope: value.isoformat() for scope, value in self._watermarks.items()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            part = self.path.with_suffix(self.path.suffix + ".part")
+            part.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            part.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save export watermarks to {self.path}: {e}")
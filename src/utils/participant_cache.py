@@ -0,0 +1,280 @@
+"""
+Versioned participant snapshot cache with single-flight refresh.
+
+Holds the full participant list used by name search as an immutable snapshot.
+Concurrent misses share one in-flight load, expired snapshots are served
+while a background refresh runs (stale-while-revalidate), and single-record
+writes patch the snapshot instead of discarding it.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from src.models.participant import Participant
+
+logger = logging.getLogger(__name__)
+
+# Default cache configuration
+DEFAULT_SNAPSHOT_TTL_SECONDS = 60
+DEFAULT_SNAPSHOT_MAX_STALE_SECONDS = 600
+
+ParticipantLoader = Callable[[], Awaitable[List[Participant]]]
+
+
+@dataclass(frozen=True)
+class ParticipantSnapshot:
+    """Immutable participant list tagged with a monotonically rising version."""
+
+    version: int
+    participants: Tuple[Participant, ...]
+    loaded_at: float
+
+    def age(self) -> float:
+        """Seconds since the snapshot was loaded from the source."""
+        return time.monotonic() - self.loaded_at
+
+
+def _merge(
+    participants: Iterable[Participant],
+    patches: Mapping[Optional[str], Optional[Participant]],
+) -> List[Participant]:
+    """Replace, drop (``None``) or append patched participants, keeping order."""
+    pending = dict(patches)
+    merged: List[Participant] = []
+    for participant in participants:
+        if participant.record_id in pending:
+            replacement = pending.pop(participant.record_id)
+            if replacement is not None:
+                merged.append(replacement)
+        else:
+            merged.append(participant)
+    merged.extend(p for p in pending.values() if p is not None)
+    return merged
+
+
+class ParticipantSnapshotCache:
+    """
+    Participant snapshot cache with request coalescing.
+
+    Features:
+    - One in-flight load shared by all concurrent callers
+    - Stale-while-revalidate between ``ttl_seconds`` and ``max_stale_seconds``
+    - Targeted upsert/remove patches that bump the snapshot version
+    - Hit/miss/refresh statistics
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_SNAPSHOT_TTL_SECONDS,
+        max_stale_seconds: float = DEFAULT_SNAPSHOT_MAX_STALE_SECONDS,
+    ):
+        """
+        Initialize an empty snapshot cache.
+
+        Args:
+            ttl_seconds: Age after which a background refresh is started
+            max_stale_seconds: Age after which callers wait for a fresh load
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max(max_stale_seconds, ttl_seconds)
+        self._snapshot: Optional[ParticipantSnapshot] = None
+        self._version = 0
+        self._inflight: Optional["asyncio.Future[ParticipantSnapshot]"] = None
+        self._inflight_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Patches applied while a load is in flight, replayed onto its result
+        self._pending_patches: Dict[Optional[str], Optional[Participant]] = {}
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "patches": 0,
+        }
+
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot (0 when empty)."""
+        return self._snapshot.version if self._snapshot else 0
+
+    def peek(self) -> Optional[ParticipantSnapshot]:
+        """Return the current snapshot without loading or refreshing."""
+        return self._snapshot
+
+    async def get_snapshot(
+        self, loader: ParticipantLoader, ttl_seconds: Optional[float] = None
+    ) -> ParticipantSnapshot:
+        """
+        Return a participant snapshot, loading it if needed.
+
+        Args:
+            loader: Coroutine function returning the full participant list
+            ttl_seconds: Optional TTL override for this call
+
+        Returns:
+            Current snapshot; may be stale while a background refresh runs
+
+        Raises:
+            Exception: Whatever the loader raises when no usable snapshot exists
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        snapshot = self._snapshot
+
+        if snapshot is None or snapshot.age() >= max(self.max_stale_seconds, ttl):
+            self._stats["misses"] += 1
+            return await self._load(loader)
+
+        if snapshot.age() >= ttl:
+            self._stats["stale_hits"] += 1
+            self._refresh_in_background(loader)
+        else:
+            self._stats["hits"] += 1
+        return snapshot
+
+    async def get(
+        self, loader: ParticipantLoader, ttl_seconds: Optional[float] = None
+    ) -> List[Participant]:
+        """Return the cached participant list (see :meth:`get_snapshot`)."""
+        snapshot = await self.get_snapshot(loader, ttl_seconds)
+        return list(snapshot.participants)
+
+    def _current_inflight(self) -> Optional["asyncio.Future[ParticipantSnapshot]"]:
+        # A load started on another (possibly closed) loop cannot be awaited
+        if self._inflight is None:
+            return None
+        if self._inflight_loop is not asyncio.get_running_loop():
+            self._inflight = None
+            self._pending_patches.clear()
+            return None
+        return self._inflight
+
+    async def _load(self, loader: ParticipantLoader) -> ParticipantSnapshot:
+        inflight = self._current_inflight()
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+        else:
+            inflight = self._start_load(loader)
+        # Shield so a cancelled caller does not cancel the shared load
+        return await asyncio.shield(inflight)
+
+    def _start_load(
+        self, loader: ParticipantLoader
+    ) -> "asyncio.Future[ParticipantSnapshot]":
+        loop = asyncio.get_running_loop()
+        self._pending_patches.clear()
+        self._inflight = loop.create_task(self._run_load(loader))
+        self._inflight_loop = loop
+        return self._inflight
+
+    async def _run_load(self, loader: ParticipantLoader) -> ParticipantSnapshot:
+        try:
+            participants = await loader()
+        except Exception:
+            self._stats["refresh_errors"] += 1
+            raise
+        finally:
+            self._inflight = None
+            self._inflight_loop = None
+
+        loaded = _merge(participants, self._pending_patches)
+        self._pending_patches.clear()
+
+        self._stats["refreshes"] += 1
+        self._snapshot = self._new_snapshot(loaded, time.monotonic())
+        logger.debug(
+            f"Participant snapshot v{self._snapshot.version} loaded "
+            f"({len(loaded)} participants)"
+        )
+        return self._snapshot
+
+    def _refresh_in_background(self, loader: ParticipantLoader) -> None:
+        if self._current_inflight() is not None:
+            return
+        task = self._start_load(loader)
+
+        def _log_failure(done: "asyncio.Future[ParticipantSnapshot]") -> None:
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning(
+                    f"Background participant refresh failed: {done.exception()}"
+                )
+
+        task.add_done_callback(_log_failure)
+
+    def _new_snapshot(
+        self, participants: List[Participant], loaded_at: float
+    ) -> ParticipantSnapshot:
+        self._version += 1
+        return ParticipantSnapshot(self._version, tuple(participants), loaded_at)
+
+    def upsert(self, participants: Iterable[Participant]) -> None:
+        """
+        Insert or replace participants in the snapshot.
+
+        Args:
+            participants: Participants with record IDs
+        """
+        self._patch({p.record_id: p for p in participants})
+
+    def remove(self, record_id: str) -> None:
+        """
+        Remove a single participant from the snapshot.
+
+        Args:
+            record_id: Airtable record ID
+        """
+        self._patch({record_id: None})
+
+    def _patch(self, patches: Dict[Optional[str], Optional[Participant]]) -> None:
+        if not patches:
+            return
+        if None in patches or "" in patches:
+            # Without a record ID the affected entry cannot be located
+            self.invalidate()
+            return
+
+        self._stats["patches"] += 1
+        if self._inflight is not None:
+            self._pending_patches.update(patches)
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+
+        # Copy-on-write keeps lists handed out earlier unchanged
+        participants = _merge(snapshot.participants, patches)
+        self._snapshot = self._new_snapshot(participants, snapshot.loaded_at)
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next read loads from the source."""
+        self._snapshot = None
+        self._pending_patches.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with counters, snapshot version, size and age
+        """
+        snapshot = self._snapshot
+        return {
+            **self._stats,
+            "version": self.version,
+            "size": len(snapshot.participants) if snapshot else 0,
+            "age_seconds": snapshot.age() if snapshot else None,
+            "refreshing": self._inflight is not None,
+        }
@@ -2,17 +2,89 @@
 Role-based participant data filtering utilities.
 
 Provides functions to filter participant data based on user roles
-to prevent unauthorized access to sensitive information.
+to prevent unauthorized access to sensitive information. Each role has a
+fixed mask of hidden fields; participants are projected through it with a
+shallow copy.
 """
 
 import logging
-from typing import Any, List, Union
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Union
 
 from src.models.participant import Participant
 
 logger = logging.getLogger(__name__)
 
 
+# Sensitive fields hidden from each non-admin role; unknown roles get the
+# viewer mask
+_COORDINATOR_HIDDEN_FIELDS = frozenset({"date_of_birth"})
+_VIEWER_HIDDEN_FIELDS = frozenset(
+    {
+        "contact_information",
+        "payment_amount",
+        "payment_date",
+        "payment_status",
+        "date_of_birth",
+        "age",
+        "notes",
+        "submitted_by",
+        "church_leader",
+    }
+)
+ROLE_HIDDEN_FIELDS: Mapping[Optional[str], FrozenSet[str]] = MappingProxyType(
+    {
+        "admin": frozenset(),
+        "coordinator": _COORDINATOR_HIDDEN_FIELDS,
+        "viewer": _VIEWER_HIDDEN_FIELDS,
+        None: _VIEWER_HIDDEN_FIELDS,
+    }
+)
+
+# Precomputed model_copy updates per role
+_ROLE_UPDATES: Dict[Optional[str], Dict[str, None]] = {
+    role: dict.fromkeys(sorted(fields)) for role, fields in ROLE_HIDDEN_FIELDS.items()
+}
+
+
+def get_hidden_fields(user_role: Union[str, None]) -> FrozenSet[str]:
+    """
+    Get the participant fields a role must not see.
+
+    Args:
+        user_role: User's role ("admin", "coordinator", "viewer", or None)
+
+    Returns:
+        Field names to blank out; viewer-level fields for unknown roles
+    """
+    hidden = ROLE_HIDDEN_FIELDS.get(user_role)
+    if hidden is None:
+        logger.warning(f"Unknown role '{user_role}' in participant filtering")
+        return _VIEWER_HIDDEN_FIELDS
+    return hidden
+
+
+def _is_mock(participant: Any) -> bool:
+    """Check whether an object is a test double by class name or module."""
+    cls = participant.__class__
+    return (
+        "Mock" in cls.__name__
+        or hasattr(participant, "_mock_name")
+        or "mock" in (getattr(cls, "__module__", None) or "").lower()
+    )
+
+
+def _project(participant: Participant, updates: Dict[str, None]) -> Participant:
+    """
+    Return a role projection of a participant.
+
+    All participant fields hold immutable values, so a shallow copy with the
+    hidden fields blanked is isolated from the original without the cost of
+    a deep copy or per-field assignment validation.
+    """
+    return participant.model_copy(update=updates)
+
+
 def filter_participant_by_role(
     participant: Union[Participant, Any], user_role: Union[str, None]
 ) -> Union[Participant, Any]:
@@ -36,27 +108,25 @@ def filter_participant_by_role(
         # Admins see everything
         return participant
 
-    filtered: Union[Participant, Any]
+    if user_role not in _ROLE_UPDATES:
+        # Unknown role - apply viewer-level filtering (logs a warning)
+        get_hidden_fields(user_role)
+        user_role = None
+    updates = _ROLE_UPDATES[user_role]
 
-    # Check if this is a mock object by examining class name, module, or _mock_name
-    is_mock = hasattr(participant, "__class__") and (
-        "Mock" in participant.__class__.__name__
-        or hasattr(participant, "_mock_name")
-        or (
-            hasattr(participant.__class__, "__module__")
-            and participant.__class__.__module__
-            and "mock" in participant.__class__.__module__.lower()
-        )
-    )
+    # Fast path for real participants; Mock(spec=Participant) passes
+    # isinstance checks, so only the exact type skips mock detection
+    if type(participant) is Participant:
+        return _project(participant, updates)
 
-    if is_mock:
+    if _is_mock(participant):
         # Mock objects (used in tests) should pass through completely untouched
         return participant
-    elif isinstance(participant, Participant):
-        # Use Pydantic's model_copy to clone real Participant instances
-        # without altering originals
-        filtered = participant.model_copy(deep=True)
-    elif hasattr(participant, "model_copy") and callable(
+    if isinstance(participant, Participant):
+        return _project(participant, updates)
+
+    filtered: Any
+    if hasattr(participant, "model_copy") and callable(
         getattr(participant, "model_copy")
     ):
         # Some objects might provide model_copy-like behavior; use it if available
@@ -64,41 +134,8 @@ def filter_participant_by_role(
     else:
         # Other objects should pass through untouched
         filtered = participant
-
-    if user_role == "coordinator":
-        # Coordinators see most fields but not the most sensitive PII
-        # Remove highly sensitive personal information
-        filtered.date_of_birth = None
-        # Keep other fields for operational needs
-
-    elif user_role == "viewer" or user_role is None:
-        # Viewers see only basic organizational information
-        # Clear all sensitive fields
-        filtered.contact_information = None
-        filtered.payment_amount = None
-        filtered.payment_date = None
-        filtered.payment_status = None
-        filtered.date_of_birth = None
-        filtered.age = None
-        filtered.notes = None
-        filtered.submitted_by = None
-        filtered.church_leader = None
-        # Keep basic organizational fields for search/organizational purposes
-
-    else:
-        # Unknown role - treat as no access
-        logger.warning(f"Unknown role '{user_role}' in participant filtering")
-        # Apply viewer-level filtering for unknown roles
-        filtered.contact_information = None
-        filtered.payment_amount = None
-        filtered.payment_date = None
-        filtered.payment_status = None
-        filtered.date_of_birth = None
-        filtered.age = None
-        filtered.notes = None
-        filtered.submitted_by = None
-        filtered.church_leader = None
-
+    for field_name in updates:
+        setattr(filtered, field_name, None)
     return filtered
 
 
@@ -118,12 +155,13 @@ def filter_participants_by_role(
     if not participants:
         return participants
 
-    filtered_participants = []
-    for participant in participants:
-        filtered = filter_participant_by_role(participant, user_role)
-        filtered_participants.append(filtered)
+    if user_role == "admin":
+        return list(participants)
 
-    return filtered_participants
+    return [
+        filter_participant_by_role(participant, user_role)
+        for participant in participants
+    ]
 
 
 def get_allowed_search_fields(user_role: Union[str, None]) -> List[str]:
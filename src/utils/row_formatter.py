@@ -0,0 +1,190 @@
+"""
+Row formatters compiled once per export.
+
+Legacy row conversion looked up every mapped field by name and dispatched on
+the type of each value for every row. A :class:`RowFormatter` resolves the
+fields of an export once, from the field mapping, the model's annotations and
+the export headers, into a tuple of ``(getter, formatter, column index)``.
+Formatting a row then only calls the precompiled getters and formatters.
+"""
+
+import typing
+from datetime import date
+from enum import Enum
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel
+
+FieldFormatter = Callable[[Any], str]
+CompiledColumn = Tuple[Callable[[Any], Any], FieldFormatter, int]
+
+
+def _missing(item: Any) -> None:
+    return None
+
+
+def format_text(value: Any) -> str:
+    """Format a scalar value, empty for None."""
+    return "" if value is None else str(value)
+
+
+def format_iso_date(value: Any) -> str:
+    """Format a date or datetime as YYYY-MM-DD, empty for None."""
+    return "" if value is None else value.isoformat()[:10]
+
+
+def format_enum(value: Any) -> str:
+    """Format an enum member or an already unwrapped enum value."""
+    if value is None:
+        return ""
+    return str(getattr(value, "value", value))
+
+
+def list_formatter(separator: str) -> FieldFormatter:
+    """
+    Build a formatter joining list items with a separator.
+
+    Args:
+        separator: Separator placed between items
+
+    Returns:
+        Formatter returning an empty string for None and empty lists
+    """
+
+    def format_list(value: Any) -> str:
+        return separator.join(map(str, value)) if value else ""
+
+    return format_list
+
+
+def formatter_for_annotation(annotation: Any, list_separator: str) -> FieldFormatter:
+    """
+    Pick the formatter of a model field from its type annotation.
+
+    ``Optional`` is unwrapped; other unions are formatted as text.
+
+    Args:
+        annotation: Field annotation, e.g. ``Optional[date]``
+        list_separator: Separator of list fields
+
+    Returns:
+        Formatter of the field's values
+    """
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if typing.get_origin(annotation) is typing.Union and len(args) == 1:
+        annotation = args[0]
+
+    if typing.get_origin(annotation) is list:
+        return list_formatter(list_separator)
+    if isinstance(annotation, type):
+        if issubclass(annotation, date):
+            return format_iso_date
+        if issubclass(annotation, Enum):
+            return format_enum
+    return format_text
+
+
+class RowFormatter:
+    """
+    Formatter of model instances into CSV rows in a fixed header order.
+
+    Features:
+    - Fields resolved once per export instead of once per row
+    - Formatters picked from model annotations, overridable per column
+    - Headers without a mapped field are left empty
+    """
+
+    def __init__(self, headers: Sequence[str], columns: Iterable[CompiledColumn]):
+        """
+        Initialize the formatter.
+
+        Args:
+            headers: Export headers, one per row position
+            columns: Precompiled ``(getter, formatter, column index)`` tuples
+        """
+        self.headers = list(headers)
+        self.columns: Tuple[CompiledColumn, ...] = tuple(columns)
+        self._indexes = {header: index for index, header in enumerate(self.headers)}
+
+    @classmethod
+    def compile(
+        cls,
+        model: Type[BaseModel],
+        field_mapping: Mapping[str, str],
+        headers: Sequence[str],
+        formatters: Optional[Mapping[str, FieldFormatter]] = None,
+        skip: Collection[str] = (),
+        list_separator: str = "; ",
+    ) -> "RowFormatter":
+        """
+        Compile a formatter for a model, field mapping and headers.
+
+        Args:
+            model: Model class whose instances are formatted
+            field_mapping: Python field name to Airtable field name
+            headers: Export headers in output order
+            formatters: Formatters overriding the annotation-based ones, keyed
+                by Airtable field name
+            skip: Headers filled by the caller, e.g. hydrated names
+            list_separator: Separator of list fields
+
+        Returns:
+            Compiled row formatter
+        """
+        formatters = formatters or {}
+        indexes = {header: index for index, header in enumerate(headers)}
+        columns: List[CompiledColumn] = []
+        for python_field, airtable_field in field_mapping.items():
+            index = indexes.get(airtable_field)
+            if python_field == "record_id" or index is None or airtable_field in skip:
+                continue
+            field = model.model_fields.get(python_field)
+            if field is None:
+                # Mapped fields the model does not define stay empty
+                columns.append((_missing, format_text, index))
+                continue
+            formatter = formatters.get(airtable_field) or formatter_for_annotation(
+                field.annotation, list_separator
+            )
+            columns.append((attrgetter(python_field), formatter, index))
+        return cls(headers, columns)
+
+    def index(self, header: str) -> Optional[int]:
+        """Return the row position of a header, if present."""
+        return self._indexes.get(header)
+
+    def format(self, item: Any) -> List[str]:
+        """
+        Format one instance into a row.
+
+        Args:
+            item: Model instance
+
+        Returns:
+            One string per header; unmapped headers are empty
+        """
+        row = [""] * len(self.headers)
+        for getter, formatter, index in self.columns:
+            row[index] = formatter(getter(item))
+        return row
+
+    def format_dict(self, item: Any) -> Dict[str, str]:
+        """Format one instance into a row keyed by the mapped headers."""
+        headers = self.headers
+        return {
+            headers[index]: formatter(getter(item))
+            for getter, formatter, index in self.columns
+        }
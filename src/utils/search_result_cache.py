@@ -0,0 +1,112 @@
+"""
+Bounded LRU cache for name search results.
+
+Results are only valid for the participant data they were computed from, so
+every lookup carries the version of the participant snapshot. A version
+different from the one the cached results belong to clears the cache before
+the lookup, which keeps stale results from ever being served.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Default cache configuration
+DEFAULT_MAX_SEARCH_RESULTS = 256  # Cached (query, options) combinations
+
+
+class SearchResultCache:
+    """
+    LRU cache of search results tied to one participant snapshot version.
+
+    Features:
+    - Bounded size with least-recently-used eviction
+    - Automatic invalidation when the snapshot version changes
+    - Hit/miss statistics and hit rate
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_SEARCH_RESULTS):
+        """
+        Initialize an empty result cache.
+
+        Args:
+            max_entries: Maximum number of cached result lists
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._version: Optional[Hashable] = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def _check_version(self, version: Hashable) -> None:
+        if version != self._version:
+            if self._entries:
+                self._stats["invalidations"] += 1
+                logger.debug(
+                    f"Search result cache invalidated ({len(self._entries)} entries)"
+                )
+            self._entries.clear()
+            self._version = version
+
+    def get(self, version: Hashable, key: Hashable) -> Optional[Any]:
+        """
+        Look up cached results.
+
+        Args:
+            version: Version of the participant snapshot being searched
+            key: Query and search options
+
+        Returns:
+            Cached results or None on a miss
+        """
+        self._check_version(version)
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return value
+
+    def put(self, version: Hashable, key: Hashable, value: Any) -> None:
+        """
+        Store results computed from the given snapshot version.
+
+        Args:
+            version: Version of the participant snapshot that was searched
+            key: Query and search options
+            value: Results to cache
+        """
+        self._check_version(version)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        self._version = None
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with counters, hit rate and current size
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
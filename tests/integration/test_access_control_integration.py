@@ -246,7 +246,9 @@ class TestEndToEndSecurityIntegration:
                 "src.bot.handlers.search_handlers.get_settings",
                 return_value=mock_settings,
             ),
-            patch("src.bot.handlers.search_handlers.get_user_role") as mock_get_role,
+            patch(
+                "src.bot.handlers.search_handlers.get_user_role_async"
+            ) as mock_get_role,
             patch(
                 "src.bot.handlers.search_handlers.get_participant_repository"
             ) as mock_get_repo,
@@ -408,7 +410,7 @@ class TestEndToEndSecurityIntegration:
                     return_value=mock_settings,
                 ),
                 patch(
-                    "src.bot.handlers.search_handlers.get_user_role",
+                    "src.bot.handlers.search_handlers.get_user_role_async",
                     return_value=expected_role,
                 ),
                 patch(
@@ -482,7 +484,7 @@ class TestEndToEndSecurityIntegration:
                     return_value=mock_settings,
                 ),
                 patch(
-                    "src.bot.handlers.search_handlers.get_user_role",
+                    "src.bot.handlers.search_handlers.get_user_role_async",
                     return_value=expected_role,
                 ),
                 patch(
@@ -574,7 +576,7 @@ class TestEndToEndSecurityIntegration:
                     return_value=mock_settings,
                 ),
                 patch(
-                    "src.bot.handlers.search_handlers.get_user_role"
+                    "src.bot.handlers.search_handlers.get_user_role_async"
                 ) as mock_get_role,
                 patch(
                     "src.bot.handlers.search_handlers.get_participant_repository"
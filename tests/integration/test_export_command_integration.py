@@ -130,7 +130,7 @@ class TestExportCommandIntegration:
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
 
         with patch(
-            "src.bot.handlers.export_conversation_handlers.is_admin_user",
+            "src.bot.handlers.export_conversation_handlers.is_admin_user_async",
             return_value=True,
         ):
             # Execute conversation entry point
@@ -16,8 +16,10 @@ from src.bot.handlers.export_conversation_handlers import (
     handle_department_selection,
     handle_export_type_selection,
     start_export_selection,
+    wait_for_background_exports,
 )
 from src.bot.handlers.export_states import ExportCallbackData, ExportStates
+from src.utils.export_utils import CSVExportFile
 
 
 class TestExportSelectionWorkflow:
@@ -37,7 +39,7 @@ class TestExportSelectionWorkflow:
 
         # Mock admin validation
         with patch(
-            "src.bot.handlers.export_conversation_handlers.is_admin_user",
+            "src.bot.handlers.export_conversation_handlers.is_admin_user_async",
             return_value=True,
         ):
             # Start export selection
@@ -62,8 +64,10 @@ class TestExportSelectionWorkflow:
 
         # Mock export service with line numbers
         mock_export_service = AsyncMock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="#,Name,Department\n1,participant1,data\n2,participant2,data"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text(
+                "#,Name,Department\n1,participant1,data\n2,participant2,data"
+            )
         )
 
         with patch(
@@ -74,6 +78,7 @@ class TestExportSelectionWorkflow:
                 "src.bot.handlers.export_conversation_handlers._send_export_file"
             ) as mock_send_file:
                 result = await handle_export_type_selection(query_update, context)
+                await wait_for_background_exports()
 
         # Should end conversation after processing export
         from telegram.ext import ConversationHandler
@@ -81,7 +86,7 @@ class TestExportSelectionWorkflow:
         assert result == ConversationHandler.END
 
         # Should call export service
-        mock_export_service.export_to_csv_async.assert_called_once()
+        mock_export_service.get_all_participants_as_file.assert_called_once()
 
         # Should call file sending
         mock_send_file.assert_called_once()
@@ -101,6 +106,7 @@ class TestExportSelectionWorkflow:
 
         # Handle export by department selection
         result = await handle_export_type_selection(update, context)
+        await wait_for_background_exports()
 
         # Should enter SELECTING_DEPARTMENT state
         assert result == ExportStates.SELECTING_DEPARTMENT
@@ -125,8 +131,10 @@ class TestExportSelectionWorkflow:
 
         # Mock export service for department filtering with line numbers
         mock_export_service = AsyncMock()
-        mock_export_service.get_participants_by_department_as_csv = AsyncMock(
-            return_value="#,Name,Department\n1,kitchen_participant,Kitchen"
+        mock_export_service.get_participants_by_department_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text(
+                "#,Name,Department\n1,kitchen_participant,Kitchen"
+            )
         )
 
         with patch(
@@ -137,6 +145,7 @@ class TestExportSelectionWorkflow:
                 "src.bot.handlers.export_conversation_handlers._send_export_file"
             ) as mock_send_file:
                 result = await handle_department_selection(dept_update, context)
+                await wait_for_background_exports()
 
         # Should end conversation after processing export
         from telegram.ext import ConversationHandler
@@ -144,8 +153,8 @@ class TestExportSelectionWorkflow:
         assert result == ConversationHandler.END
 
         # Should call export service with department filter
-        mock_export_service.get_participants_by_department_as_csv.assert_called_once()
-        call_args = mock_export_service.get_participants_by_department_as_csv.call_args
+        mock_export_service.get_participants_by_department_as_file.assert_called_once()
+        call_args = mock_export_service.get_participants_by_department_as_file.call_args
         # Should be called with Department enum value
         from src.models.participant import Department
 
@@ -179,6 +188,7 @@ class TestExportSelectionWorkflow:
                 "src.bot.handlers.export_conversation_handlers._send_export_file"
             ) as mock_send_file:
                 result = await handle_export_type_selection(update, context)
+                await wait_for_background_exports()
 
         # Should end conversation after processing export
         from telegram.ext import ConversationHandler
@@ -216,6 +226,7 @@ class TestExportSelectionWorkflow:
                 "src.bot.handlers.export_conversation_handlers._send_export_file"
             ) as mock_send_file:
                 result = await handle_export_type_selection(update, context)
+                await wait_for_background_exports()
 
         # Should end conversation after processing export
         from telegram.ext import ConversationHandler
@@ -239,6 +250,7 @@ class TestExportSelectionWorkflow:
         context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
 
         result = await handle_department_selection(update, context)
+        await wait_for_background_exports()
 
         # Should return to SELECTING_EXPORT_TYPE state
         assert result == ExportStates.SELECTING_EXPORT_TYPE
@@ -280,8 +292,10 @@ class TestExportSelectionWorkflow:
 
         # Mock export service with line numbers for role filtering
         mock_export_service = AsyncMock()
-        mock_export_service.get_participants_by_role_as_csv = AsyncMock(
-            return_value="#,Name,Role,Department\n1,team_member1,TEAM,Kitchen\n2,team_member2,TEAM,Worship"
+        mock_export_service.get_participants_by_role_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text(
+                "#,Name,Role,Department\n1,team_member1,TEAM,Kitchen\n2,team_member2,TEAM,Worship"
+            )
         )
 
         # Test Team export
@@ -300,11 +314,12 @@ class TestExportSelectionWorkflow:
                 "src.bot.handlers.export_conversation_handlers._send_export_file"
             ):
                 result = await handle_export_type_selection(team_update, context)
+                await wait_for_background_exports()
 
         # Should call with Role.TEAM
         from src.models.participant import Role
 
-        mock_export_service.get_participants_by_role_as_csv.assert_called_with(
+        mock_export_service.get_participants_by_role_as_file.assert_called_with(
             Role.TEAM
         )
         # Should end conversation after processing export
@@ -331,9 +346,10 @@ class TestExportSelectionWorkflow:
                 "src.bot.handlers.export_conversation_handlers._send_export_file"
             ):
                 result = await handle_export_type_selection(candidates_update, context)
+                await wait_for_background_exports()
 
         # Should call with Role.CANDIDATE
-        mock_export_service.get_participants_by_role_as_csv.assert_called_with(
+        mock_export_service.get_participants_by_role_as_file.assert_called_with(
             Role.CANDIDATE
         )
         assert result == ConversationHandler.END
@@ -354,7 +370,7 @@ class TestExportSelectionWorkflow:
 
         # Mock export service to raise exception
         mock_export_service = AsyncMock()
-        mock_export_service.export_to_csv_async = AsyncMock(
+        mock_export_service.get_all_participants_as_file = AsyncMock(
             side_effect=Exception("Export failed")
         )
 
@@ -363,6 +379,7 @@ class TestExportSelectionWorkflow:
             return_value=mock_export_service,
         ):
             result = await handle_export_type_selection(update, context)
+            await wait_for_background_exports()
 
         # Should still end conversation even with error
         from telegram.ext import ConversationHandler
@@ -406,16 +423,16 @@ class TestExportLineNumberIntegration:
         )
 
         mock_export_service = AsyncMock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value=csv_data_with_line_numbers
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text(csv_data_with_line_numbers)
         )
 
         # Capture the CSV data passed to _send_export_file
         captured_csv_data = None
 
-        async def capture_send_file(csv_data, filename_prefix, query, user_id):
+        async def capture_send_file(export, filename_prefix, query, user_id):
             nonlocal captured_csv_data
-            captured_csv_data = csv_data
+            captured_csv_data = export.read_text()
 
         with patch(
             "src.services.service_factory.get_export_service",
@@ -426,6 +443,7 @@ class TestExportLineNumberIntegration:
                 side_effect=capture_send_file,
             ):
                 await handle_export_type_selection(update, context)
+                await wait_for_background_exports()
 
         # Verify CSV data contains line numbers
         assert captured_csv_data is not None
@@ -486,6 +504,7 @@ class TestExportLineNumberIntegration:
                 side_effect=capture_send_file,
             ):
                 await handle_export_type_selection(update, context)
+                await wait_for_background_exports()
 
         # Verify Bible Readers CSV has line numbers
         assert captured_csv_data is not None
@@ -540,6 +559,7 @@ class TestExportLineNumberIntegration:
                 side_effect=capture_send_file,
             ):
                 await handle_export_type_selection(update, context)
+                await wait_for_background_exports()
 
         # Verify ROE CSV has line numbers
         assert captured_csv_data is not None
@@ -575,15 +595,15 @@ class TestExportLineNumberIntegration:
         )
 
         mock_export_service = AsyncMock()
-        mock_export_service.get_participants_by_department_as_csv = AsyncMock(
-            return_value=csv_data_with_line_numbers
+        mock_export_service.get_participants_by_department_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text(csv_data_with_line_numbers)
         )
 
         captured_csv_data = None
 
-        async def capture_send_file(csv_data, filename_prefix, query, user_id):
+        async def capture_send_file(export, filename_prefix, query, user_id):
             nonlocal captured_csv_data
-            captured_csv_data = csv_data
+            captured_csv_data = export.read_text()
 
         with patch(
             "src.services.service_factory.get_export_service",
@@ -594,6 +614,7 @@ class TestExportLineNumberIntegration:
                 side_effect=capture_send_file,
             ):
                 await handle_department_selection(dept_update, context)
+                await wait_for_background_exports()
 
         # Verify department-filtered CSV has line numbers
         assert captured_csv_data is not None
@@ -628,8 +649,8 @@ class TestExportLineNumberIntegration:
         )
 
         mock_export_service = AsyncMock()
-        mock_export_service.get_participants_by_role_as_csv = AsyncMock(
-            return_value=csv_data_with_line_numbers
+        mock_export_service.get_participants_by_role_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text(csv_data_with_line_numbers)
         )
 
         # Test TEAM export
@@ -642,9 +663,9 @@ class TestExportLineNumberIntegration:
 
         captured_csv_data = None
 
-        async def capture_send_file(csv_data, filename_prefix, query, user_id):
+        async def capture_send_file(export, filename_prefix, query, user_id):
             nonlocal captured_csv_data
-            captured_csv_data = csv_data
+            captured_csv_data = export.read_text()
 
         with patch(
             "src.services.service_factory.get_export_service",
@@ -655,6 +676,7 @@ class TestExportLineNumberIntegration:
                 side_effect=capture_send_file,
             ):
                 await handle_export_type_selection(team_update, context)
+                await wait_for_background_exports()
 
         # Verify role-filtered CSV has line numbers
         assert captured_csv_data is not None
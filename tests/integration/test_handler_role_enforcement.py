@@ -84,7 +84,7 @@ class TestHandlerRoleEnforcement:
     """Test role enforcement in bot handlers."""
 
     @patch("src.bot.handlers.search_handlers.get_settings")
-    @patch("src.bot.handlers.search_handlers.get_user_role")
+    @patch("src.bot.handlers.search_handlers.get_user_role_async")
     @patch("src.bot.handlers.search_handlers.get_participant_repository")
     async def test_admin_gets_all_data(
         self,
@@ -122,7 +122,7 @@ class TestHandlerRoleEnforcement:
         assert result is not None
 
     @patch("src.bot.handlers.search_handlers.get_settings")
-    @patch("src.bot.handlers.search_handlers.get_user_role")
+    @patch("src.bot.handlers.search_handlers.get_user_role_async")
     @patch("src.bot.handlers.search_handlers.get_participant_repository")
     async def test_coordinator_gets_filtered_data(
         self,
@@ -161,7 +161,7 @@ class TestHandlerRoleEnforcement:
         assert result is not None
 
     @patch("src.bot.handlers.search_handlers.get_settings")
-    @patch("src.bot.handlers.search_handlers.get_user_role")
+    @patch("src.bot.handlers.search_handlers.get_user_role_async")
     @patch("src.bot.handlers.search_handlers.get_participant_repository")
     async def test_viewer_gets_restricted_data(
         self,
@@ -198,7 +198,7 @@ class TestHandlerRoleEnforcement:
         assert result is not None
 
     @patch("src.bot.handlers.search_handlers.get_settings")
-    @patch("src.bot.handlers.search_handlers.get_user_role")
+    @patch("src.bot.handlers.search_handlers.get_user_role_async")
     @patch("src.bot.handlers.search_handlers.get_participant_repository")
     @patch("src.bot.handlers.search_handlers.filter_participants_by_role")
     async def test_fallback_path_applies_filtering(
@@ -254,7 +254,7 @@ class TestHandlerRoleEnforcement:
         assert result is not None
 
     @patch("src.bot.handlers.search_handlers.get_settings")
-    @patch("src.bot.handlers.search_handlers.get_user_role")
+    @patch("src.bot.handlers.search_handlers.get_user_role_async")
     @patch("src.bot.handlers.search_handlers.get_participant_repository")
     async def test_unauthorized_user_gets_none_role(
         self,
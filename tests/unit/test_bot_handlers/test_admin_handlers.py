@@ -32,7 +32,7 @@ def mock_context():
     return context
 
 
-@patch("src.bot.handlers.admin_handlers.is_admin_user", return_value=False)
+@patch("src.bot.handlers.admin_handlers.is_admin_user_async", return_value=False)
 @pytest.mark.asyncio
 async def test_logging_toggle_denies_non_admin(
     mock_is_admin, mock_update, mock_context
@@ -44,7 +44,7 @@ async def test_logging_toggle_denies_non_admin(
     assert "нет прав" in mock_update.effective_message.reply_text.call_args[0][0]
 
 
-@patch("src.bot.handlers.admin_handlers.is_admin_user", return_value=True)
+@patch("src.bot.handlers.admin_handlers.is_admin_user_async", return_value=True)
 @patch(
     "src.bot.handlers.admin_handlers.is_user_interaction_logging_enabled",
     return_value=True,
@@ -62,7 +62,7 @@ async def test_logging_toggle_status_report(
 
 
 @patch("src.bot.handlers.admin_handlers.set_user_interaction_logging_enabled")
-@patch("src.bot.handlers.admin_handlers.is_admin_user", return_value=True)
+@patch("src.bot.handlers.admin_handlers.is_admin_user_async", return_value=True)
 @pytest.mark.asyncio
 async def test_logging_toggle_enable(
     mock_is_admin, mock_set_logging, mock_update, mock_context
@@ -77,7 +77,7 @@ async def test_logging_toggle_enable(
 
 
 @patch("src.bot.handlers.admin_handlers.set_user_interaction_logging_enabled")
-@patch("src.bot.handlers.admin_handlers.is_admin_user", return_value=True)
+@patch("src.bot.handlers.admin_handlers.is_admin_user_async", return_value=True)
 @pytest.mark.asyncio
 async def test_logging_toggle_disable(
     mock_is_admin, mock_set_logging, mock_update, mock_context
@@ -91,7 +91,7 @@ async def test_logging_toggle_disable(
     assert "отключено" in mock_update.effective_message.reply_text.call_args[0][0]
 
 
-@patch("src.bot.handlers.admin_handlers.is_admin_user", return_value=False)
+@patch("src.bot.handlers.admin_handlers.is_admin_user_async", return_value=False)
 @pytest.mark.asyncio
 async def test_auth_refresh_denies_non_admin(mock_is_admin, mock_update, mock_context):
     """Test auth refresh command denies access to non-admin users."""
@@ -102,16 +102,22 @@ async def test_auth_refresh_denies_non_admin(mock_is_admin, mock_update, mock_co
     assert "нет прав" in mock_update.effective_message.reply_text.call_args[0][0]
 
 
+@patch("src.bot.handlers.admin_handlers.get_authorization_cache")
 @patch("src.bot.handlers.admin_handlers.invalidate_role_cache")
-@patch("src.bot.handlers.admin_handlers.is_admin_user", return_value=True)
+@patch("src.bot.handlers.admin_handlers.is_admin_user_async", return_value=True)
 @pytest.mark.asyncio
 async def test_auth_refresh_allows_admin_user(
-    mock_is_admin, mock_invalidate_cache, mock_update, mock_context
+    mock_is_admin, mock_invalidate_cache, mock_get_cache, mock_update, mock_context
 ):
     """Test auth refresh command allows access to admin users and clears cache."""
     await handle_auth_refresh_command(mock_update, mock_context)
 
-    mock_is_admin.assert_called_once_with(123, mock_context.bot_data["settings"])
+    settings = mock_context.bot_data["settings"]
+    mock_is_admin.assert_called_once_with(123, settings)
+    settings.telegram.refresh_role_map.assert_called_once_with()
+    mock_get_cache.return_value.refresh_all.assert_called_once_with(
+        settings.telegram.refresh_role_map.return_value
+    )
     mock_invalidate_cache.assert_called_once()
     mock_update.effective_message.reply_text.assert_called_once()
 
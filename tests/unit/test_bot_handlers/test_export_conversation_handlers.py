@@ -5,21 +5,34 @@ Validates conversation flow, state transitions, admin validation,
 and integration with export services through service factory.
 """
 
+import asyncio
+import uuid
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from telegram import CallbackQuery, Message, Update, User
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes, ConversationHandler
 
 from src.bot.handlers.export_conversation_handlers import (
     _send_export_file,
+    _start_background_export,
     cancel_export,
     get_export_conversation_handler,
     handle_department_selection,
     handle_export_type_selection,
     start_export_selection,
+    wait_for_background_exports,
 )
 from src.bot.handlers.export_states import ExportCallbackData, ExportStates
+from src.data.airtable.airtable_client import RequestPriority, _current_priority
+from src.services.participant_export_service import DeltaExport
+from src.utils.export_utils import (
+    CSVExportFile,
+    prepare_telegram_delivery,
+    write_zip_export,
+)
 
 
 class TestExportConversationEntryPoint:
@@ -39,7 +52,7 @@ class TestExportConversationEntryPoint:
 
         # Mock admin validation to return True
         with patch(
-            "src.bot.handlers.export_conversation_handlers.is_admin_user",
+            "src.bot.handlers.export_conversation_handlers.is_admin_user_async",
             return_value=True,
         ):
             result = await start_export_selection(update, context)
@@ -67,7 +80,7 @@ class TestExportConversationEntryPoint:
 
         # Mock admin validation to return False
         with patch(
-            "src.bot.handlers.export_conversation_handlers.is_admin_user",
+            "src.bot.handlers.export_conversation_handlers.is_admin_user_async",
             return_value=False,
         ):
             result = await start_export_selection(update, context)
@@ -102,8 +115,8 @@ class TestExportTypeSelection:
 
         # Mock export service
         mock_export_service = AsyncMock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="test,csv,data"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("test,csv,data")
         )
 
         with patch(
@@ -111,6 +124,7 @@ class TestExportTypeSelection:
             return_value=mock_export_service,
         ):
             result = await handle_export_type_selection(update, context)
+            await wait_for_background_exports()
 
         # Should end the conversation
         assert result == ConversationHandler.END
@@ -136,6 +150,7 @@ class TestExportTypeSelection:
         context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
 
         result = await handle_export_type_selection(update, context)
+        await wait_for_background_exports()
 
         # Should transition to SELECTING_DEPARTMENT state
         assert result == ExportStates.SELECTING_DEPARTMENT
@@ -148,6 +163,41 @@ class TestExportTypeSelection:
         call_args = query.edit_message_text.call_args
         assert call_args[1]["reply_markup"] is not None  # Department keyboard
 
+    @pytest.mark.asyncio
+    async def test_handle_retreat_packet_export(self):
+        """Test the full packet is built by the orchestrator and sent as ZIP."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.data = ExportCallbackData.EXPORT_RETREAT_PACKET
+        query.answer = AsyncMock()
+        query.edit_message_text = AsyncMock()
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+
+        update = MagicMock(spec=Update)
+        update.callback_query = query
+
+        context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
+
+        orchestrator = MagicMock()
+        orchestrator.run_as_zip = AsyncMock(
+            return_value=write_zip_export(
+                {"participants.csv": CSVExportFile.from_text("#,Name\n1,Иван\n")}, 1
+            )
+        )
+
+        with patch(
+            "src.services.service_factory.get_retreat_packet_orchestrator",
+            return_value=orchestrator,
+        ):
+            result = await handle_export_type_selection(update, context)
+            await wait_for_background_exports()
+
+        assert result == ConversationHandler.END
+        orchestrator.run_as_zip.assert_awaited_once_with(count_from="participants.csv")
+        filename = query.message.reply_document.call_args.kwargs["filename"]
+        assert filename.startswith("retreat_packet_")
+        assert filename.endswith(".zip")
+
     @pytest.mark.asyncio
     async def test_handle_bible_readers_export(self):
         """Test handling of Bible Readers export selection."""
@@ -174,6 +224,7 @@ class TestExportTypeSelection:
             return_value=mock_export_service,
         ):
             result = await handle_export_type_selection(update, context)
+            await wait_for_background_exports()
 
         # Should end the conversation
         assert result == ConversationHandler.END
@@ -181,6 +232,89 @@ class TestExportTypeSelection:
         # Should call Bible Readers export service
         mock_export_service.export_to_csv_async.assert_called_once()
 
+    @staticmethod
+    def _changes_update(query):
+        update = MagicMock(spec=Update)
+        update.callback_query = query
+        update.effective_user = MagicMock(id=42)
+        return update
+
+    @pytest.mark.asyncio
+    async def test_handle_changes_export_commits_watermark(self):
+        """Test the delta export is sent and the watermark advanced."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.data = ExportCallbackData.EXPORT_CHANGES
+        query.edit_message_text = AsyncMock()
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+        context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
+
+        delta = DeltaExport(
+            export=CSVExportFile.from_text("#,ChangeType,Name\n1,created,Иван\n"),
+            since=None,
+            watermark=datetime.now(timezone.utc),
+            created=1,
+        )
+        priorities = []
+
+        async def get_changed_participants_as_file(scope):
+            priorities.append(_current_priority.get())
+            return delta
+
+        export_service = MagicMock()
+        export_service.get_changed_participants_as_file = AsyncMock(
+            side_effect=get_changed_participants_as_file
+        )
+
+        with patch(
+            "src.services.service_factory.get_export_service",
+            return_value=export_service,
+        ):
+            result = await handle_export_type_selection(
+                self._changes_update(query), context
+            )
+            await wait_for_background_exports()
+
+        assert result == ConversationHandler.END
+        # The delta fetch yields to interactive searches like other exports
+        assert priorities == [RequestPriority.BACKGROUND]
+        export_service.get_changed_participants_as_file.assert_awaited_once_with(
+            "user:42"
+        )
+        filename = query.message.reply_document.call_args.kwargs["filename"]
+        assert filename.startswith("changes_")
+        export_service.mark_changes_exported.assert_called_once_with("user:42", delta)
+
+    @pytest.mark.asyncio
+    async def test_handle_changes_export_without_changes(self):
+        """Test an empty delta is reported instead of uploaded."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.data = ExportCallbackData.EXPORT_CHANGES
+        query.edit_message_text = AsyncMock()
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+        context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
+
+        delta = DeltaExport(
+            export=CSVExportFile.from_text("#,ChangeType,Name\n"),
+            since=datetime(2025, 3, 1, tzinfo=timezone.utc),
+            watermark=datetime.now(timezone.utc),
+        )
+        export_service = MagicMock()
+        export_service.get_changed_participants_as_file = AsyncMock(return_value=delta)
+
+        with patch(
+            "src.services.service_factory.get_export_service",
+            return_value=export_service,
+        ):
+            await handle_export_type_selection(self._changes_update(query), context)
+            await wait_for_background_exports()
+
+        query.message.reply_document.assert_not_called()
+        assert "изменений нет" in query.edit_message_text.call_args[0][0]
+        assert delta.export.file.closed
+        export_service.mark_changes_exported.assert_called_once_with("user:42", delta)
+
 
 class TestDepartmentSelection:
     """Test department selection callback handling."""
@@ -202,8 +336,8 @@ class TestDepartmentSelection:
 
         # Mock participant export service with department filtering
         mock_export_service = AsyncMock()
-        mock_export_service.get_participants_by_department_as_csv = AsyncMock(
-            return_value="kitchen,participants,data"
+        mock_export_service.get_participants_by_department_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("kitchen,participants,data")
         )
 
         with patch(
@@ -211,15 +345,52 @@ class TestDepartmentSelection:
             return_value=mock_export_service,
         ):
             result = await handle_department_selection(update, context)
+            await wait_for_background_exports()
 
         # Should end the conversation
         assert result == ConversationHandler.END
 
         # Should call export service with department filter
-        mock_export_service.get_participants_by_department_as_csv.assert_called_once()
-        call_args = mock_export_service.get_participants_by_department_as_csv.call_args
+        mock_export_service.get_participants_by_department_as_file.assert_called_once()
+        call_args = mock_export_service.get_participants_by_department_as_file.call_args
         assert call_args[0][0].value == "Kitchen"
 
+    @pytest.mark.asyncio
+    async def test_handle_department_packets_selection(self):
+        """Test the all-departments button sends one ZIP archive."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.data = ExportCallbackData.EXPORT_DEPARTMENT_PACKETS
+        query.answer = AsyncMock()
+        query.edit_message_text = AsyncMock()
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+
+        update = MagicMock(spec=Update)
+        update.callback_query = query
+
+        context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
+
+        mock_export_service = AsyncMock()
+        mock_export_service.get_department_packets_as_zip = AsyncMock(
+            return_value=write_zip_export(
+                {"participants.csv": CSVExportFile.from_text("#,Name\n1,Иван\n")}, 1
+            )
+        )
+
+        with patch(
+            "src.services.service_factory.get_export_service",
+            return_value=mock_export_service,
+        ):
+            result = await handle_department_selection(update, context)
+            await wait_for_background_exports()
+
+        assert result == ConversationHandler.END
+        mock_export_service.get_department_packets_as_zip.assert_awaited_once()
+        mock_export_service.get_participants_by_department_as_file.assert_not_called()
+        filename = query.message.reply_document.call_args.kwargs["filename"]
+        assert filename.startswith("departments_")
+        assert filename.endswith(".zip")
+
     @pytest.mark.asyncio
     async def test_handle_department_back_navigation(self):
         """Test handling of back button in department selection."""
@@ -235,6 +406,7 @@ class TestDepartmentSelection:
         context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
 
         result = await handle_department_selection(update, context)
+        await wait_for_background_exports()
 
         # Should return to SELECTING_EXPORT_TYPE state
         assert result == ExportStates.SELECTING_EXPORT_TYPE
@@ -456,3 +628,202 @@ class TestExportFileDeliveryWithRussianDescriptions:
 
             assert "export_type" in call_kwargs
             assert call_kwargs["export_type"] == "departments"
+
+
+class TestExportFileDelivery:
+    """Test delivery of export files written by the export services."""
+
+    @pytest.mark.asyncio
+    async def test_send_export_file_uploads_spooled_file(self):
+        """Test the spooled file is uploaded with its recorded count and size."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+        query.edit_message_text = AsyncMock()
+
+        export = CSVExportFile.from_text("#,Name\n1,John Doe\n2,Jane Smith")
+
+        with patch(
+            "src.bot.handlers.export_conversation_handlers.format_export_success_message",
+            return_value="caption",
+        ) as mock_format:
+            await _send_export_file(export, "participants_all", query, 123)
+
+        call_kwargs = mock_format.call_args.kwargs
+        assert call_kwargs["participant_count"] == 2
+        assert call_kwargs["file_size_mb"] == export.size_mb
+        assert "csv_data" not in call_kwargs
+
+        document = query.message.reply_document.call_args.kwargs["document"]
+        assert document is export.file
+        assert export.file.closed
+
+    @pytest.mark.asyncio
+    async def test_oversized_export_sent_in_parts(self):
+        """Test exports over the upload limit are split into numbered parts."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+        query.edit_message_text = AsyncMock()
+
+        rows = "".join(f"{i},{uuid.uuid4().hex}\n" for i in range(1, 101))
+        export = CSVExportFile.from_text(f"#,Name\n{rows}")
+
+        with patch(
+            "src.bot.handlers.export_conversation_handlers.prepare_telegram_delivery",
+            side_effect=lambda e, name: prepare_telegram_delivery(
+                e, name, max_bytes=1000
+            ),
+        ):
+            await _send_export_file(export, "participants_all", query, 123)
+
+        calls = query.message.reply_document.call_args_list
+        assert len(calls) > 1
+        for index, sent in enumerate(calls, start=1):
+            assert sent.kwargs["filename"].endswith(f"_part{index}.csv")
+            assert f"Часть {index} из {len(calls)}" in sent.kwargs["caption"]
+            assert sent.kwargs["document"].closed
+        assert export.file.closed
+
+    @pytest.mark.asyncio
+    async def test_send_export_file_with_empty_data(self):
+        """Test empty exports are reported instead of uploaded."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+        query.edit_message_text = AsyncMock()
+
+        await _send_export_file("  ", "participants_all", query, 123)
+
+        query.message.reply_document.assert_not_called()
+        assert "📭" in query.edit_message_text.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_cached_export_resent_by_file_id(self):
+        """Test an export uploaded before is re-sent without uploading it."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+        query.edit_message_text = AsyncMock()
+
+        export = CSVExportFile.from_text("#,Name\n1,John Doe")
+        export.digest = "abc"
+        export.file_id = "telegram-file-id"
+        cache = MagicMock()
+
+        with patch(
+            "src.services.service_factory.get_export_artifact_cache",
+            return_value=cache,
+        ):
+            await _send_export_file(export, "participants_all", query, 123)
+
+        query.message.reply_document.assert_awaited_once()
+        document = query.message.reply_document.call_args.kwargs["document"]
+        assert document == "telegram-file-id"
+        cache.remember_file_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_upload_remembers_file_id(self):
+        """Test the file_id of a cached export's first upload is remembered."""
+        sent = MagicMock(spec=Message)
+        sent.document.file_id = "new-file-id"
+        query = AsyncMock(spec=CallbackQuery)
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock(return_value=sent)
+        query.edit_message_text = AsyncMock()
+
+        export = CSVExportFile.from_text("#,Name\n1,John Doe")
+        export.digest = "abc"
+        cache = MagicMock()
+
+        with patch(
+            "src.services.service_factory.get_export_artifact_cache",
+            return_value=cache,
+        ):
+            await _send_export_file(export, "participants_all", query, 123)
+
+        cache.remember_file_id.assert_called_once_with("abc", "new-file-id")
+
+    @pytest.mark.asyncio
+    async def test_rejected_file_id_falls_back_to_upload(self):
+        """Test a file_id Telegram no longer accepts is forgotten and replaced."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock(
+            side_effect=[BadRequest("Wrong file identifier"), MagicMock(spec=Message)]
+        )
+        query.edit_message_text = AsyncMock()
+
+        export = CSVExportFile.from_text("#,Name\n1,John Doe")
+        export.digest = "abc"
+        export.file_id = "stale-file-id"
+        cache = MagicMock()
+
+        with patch(
+            "src.services.service_factory.get_export_artifact_cache",
+            return_value=cache,
+        ):
+            await _send_export_file(export, "participants_all", query, 123)
+
+        cache.forget_file_id.assert_called_once_with("abc")
+        last_call = query.message.reply_document.call_args_list[-1]
+        assert last_call.kwargs["document"] is export.file
+
+
+class TestBackgroundExports:
+    """Test exports are rendered and uploaded outside the handler."""
+
+    @pytest.mark.asyncio
+    async def test_handler_returns_before_upload(self):
+        """Test the conversation ends while the export is still rendering."""
+        query = AsyncMock(spec=CallbackQuery)
+        query.data = ExportCallbackData.EXPORT_ALL
+        query.edit_message_text = AsyncMock()
+        query.message = AsyncMock(spec=Message)
+        query.message.reply_document = AsyncMock()
+
+        update = MagicMock(spec=Update)
+        update.callback_query = query
+        context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
+
+        rendered = asyncio.Event()
+
+        async def render():
+            await rendered.wait()
+            return CSVExportFile.from_text("#,Name\n1,Иван\n")
+
+        export_service = MagicMock()
+        export_service.get_all_participants_as_file = render
+
+        with patch(
+            "src.services.service_factory.get_export_service",
+            return_value=export_service,
+        ):
+            result = await handle_export_type_selection(update, context)
+
+            assert result == ConversationHandler.END
+            assert "Начинаю экспорт" in query.edit_message_text.call_args[0][0]
+            query.message.reply_document.assert_not_called()
+
+            rendered.set()
+            await wait_for_background_exports()
+
+        query.message.reply_document.assert_awaited_once()
+        assert "Экспорт завершён" in query.edit_message_text.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_wait_gives_up_after_timeout(self):
+        """Test waiting for a stuck export is bounded by the timeout."""
+        blocker = asyncio.Event()
+
+        async def stuck():
+            await blocker.wait()
+
+        task = _start_background_export(stuck(), 123)
+
+        await wait_for_background_exports(timeout=0.01)
+        assert not task.done()
+
+        blocker.set()
+        await wait_for_background_exports()
+        assert task.done()
@@ -6,10 +6,11 @@ progress notifications, and error handling.
 """
 
 import asyncio
-import tempfile
+import io
+import zipfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 from telegram import Message, Update, User
@@ -23,6 +24,8 @@ from src.bot.handlers.export_handlers import (
 )
 from src.config.settings import Settings
 from src.models.participant import Participant, Role
+from src.utils.columnar_export import ExportFormat
+from src.utils.export_utils import CSVExportFile, prepare_telegram_delivery
 
 
 class TestExportSelectionRedirect:
@@ -41,7 +44,9 @@ class TestExportSelectionRedirect:
         context.bot_data = {"settings": Mock()}
 
         # Mock admin validation to return True
-        with patch("src.bot.handlers.export_handlers.is_admin_user", return_value=True):
+        with patch(
+            "src.bot.handlers.export_handlers.is_admin_user_async", return_value=True
+        ):
             # Mock the conversation handler start function
             with patch(
                 "src.bot.handlers.export_handlers.start_export_selection"
@@ -70,7 +75,7 @@ class TestExportSelectionRedirect:
 
         # Mock admin validation to return False
         with patch(
-            "src.bot.handlers.export_handlers.is_admin_user", return_value=False
+            "src.bot.handlers.export_handlers.is_admin_user_async", return_value=False
         ):
             with patch(
                 "src.bot.handlers.export_handlers.start_export_selection"
@@ -100,14 +105,16 @@ class TestExportSelectionRedirect:
         context.bot_data = {"settings": Mock()}
 
         # Mock admin validation
-        with patch("src.bot.handlers.export_handlers.is_admin_user", return_value=True):
+        with patch(
+            "src.bot.handlers.export_handlers.is_admin_user_async", return_value=True
+        ):
             # Mock service factory to prevent actual export
             with patch(
                 "src.services.service_factory.get_export_service"
             ) as mock_service:
                 mock_export_service = AsyncMock()
-                mock_export_service.export_to_csv_async = AsyncMock(
-                    return_value="test,csv,data"
+                mock_export_service.get_all_participants_as_file = AsyncMock(
+                    return_value=CSVExportFile.from_text("test,csv,data")
                 )
                 mock_export_service.is_within_telegram_limit = AsyncMock(
                     return_value=True
@@ -167,8 +174,8 @@ class TestExportCommandHandler:
     def mock_export_service(self):
         """Create mock export service."""
         service = Mock()
-        service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         service.save_to_file = AsyncMock()
         service.is_within_telegram_limit = AsyncMock(return_value=True)
@@ -211,8 +218,10 @@ class TestExportCommandHandler:
             first_call = mock_update.message.reply_text.call_args_list[0]
             assert "Начинаю экспорт" in first_call[0][0]
 
-            # Should call export service
-            mock_export_service.export_to_csv_async.assert_called_once()
+            # Should export straight into a CSV file
+            mock_export_service.get_all_participants_as_file.assert_called_once_with(
+                ExportFormat.CSV
+            )
 
             # Should send document with CSV file
             mock_update.message.reply_document.assert_called_once()
@@ -257,7 +266,9 @@ class TestExportCommandHandler:
     async def test_export_command_empty_data(self, mock_update, mock_context):
         """Test handling when no participants exist."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(return_value="")
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("")
+        )
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
 
@@ -287,20 +298,16 @@ class TestExportCommandHandler:
         ):
             await handle_export_command(mock_update, mock_context)
 
-            # Should warn about file size
+            # Should announce zipped or split delivery and still send the file
             calls = mock_update.message.reply_text.call_args_list
-            assert any(
-                "превышает лимит" in call[0][0].lower()
-                or "слишком большой" in call[0][0].lower()
-                or "предупреждение" in call[0][0].lower()
-                for call in calls
-            )
+            assert any("превышает лимит" in call[0][0].lower() for call in calls)
+            mock_update.message.reply_document.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_export_command_error_handling(self, mock_update, mock_context):
         """Test proper error handling during export."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
+        mock_export_service.get_all_participants_as_file = AsyncMock(
             side_effect=Exception("Database connection failed")
         )
 
@@ -476,8 +483,8 @@ class TestExportErrorHandling:
     ):
         """Test RetryAfter error handling with automatic retry."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
@@ -502,7 +509,9 @@ class TestExportErrorHandling:
 
             # Should attempt retry
             assert mock_update_with_file.message.reply_document.call_count == 2
-            mock_sleep.assert_called_once_with(4)  # retry_after + retry_delay
+            # The auth check pads itself with asyncio.sleep before the retry
+            mock_sleep.assert_called_with(4)  # retry_after + retry_delay
+            assert [c for c in mock_sleep.call_args_list if c.args[0] >= 1] == [call(4)]
 
     @pytest.mark.asyncio
     async def test_export_command_file_too_large_error(
@@ -510,8 +519,8 @@ class TestExportErrorHandling:
     ):
         """Test BadRequest error for file too large."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
@@ -542,8 +551,8 @@ class TestExportErrorHandling:
     ):
         """Test BadRequest error for invalid file format."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
@@ -574,8 +583,8 @@ class TestExportErrorHandling:
     ):
         """Test NetworkError with retry logic."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
@@ -611,8 +620,8 @@ class TestExportErrorHandling:
     ):
         """Test general TelegramError handling."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
@@ -638,63 +647,72 @@ class TestExportErrorHandling:
             assert len(error_calls) > 0
 
     @pytest.mark.asyncio
-    async def test_export_command_file_size_check_before_upload(
+    async def test_export_command_oversized_file_sent_zipped(
         self, mock_update_with_file, mock_context_with_settings
     ):
-        """Test file size check before attempting upload."""
+        """Test an export over the upload limit is zipped instead of refused."""
+        csv_text = "field1,field2\n" + "value1,value2\n" * 1000
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text(csv_text)
         )
-        mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
-        mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
+        mock_export_service.is_within_telegram_limit = AsyncMock(return_value=False)
+        mock_export_service.estimate_file_size = AsyncMock(return_value=20_000)
+        uploaded = []
+
+        async def reply_document(document, filename, caption):
+            uploaded.append((filename, document.read()))
+
+        mock_update_with_file.message.reply_document.side_effect = reply_document
 
-        # Mock file creation that results in oversized file
         with (
-            patch("tempfile.NamedTemporaryFile"),
-            patch("pathlib.Path.stat") as mock_stat,
             patch(
                 "src.bot.handlers.export_handlers.service_factory.get_export_service",
                 return_value=mock_export_service,
             ),
+            patch(
+                "src.bot.handlers.export_handlers.prepare_telegram_delivery",
+                side_effect=lambda export, filename: prepare_telegram_delivery(
+                    export, filename, max_bytes=export.byte_size - 1
+                ),
+            ),
         ):
-            # Mock file size > 50MB
-            mock_stat.return_value.st_size = 55 * 1024 * 1024  # 55MB
-
             await handle_export_command(
                 mock_update_with_file, mock_context_with_settings
             )
 
-            # Should send file too large message without attempting upload
-            error_calls = [
-                call
-                for call in mock_update_with_file.message.reply_text.call_args_list
-                if any("слишком большой" in str(arg).lower() for arg in call[0])
-            ]
-            assert len(error_calls) > 0
-
-            # Should not attempt document upload
-            mock_update_with_file.message.reply_document.assert_not_called()
+        assert len(uploaded) == 1
+        filename, data = uploaded[0]
+        assert filename.endswith(".zip")
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.namelist() == [filename[: -len(".zip")] + ".csv"]
+        assert not any(
+            "слишком большой" in str(arg).lower()
+            for call in mock_update_with_file.message.reply_text.call_args_list
+            for arg in call[0]
+        )
 
     @pytest.mark.asyncio
-    async def test_export_command_temp_file_creation_failure(
+    async def test_export_command_file_creation_failure(
         self, mock_update_with_file, mock_context_with_settings
     ):
-        """Test handling of temporary file creation failure."""
+        """Test handling of a failure while preparing the upload file."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
 
-        # Mock tempfile creation failure
         with (
             patch(
                 "src.bot.handlers.export_handlers.service_factory.get_export_service",
                 return_value=mock_export_service,
             ),
-            patch("tempfile.NamedTemporaryFile", side_effect=OSError("Disk full")),
+            patch(
+                "src.bot.handlers.export_handlers.prepare_telegram_delivery",
+                side_effect=OSError("Disk full"),
+            ),
         ):
             await handle_export_command(
                 mock_update_with_file, mock_context_with_settings
@@ -707,6 +725,7 @@ class TestExportErrorHandling:
                 if any("создании файла" in str(arg).lower() for arg in call[0])
             ]
             assert len(error_calls) > 0
+            mock_update_with_file.message.reply_document.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_export_command_user_interaction_logging(
@@ -714,8 +733,8 @@ class TestExportErrorHandling:
     ):
         """Test that user interactions are properly logged."""
         mock_export_service = Mock()
-        mock_export_service.export_to_csv_async = AsyncMock(
-            return_value="field1,field2\nvalue1,value2"
+        mock_export_service.get_all_participants_as_file = AsyncMock(
+            return_value=CSVExportFile.from_text("field1,field2\nvalue1,value2")
         )
         mock_export_service.is_within_telegram_limit = AsyncMock(return_value=True)
         mock_export_service.estimate_file_size = AsyncMock(return_value=1000)
@@ -52,6 +52,8 @@ class TestExportCallbackData:
         assert ExportCallbackData.EXPORT_BY_DEPARTMENT == "export:by_department"
         assert ExportCallbackData.EXPORT_BIBLE_READERS == "export:bible_readers"
         assert ExportCallbackData.EXPORT_ROE == "export:roe"
+        assert ExportCallbackData.EXPORT_RETREAT_PACKET == "export:retreat_packet"
+        assert ExportCallbackData.EXPORT_CHANGES == "export:changes"
 
     def test_department_callback_patterns(self):
         """Test callback data patterns for department selection."""
@@ -98,6 +100,9 @@ class TestExportCallbackData:
             ExportCallbackData.EXPORT_BY_DEPARTMENT,
             ExportCallbackData.EXPORT_BIBLE_READERS,
             ExportCallbackData.EXPORT_ROE,
+            ExportCallbackData.EXPORT_RETREAT_PACKET,
+            ExportCallbackData.EXPORT_DEPARTMENT_PACKETS,
+            ExportCallbackData.EXPORT_CHANGES,
             ExportCallbackData.CANCEL,
             ExportCallbackData.BACK_TO_EXPORT_SELECTION,
         ]
@@ -24,12 +24,13 @@ class TestExportSelectionKeyboard:
         # Should be an InlineKeyboardMarkup
         assert hasattr(keyboard, "inline_keyboard")
 
-        # Should have 4 rows (6 export options + cancel arranged in rows)
+        # Should have 5 rows (8 export options + cancel arranged in rows)
         # Row 1: Export All, Export Team
         # Row 2: Export Candidates, Export by Department
         # Row 3: Export Bible Readers, Export ROE
-        # Row 4: Cancel
-        assert len(keyboard.inline_keyboard) == 4
+        # Row 4: Full retreat packet, Changes
+        # Row 5: Cancel
+        assert len(keyboard.inline_keyboard) == 5
 
     def test_export_selection_keyboard_buttons(self):
         """Test that all required export buttons are present with correct labels."""
@@ -40,8 +41,8 @@ class TestExportSelectionKeyboard:
         for row in keyboard.inline_keyboard:
             all_buttons.extend(row)
 
-        # Should have 7 buttons total (6 export types + cancel)
-        assert len(all_buttons) == 7
+        # Should have 9 buttons total (8 export types + cancel)
+        assert len(all_buttons) == 9
 
         # Check Russian labels are present
         button_texts = [btn.text for btn in all_buttons]
@@ -52,6 +53,8 @@ class TestExportSelectionKeyboard:
             "🏢 Экспорт по отделу",
             "📖 Экспорт Bible Readers",
             "🎯 Экспорт ROE",
+            "📦 Полный пакет (ZIP)",
+            "🔁 Изменения",
             "❌ Отмена",
         ]
 
@@ -78,6 +81,8 @@ class TestExportSelectionKeyboard:
             ExportCallbackData.EXPORT_BY_DEPARTMENT,
             ExportCallbackData.EXPORT_BIBLE_READERS,
             ExportCallbackData.EXPORT_ROE,
+            ExportCallbackData.EXPORT_RETREAT_PACKET,
+            ExportCallbackData.EXPORT_CHANGES,
             ExportCallbackData.CANCEL,
         ]
 
@@ -100,8 +105,11 @@ class TestExportSelectionKeyboard:
         # Row 3: 2 buttons (Export Bible Readers, Export ROE)
         assert len(rows[2]) == 2
 
-        # Row 4: 1 button (Cancel)
-        assert len(rows[3]) == 1
+        # Row 4: 2 buttons (Full retreat packet, Changes)
+        assert len(rows[3]) == 2
+
+        # Row 5: 1 button (Cancel)
+        assert len(rows[4]) == 1
 
 
 class TestDepartmentSelectionKeyboard:
@@ -122,9 +130,9 @@ class TestDepartmentSelectionKeyboard:
         """Test that all 13 departments are present with correct labels."""
         keyboard = get_department_selection_keyboard()
 
-        # Flatten all buttons except navigation (last row)
+        # Flatten all buttons except archive and navigation (last two rows)
         department_buttons = []
-        for row in keyboard.inline_keyboard[:-1]:  # Exclude last row (navigation)
+        for row in keyboard.inline_keyboard[:-2]:  # Exclude archive and navigation
             department_buttons.extend(row)
 
         # Should have 13 department buttons
@@ -155,9 +163,9 @@ class TestDepartmentSelectionKeyboard:
         """Test that department buttons have correct callback data."""
         keyboard = get_department_selection_keyboard()
 
-        # Get department buttons (exclude navigation row)
+        # Get department buttons (exclude archive and navigation rows)
         department_buttons = []
-        for row in keyboard.inline_keyboard[:-1]:
+        for row in keyboard.inline_keyboard[:-2]:
             department_buttons.extend(row)
 
         # Check callback data patterns
@@ -170,6 +178,18 @@ class TestDepartmentSelectionKeyboard:
             assert dept_name is not None
             assert dept_name == button.text  # Button text should match department name
 
+    def test_department_selection_keyboard_archive_button(self):
+        """Test the all-departments archive button above the navigation row."""
+        keyboard = get_department_selection_keyboard()
+
+        archive_row = keyboard.inline_keyboard[-2]
+
+        assert len(archive_row) == 1
+        assert archive_row[0].text == "📦 Все отделы (ZIP)"
+        assert (
+            archive_row[0].callback_data == ExportCallbackData.EXPORT_DEPARTMENT_PACKETS
+        )
+
     def test_department_selection_keyboard_navigation(self):
         """Test that navigation buttons are present in department keyboard."""
         keyboard = get_department_selection_keyboard()
@@ -255,6 +255,44 @@ class TestTelegramSettings:
 
             assert "TELEGRAM_BOT_TOKEN" in str(exc_info.value)
 
+    def test_role_map_built_from_allowlists(self):
+        """Test that the role map resolves each user to the highest role."""
+        env_vars = {
+            "TELEGRAM_ADMIN_IDS": "111",
+            "TELEGRAM_COORDINATOR_IDS": "111,222",
+            "TELEGRAM_VIEWER_IDS": "222,333",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            settings = TelegramSettings()
+
+            role_map = settings.role_map
+            assert role_map.admin_ids == frozenset({111})
+            assert role_map.viewer_ids == frozenset({222, 333})
+            assert role_map.role_of(111) == "admin"
+            assert role_map.role_of(222) == "coordinator"
+            assert role_map.role_of(333) == "viewer"
+            assert role_map.role_of(444) is None
+            assert role_map.has_access(222, "viewer") is True
+            assert role_map.has_access(222, "admin") is False
+            assert role_map.has_access(111, "unknown") is False
+
+            with pytest.raises(TypeError):
+                role_map.roles[444] = "admin"  # type: ignore[index]
+
+    def test_role_map_rebuilt_on_allowlist_change(self):
+        """Test that reassigning or refreshing allowlists rebuilds the map."""
+        with patch.dict(os.environ, {}, clear=True):
+            settings = TelegramSettings()
+
+            settings.viewer_user_ids = [555]
+            assert settings.role_map.role_of(555) == "viewer"
+
+            settings.viewer_user_ids.append(666)
+            assert settings.role_map.role_of(666) is None
+            assert settings.refresh_role_map().role_of(666) == "viewer"
+            assert settings.role_map.role_of(666) == "viewer"
+
     def test_validation_invalid_message_length(self):
         """Test validation failure with invalid message length."""
         env_vars = {
@@ -357,6 +395,36 @@ class TestLoggingSettings:
 
             assert "LOG_LEVEL must be one of" in str(exc_info.value)
 
+    def test_security_audit_pipeline_loading(self):
+        """Test loading security audit sampling and buffering settings."""
+        env_vars = {
+            "SECURITY_AUDIT_BUFFER_SIZE": "500",
+            "SECURITY_AUDIT_FLUSH_INTERVAL_SECONDS": "0.5",
+            "SECURITY_AUDIT_GRANTED_SAMPLE_RATE": "0.1",
+            "SECURITY_AUDIT_FAST_SAMPLE_RATE": "0",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            settings = LoggingSettings()
+            settings.validate()
+
+            assert settings.security_audit_buffer_size == 500
+            assert settings.security_audit_flush_interval_seconds == 0.5
+            assert settings.security_audit_granted_sample_rate == 0.1
+            assert settings.security_audit_fast_sample_rate == 0.0
+
+    def test_validation_invalid_security_audit_sample_rate(self):
+        """Test validation failure with a sample rate above 1."""
+        env_vars = {"SECURITY_AUDIT_GRANTED_SAMPLE_RATE": "1.5"}
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            settings = LoggingSettings()
+
+            with pytest.raises(ValueError) as exc_info:
+                settings.validate()
+
+            assert "security_audit_granted_sample_rate" in str(exc_info.value)
+
     def test_user_interaction_logging_default_values(self):
         """Test default values for user interaction logging settings."""
         with patch.dict(os.environ, {}, clear=True):
@@ -410,6 +478,7 @@ class TestApplicationSettings:
             assert settings.enable_health_checks is True
             assert settings.max_concurrent_operations == 10
             assert settings.operation_timeout == 60
+            assert settings.export_format == "csv"
 
     def test_environment_variable_loading(self):
         """Test loading application settings from environment."""
@@ -444,6 +513,35 @@ class TestApplicationSettings:
 
             assert "ENVIRONMENT must be one of" in str(exc_info.value)
 
+    def test_export_format_loading(self):
+        """Test the export format is read case-insensitively."""
+        with patch.dict(os.environ, {"EXPORT_FORMAT": "XLSX"}, clear=True):
+            settings = ApplicationSettings()
+
+            assert settings.export_format == "xlsx"
+            settings.validate()
+
+    def test_validation_invalid_export_format(self):
+        """Test validation failure with an unknown export format."""
+        with patch.dict(os.environ, {"EXPORT_FORMAT": "pdf"}, clear=True):
+            settings = ApplicationSettings()
+
+            with pytest.raises(ValueError) as exc_info:
+                settings.validate()
+
+            assert "EXPORT_FORMAT must be one of" in str(exc_info.value)
+
+    def test_export_watermark_file_loading(self):
+        """Test delta export watermarks are kept in memory unless configured."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert ApplicationSettings().export_watermark_file == ""
+
+        env_vars = {"EXPORT_WATERMARK_FILE": "data/export_watermarks.json"}
+        with patch.dict(os.environ, env_vars, clear=True):
+            settings = ApplicationSettings()
+
+            assert settings.export_watermark_file == "data/export_watermarks.json"
+
 
 class TestSettings:
     """Test suite for main Settings container."""
@@ -785,6 +883,22 @@ class TestFileLoggingSettings:
 
             assert "file_backup_count cannot be negative" in str(exc_info.value)
 
+    def test_file_logging_validation_invalid_queue_size(self):
+        """Test validation failure when queue size is negative."""
+        env_vars = {
+            "AIRTABLE_API_KEY": "test_key",
+            "TELEGRAM_BOT_TOKEN": "test_token",
+            "FILE_LOG_QUEUE_SIZE": "-1",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            from src.config.settings import Settings
+
+            with pytest.raises(ValueError) as exc_info:
+                Settings()
+
+            assert "file_queue_size cannot be negative" in str(exc_info.value)
+
     def test_file_logging_config_creation(self):
         """Test creation of FileLoggingConfig from settings."""
         # RED phase - this test will fail until we implement get_file_logging_config method
@@ -796,6 +910,7 @@ class TestFileLoggingSettings:
             "FILE_LOG_DIR": "/test/logs",
             "FILE_LOG_MAX_SIZE": "1048576",  # 1MB
             "FILE_LOG_BACKUP_COUNT": "2",
+            "FILE_LOG_QUEUE_SIZE": "500",
         }
 
         with patch.dict(os.environ, env_vars, clear=True):
@@ -813,6 +928,7 @@ class TestFileLoggingSettings:
             assert str(file_config.log_dir) == "/test/logs"
             assert file_config.max_file_size == 1048576
             assert file_config.backup_count == 2
+            assert file_config.queue_size == 500
 
 
 class TestViewConfiguration:
@@ -22,6 +22,10 @@ from src.data.airtable.airtable_client import (
     AirtableClient,
     AirtableConfig,
     RateLimiter,
+    RequestPriority,
+    get_shared_rate_limiter,
+    request_priority,
+    reset_shared_rate_limiters,
 )
 
 
@@ -274,6 +278,108 @@ class TestRateLimiter:
         assert 0.18 <= times[2] <= 0.25  # Third request ~0.2s delay
 
 
+class TestTokenBucketRateLimiter:
+    """Test suite for burst credit, priorities and per-base sharing."""
+
+    @pytest.mark.asyncio
+    async def test_burst_allows_back_to_back_requests(self):
+        """Requests within the burst capacity are not delayed."""
+        limiter = RateLimiter(requests_per_second=5, burst=3)
+
+        start_time = time.time()
+        for _ in range(3):
+            await limiter.acquire()
+        assert time.time() - start_time < 0.05
+
+        # Fourth request has to wait for a refilled token
+        start_time = time.time()
+        await limiter.acquire()
+        assert 0.15 <= time.time() - start_time <= 0.3
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_go_first(self):
+        """Queued interactive requests overtake queued background requests."""
+        limiter = RateLimiter(requests_per_second=20)
+        await limiter.acquire()  # Drain the bucket
+        order = []
+
+        async def make_request(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        background = [
+            asyncio.create_task(make_request(f"bg{i}", RequestPriority.BACKGROUND))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(
+            make_request("search", RequestPriority.INTERACTIVE)
+        )
+        await asyncio.gather(*background, interactive)
+
+        assert order[0] == "search"
+
+    @pytest.mark.asyncio
+    async def test_request_priority_context(self):
+        """Requests inside a request_priority block use that priority."""
+        limiter = RateLimiter(requests_per_second=100)
+
+        with request_priority(RequestPriority.BACKGROUND):
+            await limiter.acquire()
+        await limiter.acquire()
+
+        stats = limiter.get_stats()
+        assert stats["by_priority"]["background"]["acquired"] == 1
+        assert stats["by_priority"]["interactive"]["acquired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_report_queue_and_wait(self):
+        """Statistics expose queue depth and wait times."""
+        limiter = RateLimiter(requests_per_second=10)
+        await limiter.acquire()
+
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.get_stats()["queue_depth"] == 1
+
+        await task
+        stats = limiter.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["acquired"] == 2
+        assert stats["queued"] == 1
+        assert stats["max_wait_seconds"] >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_consume_token(self):
+        """A cancelled waiter leaves its slot to the next request."""
+        limiter = RateLimiter(requests_per_second=10)
+        await limiter.acquire()
+
+        cancelled = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        start_time = time.time()
+        await limiter.acquire()
+        assert time.time() - start_time <= 0.15
+
+    def test_limiter_shared_per_base(self):
+        """Clients of the same base share a limiter; other bases do not."""
+        reset_shared_rate_limiters()
+        participants = AirtableClient(
+            AirtableConfig(api_key="key", base_id="app1", table_name="Participants")
+        )
+        roe = AirtableClient(
+            AirtableConfig(api_key="key", base_id="app1", table_name="ROE")
+        )
+        other = AirtableClient(AirtableConfig(api_key="key", base_id="app2"))
+
+        assert participants.rate_limiter is roe.rate_limiter
+        assert other.rate_limiter is not roe.rate_limiter
+        assert get_shared_rate_limiter("app1", 5) is roe.rate_limiter
+        reset_shared_rate_limiters()
+
+
 class TestAirtableAPIError:
     """Test suite for AirtableAPIError exception."""
 
@@ -580,6 +686,50 @@ class TestAirtableClientOperations:
             view="MyView",
         )
 
+    @pytest.mark.asyncio
+    async def test_stream_records_yields_pages(self, client_with_mock_table):
+        """Test streaming records across pages."""
+        client, mock_table = client_with_mock_table
+        mock_table.iterate.return_value = iter(
+            [[{"id": "rec1"}, {"id": "rec2"}], [{"id": "rec3"}]]
+        )
+
+        records = [record async for record in client.stream_records(view="MyView")]
+
+        assert [r["id"] for r in records] == ["rec1", "rec2", "rec3"]
+        mock_table.iterate.assert_called_once_with(view="MyView")
+
+    @pytest.mark.asyncio
+    async def test_stream_records_stops_early(self, client_with_mock_table):
+        """Test that breaking out of the stream stops fetching pages."""
+        client, mock_table = client_with_mock_table
+        fetched = []
+
+        def pages(**kwargs):
+            for i in range(5):
+                fetched.append(i)
+                yield [{"id": f"rec{i}"}]
+
+        mock_table.iterate.side_effect = pages
+
+        async for record in client.stream_records(prefetch=False):
+            if record["id"] == "rec1":
+                break
+
+        assert fetched == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_stream_records_failure(self, client_with_mock_table):
+        """Test streaming failure is wrapped in AirtableAPIError."""
+        client, mock_table = client_with_mock_table
+        mock_table.iterate.side_effect = Exception("Listing failed")
+
+        with pytest.raises(AirtableAPIError) as exc_info:
+            async for _ in client.stream_records():
+                pass
+
+        assert "failed to stream records" in str(exc_info.value).lower()
+
     @pytest.mark.asyncio
     async def test_list_records_failure(self, client_with_mock_table):
         """Test record listing failure."""
@@ -783,6 +933,29 @@ class TestAirtableClientSearchOperations:
         expected_formula = "{CommentField} = 'Can''t find John''s file'"
         mock_table.all.assert_called_once_with(formula=expected_formula)
 
+    @pytest.mark.asyncio
+    async def test_find_first_by_field_requests_one_record(
+        self, client_with_mock_table
+    ):
+        """Test first-match lookups fetch a single record without prefetch."""
+        client, mock_table = client_with_mock_table
+        mock_table.iterate.return_value = iter([[{"id": "rec1"}]])
+
+        record = await client.find_first_by_field("NameField", "O'Connor")
+
+        assert record == {"id": "rec1"}
+        mock_table.iterate.assert_called_once_with(
+            formula="{NameField} = 'O''Connor'", max_records=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_first_by_field_no_match(self, client_with_mock_table):
+        """Test first-match lookups return None when nothing matches."""
+        client, mock_table = client_with_mock_table
+        mock_table.iterate.return_value = iter([])
+
+        assert await client.find_first_by_field("NumberField", 42) is None
+
     @pytest.mark.asyncio
     async def test_search_by_formula(self, client_with_mock_table):
         """Test search by custom formula."""
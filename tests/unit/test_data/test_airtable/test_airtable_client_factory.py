@@ -126,3 +126,39 @@ class TestAirtableClientFactory:
             for table_type in supported_types:
                 client = factory.create_client(table_type)
                 assert isinstance(client, AirtableClient)
+
+
+class TestAirtableClientFactorySharedTransport:
+    """Test suite for connection pool sharing across factory clients."""
+
+    def test_clients_share_transport_when_enabled(self):
+        """All table clients reuse one async transport when enabled."""
+        with patch.dict(
+            "os.environ",
+            {
+                "AIRTABLE_API_KEY": "test_key",
+                "AIRTABLE_BASE_ID": "test_base",
+                "AIRTABLE_ASYNC_TRANSPORT": "true",
+            },
+            clear=True,
+        ):
+            factory = AirtableClientFactory()
+            clients = [
+                factory.create_client(table_type)
+                for table_type in ["participants", "roe", "bible_readers", "schedule"]
+            ]
+
+        transports = {id(client.transport) for client in clients}
+        assert clients[0].transport is not None
+        assert len(transports) == 1
+
+    def test_clients_use_pyairtable_by_default(self):
+        """Without the flag, clients keep the thread-based pyairtable path."""
+        with patch.dict(
+            "os.environ",
+            {"AIRTABLE_API_KEY": "test_key", "AIRTABLE_BASE_ID": "test_base"},
+            clear=True,
+        ):
+            client = AirtableClientFactory().create_client("roe")
+
+        assert client.transport is None
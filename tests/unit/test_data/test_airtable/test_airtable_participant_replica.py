@@ -0,0 +1,279 @@
+"""
+Unit tests for the local Participants replica.
+
+Tests cover:
+- Full and delta sync with the LAST_MODIFIED_TIME watermark
+- Write-through of repository writes, including during a full sync
+- Field lookups with Airtable-like value comparison
+- Freshness checks and repository fallback to Airtable
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.data.airtable.airtable_client import AirtableAPIError, AirtableClient
+from src.data.airtable.airtable_participant_replica import ParticipantReplica
+from src.data.airtable.airtable_participant_repo import AirtableParticipantRepository
+
+
+def make_record(record_id, **fields):
+    fields.setdefault("FullNameRU", f"Участник {record_id}")
+    return {"id": record_id, "fields": fields}
+
+
+def stream_of(*batches):
+    """Build a stream_records side effect returning one batch per call."""
+    calls = []
+    batches = list(batches)
+
+    def stream_records(**kwargs):
+        calls.append(kwargs)
+        records = batches.pop(0)
+
+        async def generator():
+            for record in records:
+                if isinstance(record, Exception):
+                    raise record
+                yield record
+
+        return generator()
+
+    return stream_records, calls
+
+
+@pytest.fixture
+def mock_client():
+    client = Mock(spec=AirtableClient)
+    client.config = Mock(
+        base_id="appTestBase123456789", table_id="tblTest", table_name="Test"
+    )
+    return client
+
+
+class TestParticipantReplicaSync:
+    """Test suite for replica synchronization."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_loads_all_records(self, mock_client):
+        """The first sync is a full load without a formula."""
+        mock_client.stream_records, calls = stream_of(
+            [make_record("rec1", Role="TEAM"), {"id": "rec2", "fields": {}}]
+        )
+        replica = ParticipantReplica(mock_client)
+
+        assert not replica.is_fresh()
+        loaded = await replica.sync()
+
+        assert loaded == 2
+        assert calls == [{}]
+        assert replica.is_fresh()
+        assert replica.count() == 2
+        # Records without FullNameRU are counted but not returned as participants
+        assert [p.record_id for p in replica.participants()] == ["rec1"]
+
+    @pytest.mark.asyncio
+    async def test_delta_sync_uses_watermark_formula(self, mock_client):
+        """Later syncs pull only records modified since the watermark."""
+        mock_client.stream_records, calls = stream_of(
+            [make_record("rec1", RoomNumber="101")],
+            [make_record("rec1", RoomNumber="202"), make_record("rec2")],
+        )
+        replica = ParticipantReplica(mock_client)
+        await replica.sync()
+        version = replica.version
+
+        changed = await replica.sync()
+
+        assert changed == 2
+        assert calls[1]["formula"].startswith(
+            "IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('"
+        )
+        assert replica.get_record("rec1")["fields"]["RoomNumber"] == "202"
+        assert replica.count() == 2
+        assert replica.version > version
+
+    @pytest.mark.asyncio
+    async def test_full_sync_drops_deleted_records(self, mock_client):
+        """A full resync removes records that no longer exist in Airtable."""
+        mock_client.stream_records, _ = stream_of(
+            [make_record("rec1"), make_record("rec2")], [make_record("rec2")]
+        )
+        replica = ParticipantReplica(mock_client)
+        await replica.sync()
+
+        await replica.sync(full=True)
+
+        assert replica.get("rec1") is None
+        assert replica.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_previous_state(self, mock_client):
+        """A failing sync raises and leaves loaded records untouched."""
+        mock_client.stream_records, _ = stream_of(
+            [make_record("rec1")], [AirtableAPIError("boom")]
+        )
+        replica = ParticipantReplica(mock_client)
+        await replica.sync()
+
+        with pytest.raises(AirtableAPIError):
+            await replica.sync(full=True)
+
+        assert replica.count() == 1
+        assert replica.get_stats()["sync_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_replica_is_not_fresh(self, mock_client):
+        """Reads are refused once the last sync is older than the limit."""
+        mock_client.stream_records, _ = stream_of([make_record("rec1")])
+        replica = ParticipantReplica(mock_client, max_staleness_seconds=60)
+
+        with patch(
+            "src.data.airtable.airtable_participant_replica.time.monotonic",
+            side_effect=[1000.0, 1000.0, 1061.0],
+        ):
+            await replica.sync()
+            assert not replica.is_fresh()
+
+
+class TestParticipantReplicaWriteThrough:
+    """Test suite for write-through updates."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_and_delete(self, mock_client):
+        mock_client.stream_records, _ = stream_of([make_record("rec1", Floor=1)])
+        replica = ParticipantReplica(mock_client)
+        await replica.sync()
+
+        replica.apply_upsert(make_record("rec1", Floor=3))
+        replica.apply_upsert(make_record("rec2", Floor=3))
+        replica.apply_delete("rec1")
+
+        assert [p.record_id for p in replica.find_by_field("Floor", 3)] == ["rec2"]
+        assert replica.get_stats()["write_through"] == 3
+
+    @pytest.mark.asyncio
+    async def test_write_during_full_sync_survives_swap(self, mock_client):
+        """Writes applied while a full sync streams are not lost."""
+        replica = ParticipantReplica(mock_client)
+
+        def stream_records(**kwargs):
+            async def generator():
+                yield make_record("rec1", RoomNumber="101")
+                replica.apply_upsert(make_record("rec1", RoomNumber="303"))
+
+            return generator()
+
+        mock_client.stream_records = stream_records
+        await replica.sync()
+
+        assert replica.get("rec1").room_number == "303"
+
+
+class TestParticipantReplicaLookups:
+    """Test suite for local field lookups."""
+
+    @pytest.mark.asyncio
+    async def test_numbers_and_numeric_strings_match(self, mock_client):
+        mock_client.stream_records, _ = stream_of(
+            [
+                make_record("rec1", Floor=2, TelegramID="12345"),
+                make_record("rec2", Floor="2"),
+                make_record("rec3", Floor="Ground"),
+            ]
+        )
+        replica = ParticipantReplica(mock_client)
+        await replica.sync()
+
+        assert len(replica.find_by_field("Floor", "2")) == 2
+        assert len(replica.find_by_field("Floor", 2)) == 2
+        assert len(replica.find_by_field("Floor", "Ground")) == 1
+        assert replica.find_by_field("TelegramID", 12345)[0].record_id == "rec1"
+
+    @pytest.mark.asyncio
+    async def test_returned_participants_are_copies(self, mock_client):
+        mock_client.stream_records, _ = stream_of([make_record("rec1", Floor=1)])
+        replica = ParticipantReplica(mock_client)
+        await replica.sync()
+
+        replica.get("rec1").floor = 5
+
+        assert replica.get("rec1").floor == 1
+
+
+class TestRepositoryWithReplica:
+    """Test suite for repository reads and writes backed by the replica."""
+
+    @pytest.fixture
+    async def repository(self, mock_client):
+        mock_client.stream_records, _ = stream_of(
+            [
+                make_record("rec1", Role="TEAM", Department="ROE", Church="Б", Floor=2),
+                make_record(
+                    "rec2",
+                    Role="TEAM",
+                    Department="ROE",
+                    Church="А",
+                    IsDepartmentChief=True,
+                    Floor=3,
+                ),
+                make_record("rec3", Role="TEAM", Church="В", RoomNumber="101"),
+                make_record("rec4", Role="CANDIDATE", Floor="Ground"),
+            ]
+        )
+        mock_client.search_by_field = AsyncMock()
+        mock_client.list_records = AsyncMock()
+        replica = ParticipantReplica(mock_client)
+        await replica.sync()
+        return AirtableParticipantRepository(mock_client, replica=replica)
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_locally(self, repository, mock_client):
+        assert len(await repository.find_by_role("TEAM")) == 3
+        assert len(await repository.find_by_department("ROE")) == 2
+        assert len(await repository.find_by_room_number("101")) == 1
+        assert len(await repository.find_by_floor(2)) == 1
+        assert await repository.count_all() == 4
+        assert repository.peek_count() == 4
+        assert await repository.get_available_floors() == [2, 3]
+
+        mock_client.search_by_field.assert_not_called()
+        mock_client.list_records.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_team_members_sorted_chiefs_first(self, repository, mock_client):
+        members = await repository.get_team_members_by_department("ROE")
+        unassigned = await repository.get_team_members_by_department("unassigned")
+
+        assert [m.record_id for m in members] == ["rec2", "rec1"]
+        assert [m.record_id for m in unassigned] == ["rec3"]
+        mock_client.list_records.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_by_id_writes_through(self, repository, mock_client):
+        mock_client.update_record = AsyncMock(
+            return_value=make_record("rec4", Role="CANDIDATE", Floor=4)
+        )
+
+        assert await repository.update_by_id("rec4", {"floor": 4})
+
+        assert [p.record_id for p in await repository.find_by_floor(4)] == ["rec4"]
+
+    @pytest.mark.asyncio
+    async def test_data_version_follows_replica(self, repository, mock_client):
+        version = repository.get_data_version()
+        repository.replica.apply_delete("rec4")
+
+        assert repository.get_data_version() == version + 1
+        with patch.object(repository.replica, "is_fresh", return_value=False):
+            assert repository.get_data_version() is None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_airtable_when_stale(self, repository, mock_client):
+        mock_client.search_by_field.return_value = [make_record("rec9")]
+
+        with patch.object(repository.replica, "is_fresh", return_value=False):
+            result = await repository.find_by_role("TEAM")
+
+        assert [p.record_id for p in result] == ["rec9"]
+        mock_client.search_by_field.assert_awaited_once_with("Role", "TEAM")
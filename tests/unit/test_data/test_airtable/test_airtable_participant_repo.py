@@ -11,7 +11,7 @@ Tests cover:
 """
 
 import asyncio
-from datetime import date
+from datetime import date, datetime, timezone
 from typing import Any, Dict, List
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -317,13 +317,78 @@ class TestAirtableParticipantRepositoryRead:
 
         assert "Failed to get participant" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_get_by_ids_batches_record_id_formulas(
+        self, repository, mock_airtable_client
+    ):
+        """IDs are resolved with chunked OR(RECORD_ID()=...) queries."""
+        _PARTICIPANT_CACHE.clear()
+        record_ids = [f"rec{i:03d}" for i in range(150)]
+        mock_airtable_client.list_records = AsyncMock(
+            side_effect=lambda formula: [
+                {"id": record_id, "fields": {"FullNameRU": f"Участник {record_id}"}}
+                for record_id in record_ids
+                if f"RECORD_ID()='{record_id}'" in formula
+            ]
+        )
+
+        result = await repository.get_by_ids(record_ids + ["rec000", ""])
+
+        assert len(result) == 150
+        assert result["rec149"].full_name_ru == "Участник rec149"
+        formulas = [
+            c.kwargs["formula"]
+            for c in mock_airtable_client.list_records.call_args_list
+        ]
+        assert len(formulas) == 2
+        assert formulas[0].startswith("OR(RECORD_ID()='rec000',RECORD_ID()='rec001'")
+        mock_airtable_client.get_record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_uses_participant_snapshot(
+        self, repository, mock_airtable_client
+    ):
+        """IDs found in the snapshot cache cost no request."""
+        _PARTICIPANT_CACHE.clear()
+        await repository._get_participant_cache().get(
+            AsyncMock(return_value=[Participant(record_id="rec1", full_name_ru="Иван")])
+        )
+        mock_airtable_client.list_records = AsyncMock(return_value=[])
+
+        result = await repository.get_by_ids(["rec1", "rec2"])
+
+        assert list(result) == ["rec1"]
+        mock_airtable_client.list_records.assert_awaited_once_with(
+            formula="OR(RECORD_ID()='rec2')"
+        )
+        _PARTICIPANT_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_api_error(self, repository, mock_airtable_client):
+        """API errors are wrapped in RepositoryError."""
+        _PARTICIPANT_CACHE.clear()
+        mock_airtable_client.list_records.side_effect = AirtableAPIError("API error")
+
+        with pytest.raises(RepositoryError) as exc_info:
+            await repository.get_by_ids(["rec1"])
+
+        assert "Failed to get participants by ID" in str(exc_info.value)
+
     @pytest.mark.asyncio
     async def test_list_all_success(self, repository, mock_airtable_client):
-        """Test successful list all participants."""
-        result = await repository.list_all()
+        """Test list all collects the streamed pages."""
+        stream_calls = []
 
-        mock_airtable_client.list_records.assert_called_once_with(max_records=None)
+        async def stream_records(**kwargs):
+            stream_calls.append(kwargs)
+            for record in await mock_airtable_client.list_records():
+                yield record
 
+        mock_airtable_client.stream_records = stream_records
+
+        result = await repository.list_all()
+
+        assert stream_calls == [{"max_records": None}]
         assert isinstance(result, list)
         assert len(result) == 2
         assert all(isinstance(p, Participant) for p in result)
@@ -331,14 +396,28 @@ class TestAirtableParticipantRepositoryRead:
     @pytest.mark.asyncio
     async def test_list_all_with_limit(self, repository, mock_airtable_client):
         """Test list all with limit."""
+        stream_calls = []
+
+        async def stream_records(**kwargs):
+            stream_calls.append(kwargs)
+            return
+            yield  # pragma: no cover - makes this an async generator
+
+        mock_airtable_client.stream_records = stream_records
+
         await repository.list_all(limit=10)
 
-        mock_airtable_client.list_records.assert_called_once_with(max_records=10)
+        assert stream_calls == [{"max_records": 10}]
 
     @pytest.mark.asyncio
     async def test_list_all_api_error(self, repository, mock_airtable_client):
         """Test list all with API error."""
-        mock_airtable_client.list_records.side_effect = AirtableAPIError("API error")
+
+        async def stream_records(**kwargs):
+            raise AirtableAPIError("API error")
+            yield  # pragma: no cover - makes this an async generator
+
+        mock_airtable_client.stream_records = stream_records
 
         with pytest.raises(RepositoryError) as exc_info:
             await repository.list_all()
@@ -470,6 +549,35 @@ class TestAirtableParticipantRepositorySearch:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_by_full_name_ru_fetches_first_match(
+        self, repository, mock_airtable_client
+    ):
+        """Test the primary-field lookup requests only the first match."""
+        mock_airtable_client.find_first_by_field = AsyncMock(
+            return_value={
+                "id": "rec123456789012345",
+                "fields": {"FullNameRU": "Иван Иванов", "Role": "CANDIDATE"},
+            }
+        )
+
+        result = await repository.get_by_full_name_ru("Иван Иванов")
+
+        mock_airtable_client.find_first_by_field.assert_awaited_once_with(
+            "FullNameRU", "Иван Иванов"
+        )
+        mock_airtable_client.search_by_field.assert_not_called()
+        assert result.record_id == "rec123456789012345"
+
+    @pytest.mark.asyncio
+    async def test_get_by_full_name_ru_not_found(
+        self, repository, mock_airtable_client
+    ):
+        """Test the primary-field lookup returns None without a match."""
+        mock_airtable_client.find_first_by_field = AsyncMock(return_value=None)
+
+        assert await repository.get_by_full_name_ru("Никто") is None
+
     @pytest.mark.asyncio
     async def test_find_by_telegram_id_success(self, repository, mock_airtable_client):
         """Test successful find by Telegram ID."""
@@ -669,10 +777,10 @@ class TestParticipantCacheBehavior:
     """Test caching invalidation logic for participant list."""
 
     @pytest.mark.asyncio
-    async def test_create_invalidates_participant_cache(
+    async def test_create_patches_participant_cache(
         self, repository, mock_airtable_client
     ):
-        """Creating a participant clears the cached list used by enhanced search."""
+        """Creating a participant adds it to the cached enhanced search snapshot."""
         sample_participants = [
             Participant(record_id="recA", full_name_ru="Кэш Тест"),
         ]
@@ -689,13 +797,55 @@ class TestParticipantCacheBehavior:
 
             await repository.search_by_name_enhanced("Тест")
 
-        cache_key = repository._get_participant_cache_key()
-        assert cache_key in _PARTICIPANT_CACHE
+        cache = _PARTICIPANT_CACHE[repository._get_participant_cache_key()]
+        version = cache.version
 
         new_participant = Participant(full_name_ru="Новый Участник")
         await repository.create(new_participant)
 
-        assert cache_key not in _PARTICIPANT_CACHE
+        assert cache.version > version
+        assert [p.record_id for p in cache.peek().participants] == [
+            "recA",
+            "rec123456789012345",
+        ]
+        assert repository.list_all.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_by_id_patches_single_cached_record(
+        self, repository, mock_airtable_client
+    ):
+        """Updating one participant replaces only that entry in the snapshot."""
+        repository.list_all = AsyncMock(
+            return_value=[
+                Participant(record_id="recA", full_name_ru="Первый"),
+                Participant(record_id="rec123456789012345", full_name_ru="Второй"),
+            ]
+        )
+        _PARTICIPANT_CACHE.clear()
+        await repository._get_all_participants_cached()
+
+        await repository.update_by_id("rec123456789012345", {"floor": 2})
+
+        cached = await repository._get_all_participants_cached()
+        assert [p.full_name_ru for p in cached] == ["Первый", "Иван Петров"]
+        assert repository.list_all.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_cached_record(self, repository, mock_airtable_client):
+        """Deleting a participant drops it from the snapshot."""
+        repository.list_all = AsyncMock(
+            return_value=[
+                Participant(record_id="recA", full_name_ru="Первый"),
+                Participant(record_id="rec123456789012345", full_name_ru="Второй"),
+            ]
+        )
+        _PARTICIPANT_CACHE.clear()
+        await repository._get_all_participants_cached()
+
+        await repository.delete("rec123456789012345")
+
+        cached = await repository._get_all_participants_cached()
+        assert [p.record_id for p in cached] == ["recA"]
 
 
 class TestAirtableParticipantRepositoryBulkOperations:
@@ -787,22 +937,115 @@ class TestAirtableParticipantRepositoryUtilities:
 
     @pytest.mark.asyncio
     async def test_count_all_success(self, repository, mock_airtable_client):
-        """Test successful count all."""
+        """Test successful count all streams a single field."""
+        stream_calls = []
+
+        async def stream_records(**kwargs):
+            stream_calls.append(kwargs)
+            for record in [{"id": "rec1"}, {"id": "rec2"}]:
+                yield record
+
+        mock_airtable_client.stream_records = stream_records
+
         result = await repository.count_all()
 
-        mock_airtable_client.list_records.assert_called_once()
-        assert result == 2  # Based on mock data
+        assert result == 2
+        assert stream_calls == [{"fields": ["FullNameRU"]}]
+        mock_airtable_client.list_records.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_count_all_api_error(self, repository, mock_airtable_client):
         """Test count all with API error."""
-        mock_airtable_client.list_records.side_effect = AirtableAPIError("API error")
+
+        async def stream_records(**kwargs):
+            raise AirtableAPIError("API error")
+            yield  # pragma: no cover - makes this an async generator
+
+        mock_airtable_client.stream_records = stream_records
 
         with pytest.raises(RepositoryError) as exc_info:
             await repository.count_all()
 
         assert "Failed to count participants" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_stream_all_yields_participants(
+        self, repository, mock_airtable_client
+    ):
+        """Streaming converts records to participants and skips invalid ones."""
+
+        async def stream_records(**kwargs):
+            yield {"id": "rec1", "fields": {"FullNameRU": "Иван Иванов"}}
+            yield {"id": "rec2", "fields": {"FullNameRU": None}}
+            yield {"id": "rec3", "fields": {"FullNameRU": "Петр Петров"}}
+
+        mock_airtable_client.stream_records = stream_records
+
+        names = [p.full_name_ru async for p in repository.stream_all()]
+
+        assert names == ["Иван Иванов", "Петр Петров"]
+
+    @pytest.mark.asyncio
+    async def test_stream_all_closed_early_closes_record_stream(
+        self, repository, mock_airtable_client
+    ):
+        """Closing the stream early closes the record stream without prefetch."""
+        calls = []
+        closed = []
+
+        async def stream_records(**kwargs):
+            calls.append(kwargs)
+            try:
+                yield {"id": "rec1", "fields": {"FullNameRU": "Иван Иванов"}}
+                yield {"id": "rec2", "fields": {"FullNameRU": "Петр Петров"}}
+            finally:
+                closed.append(True)
+
+        mock_airtable_client.stream_records = stream_records
+
+        participants = repository.stream_all(page_size=1, prefetch=False)
+        assert (await participants.__anext__()).full_name_ru == "Иван Иванов"
+        await participants.aclose()
+
+        assert calls == [{"page_size": 1, "prefetch": False}]
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_has_changes_since_queries_one_record(
+        self, repository, mock_airtable_client
+    ):
+        """Change checks ask Airtable for a single modified record."""
+        mock_airtable_client.list_records.return_value = [{"id": "rec1"}]
+        since = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        assert await repository.has_changes_since(since) is True
+
+        mock_airtable_client.list_records.assert_called_once_with(
+            formula=(
+                "IS_AFTER(LAST_MODIFIED_TIME(), "
+                "DATETIME_PARSE('2025-01-02T03:04:05.000Z'))"
+            ),
+            max_records=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_has_changes_since_api_error(self, repository, mock_airtable_client):
+        """Change check failures are wrapped as repository errors."""
+        mock_airtable_client.list_records.side_effect = AirtableAPIError("API error")
+
+        with pytest.raises(RepositoryError) as exc_info:
+            await repository.has_changes_since(datetime.now(timezone.utc))
+
+        assert "Failed to check participants for changes" in str(exc_info.value)
+
+    def test_data_version_without_replica(self, repository):
+        """Without a replica there is no local data version."""
+        assert repository.get_data_version() is None
+
+    def test_count_unknown_without_replica(self, repository):
+        """Without a replica the count needs a table scan."""
+        assert repository.peek_count() is None
+
     @pytest.mark.asyncio
     async def test_health_check_success(self, repository, mock_airtable_client):
         """Test successful health check."""
@@ -872,8 +1115,8 @@ class TestAirtableParticipantRepositoryErrorHandling:
         self, repository, mock_airtable_client
     ):
         """Test that invalid records are skipped and logged during list operations."""
-        # Mock list_records to return some valid and some invalid records
-        mock_airtable_client.list_records.return_value = [
+        # Stream some valid and some invalid records
+        records = [
             {
                 "id": "rec123456789012345",
                 "fields": {"FullNameRU": "Valid Participant", "Role": "CANDIDATE"},
@@ -888,6 +1131,12 @@ class TestAirtableParticipantRepositoryErrorHandling:
             },
         ]
 
+        async def stream_records(**kwargs):
+            for record in records:
+                yield record
+
+        mock_airtable_client.stream_records = stream_records
+
         with patch("src.data.airtable.airtable_participant_repo.logger") as mock_logger:
             result = await repository.list_all()
 
@@ -5,6 +5,7 @@ Tests the fuzzy search method implementation with various scenarios
 including Russian/English name matching and similarity scoring.
 """
 
+import asyncio
 from typing import List, Tuple
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -13,6 +14,7 @@ import pytest
 from src.data.airtable.airtable_client import AirtableAPIError, AirtableClient
 from src.data.airtable.airtable_participant_repo import (
     _PARTICIPANT_CACHE,
+    _SEARCH_RESULT_CACHES,
     AirtableParticipantRepository,
 )
 from src.data.repositories.participant_repository import RepositoryError
@@ -21,10 +23,12 @@ from src.models.participant import Department, Participant, Role
 
 @pytest.fixture(autouse=True)
 def clear_participant_cache():
-    """Ensure participant cache is cleared between tests."""
+    """Ensure participant and search result caches are cleared between tests."""
     _PARTICIPANT_CACHE.clear()
+    _SEARCH_RESULT_CACHES.clear()
     yield
     _PARTICIPANT_CACHE.clear()
+    _SEARCH_RESULT_CACHES.clear()
 
 
 @pytest.fixture
@@ -299,9 +303,12 @@ class TestFuzzySearchImplementation:
                 similarity_threshold=0.75, max_results=10
             )
 
-            # Should call search_participants with query and all participants
+            # Should call search_participants with query, all participants and
+            # the shared search index for the table
             mock_service.search_participants.assert_called_once_with(
-                "Александр", sample_participants
+                "Александр",
+                sample_participants,
+                index=repository._get_search_index(),
             )
 
 
@@ -547,7 +554,7 @@ class TestEnhancedSearchCaching:
     async def test_enhanced_search_cache_expires_after_ttl(
         self, repository, enhanced_sample_participants
     ):
-        """Cache expiry triggers a fresh Airtable fetch."""
+        """An expired snapshot is served while a refresh runs in the background."""
         repository.list_all = AsyncMock(return_value=enhanced_sample_participants)
 
         _PARTICIPANT_CACHE.clear()
@@ -565,5 +572,62 @@ class TestEnhancedSearchCaching:
             ):
                 await repository.search_by_name_enhanced("Александр")
                 await repository.search_by_name_enhanced("Мария")
+                assert repository.list_all.await_count == 1
+
+                # Let the background refresh started by the stale hit complete
+                await asyncio.sleep(0)
 
         assert repository.list_all.await_count == 2
+
+
+class TestSearchResultCaching:
+    """Test the per-snapshot search result cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_skips_scoring_and_formatting(
+        self, repository, enhanced_sample_participants
+    ):
+        repository.list_all = AsyncMock(return_value=enhanced_sample_participants)
+
+        with patch(
+            "src.data.airtable.airtable_participant_repo.format_participant_result",
+            return_value="formatted",
+        ) as formatter:
+            first = await repository.search_by_name_enhanced("Александр")
+            calls = formatter.call_count
+            second = await repository.search_by_name_enhanced("  александр ")
+
+        assert first and second == first
+        assert formatter.call_count == calls
+        stats = repository._get_search_result_cache().get_stats()
+        assert stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_user_role_is_part_of_the_key(
+        self, repository, enhanced_sample_participants
+    ):
+        repository.list_all = AsyncMock(return_value=enhanced_sample_participants)
+
+        await repository.search_by_name_enhanced("Александр", user_role="admin")
+        await repository.search_by_name_enhanced("Александр", user_role="viewer")
+
+        assert repository._get_search_result_cache().get_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_results(
+        self, repository, mock_airtable_client, enhanced_sample_participants
+    ):
+        repository.list_all = AsyncMock(return_value=enhanced_sample_participants)
+        await repository.search_by_name_enhanced("Кузнецова")
+        mock_airtable_client.update_record = AsyncMock(
+            return_value={
+                "id": "rec1",
+                "fields": {"FullNameRU": "Александра Кузнецова"},
+            }
+        )
+
+        await repository.update_by_id("rec1", {"full_name_ru": "Александра Кузнецова"})
+        results = await repository.search_by_name_enhanced("Кузнецова")
+
+        assert "rec1" in [participant.record_id for participant, _, _ in results]
+        assert repository.list_all.await_count == 1
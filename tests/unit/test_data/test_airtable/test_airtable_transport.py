@@ -0,0 +1,289 @@
+"""
+Unit tests for the native async Airtable transport.
+
+Tests cover:
+- REST request building for list/get/create/update/delete/batch operations
+- Pagination and max_records handling
+- Retry on rate limiting and error propagation
+- Shared connection pool across table clients
+"""
+
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.data.airtable.airtable_client import (
+    AirtableAPIError,
+    AirtableClient,
+    AirtableConfig,
+)
+from src.data.airtable.airtable_transport import (
+    AirtableAsyncTransport,
+    AirtableTransportError,
+    close_shared_transports,
+    get_shared_transport,
+)
+
+
+def make_transport(handler, **kwargs) -> AirtableAsyncTransport:
+    """Create a transport that routes requests to a handler function."""
+    kwargs.setdefault("retry_delay_seconds", 0)
+    return AirtableAsyncTransport(
+        api_key="test_key",
+        http_transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestAirtableAsyncTransport:
+    """Test suite for AirtableAsyncTransport REST operations."""
+
+    @pytest.mark.asyncio
+    async def test_list_records_follows_pagination(self):
+        """All pages are fetched by following the offset token."""
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            bodies.append(body)
+            assert request.method == "POST"
+            assert request.url.path == "/v0/app1/tbl1/listRecords"
+            assert request.headers["Authorization"] == "Bearer test_key"
+            if "offset" not in body:
+                return httpx.Response(
+                    200, json={"records": [{"id": "rec1"}], "offset": "next"}
+                )
+            return httpx.Response(200, json={"records": [{"id": "rec2"}]})
+
+        transport = make_transport(handler)
+        records = await transport.list_records(
+            "app1",
+            "tbl1",
+            formula="{Name} = 'A'",
+            sort=["-Name", "Age"],
+            fields=["Name"],
+            view="Grid",
+        )
+
+        assert [r["id"] for r in records] == ["rec1", "rec2"]
+        assert bodies[0] == {
+            "filterByFormula": "{Name} = 'A'",
+            "sort": [
+                {"field": "Name", "direction": "desc"},
+                {"field": "Age", "direction": "asc"},
+            ],
+            "fields": ["Name"],
+            "view": "Grid",
+        }
+        assert bodies[1]["offset"] == "next"
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_table_name_is_url_encoded(self):
+        """Non-ASCII table names are quoted in the request path."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.raw_path.decode())
+            return httpx.Response(200, json={"records": []})
+
+        transport = make_transport(handler)
+        await transport.list_records("app1", "Участники")
+
+        assert paths[0].startswith("/v0/app1/%D0%A3")
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_record_not_found_returns_none(self):
+        """A 404 for a record is reported as a missing record."""
+        transport = make_transport(lambda request: httpx.Response(404, json={}))
+
+        assert await transport.get_record("app1", "tbl1", "recX") is None
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_create_record_in_missing_table_raises(self):
+        """A 404 on create is an error, not a created record."""
+        transport = make_transport(lambda request: httpx.Response(404, json={}))
+
+        for create in (
+            transport.create_record("app1", "tblX", {"Name": "A"}),
+            transport.batch_create("app1", "tblX", [{"Name": "A"}]),
+        ):
+            with pytest.raises(AirtableTransportError) as exc_info:
+                await create
+            assert exc_info.value.status_code == 404
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_write_operations(self):
+        """Create, update, delete and batch operations use the REST verbs."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content) if request.content else None
+            calls.append((request.method, request.url.path, body))
+            if request.method == "DELETE":
+                return httpx.Response(200, json={"id": "rec1", "deleted": True})
+            if body and "records" in body:
+                return httpx.Response(200, json={"records": body["records"]})
+            return httpx.Response(200, json={"id": "rec1", "fields": body["fields"]})
+
+        transport = make_transport(handler)
+
+        created = await transport.create_record("app1", "tbl1", {"Name": "A"})
+        updated = await transport.update_record("app1", "tbl1", "rec1", {"Name": "B"})
+        deleted = await transport.delete_record("app1", "tbl1", "rec1")
+        batch = await transport.batch_update(
+            "app1", "tbl1", [{"id": "rec1", "fields": {"Name": "C"}}]
+        )
+
+        assert created["fields"] == {"Name": "A"}
+        assert updated["fields"] == {"Name": "B"}
+        assert deleted is True
+        assert batch == [{"id": "rec1", "fields": {"Name": "C"}}]
+        assert [c[0] for c in calls] == ["POST", "PATCH", "DELETE", "PATCH"]
+        assert calls[1][1] == "/v0/app1/tbl1/rec1"
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retries_on_rate_limit(self):
+        """429 responses are retried before succeeding."""
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(1)
+            if len(attempts) < 3:
+                return httpx.Response(429, json={"error": "RATE_LIMIT"})
+            return httpx.Response(200, json={"id": "rec1", "fields": {}})
+
+        transport = make_transport(handler, max_retries=3)
+        record = await transport.get_record("app1", "tbl1", "rec1")
+
+        assert record["id"] == "rec1"
+        assert len(attempts) == 3
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_error_carries_status_code(self):
+        """Non-retryable errors raise with the HTTP status code."""
+        transport = make_transport(
+            lambda request: httpx.Response(422, json={"error": "INVALID"})
+        )
+
+        with pytest.raises(AirtableTransportError) as exc_info:
+            await transport.create_record("app1", "tbl1", {"Name": "A"})
+
+        assert exc_info.value.status_code == 422
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_table_schema_by_id_or_name(self):
+        """Schema lookup matches tables by ID or name from the meta API."""
+        tables = {"tables": [{"id": "tbl1", "name": "Participants", "fields": []}]}
+        transport = make_transport(lambda request: httpx.Response(200, json=tables))
+
+        assert (await transport.get_table_schema("app1", "tbl1"))["id"] == "tbl1"
+        assert (await transport.get_table_schema("app1", "Participants"))[
+            "id"
+        ] == "tbl1"
+        with pytest.raises(AirtableTransportError):
+            await transport.get_table_schema("app1", "Missing")
+        await transport.aclose()
+
+    def test_http2_falls_back_without_h2(self):
+        """HTTP/2 is only enabled when the h2 package is installed."""
+        with patch(
+            "src.data.airtable.airtable_transport.is_http2_available",
+            return_value=False,
+        ):
+            transport = AirtableAsyncTransport(api_key="key", http2=True)
+
+        assert transport.http2 is False
+
+
+class TestAirtableClientWithTransport:
+    """Test suite for AirtableClient routing calls through the async transport."""
+
+    @pytest.fixture
+    def config(self):
+        return AirtableConfig(
+            api_key="test_key",
+            base_id="app1",
+            table_name="Participants",
+            table_id="tbl1",
+            rate_limit_per_second=100,
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_records_uses_transport(self, config):
+        """The client bypasses pyairtable when a transport is supplied."""
+        transport = make_transport(
+            lambda request: httpx.Response(200, json={"records": [{"id": "rec1"}]})
+        )
+        client = AirtableClient(config, transport=transport)
+
+        records = await client.list_records(max_records=1)
+
+        assert records == [{"id": "rec1"}]
+        assert client._table is None
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_records_follows_offsets(self, config):
+        """Streaming over the transport requests pages by offset."""
+        offsets = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = json.loads(request.content).get("offset")
+            offsets.append(offset)
+            if offset is None:
+                return httpx.Response(
+                    200, json={"records": [{"id": "rec1"}], "offset": "p2"}
+                )
+            return httpx.Response(200, json={"records": [{"id": "rec2"}]})
+
+        transport = make_transport(handler)
+        client = AirtableClient(config, transport=transport)
+
+        records = [record async for record in client.stream_records(page_size=1)]
+
+        assert [r["id"] for r in records] == ["rec1", "rec2"]
+        assert offsets == [None, "p2"]
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_errors_wrapped_with_status_code(self, config):
+        """Transport errors surface as AirtableAPIError with the status code."""
+        transport = make_transport(lambda request: httpx.Response(403, json={}))
+        client = AirtableClient(config, transport=transport)
+
+        with pytest.raises(AirtableAPIError) as exc_info:
+            await client.update_record("rec1", {"FullNameRU": "A"})
+
+        assert exc_info.value.status_code == 403
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_shared_transport_across_tables(self):
+        """Clients for different tables of the same base share one pool."""
+        participants = AirtableConfig(
+            api_key="key", base_id="app1", table_id="tbl1", use_async_transport=True
+        )
+        roe = AirtableConfig(
+            api_key="key", base_id="app1", table_id="tbl2", use_async_transport=True
+        )
+
+        try:
+            assert (
+                AirtableClient(participants).transport is AirtableClient(roe).transport
+            )
+            assert get_shared_transport(roe) is AirtableClient(roe).transport
+        finally:
+            await close_shared_transports()
+
+    def test_transport_disabled_by_default(self, config):
+        """Without opting in, the client keeps using pyairtable."""
+        assert AirtableClient(config).transport is None
@@ -1,6 +1,13 @@
 """Tests for Airtable formula utility helpers."""
 
-from src.data.airtable.formula_utils import escape_formula_value, prepare_formula_value
+from datetime import datetime, timedelta, timezone
+
+from src.data.airtable.formula_utils import (
+    build_modified_since_formula,
+    build_record_id_formulas,
+    escape_formula_value,
+    prepare_formula_value,
+)
 from src.models.participant import Role
 
 
@@ -34,3 +41,30 @@ class TestPrepareFormulaValue:
         should_quote, value = prepare_formula_value(42)
         assert should_quote is False
         assert value == 42
+
+
+class TestBuildRecordIdFormulas:
+    """Test batched record ID lookup formulas."""
+
+    def test_chunks_ids_into_or_formulas(self):
+        formulas = build_record_id_formulas(["rec1", "rec2", "rec3"], batch_size=2)
+
+        assert formulas == [
+            "OR(RECORD_ID()='rec1',RECORD_ID()='rec2')",
+            "OR(RECORD_ID()='rec3')",
+        ]
+
+    def test_no_ids_no_formulas(self):
+        assert build_record_id_formulas([]) == []
+
+
+class TestBuildModifiedSinceFormula:
+    """Test LAST_MODIFIED_TIME watermark formulas."""
+
+    def test_watermark_converted_to_utc(self):
+        since = datetime(2025, 1, 2, 5, 30, 15, tzinfo=timezone(timedelta(hours=3)))
+
+        assert build_modified_since_formula(since) == (
+            "IS_AFTER(LAST_MODIFIED_TIME(), "
+            "DATETIME_PARSE('2025-01-02T02:30:15.000Z'))"
+        )
@@ -278,9 +278,12 @@ class TestNotificationSchedulerIntegration:
             patch("src.main.StatisticsService") as mock_stats_service,
             patch("src.main.DailyNotificationService") as mock_notif_service,
             patch("src.main.NotificationScheduler") as mock_scheduler_class,
+            patch("src.main.get_security_audit_service") as mock_audit_service,
         ):
             # Reset cached settings to ensure fresh configuration
             reset_settings()
+            mock_audit_service.return_value.start = AsyncMock()
+            mock_audit_service.return_value.stop = AsyncMock()
 
             # Setup mocks
             mock_builder = Mock()
@@ -290,6 +293,7 @@ class TestNotificationSchedulerIntegration:
             mock_app.bot_data = {}
             mock_app.add_handler = Mock()
             mock_app.post_init = None  # Will be set by create_application
+            mock_app.post_stop = None
             mock_builder.build.return_value = mock_app
             mock_app_builder.return_value = mock_builder
 
@@ -302,6 +306,7 @@ class TestNotificationSchedulerIntegration:
 
             # Assert post_init was set
             assert app.post_init is not None
+            assert app.post_stop is not None
 
             # Simulate calling post_init
             await app.post_init(app)
@@ -312,6 +317,11 @@ class TestNotificationSchedulerIntegration:
             mock_notif_service.assert_called_once()
             mock_scheduler_class.assert_called_once()
             mock_scheduler.schedule_daily_notification.assert_called_once()
+            mock_audit_service.return_value.start.assert_awaited_once()
+
+            # Buffered audit events are written on stop
+            await app.post_stop(app)
+            mock_audit_service.return_value.stop.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_post_init_skips_scheduler_when_disabled(self):
@@ -335,7 +345,10 @@ class TestNotificationSchedulerIntegration:
             patch("src.main.StatisticsService") as mock_stats_service,
             patch("src.main.DailyNotificationService") as mock_notif_service,
             patch("src.main.NotificationScheduler") as mock_scheduler_class,
+            patch("src.main.get_security_audit_service") as mock_audit_service,
         ):
+            mock_audit_service.return_value.start = AsyncMock()
+
             # Setup mocks
             mock_builder = Mock()
             mock_builder.token.return_value = mock_builder
@@ -387,9 +400,11 @@ class TestNotificationSchedulerIntegration:
                 "src.main.get_participant_repository",
                 side_effect=Exception("Repository error"),
             ),
+            patch("src.main.get_security_audit_service") as mock_audit_service,
         ):
             # Reset cached settings to ensure fresh configuration
             reset_settings()
+            mock_audit_service.return_value.start = AsyncMock()
 
             # Setup mocks
             mock_builder = Mock()
@@ -38,6 +38,12 @@ def mock_bible_readers_repository():
 def mock_participant_repository():
     """Create a mock participant repository."""
     repo = AsyncMock(spec=ParticipantRepository)
+
+    async def get_by_ids(record_ids):
+        # Resolve batches through get_by_id like the base implementation
+        return await ParticipantRepository.get_by_ids(repo, record_ids)
+
+    repo.get_by_ids.side_effect = get_by_ids
     return repo
 
 
@@ -0,0 +1,235 @@
+"""
+Tests for concurrent orchestration of table exports.
+
+Covers concurrent execution within the concurrency cap, combined progress,
+failure handling and packing the results into one archive.
+"""
+
+import asyncio
+import zipfile
+
+import pytest
+
+from src.services.export_orchestrator import ExportOrchestrator
+from src.utils.export_utils import CSVExportFile
+
+
+def make_job(text, started=None, release=None, progress=None):
+    async def job(report):
+        if started is not None:
+            started.append(text)
+        if progress is not None:
+            report(*progress)
+        if release is not None:
+            await release.wait()
+        return CSVExportFile.from_text(text)
+
+    return job
+
+
+class TestConcurrentExecution:
+    """Table exports run at the same time within the concurrency cap."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_concurrently(self):
+        """Test every job starts before any of them finishes."""
+        started = []
+        release = asyncio.Event()
+        orchestrator = ExportOrchestrator(
+            {
+                "a.csv": make_job("#,A\n1,a\n", started, release),
+                "b.csv": make_job("#,B\n1,b\n", started, release),
+            }
+        )
+
+        run = asyncio.ensure_future(orchestrator.run())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(started) == 2
+
+        release.set()
+        exports = await run
+        assert list(exports) == ["a.csv", "b.csv"]
+        for export in exports.values():
+            export.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """Test a cap of one runs the jobs one after another."""
+        started = []
+        release = asyncio.Event()
+        orchestrator = ExportOrchestrator(
+            {
+                "a.csv": make_job("#,A\n1,a\n", started, release),
+                "b.csv": make_job("#,B\n1,b\n", started, release),
+            },
+            max_concurrency=1,
+        )
+
+        run = asyncio.ensure_future(orchestrator.run())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(started) == 1
+
+        release.set()
+        for export in (await run).values():
+            export.close()
+
+    @pytest.mark.asyncio
+    async def test_fast_table_kept_while_slow_one_runs(self):
+        """Test results are kept in job order even when finished out of order."""
+        release = asyncio.Event()
+        orchestrator = ExportOrchestrator(
+            {
+                "slow.csv": make_job("#,S\n1,s\n", release=release),
+                "fast.csv": make_job("#,F\n1,f\n"),
+            }
+        )
+
+        run = asyncio.ensure_future(orchestrator.run())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert "fast.csv" in orchestrator.durations
+        assert "slow.csv" not in orchestrator.durations
+
+        release.set()
+        exports = await run
+        assert list(exports) == ["slow.csv", "fast.csv"]
+        for export in exports.values():
+            export.close()
+
+
+class TestProgressAndResults:
+    """Combined progress and result handling."""
+
+    @pytest.mark.asyncio
+    async def test_combined_progress(self):
+        """Test progress is summed across tables."""
+        updates = []
+        orchestrator = ExportOrchestrator(
+            {
+                "a.csv": make_job("#,A\n1,a\n", progress=(10, 20)),
+                "b.csv": make_job("#,B\n1,b\n", progress=(5, 5)),
+            },
+            progress_callback=lambda current, total: updates.append((current, total)),
+        )
+
+        for export in (await orchestrator.run()).values():
+            export.close()
+
+        assert updates[-1] == (15, 25)
+
+    @pytest.mark.asyncio
+    async def test_unknown_total_keeps_combined_total_unknown(self):
+        """Test a table streaming without a total never yields over 100%."""
+        updates = []
+        release = asyncio.Event()
+
+        async def participants(report):
+            for current in (50, 100, 120):
+                report(current, 0)
+                await asyncio.sleep(0)
+            await release.wait()
+            report(120, 120)
+            return CSVExportFile.from_text("#,A\n1,a\n")
+
+        orchestrator = ExportOrchestrator(
+            {
+                "participants.csv": participants,
+                "roe.csv": make_job("#,B\n1,b\n", progress=(20, 20)),
+            },
+            progress_callback=lambda current, total: updates.append((current, total)),
+        )
+
+        run = asyncio.ensure_future(orchestrator.run())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        release.set()
+        for export in (await run).values():
+            export.close()
+
+        assert all(current <= total for current, total in updates if total)
+        assert (140, 0) in updates
+        assert updates[-1] == (140, 140)
+
+    @pytest.mark.asyncio
+    async def test_finished_empty_table_does_not_hide_total(self):
+        """Test a finished table without rows counts as a known total."""
+        updates = []
+        release = asyncio.Event()
+
+        async def roe(report):
+            await release.wait()
+            report(5, 10)
+            return CSVExportFile.from_text("#,B\n1,b\n")
+
+        orchestrator = ExportOrchestrator(
+            {"empty.csv": make_job("#,A\n", progress=(0, 0)), "roe.csv": roe},
+            progress_callback=lambda current, total: updates.append((current, total)),
+        )
+
+        run = asyncio.ensure_future(orchestrator.run())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        release.set()
+        for export in (await run).values():
+            export.close()
+
+        assert updates[-1] == (5, 10)
+
+    @pytest.mark.asyncio
+    async def test_string_results_are_wrapped(self):
+        """Test exports returning CSV strings become export files."""
+
+        async def job(report):
+            return "#,Name\n1,Иван\n"
+
+        orchestrator = ExportOrchestrator({"roe.csv": job})
+
+        exports = await orchestrator.run()
+        with exports["roe.csv"] as export:
+            assert export.row_count == 1
+            assert export.read_text() == "#,Name\n1,Иван\n"
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_others_and_closes_files(self):
+        """Test one failing table cancels the rest and releases finished files."""
+        finished = []
+        never = asyncio.Event()
+
+        async def fast(report):
+            export = CSVExportFile.from_text("#,A\n1,a\n")
+            finished.append(export)
+            return export
+
+        async def failing(report):
+            await asyncio.sleep(0)
+            raise RuntimeError("Airtable unavailable")
+
+        orchestrator = ExportOrchestrator(
+            {
+                "fast.csv": fast,
+                "failing.csv": failing,
+                "slow.csv": make_job("#,S\n1,s\n", release=never),
+            }
+        )
+
+        with pytest.raises(RuntimeError, match="Airtable unavailable"):
+            await orchestrator.run()
+
+        assert finished[0].file.closed
+
+    @pytest.mark.asyncio
+    async def test_zip_with_row_count_of_one_table(self):
+        """Test the archive holds every table and the chosen row count."""
+        orchestrator = ExportOrchestrator(
+            {
+                "participants.csv": make_job("#,Name\n1,Иван\n2,Мария\n"),
+                "roe.csv": make_job("#,Topic\n1,Любовь\n"),
+            }
+        )
+
+        with await orchestrator.run_as_zip(count_from="participants.csv") as export:
+            assert export.row_count == 2
+            with zipfile.ZipFile(export.file) as archive:
+                assert archive.namelist() == ["participants.csv", "roe.csv"]
@@ -6,7 +6,9 @@ log file creation, and persistent logging infrastructure.
 """
 
 import logging
+import logging.handlers
 import os
+import queue
 import shutil
 import tempfile
 from pathlib import Path
@@ -14,7 +16,11 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.services.file_logging_service import FileLoggingConfig, FileLoggingService
+from src.services.file_logging_service import (
+    BoundedQueueHandler,
+    FileLoggingConfig,
+    FileLoggingService,
+)
 
 
 @pytest.fixture
@@ -280,3 +286,88 @@ class TestFileLoggingServiceErrorHandling:
                 pytest.fail(
                     f"Logging system failure should not crash the application: {e}"
                 )
+
+
+class TestQueuedFileHandlers:
+    """Records are written by one writer thread per log category."""
+
+    def test_loggers_share_one_queued_handler_per_category(self, basic_config):
+        service = FileLoggingService(basic_config)
+        try:
+            first = service.get_application_logger("queued_first")
+            second = service.get_application_logger("queued_second")
+            errors = service.get_error_logger("queued_errors")
+
+            assert isinstance(first.handlers[0], BoundedQueueHandler)
+            assert first.handlers[0] is second.handlers[0]
+            assert errors.handlers[0] is not first.handlers[0]
+        finally:
+            service.close()
+
+    def test_close_writes_queued_records(self, basic_config):
+        service = FileLoggingService(basic_config)
+        logger = service.get_application_logger("queued_close")
+        logger.setLevel(logging.INFO)
+
+        for index in range(100):
+            logger.info(f"Queued message {index}")
+        service.close()
+
+        content = (basic_config.log_dir / "application" / "app.log").read_text()
+        assert "Queued message 0" in content
+        assert "Queued message 99" in content
+        assert logger.handlers == []
+
+    def test_zero_queue_size_writes_directly(self, temp_log_dir):
+        config = FileLoggingConfig(log_dir=temp_log_dir, queue_size=0)
+        service = FileLoggingService(config)
+        try:
+            logger = service.get_application_logger("queued_direct")
+
+            assert isinstance(logger.handlers[0], logging.handlers.RotatingFileHandler)
+        finally:
+            service.close()
+
+
+class TestBoundedQueueHandler:
+    """A filling queue drops debug, then info records before warnings."""
+
+    @staticmethod
+    def record(level: int) -> logging.LogRecord:
+        return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+    def test_debug_dropped_before_info_above_half_full(self):
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(8)
+        handler = BoundedQueueHandler(log_queue, "application")
+
+        for _ in range(4):
+            handler.handle(self.record(logging.INFO))
+        handler.handle(self.record(logging.DEBUG))
+        handler.handle(self.record(logging.INFO))
+
+        assert log_queue.qsize() == 5
+        assert handler.dropped == 1
+        assert log_queue.queue[-1].levelno == logging.INFO
+
+    def test_info_dropped_above_high_water_mark(self):
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(8)
+        handler = BoundedQueueHandler(log_queue, "application")
+
+        for _ in range(7):
+            handler.handle(self.record(logging.INFO))
+        handler.handle(self.record(logging.INFO))
+        handler.handle(self.record(logging.WARNING))
+
+        assert log_queue.qsize() == 8
+        assert handler.dropped == 1
+        assert log_queue.queue[-1].levelno == logging.WARNING
+
+    def test_any_record_dropped_when_full(self):
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(2)
+        handler = BoundedQueueHandler(log_queue, "errors")
+
+        for _ in range(3):
+            handler.handle(self.record(logging.ERROR))
+
+        assert log_queue.qsize() == 2
+        assert handler.dropped == 1
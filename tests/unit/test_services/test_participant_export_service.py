@@ -12,7 +12,8 @@ Tests the CSV export functionality including:
 import csv
 import io
 import tempfile
-from datetime import date, datetime
+import zipfile
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
@@ -34,12 +35,30 @@ from src.models.participant import (
     Size,
 )
 from src.services.participant_export_service import ParticipantExportService
+from src.utils.columnar_export import ExportFormat
+from src.utils.export_artifact_cache import ExportArtifactCache
+from src.utils.export_size_estimator import ExportSizeEstimator
+from src.utils.export_watermarks import ExportWatermarkStore
 
 
 @pytest.fixture
 def mock_repository():
-    """Create a mock participant repository."""
+    """
+    Create a mock participant repository.
+
+    Like the repository defaults, streaming reads ``list_all``, the count is
+    its length and no count is known without a read, so tests only set
+    ``list_all.return_value``.
+    """
     repo = AsyncMock(spec=ParticipantRepository)
+    repo.peek_count.return_value = None
+
+    async def stream_all(page_size=None, prefetch=True):
+        for participant in await repo.list_all():
+            yield participant
+
+    repo.stream_all = stream_all
+    repo.count_total.side_effect = lambda: len(repo.list_all.return_value)
     return repo
 
 
@@ -348,6 +367,168 @@ class TestGetAllParticipantsAsCSV:
         assert "Database connection failed" in str(exc_info.value)
 
 
+class TestExportToFile:
+    """Test exports written straight into spooled CSV files."""
+
+    @pytest.mark.asyncio
+    async def test_file_export_matches_csv_string(
+        self, export_service, mock_repository, sample_participants
+    ):
+        """Test the file export carries the CSV content, row count and size."""
+        mock_repository.list_all.return_value = sample_participants
+
+        csv_string = await export_service.get_all_participants_as_csv()
+        with await export_service.get_all_participants_as_file() as export:
+            data = export.file.read()
+
+            assert export.row_count == 2
+            assert export.byte_size == len(data)
+            assert data == csv_string.encode("utf-8-sig")
+
+    @pytest.mark.asyncio
+    async def test_view_export_to_file(self, export_service, mock_repository):
+        """Test view-based exports keep the view column order in the file."""
+        mock_repository.list_view_records.return_value = [
+            {
+                "id": "rec1",
+                "fields": {
+                    "FullNameRU": "Иванов Иван",
+                    "Role": "TEAM",
+                    "Department": "Kitchen",
+                },
+            }
+        ]
+
+        with await export_service.get_participants_by_department_as_file(
+            Department.KITCHEN
+        ) as export:
+            lines = export.read_text().splitlines()
+
+        assert export.row_count == 1
+        assert lines[0] == "#,FullNameRU,Role,Department"
+        assert lines[1] == "1,Иванов Иван,TEAM,Kitchen"
+
+    @pytest.mark.asyncio
+    async def test_xlsx_export_uses_service_format(
+        self, mock_repository, sample_participants
+    ):
+        """Test the service's default format applies to file exports only."""
+        mock_repository.list_all.return_value = sample_participants
+        service = ParticipantExportService(
+            mock_repository, export_format=ExportFormat.XLSX
+        )
+
+        with await service.get_all_participants_as_file() as export:
+            assert export.extension == "xlsx"
+            assert export.row_count == 2
+            with zipfile.ZipFile(export.file) as archive:
+                assert "xl/worksheets/sheet1.xml" in archive.namelist()
+
+        csv_string = await service.get_all_participants_as_csv()
+        assert csv_string.startswith("#,")
+
+
+class TestExportArtifactCaching:
+    """Test reuse of rendered exports through the artifact cache."""
+
+    @pytest.fixture
+    def artifact_cache(self, tmp_path):
+        cache = ExportArtifactCache(directory=tmp_path)
+        yield cache
+        cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_same_version_reuses_rendered_file(
+        self, mock_repository, sample_participants, artifact_cache
+    ):
+        """Test a second export of unchanged data skips the Airtable pull."""
+        mock_repository.list_all.return_value = sample_participants
+        mock_repository.get_data_version.return_value = 7
+        service = ParticipantExportService(
+            mock_repository, artifact_cache=artifact_cache
+        )
+
+        with await service.get_all_participants_as_file() as first:
+            first_text = first.read_text()
+        with await service.get_all_participants_as_file() as second:
+            assert second.read_text() == first_text
+            assert second.digest == first.digest
+
+        mock_repository.list_all.assert_awaited_once()
+        mock_repository.has_changes_since.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_new_version_renders_again(
+        self, mock_repository, sample_participants, artifact_cache
+    ):
+        """Test a changed data version invalidates the cached export."""
+        mock_repository.list_all.return_value = sample_participants
+        mock_repository.get_data_version.side_effect = [1, 2]
+        service = ParticipantExportService(
+            mock_repository, artifact_cache=artifact_cache
+        )
+
+        (await service.get_all_participants_as_file()).close()
+        (await service.get_all_participants_as_file()).close()
+
+        assert mock_repository.list_all.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unversioned_reuse_checks_for_changes(
+        self, mock_repository, sample_participants, artifact_cache
+    ):
+        """Test exports without a data version ask the repository for changes."""
+        mock_repository.list_all.return_value = sample_participants
+        mock_repository.list_view_records.return_value = []
+        mock_repository.get_data_version.return_value = None
+        mock_repository.has_changes_since.side_effect = [False, True]
+        service = ParticipantExportService(
+            mock_repository, artifact_cache=artifact_cache
+        )
+
+        for _ in range(3):
+            (await service.get_participants_by_role_as_file(Role.TEAM)).close()
+
+        assert mock_repository.list_view_records.await_count == 2
+        assert mock_repository.has_changes_since.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exports_are_keyed_by_filter(
+        self, mock_repository, sample_participants, artifact_cache
+    ):
+        """Test different departments are cached separately."""
+        mock_repository.list_view_records.return_value = []
+        mock_repository.get_data_version.return_value = 1
+        service = ParticipantExportService(
+            mock_repository, artifact_cache=artifact_cache
+        )
+
+        for department in (Department.KITCHEN, Department.WORSHIP, Department.KITCHEN):
+            (await service.get_participants_by_department_as_file(department)).close()
+
+        assert mock_repository.list_view_records.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exports_are_keyed_by_format(
+        self, mock_repository, sample_participants, artifact_cache
+    ):
+        """Test CSV and XLSX renderings of the same data are cached separately."""
+        mock_repository.list_all.return_value = sample_participants
+        mock_repository.get_data_version.return_value = 1
+        service = ParticipantExportService(
+            mock_repository, artifact_cache=artifact_cache
+        )
+
+        with await service.get_all_participants_as_file() as csv_export:
+            assert csv_export.extension == "csv"
+        with await service.get_all_participants_as_file(ExportFormat.XLSX) as xlsx:
+            assert xlsx.extension == "xlsx"
+        with await service.get_all_participants_as_file(ExportFormat.XLSX) as xlsx:
+            assert xlsx.extension == "xlsx"
+
+        assert mock_repository.list_all.await_count == 2
+
+
 class TestSaveToFile:
     """Test save_to_file method."""
 
@@ -376,6 +557,24 @@ class TestSaveToFile:
         # Cleanup
         Path(file_path).unlink()
 
+    @pytest.mark.asyncio
+    async def test_save_csv_with_other_export_format(
+        self, mock_repository, sample_participants
+    ):
+        """Test the saved .csv file is CSV even when XLSX is configured."""
+        mock_repository.list_all.return_value = sample_participants
+        service = ParticipantExportService(
+            repository=mock_repository, export_format=ExportFormat.XLSX
+        )
+
+        file_path = await service.save_to_file()
+        try:
+            assert file_path.endswith(".csv")
+            content = Path(file_path).read_text(encoding="utf-8-sig")
+            assert content.startswith("#,")
+        finally:
+            Path(file_path).unlink()
+
     @pytest.mark.asyncio
     async def test_save_with_custom_filename(
         self, export_service, mock_repository, sample_participants
@@ -435,7 +634,7 @@ class TestFileSizeEstimation:
         """Test file size estimation before generation."""
         # Arrange
         mock_repository.list_all.return_value = sample_participants
-        mock_repository.count_total.return_value = len(sample_participants)
+        mock_repository.count_total = AsyncMock(return_value=len(sample_participants))
 
         # Act
         estimated_size = await export_service.estimate_file_size()
@@ -451,7 +650,7 @@ class TestFileSizeEstimation:
     async def test_estimate_large_file_size(self, export_service, mock_repository):
         """Test file size estimation for large datasets."""
         # Arrange
-        mock_repository.count_total.return_value = 10000
+        mock_repository.count_total = AsyncMock(return_value=10000)
 
         # Act
         estimated_size = await export_service.estimate_file_size()
@@ -465,7 +664,7 @@ class TestFileSizeEstimation:
     async def test_check_telegram_limit(self, export_service, mock_repository):
         """Test checking if file exceeds Telegram's limit."""
         # Arrange
-        mock_repository.count_total.return_value = 100  # Small dataset
+        mock_repository.count_total = AsyncMock(return_value=100)  # Small dataset
 
         # Act
         is_within_limit = await export_service.is_within_telegram_limit()
@@ -477,7 +676,7 @@ class TestFileSizeEstimation:
     async def test_check_telegram_limit_exceeded(self, export_service, mock_repository):
         """Test detection of files exceeding Telegram's limit."""
         # Arrange
-        mock_repository.count_total.return_value = 1000000  # Huge dataset
+        mock_repository.count_total = AsyncMock(return_value=1000000)  # Huge dataset
 
         # Act
         is_within_limit = await export_service.is_within_telegram_limit()
@@ -485,6 +684,197 @@ class TestFileSizeEstimation:
         # Assert
         assert is_within_limit is False
 
+    @pytest.mark.asyncio
+    async def test_estimate_from_sampled_rows(
+        self, export_service, mock_repository, sample_participants
+    ):
+        """Test a short first page is measured without counting the table."""
+        pages = []
+
+        async def stream_all(page_size=None, prefetch=True):
+            pages.append((page_size, prefetch))
+            for participant in sample_participants:
+                yield participant
+
+        mock_repository.stream_all = stream_all
+        mock_repository.list_all.return_value = sample_participants
+
+        estimated_size = await export_service.estimate_file_size()
+        assert pages == [(ParticipantExportService.SIZE_SAMPLE_ROWS, False)]
+        mock_repository.count_total.assert_not_awaited()
+
+        with await export_service.get_all_participants_as_file() as export:
+            actual_size = export.byte_size
+
+        assert estimated_size == actual_size
+
+    @pytest.mark.asyncio
+    async def test_estimate_projects_sample_onto_count(
+        self, export_service, mock_repository, sample_participants
+    ):
+        """Test a full sample is projected onto the record count."""
+        closed = []
+
+        async def stream_all(page_size=None, prefetch=True):
+            try:
+                for _ in range(1000):
+                    yield sample_participants[0]
+            finally:
+                closed.append(True)
+
+        mock_repository.stream_all = stream_all
+        mock_repository.count_total = AsyncMock(return_value=200)
+
+        export_service.SIZE_SAMPLE_ROWS = 100
+        small = await export_service.estimate_file_size()
+
+        with export_service._write_participants(
+            [sample_participants[0]] * 200, report=False
+        ) as export:
+            assert small == export.byte_size
+        mock_repository.count_total.assert_awaited_once()
+        # The sample stream is closed as soon as the sample is complete
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_rendered_export_replaces_estimate(
+        self, export_service, mock_repository, sample_participants
+    ):
+        """Test estimates after an export use its size without sampling."""
+        mock_repository.list_all.return_value = sample_participants
+        mock_repository.count_total = AsyncMock(return_value=1000000)
+        export_service.SIZE_SAMPLE_ROWS = 1
+
+        assert await export_service.is_within_telegram_limit() is False
+        mock_repository.count_total.assert_awaited_once()
+
+        mock_repository.count_total.reset_mock()
+        with await export_service.get_all_participants_as_file() as export:
+            actual_size = export.byte_size
+
+        assert await export_service.estimate_file_size() == actual_size
+        assert await export_service.is_within_telegram_limit() is True
+        mock_repository.count_total.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_estimate_reuses_exported_row_count(
+        self, export_service, mock_repository, sample_participants
+    ):
+        """Test resampling after an export takes its row count, not a count."""
+        mock_repository.list_all.return_value = sample_participants
+        export_service.size_estimator = ExportSizeEstimator(max_age_seconds=0)
+        export_service.SIZE_SAMPLE_ROWS = 1
+
+        with await export_service.get_all_participants_as_file():
+            pass
+
+        assert await export_service.estimate_file_size() > 0
+        mock_repository.count_total.assert_not_awaited()
+        assert export_service.size_estimator.last_row_count(
+            ("participants", "all", "csv")
+        ) == len(sample_participants)
+
+    @pytest.mark.asyncio
+    async def test_replica_count_replaces_count(
+        self, export_service, mock_repository, sample_participants
+    ):
+        """Test a count known to the repository is used without a scan."""
+        mock_repository.list_all.return_value = sample_participants
+        mock_repository.peek_count.return_value = 500
+        export_service.SIZE_SAMPLE_ROWS = 1
+
+        await export_service.estimate_file_size()
+
+        mock_repository.count_total.assert_not_awaited()
+        assert (
+            export_service.size_estimator.last_row_count(("participants", "all", "csv"))
+            == 500
+        )
+
+
+class TestDeltaExport:
+    """Test exports of participants changed since the last delta export."""
+
+    SINCE = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def store(self):
+        return ExportWatermarkStore()
+
+    @pytest.fixture
+    def delta_service(self, mock_repository, store):
+        return ParticipantExportService(
+            repository=mock_repository, watermark_store=store
+        )
+
+    @staticmethod
+    def read_rows(delta) -> List[Dict[str, str]]:
+        with delta.export as export:
+            return list(csv.DictReader(io.StringIO(export.read_text())))
+
+    @pytest.mark.asyncio
+    async def test_first_export_contains_everyone(
+        self, delta_service, mock_repository, sample_participants
+    ):
+        """A scope without watermark gets every participant as created."""
+        mock_repository.list_all.return_value = sample_participants
+
+        delta = await delta_service.get_changed_participants_as_file("user:1")
+
+        rows = self.read_rows(delta)
+        assert delta.since is None
+        assert (delta.created, delta.updated) == (2, 0)
+        assert [row["ChangeType"] for row in rows] == ["created", "created"]
+        assert rows[0]["FullNameRU"] == "Иванов Иван Иванович"
+        assert list(rows[0])[:2] == ["#", "ChangeType"]
+        mock_repository.list_modified_since.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changes_classified_by_created_time(
+        self, delta_service, mock_repository, sample_participants, store
+    ):
+        """Only changed records are read and tagged created or updated."""
+        store.set("user:1", self.SINCE)
+        new_record = {
+            "id": "rec001",
+            "createdTime": "2025-03-02T08:00:00.000Z",
+            "fields": sample_participants[0].to_airtable_fields(),
+        }
+        old_record = {
+            "id": "rec002",
+            "createdTime": "2025-01-10T08:00:00.000Z",
+            "fields": sample_participants[1].to_airtable_fields(),
+        }
+        mock_repository.list_modified_since.return_value = [new_record, old_record]
+
+        delta = await delta_service.get_changed_participants_as_file("user:1")
+
+        mock_repository.list_modified_since.assert_awaited_once_with(self.SINCE)
+        mock_repository.list_all.assert_not_called()
+        rows = self.read_rows(delta)
+        assert [row["ChangeType"] for row in rows] == ["created", "updated"]
+        assert [row["FullNameRU"] for row in rows] == [
+            "Иванов Иван Иванович",
+            "Петрова Мария Сергеевна",
+        ]
+        assert (delta.created, delta.updated) == (1, 1)
+        assert delta.since == self.SINCE
+
+    @pytest.mark.asyncio
+    async def test_watermark_advanced_only_when_marked(
+        self, delta_service, mock_repository, store
+    ):
+        """The watermark moves only after the delta was delivered."""
+        mock_repository.list_all.return_value = []
+
+        delta = await delta_service.get_changed_participants_as_file("user:1")
+        delta.export.close()
+        assert store.get("user:1") is None
+
+        delta_service.mark_changes_exported("user:1", delta)
+        assert store.get("user:1") == delta.watermark
+        assert delta.watermark <= datetime.now(timezone.utc)
+
 
 class TestProgressTracking:
     """Test progress tracking functionality."""
@@ -517,9 +907,169 @@ class TestProgressTracking:
 
         # Assert
         assert len(progress_calls) > 0
-        # Should report progress at intervals
-        assert progress_calls[0] == (0, 100)
-        assert progress_calls[-1][0] == 100  # Completed all
+        # Should report progress at intervals, without counting first
+        assert progress_calls[0] == (0, 0)
+        assert progress_calls[1] == (10, 0)
+        assert progress_calls[-1] == (100, 100)  # Completed all
+        mock_repository.count_total.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_no_completed_progress_before_stream_ends(self, mock_repository):
+        """Test an unknown total is reported as 0 until the stream ends."""
+        participants = [Participant(full_name_ru=f"Тест {i}") for i in range(25)]
+        progress_calls = []
+        streamed = []
+
+        async def stream_all(page_size=None, prefetch=True):
+            for participant in participants:
+                streamed.append(participant)
+                yield participant
+
+        mock_repository.stream_all = stream_all
+        mock_repository.peek_count.return_value = None
+        service = ParticipantExportService(
+            repository=mock_repository,
+            progress_callback=lambda current, total: progress_calls.append(
+                (current, total, len(streamed))
+            ),
+        )
+
+        with await service.get_all_participants_as_file() as export:
+            assert export.row_count == 25
+
+        # The only completed progress comes after the last participant
+        assert progress_calls == [(0, 0, 0), (10, 0, 10), (20, 0, 20), (25, 25, 25)]
+
+    @pytest.mark.asyncio
+    async def test_export_streams_rows_with_progress(self, mock_repository):
+        """Test rows are written while streaming, reporting every 10 rows."""
+        participants = [
+            Participant(full_name_ru=f"Тест {i}", role=Role.CANDIDATE)
+            for i in range(25)
+        ]
+        progress_calls = []
+
+        async def stream_all(page_size=None, prefetch=True):
+            for participant in participants:
+                yield participant
+
+        mock_repository.stream_all = stream_all
+        mock_repository.peek_count.return_value = 25
+        service = ParticipantExportService(
+            repository=mock_repository,
+            progress_callback=lambda current, total: progress_calls.append(
+                (current, total)
+            ),
+        )
+
+        csv_data = await service.get_all_participants_as_csv()
+
+        rows = list(csv.DictReader(io.StringIO(csv_data)))
+        assert [row["#"] for row in rows[:2]] == [" 1", " 2"]
+        assert rows[-1]["FullNameRU"] == "Тест 24"
+        assert progress_calls == [(0, 25), (10, 25), (20, 25), (25, 25)]
+        mock_repository.list_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_progress_completes_when_count_is_stale(self, mock_repository):
+        """Test the final progress uses the streamed rows, not the count."""
+        mock_repository.list_all.return_value = [
+            Participant(full_name_ru=f"Тест {i}") for i in range(3)
+        ]
+        mock_repository.peek_count.return_value = 5
+        progress_calls = []
+        service = ParticipantExportService(
+            repository=mock_repository,
+            progress_callback=lambda current, total: progress_calls.append(
+                (current, total)
+            ),
+        )
+
+        with await service.get_all_participants_as_file() as export:
+            assert export.row_count == 3
+
+        assert progress_calls == [(0, 5), (3, 3)]
+
+    @pytest.mark.asyncio
+    async def test_line_numbers_padded_when_count_is_stale(self, mock_repository):
+        """Test line numbers are re-padded when the expected count is off."""
+        mock_repository.list_all.return_value = [
+            Participant(full_name_ru=f"Тест {i}\nвторая строка") for i in range(12)
+        ]
+        mock_repository.peek_count.return_value = 5
+        service = ParticipantExportService(repository=mock_repository)
+
+        with await service.get_all_participants_as_file() as export:
+            assert export.row_count == 12
+            rows = list(csv.DictReader(io.StringIO(export.read_text())))
+
+        assert [row["#"] for row in rows] == [f"{i:>2}" for i in range(1, 13)]
+        assert rows[11]["FullNameRU"] == "Тест 11\nвторая строка"
+        mock_repository.count_total.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_line_number_width_seeded_from_other_format(self, mock_repository):
+        """Test a known row count of another format avoids the padding rewrite."""
+        mock_repository.list_all.return_value = [
+            Participant(full_name_ru=f"Тест {i}") for i in range(12)
+        ]
+        mock_repository.peek_count.return_value = None
+        service = ParticipantExportService(repository=mock_repository)
+        service.size_estimator.record_export(
+            ("participants", "all", "xlsx"), Mock(row_count=12, byte_size=1200)
+        )
+
+        with patch.object(
+            service, "_pad_line_numbers", wraps=service._pad_line_numbers
+        ) as pad:
+            with await service.get_all_participants_as_file(ExportFormat.CSV) as export:
+                rows = list(csv.DictReader(io.StringIO(export.read_text())))
+
+        assert [row["#"] for row in rows[:2]] == [" 1", " 2"]
+        pad.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_line_number_width_seeded_from_sampled_estimate(
+        self, mock_repository
+    ):
+        """Test the row count of a sampled estimate avoids the padding rewrite."""
+        mock_repository.list_all.return_value = [
+            Participant(full_name_ru=f"Тест {i}") for i in range(12)
+        ]
+        service = ParticipantExportService(repository=mock_repository)
+        service.SIZE_SAMPLE_ROWS = 5
+
+        await service.estimate_file_size(ExportFormat.CSV)
+        with patch.object(
+            service, "_pad_line_numbers", wraps=service._pad_line_numbers
+        ) as pad:
+            with await service.get_all_participants_as_file(ExportFormat.CSV) as export:
+                assert export.row_count == 12
+
+        pad.assert_not_called()
+        mock_repository.count_total.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_view_rows_report_progress(self, export_service):
+        """Test view exports report progress while writing rows."""
+        rows = [
+            (
+                make_view_record(f"rec{i}", FullNameRU=f"Тест {i}", Extra=[i, "x"]),
+                Participant(full_name_ru=f"Тест {i}"),
+            )
+            for i in range(12)
+        ]
+        progress_calls = []
+        export_service.progress_callback = lambda current, total: (
+            progress_calls.append((current, total))
+        )
+
+        headers = ["#", "FullNameRU", "Extra"]
+        with export_service._write_view_rows(rows, headers) as export:
+            lines = export.read_text().splitlines()
+
+        assert lines[1] == ' 1,Тест 0,"0, x"'
+        assert progress_calls == [(0, 12), (10, 12), (12, 12)]
 
     @pytest.mark.asyncio
     async def test_export_without_progress_callback(
@@ -539,9 +1089,9 @@ class TestProgressTracking:
 class TestExportToCsvInterface:
     """Test synchronous and asynchronous export entry points."""
 
-    def test_export_to_csv_no_running_loop(self, sample_participants):
+    def test_export_to_csv_no_running_loop(self, mock_repository, sample_participants):
         """Synchronous export succeeds when no loop is active."""
-        repo = AsyncMock(spec=ParticipantRepository)
+        repo = mock_repository
         repo.list_all.return_value = sample_participants
         service = ParticipantExportService(repository=repo)
 
@@ -552,10 +1102,10 @@ class TestExportToCsvInterface:
 
     @pytest.mark.asyncio
     async def test_export_to_csv_raises_with_active_loop(
-        self, sample_participants
+        self, mock_repository, sample_participants
     ) -> None:
         """Sync API signals callers to use coroutine when loop is running."""
-        repo = AsyncMock(spec=ParticipantRepository)
+        repo = mock_repository
         repo.list_all.return_value = sample_participants
         service = ParticipantExportService(repository=repo)
 
@@ -566,9 +1116,11 @@ class TestExportToCsvInterface:
         repo.list_all.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_export_to_csv_async_alias(self, sample_participants) -> None:
+    async def test_export_to_csv_async_alias(
+        self, mock_repository, sample_participants
+    ) -> None:
         """Dedicated async alias mirrors primary coroutine implementation."""
-        repo = AsyncMock(spec=ParticipantRepository)
+        repo = mock_repository
         repo.list_all.return_value = sample_participants
         service = ParticipantExportService(repository=repo)
 
@@ -1068,6 +1620,102 @@ class TestDepartmentBasedFiltering:
         assert len(rows) == 0  # Should return empty result set
 
 
+class TestDepartmentPackets:
+    """Test exporting all departments and roles from one view pull."""
+
+    @pytest.fixture
+    def view_records(self) -> List[Dict[str, Any]]:
+        return [
+            make_view_record(
+                "rec1", FullNameRU="Worship 1", Role="TEAM", Department="Worship"
+            ),
+            make_view_record(
+                "rec2", FullNameRU="Kitchen 1", Role="TEAM", Department="Kitchen"
+            ),
+            make_view_record(
+                "rec3", FullNameRU="Worship 2", Role="CANDIDATE", Department="Worship"
+            ),
+            make_view_record("rec4", FullNameRU="Без отдела", Role="TEAM"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_split_pulls_view_once(self, mock_repository, view_records):
+        """Test every department and role file is built from a single pull."""
+        mock_repository.list_view_records.return_value = view_records
+        service = ParticipantExportService(repository=mock_repository)
+
+        exports, row_count = await service.get_department_exports_as_files()
+
+        mock_repository.list_view_records.assert_awaited_once_with("Тимы")
+        assert row_count == 4
+        assert sorted(exports) == [
+            "departments/Kitchen.csv",
+            "departments/Worship.csv",
+            "roles/CANDIDATE.csv",
+            "roles/TEAM.csv",
+        ]
+        with exports["departments/Worship.csv"] as worship:
+            lines = worship.read_text().splitlines()
+        assert worship.row_count == 2
+        assert lines == [
+            "#,FullNameRU,Role,Department",
+            "1,Worship 1,TEAM,Worship",
+            "2,Worship 2,CANDIDATE,Worship",
+        ]
+        assert exports["roles/TEAM.csv"].row_count == 3
+        for export in exports.values():
+            export.close()
+
+    @pytest.mark.asyncio
+    async def test_department_file_matches_single_export(
+        self, mock_repository, view_records
+    ):
+        """Test a split file equals the single department export."""
+        mock_repository.list_view_records.return_value = view_records
+        service = ParticipantExportService(repository=mock_repository)
+
+        single = await service.get_participants_by_department_as_csv(Department.KITCHEN)
+        exports, _ = await service.get_department_exports_as_files()
+
+        with exports["departments/Kitchen.csv"] as kitchen:
+            assert kitchen.read_text() == single
+
+    @pytest.mark.asyncio
+    async def test_zip_archive(self, mock_repository, view_records):
+        """Test the archive holds every split file."""
+        mock_repository.list_view_records.return_value = view_records
+        service = ParticipantExportService(repository=mock_repository)
+
+        with await service.get_department_packets_as_zip() as export:
+            assert export.row_count == 4
+            assert export.byte_size == len(export.file.read())
+            export.file.seek(0)
+            with zipfile.ZipFile(export.file) as archive:
+                assert "roles/CANDIDATE.csv" in archive.namelist()
+                kitchen = archive.read("departments/Kitchen.csv").decode("utf-8-sig")
+
+        assert kitchen.splitlines()[1] == "1,Kitchen 1,TEAM,Kitchen"
+
+    @pytest.mark.asyncio
+    async def test_split_falls_back_to_list_all(
+        self, mock_repository, sample_participants
+    ):
+        """Test a missing view splits list_all() participants instead."""
+        view_error = AirtableAPIError("View 'Тимы' not found", status_code=422)
+        mock_repository.list_view_records.side_effect = RepositoryError(
+            "View lookup failed", original_error=view_error
+        )
+        mock_repository.list_all.return_value = sample_participants
+        service = ParticipantExportService(repository=mock_repository)
+
+        exports, row_count = await service.get_department_exports_as_files()
+
+        assert row_count == len(sample_participants)
+        assert all(export.row_count >= 1 for export in exports.values())
+        for export in exports.values():
+            export.close()
+
+
 class TestLineNumberIntegration:
     """Test line number integration with ParticipantExportService."""
 
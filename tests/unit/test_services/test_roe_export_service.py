@@ -39,6 +39,12 @@ def mock_roe_repository():
 def mock_participant_repository():
     """Create a mock participant repository."""
     repo = AsyncMock(spec=ParticipantRepository)
+
+    async def get_by_ids(record_ids):
+        # Resolve batches through get_by_id like the base implementation
+        return await ParticipantRepository.get_by_ids(repo, record_ids)
+
+    repo.get_by_ids.side_effect = get_by_ids
     return repo
 
 
@@ -393,6 +399,28 @@ class TestParticipantHydration:
         # Should only include existing participant
         assert names == ["Существующий участник"]
 
+    @pytest.mark.asyncio
+    async def test_export_resolves_all_linked_ids_in_one_batch(
+        self,
+        export_service,
+        mock_roe_repository,
+        mock_participant_repository,
+        sample_roe_sessions,
+        sample_participants,
+    ):
+        """Roista, assistant and prayer IDs of every row share one lookup."""
+        mock_roe_repository.list_all.return_value = sample_roe_sessions
+        mock_participant_repository.get_by_ids.side_effect = None
+        mock_participant_repository.get_by_ids.return_value = {
+            p.record_id: p for p in sample_participants
+        }
+
+        csv_data = await export_service.get_all_roe_as_csv()
+
+        mock_participant_repository.get_by_ids.assert_awaited_once()
+        mock_participant_repository.get_by_id.assert_not_called()
+        assert "Сидоров Петр Александрович" in csv_data
+
     @pytest.mark.asyncio
     async def test_hydrate_participant_names_empty_list(
         self, export_service, mock_participant_repository
@@ -9,11 +9,15 @@ from typing import List, Tuple
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from rapidfuzz import fuzz
 
 from src.models.participant import Department, Participant, Role
 from src.services.search_service import (
+    ParticipantSearchIndex,
     SearchResult,
     SearchService,
+    _prefilter_is_exact,
+    canonical_name_key,
     detect_language,
     format_participant_full,
     format_participant_result,
@@ -651,6 +655,269 @@ class TestSearchServiceIntegration:
         assert service.similarity_threshold > 0
 
 
+def _reference_enhanced_score(query: str, participant: Participant) -> float:
+    """Per-participant scoring loop over canonical keys."""
+    query_key = canonical_name_key(query.strip())
+    if detect_language(query.strip()) == "ru":
+        primary, secondary = participant.full_name_ru, participant.full_name_en
+    else:
+        primary, secondary = participant.full_name_en, participant.full_name_ru
+
+    def best(name: str) -> float:
+        candidates = [name] + parse_name_parts(name)
+        return max(
+            fuzz.token_set_ratio(query_key, canonical_name_key(c)) / 100.0
+            for c in candidates
+        )
+
+    score = best(primary) if primary else 0.0
+    if secondary and score < 0.9:
+        score = max(score, best(secondary) * 0.9)
+    return score
+
+
+class TestCanonicalNameKey:
+    """Test the script-independent name keys used by the search index."""
+
+    @pytest.mark.parametrize(
+        "cyrillic,latin",
+        [
+            ("Александр", "Aleksandr"),
+            ("Максим", "Maxim"),
+            ("Михаил", "Mikhail"),
+            ("Михаил", "Mihail"),
+            ("Дмитрий", "Dmitriy"),
+            ("Щукина", "Shchukina"),
+            ("Алёна Йорданова", "alena iordanova"),
+        ],
+    )
+    def test_spellings_share_one_key(self, cyrillic, latin):
+        assert canonical_name_key(cyrillic) == canonical_name_key(latin)
+
+    def test_mixed_script_query(self):
+        assert canonical_name_key("Ivan Петров") == "ivan petrov"
+
+
+class TestParticipantSearchIndex:
+    """Test the pre-normalized participant search index."""
+
+    @pytest.fixture
+    def participants(self):
+        names = [
+            ("Александр Иванов", "Alexander Ivanov"),
+            ("Алёксей Петров", "Alexey Petrov"),
+            ("Мария Сидорова", None),
+            ("Иван Смирнов", "Ivan Smirnov"),
+            ("Сергей Александров", "Sergey Aleksandrov"),
+            ("Юлия Йорданова", "Yulia Yordanova"),
+        ]
+        return [
+            Participant(record_id=f"rec{i}", full_name_ru=ru, full_name_en=en)
+            for i, (ru, en) in enumerate(names)
+        ]
+
+    @pytest.mark.parametrize(
+        "query",
+        ["Александр", "alexander", "Иванов", "Alexey", "Петр", "Иорданова", "Ivan"],
+    )
+    def test_enhanced_scores_match_reference(self, participants, query):
+        """Index scores are identical to the per-participant algorithm."""
+        index = ParticipantSearchIndex(participants)
+
+        results = index.search_enhanced(query, threshold=0.5, limit=10)
+
+        expected = sorted(
+            ((p.record_id, _reference_enhanced_score(query, p)) for p in participants),
+            key=lambda item: -item[1],
+        )
+        expected = [item for item in expected if item[1] >= 0.5]
+        assert [r.participant.record_id for r in results] == [i[0] for i in expected]
+        assert [r.similarity_score for r in results] == pytest.approx(
+            [i[1] for i in expected]
+        )
+
+    @pytest.mark.parametrize(
+        "query,threshold,expected",
+        [("Кстатин", 0.8, 0.824), ("Ивнв", 0.8, 0.8), ("Петрова", 0.95, 1.0)],
+    )
+    def test_primary_matches_near_high_thresholds(self, query, threshold, expected):
+        """Primary-language matches are not held to the secondary cutoff."""
+        participants = [
+            Participant(
+                record_id="rec0",
+                full_name_ru="Константин Иванов",
+                full_name_en="Konstantin Ivanov",
+            ),
+            Participant(
+                record_id="rec1", full_name_ru="Петрова Мария", full_name_en="Petrova"
+            ),
+        ]
+        index = ParticipantSearchIndex(participants)
+
+        results = index.search_enhanced(query, threshold, 5)
+
+        assert len(results) == 1
+        assert results[0].similarity_score == pytest.approx(expected, abs=1e-3)
+        assert results[0].similarity_score == pytest.approx(
+            _reference_enhanced_score(query, results[0].participant)
+        )
+
+    def test_discounted_secondary_matches_below_threshold_dropped(self):
+        """A secondary match is kept only when its weighted score passes."""
+        index = ParticipantSearchIndex(
+            [Participant(record_id="rec0", full_name_ru="Мария Сидорова")]
+        )
+
+        assert index.search_enhanced("Maria Sidorova", 0.95, 5) == []
+        assert index.search_enhanced("Maria Sidorova", 0.85, 5)
+
+    def test_latin_query_matches_cyrillic_only_name(self, participants):
+        index = ParticipantSearchIndex(participants)
+
+        enhanced = index.search_enhanced("Maria Sidorova", 0.8, 5)
+        basic = index.search("Mariya Sidorova", 0.8, 5)
+
+        assert enhanced[0].participant.record_id == "rec2"
+        # Match only through the Russian name of a Latin query is discounted
+        assert enhanced[0].similarity_score <= 0.9
+        assert basic[0].participant.record_id == "rec2"
+
+    def test_query_scored_once_against_one_script(self, participants):
+        index = ParticipantSearchIndex(participants)
+
+        with patch(
+            "src.services.search_service.process.extract", return_value=[]
+        ) as extract:
+            index.search_enhanced("Александр", 0.8, 5)
+
+        assert extract.call_count == 1
+        assert extract.call_args.args[0] == "aleksandr"
+
+    def test_identical_keys_from_both_names_stored_once(self):
+        index = ParticipantSearchIndex(
+            [Participant(full_name_ru="Иван Смирнов", full_name_en="Ivan Smirnov")]
+        )
+
+        assert index._all.choices == ["ivan smirnov", "ivan", "smirnov"]
+
+    def test_sync_reindexes_only_changed_participants(self, participants):
+        index = ParticipantSearchIndex(participants)
+        renamed = participants[2].model_copy(update={"full_name_ru": "Мария Кузнецова"})
+        updated = participants[:2] + [renamed] + participants[3:]
+
+        with patch(
+            "src.services.search_service.normalize_russian",
+            wraps=normalize_russian,
+        ) as normalize:
+            index.sync(updated)
+
+        # Full name plus two parts of the one renamed participant
+        assert normalize.call_count == 3
+        assert index.search_enhanced("Кузнецова", 0.8, 5)[0].participant is renamed
+        assert index.search_enhanced("Сидорова", 0.8, 5) == []
+
+    def test_sync_drops_removed_participants(self, participants):
+        index = ParticipantSearchIndex(participants)
+
+        index.sync(participants[1:])
+
+        assert len(index) == len(participants) - 1
+        assert all(
+            r.participant.record_id != "rec0"
+            for r in index.search_enhanced("Александр", 0.5, 10)
+        )
+
+    def test_service_reuses_index(self, participants):
+        service = SearchService(similarity_threshold=0.8, max_results=5)
+        index = ParticipantSearchIndex()
+
+        first = service.search_participants_enhanced("Мария", participants, index)
+        second = service.search_participants("Мария", participants, index)
+
+        assert len(index) == len(participants)
+        assert first[0].participant.record_id == "rec2"
+        assert second[0].participant.record_id == "rec2"
+
+
+class TestSearchIndexPrefilter:
+    """Test the n-gram candidate pre-filter of the search index."""
+
+    @pytest.fixture
+    def large_index(self):
+        first = ["Александр", "Алексей", "Мария", "Иван", "Ольга", "Дмитрий"]
+        last = ["Иванов", "Петров", "Сидорова", "Смирнов", "Кузнецова", "Попов"]
+        participants = [
+            Participant(
+                record_id=f"rec{i}",
+                full_name_ru=f"{first[i % 6]} {last[(i // 6) % 6]}{i}",
+            )
+            for i in range(400)
+        ]
+        participants.append(Participant(record_id="recX", full_name_ru="Юлия Ёлкина"))
+        return ParticipantSearchIndex(participants)
+
+    @pytest.mark.parametrize(
+        "query", ["Юлия", "Елкина", "Алексанр", "Мари", "Ю", "Ольга Петров"]
+    )
+    def test_prefilter_matches_full_scan(self, large_index, query):
+        prefiltered = large_index.search_enhanced(query, 0.6, 5)
+
+        with patch("src.services.search_service.PREFILTER_MIN_ENTRIES", 10**9):
+            full_scan = large_index.search_enhanced(query, 0.6, 5)
+
+        assert [(r.participant.record_id, r.similarity_score) for r in prefiltered] == [
+            (r.participant.record_id, r.similarity_score) for r in full_scan
+        ]
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.6, 0.7, 0.8, 0.9, 0.95])
+    @pytest.mark.parametrize("query", ["Ия", "Ол", "Ив", "Юл", "Ольг", "Иван"])
+    def test_short_queries_match_full_scan(self, query, threshold):
+        """Short queries return every full-scan match at any threshold."""
+        names = ["Ия", "Ия Ли", "Оля", "Ола", "Илья", "Ива", "Юля", "Ольга", "Ивана"]
+        participants = [
+            Participant(record_id=f"rec{i}", full_name_ru=f"{name} Ким{i}")
+            for i, name in enumerate(names * 40)
+        ]
+        index = ParticipantSearchIndex(participants)
+
+        prefiltered = index.search_enhanced(query, threshold, 1000)
+        with patch("src.services.search_service.PREFILTER_MIN_ENTRIES", 10**9):
+            full_scan = index.search_enhanced(query, threshold, 1000)
+
+        assert [(r.participant.record_id, r.similarity_score) for r in prefiltered] == [
+            (r.participant.record_id, r.similarity_score) for r in full_scan
+        ]
+
+    def test_prefilter_only_where_matches_share_ngrams(self):
+        """Low cutoffs and very short queries always scan every entry."""
+        assert not _prefilter_is_exact("iya", 80)
+        assert not _prefilter_is_exact("konstantin", 70)
+        assert _prefilter_is_exact("iya", 85)
+        assert _prefilter_is_exact("yuliya", 80)
+
+    def test_prefilter_scores_only_candidates(self, large_index):
+        with patch(
+            "src.services.search_service.process.extract", return_value=[]
+        ) as extract:
+            large_index.search_enhanced("Юлия", 0.8, 5)
+
+        scored = extract.call_args_list[0].args[1]
+        assert 0 < len(scored) < len(large_index._all.choices) // 4
+        assert "yuliya" in scored
+
+    def test_partial_names_found_through_ngrams(self, large_index):
+        entries = large_index._all
+
+        candidates = entries.candidates(canonical_name_key("Юл"), 95)
+
+        assert {"yuliya elkina", "yuliya"} <= {entries.choices[p] for p in candidates}
+
+    def test_small_index_scans_all_entries(self):
+        index = ParticipantSearchIndex([Participant(full_name_ru="Тест Участник")])
+
+        assert index._all.candidates("test", 80) is None
+
+
 class TestRoomFloorSearchService:
     """Test class for room and floor search service methods."""
 
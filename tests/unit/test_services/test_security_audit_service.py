@@ -4,6 +4,7 @@ Tests for security audit service.
 Tests comprehensive security audit logging and sync telemetry functionality.
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -19,6 +20,8 @@ from src.services.security_audit_service import (
     SyncEvent,
 )
 
+AUDIT_LOGGER = "src.services.security_audit_service"
+
 
 class TestAuthorizationEvent:
     """Test authorization event data structure."""
@@ -336,8 +339,9 @@ class TestSecurityAuditService:
             assert "manual_refresh" in call_args
             assert "2 failed records" in call_args
 
-    def test_log_performance_metrics_fast_operation(self):
+    def test_log_performance_metrics_fast_operation(self, caplog):
         """Test logging performance metrics for fast operation."""
+        caplog.set_level(logging.DEBUG, logger=AUDIT_LOGGER)
         service = SecurityAuditService()
 
         with patch.object(service.logger, "debug") as mock_debug:
@@ -432,8 +436,9 @@ class TestSecurityAuditService:
 class TestSecurityAuditIntegration:
     """Test security audit service integration scenarios."""
 
-    def test_end_to_end_authorization_flow(self):
+    def test_end_to_end_authorization_flow(self, caplog):
         """Test complete authorization flow with audit logging."""
+        caplog.set_level(logging.DEBUG, logger=AUDIT_LOGGER)
         service = SecurityAuditService()
 
         with (
@@ -514,3 +519,214 @@ class TestSecurityAuditIntegration:
 
             # Verify logging occurred (specific assertions depend on implementation)
             assert mock_warning.call_count >= 0 or mock_error.call_count >= 0
+
+
+def granted_event(user_id: int = 123456) -> AuthorizationEvent:
+    return AuthorizationEvent(
+        user_id=user_id,
+        action="search_participant",
+        result="granted",
+        user_role="viewer",
+        cache_state="hit",
+    )
+
+
+class TestAuditSampling:
+    """Granted and fast events are sampled; denied and slow ones are kept."""
+
+    def test_denied_events_ignore_sample_rate(self):
+        service = SecurityAuditService(granted_sample_rate=0.0)
+
+        with (
+            patch.object(service.logger, "info") as mock_info,
+            patch.object(service.logger, "warning") as mock_warning,
+        ):
+            service.log_authorization_event(granted_event())
+            denied = granted_event()
+            denied.result = "denied"
+            service.log_authorization_event(denied)
+
+        mock_info.assert_not_called()
+        mock_warning.assert_called_once()
+        assert service.get_stats()["sampled_out"] == 1
+
+    def test_slow_metrics_ignore_sample_rate(self, caplog):
+        caplog.set_level(logging.DEBUG, logger=AUDIT_LOGGER)
+        service = SecurityAuditService(fast_sample_rate=0.0)
+
+        with (
+            patch.object(service.logger, "debug") as mock_debug,
+            patch.object(service.logger, "warning") as mock_warning,
+        ):
+            for duration_ms in (5, 500):
+                service.log_performance_metrics(
+                    PerformanceMetrics(
+                        operation="authorization_check",
+                        duration_ms=duration_ms,
+                        cache_hit=True,
+                        user_role="admin",
+                    )
+                )
+
+        mock_debug.assert_not_called()
+        mock_warning.assert_called_once()
+
+    def test_metrics_below_logger_level_are_skipped(self, caplog):
+        caplog.set_level(logging.INFO, logger=AUDIT_LOGGER)
+        service = SecurityAuditService()
+        metrics = PerformanceMetrics(
+            operation="authorization_check",
+            duration_ms=5,
+            cache_hit=True,
+            user_role="admin",
+        )
+
+        with (
+            patch.object(service.logger, "debug") as mock_debug,
+            patch.object(service, "_emit") as mock_emit,
+        ):
+            service.log_performance_metrics(metrics)
+
+        mock_debug.assert_not_called()
+        mock_emit.assert_not_called()
+        assert service.get_stats()["sampled_out"] == 0
+
+    def test_templates_match_json_payload(self):
+        service = SecurityAuditService()
+        event = granted_event()
+        event.airtable_metadata = {"status": "Active", "raw": MagicMock()}
+
+        with patch.object(service.logger, "info") as mock_info:
+            service.log_authorization_event(event)
+
+        payload = json.loads(mock_info.call_args[0][0][len("SECURITY_AUDIT: ") :])
+        assert payload["event_type"] == "authorization_event"
+        assert payload["user_id"] == 123456
+        assert payload["timestamp"] == event.timestamp.isoformat()
+        assert payload["airtable_metadata"]["status"] == "Active"
+
+
+class TestAuditBuffering:
+    """Events are buffered while the drain task runs."""
+
+    @pytest.mark.asyncio
+    async def test_events_written_by_drain_task(self):
+        service = SecurityAuditService(flush_interval_seconds=0.01)
+
+        with patch.object(service.logger, "info") as mock_info:
+            await service.start()
+            service.log_authorization_event(granted_event())
+
+            mock_info.assert_not_called()
+            assert service.get_stats()["buffered"] == 1
+
+            await asyncio.sleep(0.05)
+            mock_info.assert_called_once()
+            await service.stop()
+
+        assert service.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_buffer(self):
+        service = SecurityAuditService(flush_interval_seconds=60)
+
+        with patch.object(service.logger, "info") as mock_info:
+            await service.start()
+            for user_id in range(3):
+                service.log_authorization_event(granted_event(user_id))
+            await service.stop()
+
+        assert mock_info.call_count == 3
+        assert service.get_stats()["buffered"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_drops_oldest_events(self):
+        service = SecurityAuditService(buffer_size=2, flush_interval_seconds=60)
+
+        with patch.object(service.logger, "info") as mock_info:
+            await service.start()
+            for user_id in range(3):
+                service.log_authorization_event(granted_event(user_id))
+            await service.stop()
+
+        assert service.get_stats()["dropped"] == 1
+        # The event of user 0 was dropped
+        assert '"user_id": 1,' in mock_info.call_args_list[0][0][0]
+
+    @pytest.mark.asyncio
+    async def test_zero_buffer_size_writes_synchronously(self):
+        service = SecurityAuditService(buffer_size=0)
+
+        with patch.object(service.logger, "info") as mock_info:
+            await service.start()
+            service.log_authorization_event(granted_event())
+
+        mock_info.assert_called_once()
+        assert service.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_keeps_denied_events(self):
+        service = SecurityAuditService(buffer_size=2, flush_interval_seconds=60)
+
+        with patch.object(service.logger, "warning") as mock_warning:
+            await service.start()
+            for user_id in range(5):
+                denied = granted_event(user_id)
+                denied.result = "denied"
+                service.log_authorization_event(denied)
+
+            # Events beyond the buffer are written right away
+            assert mock_warning.call_count == 3
+            await service.stop()
+
+        assert mock_warning.call_count == 5
+        assert service.get_stats()["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_denied_event_evicts_buffered_granted_event(self):
+        service = SecurityAuditService(buffer_size=2, flush_interval_seconds=60)
+        denied = granted_event(2)
+        denied.result = "denied"
+
+        with (
+            patch.object(service.logger, "info") as mock_info,
+            patch.object(service.logger, "warning") as mock_warning,
+        ):
+            await service.start()
+            service.log_authorization_event(granted_event(0))
+            service.log_authorization_event(granted_event(1))
+            service.log_authorization_event(denied)
+
+            mock_warning.assert_not_called()
+            await service.stop()
+
+        assert service.get_stats()["dropped"] == 1
+        assert mock_info.call_count == 1
+        assert '"user_id": 1,' in mock_info.call_args[0][0]
+        mock_warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_event_order_after_eviction(self):
+        service = SecurityAuditService(buffer_size=3, flush_interval_seconds=60)
+        events = [granted_event(user_id) for user_id in range(4)]
+        for event in events[1::2]:
+            event.result = "denied"
+        written = []
+
+        def record(message):
+            payload = message.rpartition("SECURITY_AUDIT: ")[2]
+            written.append(json.loads(payload)["user_id"])
+
+        with (
+            patch.object(service.logger, "info", side_effect=record),
+            patch.object(service.logger, "warning", side_effect=record),
+        ):
+            await service.start()
+            for event in events:
+                service.log_authorization_event(event)
+            assert service.get_stats()["buffered"] == 3
+            await service.stop()
+
+        # The oldest granted event made room; the rest keep their order
+        assert written == [1, 2, 3]
+        assert service.get_stats()["dropped"] == 1
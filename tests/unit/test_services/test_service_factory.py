@@ -11,6 +11,7 @@ from src.services import service_factory
 from src.services.bible_readers_export_service import BibleReadersExportService
 from src.services.roe_export_service import ROEExportService
 from src.services.statistics_service import StatisticsService
+from src.utils.columnar_export import ExportFormat
 
 
 @pytest.fixture(autouse=True)
@@ -24,6 +25,9 @@ def reset_client_cache():
 def _build_settings(config: AirtableConfig) -> Mock:
     settings = Mock()
     settings.get_airtable_config.return_value = config
+    settings.database.participant_replica_enabled = False
+    settings.application.export_format = "csv"
+    settings.application.export_watermark_file = ""
     return settings
 
 
@@ -111,16 +115,13 @@ class TestAirtableClientReuse:
             retry_delay_seconds=1.0,
         )
 
-        mock_get_settings.side_effect = [
-            _build_settings(config_a),
-            _build_settings(config_b),
-        ]
-
         first_client = Mock()
         second_client = Mock()
         mock_airtable_client.side_effect = [first_client, second_client]
 
+        mock_get_settings.return_value = _build_settings(config_a)
         repo1 = service_factory.get_participant_repository()
+        mock_get_settings.return_value = _build_settings(config_b)
         repo2 = service_factory.get_participant_repository()
 
         assert mock_airtable_client.call_count == 2
@@ -128,6 +129,83 @@ class TestAirtableClientReuse:
         assert repo2.client is second_client
 
 
+class TestParticipantReplicaFactory:
+    """Test the shared Participants replica factory."""
+
+    @patch("src.services.service_factory.AirtableClient")
+    @patch("src.services.service_factory.get_settings")
+    def test_replica_disabled_by_default(self, mock_get_settings, mock_airtable_client):
+        mock_get_settings.return_value = _build_settings(
+            AirtableConfig(api_key="key", base_id="base")
+        )
+
+        assert service_factory.get_participant_replica() is None
+        assert service_factory.get_participant_repository().replica is None
+
+    @patch("src.services.service_factory.AirtableClient")
+    @patch("src.services.service_factory.get_settings")
+    def test_replica_shared_by_repositories(
+        self, mock_get_settings, mock_airtable_client
+    ):
+        settings = _build_settings(AirtableConfig(api_key="key", base_id="base"))
+        settings.database.participant_replica_enabled = True
+        settings.database.participant_replica_sync_interval_seconds = 10
+        settings.database.participant_replica_full_sync_interval_seconds = 600
+        mock_get_settings.return_value = settings
+
+        repo1 = service_factory.get_participant_repository()
+        repo2 = service_factory.get_participant_repository()
+
+        assert repo1.replica is not None
+        assert repo1.replica is repo2.replica
+        assert repo1.replica.client is repo1.client
+        assert repo1.replica.sync_interval_seconds == 10
+        assert repo1.replica.full_sync_interval_seconds == 600
+
+
+class TestExportArtifactCacheFactory:
+    """Test the shared export artifact cache factory."""
+
+    @patch("src.services.service_factory.AirtableClient")
+    @patch("src.services.service_factory.get_settings")
+    def test_export_services_share_cache(self, mock_get_settings, mock_airtable_client):
+        settings = _build_settings(AirtableConfig(api_key="key", base_id="base"))
+        settings.application.export_cache_enabled = True
+        settings.application.export_cache_max_age_seconds = 60
+        settings.application.export_cache_max_mb = 5
+        mock_get_settings.return_value = settings
+
+        service1 = service_factory.get_export_service()
+        service2 = service_factory.get_export_service()
+
+        assert service1.artifact_cache is not None
+        assert service1.artifact_cache is service2.artifact_cache
+        assert service1.artifact_cache.max_age_seconds == 60
+        assert service1.artifact_cache.max_total_bytes == 5 * 1024 * 1024
+
+    @patch("src.services.service_factory.AirtableClient")
+    @patch("src.services.service_factory.get_settings")
+    def test_export_service_uses_configured_format(
+        self, mock_get_settings, mock_airtable_client
+    ):
+        settings = _build_settings(AirtableConfig(api_key="key", base_id="base"))
+        settings.application.export_cache_enabled = False
+        settings.application.export_format = "xlsx"
+        mock_get_settings.return_value = settings
+
+        service = service_factory.get_export_service()
+
+        assert service.export_format == ExportFormat.XLSX
+
+    @patch("src.services.service_factory.get_settings")
+    def test_export_cache_disabled(self, mock_get_settings):
+        settings = _build_settings(AirtableConfig(api_key="key", base_id="base"))
+        settings.application.export_cache_enabled = False
+        mock_get_settings.return_value = settings
+
+        assert service_factory.get_export_artifact_cache() is None
+
+
 class TestTableSpecificClients:
     """Test table-specific client creation and caching."""
 
@@ -282,6 +360,38 @@ class TestNewExportServiceFactories:
         assert service.progress_callback is None
 
 
+class TestRetreatPacketOrchestratorFactory:
+    """Test the orchestrator of the full retreat packet export."""
+
+    def test_jobs_cover_all_tables_with_their_progress(self):
+        """Test every table job creates its service with the job's progress."""
+        services = {
+            "get_export_service": Mock(),
+            "get_roe_export_service": Mock(),
+            "get_bible_readers_export_service": Mock(),
+        }
+        progress = Mock()
+
+        orchestrator = service_factory.get_retreat_packet_orchestrator(progress)
+
+        assert list(orchestrator.jobs) == [
+            "participants.csv",
+            "roe.csv",
+            "bible_readers.csv",
+        ]
+        assert orchestrator.progress_callback is progress
+        with patch.multiple(service_factory, **services):
+            job_progress = Mock()
+            for job in orchestrator.jobs.values():
+                job(job_progress)
+        for factory in services.values():
+            factory.assert_called_once_with(job_progress)
+        export_service = services["get_export_service"].return_value
+        export_service.get_all_participants_as_file.assert_called_once_with(
+            ExportFormat.CSV
+        )
+
+
 class TestSettingsIntegration:
     """Regression tests for real Settings object integration."""
 
@@ -0,0 +1,111 @@
+"""
+Unit tests for the authorization cache.
+
+Covers LRU eviction, expiry, sampled audit records and refreshing cached
+roles from the role map.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config.settings import RoleMap
+from src.utils.auth_cache import AuthorizationCache
+
+
+@pytest.fixture
+def audit_service():
+    with patch(
+        "src.utils.auth_cache.get_security_audit_service",
+        return_value=MagicMock(),
+    ) as get_service:
+        yield get_service.return_value
+
+
+class TestLookups:
+    """Lookups report hits, misses and expired entries."""
+
+    def test_hit_miss_and_expired(self):
+        cache = AuthorizationCache(ttl_seconds=60)
+        cache.set(111, "viewer")
+
+        assert cache.get(111) == ("viewer", "hit")
+        assert cache.get(222) == (None, "miss")
+
+        cache.ttl_seconds = -1
+        assert cache.get(111) == ("viewer", "expired")
+
+        statistics = cache.get_stats()["statistics"]
+        assert statistics["hits"] == 1
+        assert statistics["misses"] == 2
+
+
+class TestLRUEviction:
+    """The least recently used entry is evicted first."""
+
+    def test_evicts_oldest_entry(self):
+        cache = AuthorizationCache(max_size=2)
+        cache.set(111, "viewer")
+        cache.set(222, "viewer")
+        cache.set(333, "viewer")
+
+        assert cache.get(111) == (None, "miss")
+        assert cache.get(222)[1] == "hit"
+        assert cache.get(333)[1] == "hit"
+        assert cache.get_stats()["statistics"]["evictions"] == 1
+
+    def test_lookup_and_update_refresh_recency(self):
+        cache = AuthorizationCache(max_size=3)
+        for user_id in (111, 222, 333):
+            cache.set(user_id, "viewer")
+
+        cache.get(111)
+        cache.set(222, "admin")
+        cache.set(444, "viewer")
+
+        assert cache.get(333) == (None, "miss")
+        assert cache.get(111) == ("viewer", "hit")
+        assert cache.get(222) == ("admin", "hit")
+        assert cache.get_stats()["size"] == 3
+
+
+class TestSampledAudit:
+    """Per-lookup audit records are opt-in and sampled."""
+
+    def test_no_audit_records_by_default(self, audit_service):
+        cache = AuthorizationCache()
+        cache.set(111, "viewer")
+        cache.get(111)
+        cache.get(222)
+
+        audit_service.log_performance_metrics.assert_not_called()
+
+    def test_sampled_lookups_are_logged(self, audit_service):
+        cache = AuthorizationCache(audit_sample_rate=1.0)
+        cache.get(111)
+
+        audit_service.create_performance_metrics.assert_called_once()
+        kwargs = audit_service.create_performance_metrics.call_args.kwargs
+        assert kwargs["operation"] == "cache_lookup"
+        assert kwargs["additional_context"]["cache_state"] == "miss"
+        audit_service.log_performance_metrics.assert_called_once()
+
+
+class TestRefreshAll:
+    """Cached roles are re-resolved from the current role map."""
+
+    def test_refresh_all_re_resolves_roles(self):
+        cache = AuthorizationCache()
+        cache.set(111, "viewer")
+        cache.set(222, "admin")
+        cache.set(333, None)
+
+        role_map = RoleMap.from_ids(
+            admin_ids=[111], coordinator_ids=[333], viewer_ids=[]
+        )
+
+        assert cache.refresh_all(role_map) == 3
+        assert cache.get(111) == ("admin", "hit")
+        assert cache.get(222) == (None, "hit")
+        assert cache.get(333) == ("coordinator", "hit")
+        assert cache.get_stats()["statistics"]["refreshes"] == 3
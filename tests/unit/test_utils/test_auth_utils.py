@@ -7,8 +7,10 @@ Tests cover:
 - Role hierarchy validation (viewer < coordinator < admin)
 - User role resolution and caching
 - Performance requirements (<50ms per check)
+- Constant-time padding that does not block the event loop
 """
 
+import asyncio
 import time
 from unittest.mock import MagicMock, patch
 
@@ -16,8 +18,12 @@ import pytest
 
 from src.config.settings import Settings, TelegramSettings
 from src.utils.auth_utils import (
+    _ADMIN_CHECK_MIN_MS,
+    deferred_min_duration,
     get_user_role,
+    get_user_role_async,
     is_admin_user,
+    is_admin_user_async,
     is_coordinator_user,
     is_viewer_user,
 )
@@ -328,6 +334,64 @@ class TestAuthorizationPerformance:
         ), f"Authorization functions too slow: {average_time:.3f}s average"
 
 
+class TestNonBlockingPadding:
+    """Test async auth checks pad their duration without blocking the loop."""
+
+    @pytest.fixture
+    def settings(self):
+        settings = MagicMock(spec=Settings)
+        settings.telegram = MagicMock(spec=TelegramSettings)
+        settings.telegram.viewer_user_ids = [111111111]
+        settings.telegram.coordinator_user_ids = [444444444]
+        settings.telegram.admin_user_ids = [123456789]
+        return settings
+
+    @pytest.mark.asyncio
+    async def test_async_checks_match_sync_checks(self, settings):
+        """Test async variants return the same decisions."""
+        assert await is_admin_user_async(123456789, settings) is True
+        assert await is_admin_user_async(111111111, settings) is False
+        assert await is_admin_user_async(None, settings) is False
+        assert await get_user_role_async(444444444, settings) == "coordinator"
+        assert await get_user_role_async(999, settings) is None
+
+    @pytest.mark.asyncio
+    async def test_async_check_keeps_minimum_duration(self, settings):
+        """Test the constant-time padding is awaited, not dropped."""
+        with patch("src.utils.auth_utils.time.sleep") as mock_sleep:
+            start = time.perf_counter()
+            await is_admin_user_async(999, settings)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        mock_sleep.assert_not_called()
+        assert elapsed_ms >= _ADMIN_CHECK_MIN_MS
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_overlap(self, settings):
+        """Test padding of concurrent checks runs in parallel."""
+        checks = 50
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(is_admin_user_async(123456789, settings) for _ in range(checks))
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert all(results)
+        # Blocking padding would take checks * 2ms in total
+        assert elapsed_ms < checks * _ADMIN_CHECK_MIN_MS / 2
+
+    def test_deferred_block_skips_blocking_padding(self, settings):
+        """Test sync checks inside the deferred block do not sleep."""
+        with patch("src.utils.auth_utils.time.sleep") as mock_sleep:
+            with deferred_min_duration():
+                assert is_admin_user(123456789, settings) is True
+            mock_sleep.assert_not_called()
+
+            is_admin_user(123456789, settings)
+            mock_sleep.assert_called()
+
+
 class TestIntegrationWithRealSettings:
     """Test integration of authorization functions with real Settings objects."""
 
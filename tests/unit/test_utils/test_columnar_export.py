@@ -0,0 +1,188 @@
+"""
+Tests for columnar export tables.
+
+Covers type inference, CSV output matching the row-based writer, the
+dependency-free XLSX writer and the optional Parquet format.
+"""
+
+import csv
+import io
+import zipfile
+from datetime import date
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+import pytest
+
+from src.utils.columnar_export import (
+    ColumnType,
+    ExportFormat,
+    ExportFormatUnavailableError,
+    ExportTable,
+    infer_column_type,
+    parquet_available,
+)
+from src.utils.export_utils import write_csv_export
+
+XLSX_NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+RECORDS = [
+    {
+        "id": "rec1",
+        "fields": {
+            "FullNameRU": "Иван Петров",
+            "Floor": 2,
+            "Paid": True,
+            "DateOfBirth": "1990-05-01",
+            "Tags": ["a", "b"],
+        },
+    },
+    {"id": "rec2", "fields": {"FullNameRU": 'Анна "Аня"', "Paid": False}},
+]
+HEADERS = ["#", "FullNameRU", "Floor", "Paid", "DateOfBirth", "Tags", "Missing"]
+
+
+def read_sheet(export) -> list:
+    with zipfile.ZipFile(export.file) as archive:
+        names = set(archive.namelist())
+        assert "[Content_Types].xml" in names
+        assert "xl/workbook.xml" in names
+        root = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    rows = []
+    for row in root.iter(f"{{{XLSX_NS['x']}}}row"):
+        cells = {}
+        for cell in row.findall("x:c", XLSX_NS):
+            value = cell.find("x:v", XLSX_NS)
+            text = cell.find("x:is/x:t", XLSX_NS)
+            cells[cell.get("r")] = (
+                cell.get("t"),
+                value.text if value is not None else text.text,
+            )
+        rows.append(cells)
+    return rows
+
+
+class TestTypeInference:
+    """Columns get one type shared by all their non-empty values."""
+
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            ([1, None, 2.5], ColumnType.NUMBER),
+            ([True, "", False], ColumnType.BOOLEAN),
+            (["2024-01-31", date(2024, 2, 1)], ColumnType.DATE),
+            (["2024-02-30"], ColumnType.STRING),
+            ([1, "x"], ColumnType.STRING),
+            ([None, ""], ColumnType.STRING),
+        ],
+    )
+    def test_infer_column_type(self, values, expected):
+        assert infer_column_type(values) == expected
+
+
+class TestCSVOutput:
+    """CSV output matches the row-based writer."""
+
+    def test_matches_row_based_writer(self):
+        table = ExportTable.from_view_records(RECORDS, HEADERS, list_separator="; ")
+
+        rows = [
+            {
+                "#": "1",
+                "FullNameRU": "Иван Петров",
+                "Floor": "2",
+                "Paid": "TRUE",
+                "DateOfBirth": "1990-05-01",
+                "Tags": "a; b",
+            },
+            {"#": "2", "FullNameRU": 'Анна "Аня"', "Paid": "FALSE"},
+        ]
+        with table.write() as columnar, write_csv_export(HEADERS, rows) as row_based:
+            assert columnar.read_text() == row_based.read_text()
+            assert columnar.row_count == 2
+            assert columnar.extension == "csv"
+
+    def test_line_numbers_keep_width(self):
+        table = ExportTable(["#"], 3)
+        table.add_line_numbers([1, 5, 12], width=3)
+
+        with table.write() as export:
+            lines = list(csv.reader(io.StringIO(export.read_text())))
+
+        assert lines == [["#"], ["  1"], ["  5"], [" 12"]]
+
+    def test_skipped_columns_added_by_caller(self):
+        table = ExportTable.from_view_records(
+            RECORDS, ["#", "FullNameRU"], skip={"FullNameRU"}
+        )
+        table.add_column("FullNameRU", ["A", "B"])
+
+        with table.write() as export:
+            assert export.read_text().splitlines()[1:] == ["1,A", "2,B"]
+
+    def test_column_length_mismatch_rejected(self):
+        table = ExportTable(["Name"], 2)
+
+        with pytest.raises(ValueError):
+            table.add_column("Name", ["only one"])
+
+
+class TestXLSXOutput:
+    """XLSX cells carry their column type."""
+
+    def test_typed_cells(self):
+        table = ExportTable.from_view_records(RECORDS, HEADERS)
+
+        with table.write(ExportFormat.XLSX) as export:
+            assert export.extension == "xlsx"
+            assert export.row_count == 2
+            header, first, second = read_sheet(export)
+
+        assert header["A1"] == ("inlineStr", "#")
+        assert header["G1"] == ("inlineStr", "Missing")
+        assert first["A2"] == (None, "1")
+        assert first["B2"] == ("inlineStr", "Иван Петров")
+        assert first["C2"] == (None, "2")
+        assert first["D2"] == ("b", "1")
+        # Days since 1899-12-30
+        assert first["E2"] == (None, str((date(1990, 5, 1) - date(1899, 12, 30)).days))
+        assert first["F2"] == ("inlineStr", "a, b")
+        assert "G2" not in first
+        assert second["B3"] == ("inlineStr", 'Анна "Аня"')
+        assert second["D3"] == ("b", "0")
+        assert "C3" not in second
+
+    def test_control_characters_removed(self):
+        table = ExportTable(["Name"], 1)
+        table.add_column("Name", ["a\x01b"])
+
+        with table.write(ExportFormat.XLSX) as export:
+            _, row = read_sheet(export)
+
+        assert row["A2"] == ("inlineStr", "ab")
+
+
+class TestParquetOutput:
+    """Parquet is only available with pyarrow installed."""
+
+    def test_missing_pyarrow_raises(self):
+        table = ExportTable(["Name"], 0)
+
+        with (
+            patch("src.utils.columnar_export.parquet_available", return_value=False),
+            pytest.raises(ExportFormatUnavailableError),
+        ):
+            table.write(ExportFormat.PARQUET)
+
+    @pytest.mark.skipif(not parquet_available(), reason="pyarrow not installed")
+    def test_typed_columns(self):
+        import pyarrow.parquet as pq
+
+        table = ExportTable.from_view_records(RECORDS, HEADERS)
+
+        with table.write(ExportFormat.PARQUET) as export:
+            result = pq.read_table(export.file)
+
+        assert result.column("Floor").to_pylist() == [2, None]
+        assert result.column("Paid").to_pylist() == [True, False]
+        assert result.column("DateOfBirth").to_pylist() == [date(1990, 5, 1), None]
@@ -0,0 +1,116 @@
+"""
+Tests for the content-addressed export artifact cache.
+
+Covers versioned reuse, shared files and Telegram file IDs for identical
+content, and eviction by age and total size.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.export_artifact_cache import ExportArtifactCache
+from src.utils.export_utils import CSVExportFile, write_zip_export
+
+RENDERED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ExportArtifactCache(directory=tmp_path)
+    yield cache
+    cache.clear()
+
+
+def export(text: str = "#,Name\n1,Иван\n") -> CSVExportFile:
+    return CSVExportFile.from_text(text)
+
+
+class TestVersionedReuse:
+    """Entries are served only for the version they were rendered from."""
+
+    def test_store_and_reopen(self, cache):
+        stored = cache.store(("participants", "all"), 1, export(), RENDERED_AT)
+        with stored:
+            assert stored.read_text() == "#,Name\n1,Иван\n"
+            assert stored.digest is not None
+
+        entry = cache.get(("participants", "all"), 1)
+        assert entry is not None
+        assert entry.rendered_at == RENDERED_AT
+        with cache.open(entry) as reopened:
+            assert reopened.row_count == 1
+            assert reopened.read_text() == "#,Name\n1,Иван\n"
+
+    def test_version_change_is_a_miss(self, cache):
+        cache.store(("participants", "all"), 1, export(), RENDERED_AT).close()
+
+        assert cache.get(("participants", "all"), 2) is None
+        assert cache.get_stats()["files"] == 0
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = ExportArtifactCache(directory=tmp_path, max_age_seconds=0)
+        cache.store(("participants", "all"), None, export(), RENDERED_AT).close()
+
+        assert cache.get(("participants", "all"), None) is None
+
+
+class TestContentAddressing:
+    """Identical content is stored once and shares its file_id."""
+
+    def test_identical_exports_share_file_and_file_id(self, cache):
+        first = cache.store(("participants", "all"), 1, export(), RENDERED_AT)
+        first.close()
+        cache.remember_file_id(first.digest, "telegram-file-id")
+
+        second = cache.store(("participants", "role", "TEAM"), 1, export(), RENDERED_AT)
+        second.close()
+
+        assert second.digest == first.digest
+        assert second.file_id == "telegram-file-id"
+        assert cache.get_stats()["files"] == 1
+        assert cache.get_stats()["shared_files"] == 1
+
+    def test_extension_kept_for_reopened_files(self, cache, tmp_path):
+        archive = write_zip_export({"participants.csv": export()}, 1)
+        cache.store(("retreat_packet",), 1, archive, RENDERED_AT).close()
+
+        with cache.open(cache.get(("retreat_packet",), 1)) as reopened:
+            assert reopened.extension == "zip"
+        assert [path.suffix for path in tmp_path.iterdir()] == [".zip"]
+
+    def test_forgotten_file_id_is_not_served(self, cache):
+        stored = cache.store(("participants", "all"), 1, export(), RENDERED_AT)
+        stored.close()
+        cache.remember_file_id(stored.digest, "telegram-file-id")
+        cache.forget_file_id(stored.digest)
+
+        with cache.open(cache.get(("participants", "all"), 1)) as reopened:
+            assert reopened.file_id is None
+
+
+class TestSizeEviction:
+    """Total size on disk stays within the limit."""
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        size = export("#,Name\n1,A\n").byte_size
+        cache = ExportArtifactCache(directory=tmp_path, max_total_bytes=size * 2)
+
+        cache.store(("a",), 1, export("#,Name\n1,A\n"), RENDERED_AT).close()
+        cache.store(("b",), 1, export("#,Name\n1,B\n"), RENDERED_AT).close()
+        assert cache.get(("a",), 1) is not None
+        cache.store(("c",), 1, export("#,Name\n1,C\n"), RENDERED_AT).close()
+
+        assert cache.get(("b",), 1) is None
+        assert cache.get(("a",), 1) is not None
+        assert cache.total_bytes <= size * 2
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_export_larger_than_cache_is_returned_uncached(self, tmp_path):
+        cache = ExportArtifactCache(directory=tmp_path, max_total_bytes=4)
+        rendered = export()
+
+        with cache.store(("a",), 1, rendered, RENDERED_AT) as result:
+            assert result is rendered
+            assert result.read_text() == "#,Name\n1,Иван\n"
+        assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,99 @@
+"""
+Tests for export size estimates.
+
+Covers exact sizes of rendered exports, projections from rendered samples
+and expiry of cached estimates.
+"""
+
+from src.utils.export_size_estimator import ExportSizeEstimator
+from src.utils.export_utils import CSVExportFile
+
+KEY = ("participants", "all", "csv")
+
+
+def export(text: str) -> CSVExportFile:
+    return CSVExportFile.from_text(text)
+
+
+class TestMeasuredEstimates:
+    """Rendered exports give exact estimates."""
+
+    def test_record_export_is_exact(self):
+        estimator = ExportSizeEstimator()
+        rendered = export("#,Name\n1,Иван\n2,Анна\n")
+
+        estimator.record_export(KEY, rendered)
+        estimate = estimator.get(KEY)
+
+        assert estimate is not None
+        assert estimate.measured is True
+        assert estimate.row_count == 2
+        assert estimate.estimated_bytes == rendered.byte_size
+
+    def test_empty_export_is_exact(self):
+        estimator = ExportSizeEstimator()
+        rendered = export("#,Name\n")
+
+        estimator.record_export(KEY, rendered)
+
+        assert estimator.get(KEY).estimated_bytes == rendered.byte_size
+
+
+class TestSampledEstimates:
+    """Samples are projected onto the full record count."""
+
+    def test_sample_projected_onto_row_count(self):
+        estimator = ExportSizeEstimator()
+        empty = export("#,Name\n")
+        sample = export("#,Name\n1,Иван\n2,Иван\n")
+        row_bytes = (sample.byte_size - empty.byte_size) / 2
+
+        estimate = estimator.record_sample(
+            KEY, sample, empty, row_count=1000, fallback_bytes_per_row=500
+        )
+
+        assert estimate.measured is False
+        assert estimate.estimated_bytes == empty.byte_size + round(1000 * row_bytes)
+        assert estimator.get(KEY) == estimate
+
+    def test_empty_sample_uses_fallback_width(self):
+        estimator = ExportSizeEstimator()
+        empty = export("#,Name\n")
+
+        estimate = estimator.record_sample(
+            KEY, empty, empty, row_count=10, fallback_bytes_per_row=500
+        )
+
+        assert estimate.estimated_bytes == empty.byte_size + 5000
+
+
+class TestExpiry:
+    """Estimates expire and are counted in the statistics."""
+
+    def test_expired_estimate_is_a_miss(self):
+        estimator = ExportSizeEstimator(max_age_seconds=0)
+        estimator.record_export(KEY, export("#,Name\n1,Иван\n"))
+
+        assert estimator.get(KEY) is None
+        assert estimator.get_stats()["estimates"] == 0
+
+    def test_row_count_outlives_estimate(self):
+        estimator = ExportSizeEstimator(max_age_seconds=0)
+        assert estimator.last_row_count(KEY) is None
+
+        estimator.record_export(KEY, export("#,Name\n1,Иван\n2,Анна\n"))
+
+        assert estimator.get(KEY) is None
+        assert estimator.last_row_count(KEY) == 2
+
+    def test_stats(self):
+        estimator = ExportSizeEstimator()
+        estimator.get(KEY)
+        estimator.record_export(KEY, export("#,Name\n1,Иван\n"))
+        estimator.get(KEY)
+
+        stats = estimator.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["measured"] == 1
+        assert stats["hit_rate"] == 0.5
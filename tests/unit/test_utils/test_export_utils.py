@@ -7,11 +7,15 @@ following TDD approach for AGB-72 implementation.
 
 import csv
 import io
+import uuid
+import zipfile
 from typing import List
 
 import pytest
 
 from src.utils.export_utils import (
+    CSVExportFile,
+    CSVExportWriter,
     add_line_numbers_to_csv,
     add_line_numbers_to_rows,
     extract_headers_from_view_records,
@@ -20,6 +24,10 @@ from src.utils.export_utils import (
     format_line_number,
     generate_readable_export_filename,
     order_rows_by_view_headers,
+    prepare_telegram_delivery,
+    split_csv_export,
+    write_csv_export,
+    write_zip_export,
 )
 
 
@@ -348,6 +356,173 @@ class TestParticipantCountExtraction:
         assert result == 2
 
 
+class TestWriteCsvExport:
+    """Test streaming CSV exports into spooled files."""
+
+    def test_rows_written_with_bom_count_and_size(self):
+        """Test file content, row count and byte size from a single pass."""
+        rows = ({"#": str(i), "Name": f"Участник {i}"} for i in range(1, 4))
+
+        with write_csv_export(["#", "Name"], rows) as export:
+            data = export.file.read()
+
+            assert data.startswith(b"\xef\xbb\xbf")
+            assert export.byte_size == len(data)
+            assert export.row_count == 3
+            assert export.read_text() == (
+                "#,Name\r\n1,Участник 1\r\n2,Участник 2\r\n3,Участник 3\r\n"
+            )
+
+    def test_columns_follow_headers(self):
+        """Test missing fields are empty and unknown fields are ignored."""
+        rows = [{"Name": "Иван", "Extra": "x", "#": "1"}]
+
+        with write_csv_export(["#", "Name", "Church"], rows) as export:
+            assert export.read_text() == "#,Name,Church\r\n1,Иван,\r\n"
+
+    def test_large_export_rolls_over_to_disk(self):
+        """Test exports above the memory limit are moved to a real file."""
+        rows = ({"Name": "x" * 100} for _ in range(50))
+
+        with write_csv_export(["Name"], rows, max_memory_bytes=1024) as export:
+            assert export.file._rolled  # type: ignore[attr-defined]
+            assert export.row_count == 50
+            assert export.byte_size == len(export.file.read())
+
+    def test_from_text_counts_rows(self):
+        """Test wrapping an already rendered CSV string."""
+        with CSVExportFile.from_text("#,Name\n1,Иван\n2,Мария") as export:
+            assert export.row_count == 2
+            assert export.read_text() == "#,Name\n1,Иван\n2,Мария"
+            assert export.byte_size == len(
+                "#,Name\n1,Иван\n2,Мария".encode("utf-8-sig")
+            )
+
+    def test_writer_encodes_pushed_rows(self):
+        """Test rows pushed one by one match a single-pass export."""
+        writer = CSVExportWriter(["#", "Name"])
+        for i in range(1, 4):
+            writer.writerow([str(i), f"Участник {i}"])
+
+        with writer.finish() as export:
+            assert export.row_count == 3
+            assert export.byte_size == len(export.file.read())
+            assert export.read_text() == (
+                "#,Name\r\n1,Участник 1\r\n2,Участник 2\r\n3,Участник 3\r\n"
+            )
+
+    def test_aborted_writer_releases_spool(self):
+        """Test aborting an unfinished export closes its file."""
+        writer = CSVExportWriter(["Name"])
+        writer.writerow(["Иван"])
+
+        writer.abort()
+
+        assert writer._spool.closed
+
+
+class TestWriteZipExport:
+    """Test packing several CSV exports into one archive."""
+
+    def test_members_packed_with_given_row_count(self):
+        """Test the archive holds every member and reports the given count."""
+        members = {
+            "departments/Kitchen.csv": CSVExportFile.from_text("#,Name\n1,Иван\n"),
+            "roles/TEAM.csv": CSVExportFile.from_text("#,Name\n1,Иван\n2,Мария\n"),
+        }
+
+        with write_zip_export(members, row_count=2) as export:
+            assert export.row_count == 2
+            assert export.byte_size == len(export.file.read())
+            export.file.seek(0)
+            with zipfile.ZipFile(export.file) as archive:
+                assert archive.namelist() == list(members)
+                team = archive.read("roles/TEAM.csv")
+
+        assert team == members["roles/TEAM.csv"].file.read()
+        for member in members.values():
+            member.close()
+
+
+class TestTelegramDelivery:
+    """Test fitting exports into Telegram's upload limit."""
+
+    @staticmethod
+    def _csv(values: List[str]) -> CSVExportFile:
+        rows = "".join(f"{index},{value}\n" for index, value in enumerate(values, 1))
+        return CSVExportFile.from_text(f"#,Name\n{rows}")
+
+    def test_export_within_limit_unchanged(self):
+        """Test small exports are delivered as they are."""
+        export = self._csv(["Иван"])
+
+        deliveries = prepare_telegram_delivery(export, "export.csv")
+
+        assert deliveries == [("export.csv", export)]
+        export.close()
+
+    def test_compressible_export_zipped(self):
+        """Test oversized CSV exports are sent as a ZIP archive when it fits."""
+        export = self._csv(["Иван Петров"] * 300)
+        text = export.read_text()
+
+        [(filename, archive)] = prepare_telegram_delivery(
+            export, "export.csv", max_bytes=1000
+        )
+
+        with archive:
+            assert filename == "export.zip"
+            assert archive.byte_size <= 1000
+            assert archive.row_count == 300
+            with zipfile.ZipFile(archive.file) as packed:
+                assert packed.read("export.csv").decode("utf-8-sig") == text
+
+    def test_incompressible_export_split(self):
+        """Test CSV exports too large even when zipped are split into parts."""
+        values = [uuid.uuid4().hex for _ in range(100)]
+        export = self._csv(values)
+
+        deliveries = prepare_telegram_delivery(export, "export.csv", max_bytes=1000)
+
+        assert len(deliveries) > 1
+        rows = []
+        for index, (filename, part) in enumerate(deliveries, start=1):
+            with part:
+                assert filename == f"export_part{index}.csv"
+                assert part.byte_size <= 1000
+                lines = list(csv.reader(io.StringIO(part.read_text())))
+            assert lines[0] == ["#", "Name"]
+            assert part.row_count == len(lines) - 1
+            rows.extend(lines[1:])
+        assert [name for _, name in rows] == values
+
+    def test_split_keeps_multiline_records(self):
+        """Test quoted line breaks never split a record across parts."""
+        export = write_csv_export(
+            ["#", "Name"],
+            ({"#": str(i), "Name": "line one\nline two"} for i in range(1, 21)),
+        )
+
+        parts = split_csv_export(export, max_bytes=100)
+
+        assert sum(part.row_count for part in parts) == 20
+        for part in parts:
+            with part:
+                records = list(csv.reader(io.StringIO(part.read_text())))[1:]
+            assert all(name == "line one\nline two" for _, name in records)
+        export.close()
+
+    def test_other_formats_unchanged(self):
+        """Test already compressed formats are not split."""
+        members = {"a.csv": self._csv(["Иван"] * 50)}
+        archive = write_zip_export(members, 50)
+
+        assert prepare_telegram_delivery(archive, "a.zip", max_bytes=10) == [
+            ("a.zip", archive)
+        ]
+        archive.close()
+
+
 class TestExportSuccessMessageFormatting:
     """Test export success message formatting with participant count and Russian descriptions."""
 
@@ -371,6 +546,18 @@ class TestExportSuccessMessageFormatting:
         )
         assert result == expected
 
+    def test_format_message_with_known_participant_count(self):
+        """Test a known row count is used without parsing CSV data."""
+        result = format_export_success_message(
+            base_message="✅ Экспорт завершен успешно!",
+            file_size_mb=1.5,
+            timestamp="2025-01-26 15:30:00 UTC",
+            csv_data="Invalid CSV Data",
+            participant_count=7,
+        )
+
+        assert "👥 Участников: 7" in result
+
     def test_format_message_without_csv_data(self):
         """Test formatting message without CSV data (no participant count)."""
         result = format_export_success_message(
@@ -987,6 +1174,17 @@ class TestReadableFilenameGeneration:
         assert result.endswith(".csv")
         assert len(result.split("_")) == 5  # type_dd_mm_yyyy_suffix
 
+    def test_generate_filename_with_extension(self):
+        """Test archives get their own extension."""
+        from datetime import datetime
+
+        result = generate_readable_export_filename(
+            "departments", datetime(2025, 9, 27), extension="zip"
+        )
+
+        assert result.startswith("departments_27_09_2025_")
+        assert result.endswith(".zip")
+
     def test_generate_filename_all_export_types(self):
         """Test filename generation for all supported export types."""
         from datetime import datetime
@@ -0,0 +1,69 @@
+"""
+Tests for delta export watermarks.
+
+Covers forward-only updates, persistence to a JSON file and recovery from
+unreadable files.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from src.utils.export_watermarks import ExportWatermarkStore
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestWatermarks:
+    """Watermarks are kept per scope and only move forward."""
+
+    def test_unknown_scope(self):
+        assert ExportWatermarkStore().get("user:1") is None
+
+    def test_set_and_get(self):
+        store = ExportWatermarkStore()
+        store.set("user:1", NOW)
+
+        assert store.get("user:1") == NOW
+        assert store.get("user:2") is None
+
+    def test_older_watermark_ignored(self):
+        store = ExportWatermarkStore()
+        store.set("user:1", NOW)
+        store.set("user:1", NOW - timedelta(hours=1))
+
+        assert store.get("user:1") == NOW
+
+    def test_stats(self):
+        store = ExportWatermarkStore()
+        store.set("user:1", NOW)
+
+        assert store.get_stats() == {"scopes": 1, "persistent": False}
+
+
+class TestPersistence:
+    """Watermarks survive restarts when a file is configured."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "state" / "watermarks.json"
+        ExportWatermarkStore(path).set("user:1", NOW)
+
+        assert path.exists()
+        assert not path.with_suffix(".json.part").exists()
+        assert ExportWatermarkStore(path).get("user:1") == NOW
+
+    def test_clear_keeps_file(self, tmp_path):
+        path = tmp_path / "watermarks.json"
+        store = ExportWatermarkStore(path)
+        store.set("user:1", NOW)
+        store.clear()
+
+        assert store.get("user:1") is None
+        assert ExportWatermarkStore(path).get("user:1") == NOW
+
+    def test_unreadable_file_ignored(self, tmp_path):
+        path = tmp_path / "watermarks.json"
+        path.write_text("not json", encoding="utf-8")
+        store = ExportWatermarkStore(path)
+
+        assert store.get("user:1") is None
+        store.set("user:1", NOW)
+        assert ExportWatermarkStore(path).get("user:1") == NOW
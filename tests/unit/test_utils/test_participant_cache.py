@@ -0,0 +1,159 @@
+"""
+Tests for the versioned participant snapshot cache.
+
+Covers request coalescing, stale-while-revalidate refresh, targeted patches
+and patch replay onto in-flight loads.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.models.participant import Participant
+from src.utils.participant_cache import ParticipantSnapshotCache
+
+
+def participant(record_id: str, name: str = "Участник") -> Participant:
+    return Participant(record_id=record_id, full_name_ru=name)
+
+
+class TestSingleFlight:
+    """Concurrent misses share one load."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        cache = ParticipantSnapshotCache()
+        release = asyncio.Event()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await release.wait()
+            return [participant("rec1")]
+
+        waiters = [asyncio.create_task(cache.get(loader)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert len(calls) == 1
+        assert all(len(result) == 1 for result in results)
+        assert cache.get_stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_failed_load_propagates_and_retries(self):
+        cache = ParticipantSnapshotCache()
+        loader = AsyncMock(side_effect=[RuntimeError("boom"), [participant("rec1")]])
+
+        with pytest.raises(RuntimeError):
+            await cache.get(loader)
+
+        assert len(await cache.get(loader)) == 1
+        assert cache.get_stats()["refresh_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_load(self):
+        cache = ParticipantSnapshotCache()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return [participant("rec1")]
+
+        first = asyncio.create_task(cache.get(loader))
+        second = asyncio.create_task(cache.get(loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert len(await second) == 1
+
+
+class TestStaleWhileRevalidate:
+    """Expired snapshots are served while refreshing."""
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_served_during_refresh(self):
+        cache = ParticipantSnapshotCache(ttl_seconds=0, max_stale_seconds=60)
+        loader = AsyncMock(
+            side_effect=[
+                [participant("rec1", "Старый")],
+                [participant("rec1", "Новый")],
+            ]
+        )
+
+        await cache.get(loader)
+        stale = await cache.get(loader)
+        assert stale[0].full_name_ru == "Старый"
+
+        await asyncio.sleep(0)
+        assert cache.peek().participants[0].full_name_ru == "Новый"
+        assert loader.await_count == 2
+        assert cache.get_stats()["stale_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_too_stale_snapshot_waits_for_load(self):
+        cache = ParticipantSnapshotCache(ttl_seconds=0, max_stale_seconds=0)
+        loader = AsyncMock(
+            side_effect=[
+                [participant("rec1", "Старый")],
+                [participant("rec1", "Новый")],
+            ]
+        )
+
+        await cache.get(loader)
+        fresh = await cache.get(loader)
+
+        assert fresh[0].full_name_ru == "Новый"
+
+
+class TestTargetedPatches:
+    """Writes patch single records and bump the version."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_and_remove_keep_order(self):
+        cache = ParticipantSnapshotCache()
+        loader = AsyncMock(return_value=[participant("rec1"), participant("rec2")])
+        await cache.get(loader)
+        version = cache.version
+        handed_out = cache.peek().participants
+
+        cache.upsert([participant("rec1", "Изменён"), participant("rec3")])
+        cache.remove("rec2")
+
+        result = await cache.get(loader)
+        assert [(p.record_id, p.full_name_ru) for p in result] == [
+            ("rec1", "Изменён"),
+            ("rec3", "Участник"),
+        ]
+        assert cache.version == version + 2
+        assert len(handed_out) == 2
+        assert loader.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_patch_during_load_is_replayed(self):
+        cache = ParticipantSnapshotCache()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return [participant("rec1", "Из Airtable"), participant("rec2")]
+
+        task = asyncio.create_task(cache.get(loader))
+        await asyncio.sleep(0)
+        cache.upsert([participant("rec1", "Свежая запись")])
+        cache.remove("rec2")
+        release.set()
+        result = await task
+
+        assert [(p.record_id, p.full_name_ru) for p in result] == [
+            ("rec1", "Свежая запись")
+        ]
+
+    def test_patch_without_record_id_invalidates(self):
+        cache = ParticipantSnapshotCache()
+
+        cache.upsert([participant(None)])  # type: ignore[arg-type]
+
+        assert cache.peek() is None
@@ -7,6 +7,7 @@ to prevent unauthorized access to PII and financial information.
 
 from copy import deepcopy
 from datetime import date
+from unittest.mock import patch
 
 import pytest
 
@@ -15,6 +16,7 @@ from src.utils.participant_filter import (
     filter_participant_by_role,
     filter_participants_by_role,
     get_allowed_search_fields,
+    get_hidden_fields,
 )
 
 
@@ -155,6 +157,24 @@ class TestFilterParticipantByRole:
         assert sample_participant.contact_information == original_contact
         assert sample_participant.payment_amount == original_payment
 
+    def test_projection_is_shallow_copy(self, sample_participant):
+        """Projections share unchanged values instead of deep-copying them."""
+        with patch.object(
+            Participant, "model_copy", wraps=sample_participant.model_copy
+        ) as model_copy:
+            filtered = filter_participant_by_role(sample_participant, "viewer")
+
+        assert filtered is not sample_participant
+        assert filtered.full_name_ru is sample_participant.full_name_ru
+        assert model_copy.call_args.kwargs.get("deep", False) is False
+
+    def test_hidden_fields_per_role(self):
+        """Each role has a fixed mask; unknown roles get the viewer mask."""
+        assert get_hidden_fields("admin") == frozenset()
+        assert get_hidden_fields("coordinator") == {"date_of_birth"}
+        assert get_hidden_fields("unknown_role") == get_hidden_fields("viewer")
+        assert "contact_information" in get_hidden_fields(None)
+
 
 class TestFilterParticipantsByRole:
     """Test bulk participant filtering by role."""
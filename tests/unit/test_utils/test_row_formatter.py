@@ -0,0 +1,182 @@
+"""
+Tests for row formatters compiled once per export.
+
+Covers formatter selection from model annotations, header ordering, overrides
+and a micro-benchmark against per-field type dispatch, which only runs when
+RUN_BENCHMARKS is set because it compares wall-clock timings.
+"""
+
+import os
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, List
+
+import pytest
+
+from src.config.field_mappings import AirtableFieldMapping
+from src.config.field_mappings.roe import ROEFieldMapping
+from src.models.participant import (
+    Department,
+    Gender,
+    Participant,
+    PaymentStatus,
+    Role,
+    Size,
+)
+from src.models.roe import ROE
+from src.services.participant_export_service import ParticipantExportService
+from src.utils.row_formatter import RowFormatter
+
+HEADERS = ["#"] + [
+    airtable_field
+    for python_field, airtable_field in AirtableFieldMapping.PYTHON_TO_AIRTABLE.items()
+    if python_field != "record_id"
+]
+
+
+def make_participant(index: int) -> Participant:
+    return Participant(
+        record_id=f"rec{index:05d}",
+        full_name_ru=f"Участник {index}",
+        full_name_en=f"Participant {index}",
+        church="Церковь",
+        country_and_city="Россия, Москва",
+        contact_information="+7 999 123-45-67",
+        gender=Gender.MALE,
+        size=Size.L,
+        role=Role.TEAM,
+        department=Department.KITCHEN,
+        payment_status=PaymentStatus.PAID,
+        payment_amount=5000,
+        payment_date=date(2025, 1, 15),
+        date_of_birth=date(1990, 5, 20),
+        age=34,
+        floor=2,
+        room_number="205",
+    )
+
+
+def legacy_row(participant: Participant) -> Dict[str, str]:
+    """Row conversion with per-field lookups and type dispatch."""
+    row = {}
+    for python_field, airtable_field in AirtableFieldMapping.PYTHON_TO_AIRTABLE.items():
+        if python_field == "record_id":
+            continue
+        value = getattr(participant, python_field, None)
+        if value is None:
+            row[airtable_field] = ""
+        elif isinstance(value, (date, datetime)):
+            if airtable_field == "DateOfBirth":
+                row[airtable_field] = Participant._format_date_of_birth(value)
+            else:
+                row[airtable_field] = value.isoformat()[:10]
+        elif hasattr(value, "value"):
+            row[airtable_field] = str(value.value)
+        else:
+            row[airtable_field] = str(value)
+    return row
+
+
+def compile_participant_formatter() -> RowFormatter:
+    return RowFormatter.compile(
+        Participant,
+        AirtableFieldMapping.PYTHON_TO_AIRTABLE,
+        HEADERS,
+        formatters={
+            "DateOfBirth": ParticipantExportService._format_date_of_birth_value
+        },
+    )
+
+
+class TestCompiledFormatter:
+    """Formatters follow the headers and the model annotations."""
+
+    def test_matches_per_field_dispatch(self):
+        participant = make_participant(1)
+        formatter = compile_participant_formatter()
+
+        row = formatter.format(participant)
+
+        assert len(row) == len(HEADERS)
+        assert row[0] == ""
+        assert dict(zip(HEADERS[1:], row[1:])) == legacy_row(participant)
+        assert formatter.format_dict(participant) == legacy_row(participant)
+
+    def test_none_values_are_empty(self):
+        participant = Participant(full_name_ru="Иван")
+        formatter = compile_participant_formatter()
+
+        row = dict(zip(HEADERS, formatter.format(participant)))
+
+        assert row["FullNameRU"] == "Иван"
+        assert row["PaymentDate"] == ""
+        assert row["Gender"] == ""
+
+    def test_unknown_headers_left_empty(self):
+        formatter = RowFormatter.compile(
+            Participant,
+            AirtableFieldMapping.PYTHON_TO_AIRTABLE,
+            ["Extra", "Role", "FullNameRU"],
+        )
+
+        row = formatter.format(make_participant(1))
+
+        assert row == ["", "TEAM", "Участник 1"]
+        assert formatter.index("FullNameRU") == 2
+        assert formatter.index("Missing") is None
+
+    def test_lists_and_skipped_columns(self):
+        roe = ROE(
+            roe_topic="Тема",
+            roista=["rec1", "rec2"],
+            roe_date=date(2025, 3, 1),
+            roe_duration=45,
+            roista_church=["Церковь 1", "Церковь 2"],
+        )
+        formatter = RowFormatter.compile(
+            ROE,
+            ROEFieldMapping.PYTHON_TO_AIRTABLE,
+            ["RoeTopic", "Roista", "RoeDate", "RoeDuration", "RoistaChurch"],
+            skip={"Roista"},
+        )
+
+        assert formatter.format(roe) == [
+            "Тема",
+            "",
+            "2025-03-01",
+            "45",
+            "Церковь 1; Церковь 2",
+        ]
+
+
+@pytest.mark.skipif(
+    not os.getenv("RUN_BENCHMARKS"),
+    reason="Wall-clock benchmark - set RUN_BENCHMARKS=1 to run",
+)
+class TestRowFormatterBenchmark:
+    """Micro-benchmark of compiled formatting against per-field dispatch."""
+
+    ROWS = 2000
+
+    @staticmethod
+    def best_rate(format_row: Callable, participants: List[Participant]) -> float:
+        """Rows per second of the fastest of several runs."""
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for participant in participants:
+                format_row(participant)
+            best = min(best, time.perf_counter() - start)
+        return len(participants) / best
+
+    def test_compiled_formatter_outpaces_per_field_dispatch(self):
+        participants = [make_participant(index) for index in range(self.ROWS)]
+        formatter = compile_participant_formatter()
+
+        legacy = self.best_rate(legacy_row, participants)
+        compiled = self.best_rate(formatter.format, participants)
+
+        assert compiled > legacy, (
+            f"Row formatting: {legacy:,.0f} rows/s per-field dispatch, "
+            f"{compiled:,.0f} rows/s compiled"
+        )
@@ -0,0 +1,42 @@
+"""
+Tests for the version-keyed search result LRU cache.
+"""
+
+from src.utils.search_result_cache import SearchResultCache
+
+
+class TestSearchResultCache:
+    """Test lookups, LRU eviction and version invalidation."""
+
+    def test_hit_and_miss_statistics(self):
+        cache = SearchResultCache()
+
+        assert cache.get(1, "иван") is None
+        cache.put(1, "иван", ("result",))
+
+        assert cache.get(1, "иван") == ("result",)
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SearchResultCache(max_entries=2)
+        cache.put(1, "a", "A")
+        cache.put(1, "b", "B")
+        cache.get(1, "a")
+
+        cache.put(1, "c", "C")
+
+        assert cache.get(1, "b") is None
+        assert cache.get(1, "a") == "A"
+        assert cache.get(1, "c") == "C"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_new_version_invalidates_all_entries(self):
+        cache = SearchResultCache()
+        cache.put(1, "a", "A")
+
+        assert cache.get(2, "a") is None
+        assert cache.get(1, "a") is None
+        assert cache.get_stats()["invalidations"] == 1
+        assert cache.get_stats()["size"] == 0